@@ -12,6 +12,10 @@
 from . import common
 from .version import __version__
 
+# Subpackages (e.g., the plugin packages that pyomo.environ does not
+# import) are imported when they are first accessed
+__getattr__ = common.dependencies.import_subpackages_on_access(__name__)
+
 
 #
 # declare deprecation paths for removed modules
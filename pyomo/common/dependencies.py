@@ -809,6 +809,33 @@ def _perform_import(
     return module, False
 
 
+def import_subpackages_on_access(module_name):
+    """Generate a module ``__getattr__`` that imports subpackages on first use
+
+    Importing a subpackage sets it as an attribute of the parent
+    package.  Packages whose subpackages are not necessarily imported
+    (e.g., the plugin packages that :py:mod:`pyomo.environ` registers
+    but does not import) can declare
+
+    .. code::
+
+       __getattr__ = import_subpackages_on_access(__name__)
+
+    so that the subpackages remain accessible as attributes (e.g.,
+    ``pyomo.dae.ContinuousSet`` after ``import pyomo``).
+
+    """
+
+    def __getattr__(name):
+        if not name.startswith('_'):
+            fullname = module_name + '.' + name
+            if importlib.util.find_spec(fullname) is not None:
+                return importlib.import_module(fullname)
+        raise AttributeError(f"module '{module_name}' has no attribute '{name}'")
+
+    return __getattr__
+
+
 @deprecated(
     "``declare_deferred_modules_as_importable()`` is deprecated.  "
     "Use the :py:class:`declare_modules_as_importable` context manager.",
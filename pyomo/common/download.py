@@ -35,7 +35,7 @@ distro, distro_available = attempt_import('distro')
 
 logger = logging.getLogger('pyomo.common.download')
 
-DownloadFactory = pyomo.common.Factory('library downloaders')
+DownloadFactory = pyomo.common.Factory('library downloaders', 'pyomo.downloaders')
 
 
 class FileDownloader(object):
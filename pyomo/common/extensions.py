@@ -11,4 +11,6 @@
 
 import pyomo.common
 
-ExtensionBuilderFactory = pyomo.common.Factory('extension builders')
+ExtensionBuilderFactory = pyomo.common.Factory(
+    'extension builders', 'pyomo.extension_builders'
+)
@@ -16,17 +16,158 @@
 #  the U.S. Government retains certain rights in this software.
 #  ___________________________________________________________________________
 
+import importlib
+
+#: Deferred plugin registrations: maps each factory group to a dict
+#: mapping plugin names to the entry point that registers them
+_entry_points = {}
+#: The entry points that have been loaded
+_loaded_entry_points = set()
+
+
+def register_entry_point(group, name, entry_point):
+    """Record the entry point that registers a plugin with a factory group
+
+    This allows a plugin to be registered by name without importing
+    the module that implements it: the entry point is loaded the first
+    time that `name` is looked up in any factory created for `group`
+    (or when the plugins registered with the factory are enumerated).
+
+    Parameters
+    ----------
+    group: str
+        The factory group (see :py:class:`Factory`)
+
+    name: str
+        The name that the plugin is registered under
+
+    entry_point: str
+        Either a module name (the module registers the plugin when it
+        is imported), or a ``"module:function"`` string (calling the
+        function registers the plugin)
+
+    """
+    _entry_points.setdefault(group, {})[name] = entry_point
+
+
+def load_entry_point(entry_point):
+    """Load an entry point (see :py:func:`register_entry_point`)
+
+    Each entry point is only loaded once.
+
+    """
+    if entry_point in _loaded_entry_points:
+        return
+    _loaded_entry_points.add(entry_point)
+    module, _, function = entry_point.partition(':')
+    try:
+        module = importlib.import_module(module)
+        if function:
+            getattr(module, function)()
+    except:
+        _loaded_entry_points.discard(entry_point)
+        raise
+
+
+def load_entry_points(group=None):
+    """Load all entry points registered for a factory group
+
+    If `group` is None, then the entry points for all groups are loaded.
+
+    """
+    if group is None:
+        groups = list(_entry_points.values())
+    else:
+        groups = [_entry_points.get(group, {})]
+    for entry_points in groups:
+        # Note: loading an entry point can register new entry points
+        for entry_point in list(entry_points.values()):
+            load_entry_point(entry_point)
+
+
+class _Registry(dict):
+    """The classes registered with a :py:class:`Factory`
+
+    A dict that loads the entry point registered for a name (see
+    :py:func:`register_entry_point`) the first time the name is looked
+    up.  Enumerating the registry loads all entry points for the group.
+
+    """
+
+    __slots__ = ('group',)
+
+    def __init__(self, group=None):
+        super().__init__()
+        self.group = group
+
+    def _load(self, name):
+        if self.group is None:
+            return False
+        entry_point = _entry_points.get(self.group, {}).get(name, None)
+        if entry_point is None or entry_point in _loaded_entry_points:
+            return False
+        load_entry_point(entry_point)
+        return dict.__contains__(self, name)
+
+    def _load_all(self):
+        if self.group is not None:
+            load_entry_points(self.group)
+
+    def __missing__(self, name):
+        if self._load(name):
+            return dict.__getitem__(self, name)
+        raise KeyError(name)
+
+    def __contains__(self, name):
+        return dict.__contains__(self, name) or self._load(name)
+
+    def get(self, name, default=None):
+        if name in self:
+            return dict.__getitem__(self, name)
+        return default
+
+    def __iter__(self):
+        self._load_all()
+        return dict.__iter__(self)
+
+    def __len__(self):
+        self._load_all()
+        return dict.__len__(self)
+
+    def keys(self):
+        self._load_all()
+        return dict.keys(self)
+
+    def values(self):
+        self._load_all()
+        return dict.values(self)
+
+    def items(self):
+        self._load_all()
+        return dict.items(self)
+
 
 class Factory(object):
     """
     A class that is used to define a factory for objects.
 
     Factory objects may be cached for future use.
+
+    Parameters
+    ----------
+    description: str
+        A description of the objects created by this factory (used in
+        error messages)
+
+    group: str
+        The entry point group for this factory.  Plugins registered for
+        the group with :py:func:`register_entry_point` are loaded the
+        first time that they are used.
     """
 
-    def __init__(self, description=None):
+    def __init__(self, description=None, group=None):
         self._description = description
-        self._cls = {}
+        self._cls = _Registry(group)
         self._doc = {}
 
     def __call__(self, name, **kwds):
@@ -51,6 +192,9 @@ class Factory(object):
         return self._cls[name]
 
     def doc(self, name):
+        if name not in self._doc:
+            # Load the plugin (if it was registered through an entry point)
+            name in self._cls
         return self._doc[name]
 
     def unregister(self, name):
@@ -28,6 +28,7 @@ from pyomo.common.dependencies import (
     _DeferredOr,
     _DeferredImportCallbackFinder,
     check_min_version,
+    import_subpackages_on_access,
     dill,
     dill_available,
     mpi4py_available,
@@ -528,6 +529,19 @@ class TestDependencies(unittest.TestCase):
         ):
             A_Class.method()
 
+    def test_import_subpackages_on_access(self):
+        _getattr = import_subpackages_on_access('pyomo.common.tests')
+        self.assertIs(_getattr('dep_mod'), dep_mod)
+        with self.assertRaisesRegex(
+            AttributeError,
+            "module 'pyomo.common.tests' has no attribute '__there_is_no_module'",
+        ):
+            _getattr('__there_is_no_module')
+        with self.assertRaisesRegex(
+            AttributeError, "module 'pyomo.common.tests' has no attribute '_deps'"
+        ):
+            _getattr('_deps')
+
     @unittest.pytest.mark.mpi
     def test_mpi4py_available(self):
         from mpi4py import MPI
@@ -0,0 +1,121 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright (c) 2008-2025
+#  National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+
+import pyomo.common.unittest as unittest
+
+import pyomo.common.factory as factory_module
+from pyomo.common.factory import Factory, register_entry_point, load_entry_points
+
+_loaded = []
+_fail = []
+
+
+class _Plugin(object):
+    def __init__(self, **kwds):
+        self.kwds = kwds
+
+
+def _register_a():
+    _loaded.append('a')
+    TestFactory.factory.register('a', doc='plugin a')(_Plugin)
+    TestFactory.factory.register('a2')(_Plugin)
+
+
+def _register_b():
+    if _fail:
+        raise RuntimeError("could not load b")
+    _loaded.append('b')
+    TestFactory.factory.register('b', doc='plugin b')(_Plugin)
+
+
+class TestFactory(unittest.TestCase):
+    factory = None
+
+    def setUp(self):
+        _loaded.clear()
+        _fail.clear()
+        self.group = 'pyomo.test.%s' % (self.id(),)
+        TestFactory.factory = Factory('test plugin', self.group)
+        for name in ('a', 'a2'):
+            register_entry_point(self.group, name, __name__ + ':_register_a')
+        register_entry_point(self.group, 'b', __name__ + ':_register_b')
+
+    def tearDown(self):
+        factory_module._entry_points.pop(self.group, None)
+        for ep in ('a', 'b'):
+            factory_module._loaded_entry_points.discard(__name__ + ':_register_' + ep)
+        TestFactory.factory = None
+
+    def test_register(self):
+        f = Factory('test plugin')
+        self.assertNotIn('x', f)
+        f.register('x', doc='plugin x')(_Plugin)
+        self.assertIn('x', f)
+        self.assertIs(f.get_class('x'), _Plugin)
+        self.assertEqual(f.doc('x'), 'plugin x')
+        self.assertEqual(f('x', y=1).kwds, {'y': 1})
+        self.assertEqual(list(f), ['x'])
+        f.unregister('x')
+        self.assertNotIn('x', f)
+        self.assertIsNone(f('x'))
+        with self.assertRaisesRegex(ValueError, "Unknown test plugin: 'x'"):
+            f('x', exception=True)
+
+    def test_deferred_lookup(self):
+        f = self.factory
+        self.assertEqual(_loaded, [])
+        self.assertNotIn('c', f)
+        self.assertEqual(_loaded, [])
+        self.assertIn('a', f)
+        self.assertEqual(_loaded, ['a'])
+        self.assertIs(f.get_class('a2'), _Plugin)
+        self.assertEqual(f('b', x=1).kwds, {'x': 1})
+        # Entry points are only loaded once
+        self.assertEqual(_loaded, ['a', 'b'])
+        f.unregister('b')
+        self.assertNotIn('b', f)
+        self.assertEqual(_loaded, ['a', 'b'])
+
+    def test_deferred_doc(self):
+        self.assertEqual(self.factory.doc('b'), 'plugin b')
+        self.assertEqual(_loaded, ['b'])
+        with self.assertRaises(KeyError):
+            self.factory.doc('c')
+
+    def test_deferred_iter(self):
+        self.assertEqual(sorted(self.factory), ['a', 'a2', 'b'])
+        self.assertEqual(sorted(_loaded), ['a', 'b'])
+
+    def test_load_entry_points(self):
+        load_entry_points(self.group)
+        self.assertEqual(sorted(_loaded), ['a', 'b'])
+        self.assertEqual(sorted(dict.keys(self.factory._cls)), ['a', 'a2', 'b'])
+
+    def test_entry_point_error(self):
+        _fail.append(1)
+        with self.assertRaisesRegex(RuntimeError, "could not load b"):
+            'b' in self.factory
+        # The entry point is loaded again the next time it is used
+        _fail.clear()
+        self.assertIn('b', self.factory)
+        self.assertEqual(_loaded, ['b'])
+
+    def test_shared_registry(self):
+        # Factories that share a registry (e.g., SolverFactory and
+        # LegacySolverFactory) see the same deferred plugins
+        f = Factory('test plugin')
+        f._cls = self.factory._cls
+        self.assertIn('a', f)
+        self.assertIn('a', dict.keys(self.factory._cls))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -74,6 +74,17 @@ class TestTiming(unittest.TestCase):
             r"[0-9\.]+ elapsed seconds",
         )
 
+    def test_construction_timer_mode(self):
+        m = ConcreteModel()
+        m.x = Var([1, 2])
+        a = ConstructionTimer(m.x, 'in parallel')
+        a.timer = 0
+        self.assertEqual(
+            str(a), "     0 seconds to construct Var x; 2 indices total (in parallel)"
+        )
+        a.mode = None
+        self.assertEqual(str(a), "     0 seconds to construct Var x; 2 indices total")
+
     def test_raw_transformation_timer(self):
         a = TransformationTimer(None)
         self.assertRegex(
@@ -120,12 +120,13 @@ class GeneralTimer(object):
 
 
 class ConstructionTimer(object):
-    __slots__ = ('obj', 'timer')
-    msg = "%6.*f seconds to construct %s %s%s"
+    __slots__ = ('obj', 'timer', 'mode')
+    msg = "%6.*f seconds to construct %s %s%s%s"
     in_progress = "ConstructionTimer object for %s %s; %0.3f elapsed seconds"
 
-    def __init__(self, obj):
+    def __init__(self, obj, mode=None):
         self.obj = obj
+        self.mode = mode
         self.timer = -default_timer()
 
     def report(self):
@@ -167,6 +168,7 @@ class ConstructionTimer(object):
             idx_label = ''
         if idx_label:
             idx_label = f'; {idx_label} total'
+        mode = '' if self.mode is None else f' ({self.mode})'
         try:
             _type = self.obj.ctype.__name__
         except AttributeError:
@@ -181,6 +183,7 @@ class ConstructionTimer(object):
             _type,
             self.name,
             idx_label,
+            mode,
         )
 
 
@@ -8,3 +8,10 @@
 #  rights in this software.
 #  This software is distributed under the 3-clause BSD License.
 #  ___________________________________________________________________________
+
+from pyomo.common.dependencies import import_subpackages_on_access
+
+# Contributed packages are imported when they are first accessed (e.g.,
+# pyomo.contrib.gdpopt)
+__getattr__ = import_subpackages_on_access(__name__)
+del import_subpackages_on_access
@@ -1703,4 +1703,4 @@ class SolverFactoryClass(Factory):
         return decorator
 
 
-SolverFactory = SolverFactoryClass()
+SolverFactory = SolverFactoryClass(group='pyomo.appsi.solvers')
@@ -23,13 +23,14 @@ from pyomo.core.expr.numvalue import nonpyomo_leaf_types, value
 from pyomo.core.expr.numvalue import is_fixed
 import pyomo.contrib.fbbt.interval as interval
 import math
-from pyomo.core.base.block import Block
+from pyomo.core.base.block import Block, _get_structure_cache
 from pyomo.core.base.constraint import Constraint
 from pyomo.core.base.expression import ExpressionData, ScalarExpression
 from pyomo.core.base.objective import ObjectiveData, ScalarObjective
 from pyomo.core.base.var import Var
 from pyomo.gdp import Disjunct
 import logging
+from pyomo.common.dependencies import numpy as np, numpy_available
 from pyomo.common.errors import InfeasibleConstraintException, PyomoException
 from pyomo.common.config import (
     ConfigDict,
@@ -38,7 +39,7 @@ from pyomo.common.config import (
     NonNegativeFloat,
     NonNegativeInt,
 )
-from pyomo.common.numeric_types import native_types
+from pyomo.common.numeric_types import native_numeric_types, native_types
 
 logger = logging.getLogger(__name__)
 
@@ -1052,6 +1053,67 @@ def _check_and_reset_bounds(var, lb, ub):
     return lb, ub
 
 
+def _tighten_var_bounds(var, lb, ub, integer_tol, feasibility_tol):
+    """
+    This function checks the bounds computed for a variable, rounds them
+    if the variable is discrete, and updates the bounds on the variable.
+    The (possibly adjusted) bounds are returned.
+    """
+    if lb > ub:
+        if lb - feasibility_tol > ub:
+            raise InfeasibleConstraintException(
+                'Lower bound ({1}) computed for variable {0} is larger than the computed upper bound ({2}).'.format(
+                    var, lb, ub
+                )
+            )
+        else:
+            """
+            If we reach this code, then lb > ub, but not by more than feasibility_tol.
+            Now we want to decrease lb slightly and increase ub slightly so that lb <= ub.
+            However, we also have to make sure we do not make lb lower than the original lower bound
+            and make sure we do not make ub larger than the original upper bound. This is what
+            _check_and_reset_bounds is for.
+            """
+            lb -= feasibility_tol
+            ub += feasibility_tol
+            lb, ub = _check_and_reset_bounds(var, lb, ub)
+    if lb == interval.inf:
+        raise InfeasibleConstraintException(
+            'Computed a lower bound of +inf for variable {0}'.format(var)
+        )
+    if ub == -interval.inf:
+        raise InfeasibleConstraintException(
+            'Computed an upper bound of -inf for variable {0}'.format(var)
+        )
+
+    if var.is_binary() or var.is_integer():
+        """
+        This bit of code has two purposes:
+        1) Improve the bounds on binary and integer variables with the fact that they are integer.
+        2) Account for roundoff error. If the lower bound of a binary variable comes back as
+           1e-16, the lower bound may actually be 0. This could potentially cause problems when
+           handing the problem to a MIP solver. Some solvers are robust to this, but some may not be
+           and may give the wrong solution. Even if the correct solution is found, this could
+           introduce numerical problems.
+        """
+        if lb > -interval.inf:
+            lb = max(math.floor(lb), math.ceil(lb - integer_tol))
+        if ub < interval.inf:
+            ub = min(math.ceil(ub), math.floor(ub + integer_tol))
+        """
+        We have to make sure we do not make lb lower than the original lower bound
+        and make sure we do not make ub larger than the original upper bound. This is what
+        _check_and_reset_bounds is for.
+        """
+        lb, ub = _check_and_reset_bounds(var, lb, ub)
+
+    if lb != -interval.inf:
+        var.setlb(lb)
+    if ub != interval.inf:
+        var.setub(ub)
+    return lb, ub
+
+
 def _before_constant(visitor, child):
     if child in visitor.bnds_dict:
         pass
@@ -1103,8 +1165,15 @@ def _before_external_function(visitor, child):
 
 
 def _register_new_before_child_handler(visitor, child):
+    return _get_before_child_handler(child)(visitor, child)
+
+
+def _get_before_child_handler(child):
     handlers = _before_child_handlers
     child_type = child.__class__
+    handler = handlers[child_type]
+    if handler is not _register_new_before_child_handler:
+        return handler
     if child_type in native_types:
         handlers[child_type] = _before_constant
     elif child.is_variable_type():
@@ -1113,7 +1182,7 @@ def _register_new_before_child_handler(visitor, child):
         handlers[child_type] = _before_NPV
     else:
         handlers[child_type] = _before_other
-    return handlers[child_type](visitor, child)
+    return handlers[child_type]
 
 
 _before_child_handlers = defaultdict(lambda: _register_new_before_child_handler)
@@ -1207,62 +1276,9 @@ class _FBBTVisitorRootToLeaf(ExpressionValueVisitor):
 
         if node.is_variable_type():
             lb, ub = self.bnds_dict[node]
-
-            lb, ub = self.bnds_dict[node]
-            if lb > ub:
-                if lb - self.feasibility_tol > ub:
-                    raise InfeasibleConstraintException(
-                        'Lower bound ({1}) computed for variable {0} is larger than the computed upper bound ({2}).'.format(
-                            node, lb, ub
-                        )
-                    )
-                else:
-                    """
-                    If we reach this code, then lb > ub, but not by more than feasibility_tol.
-                    Now we want to decrease lb slightly and increase ub slightly so that lb <= ub.
-                    However, we also have to make sure we do not make lb lower than the original lower bound
-                    and make sure we do not make ub larger than the original upper bound. This is what
-                    _check_and_reset_bounds is for.
-                    """
-                    lb -= self.feasibility_tol
-                    ub += self.feasibility_tol
-                    lb, ub = _check_and_reset_bounds(node, lb, ub)
-                    self.bnds_dict[node] = (lb, ub)
-            if lb == interval.inf:
-                raise InfeasibleConstraintException(
-                    'Computed a lower bound of +inf for variable {0}'.format(node)
-                )
-            if ub == -interval.inf:
-                raise InfeasibleConstraintException(
-                    'Computed an upper bound of -inf for variable {0}'.format(node)
-                )
-
-            if node.is_binary() or node.is_integer():
-                """
-                This bit of code has two purposes:
-                1) Improve the bounds on binary and integer variables with the fact that they are integer.
-                2) Account for roundoff error. If the lower bound of a binary variable comes back as
-                   1e-16, the lower bound may actually be 0. This could potentially cause problems when
-                   handing the problem to a MIP solver. Some solvers are robust to this, but some may not be
-                   and may give the wrong solution. Even if the correct solution is found, this could
-                   introduce numerical problems.
-                """
-                if lb > -interval.inf:
-                    lb = max(math.floor(lb), math.ceil(lb - self.integer_tol))
-                if ub < interval.inf:
-                    ub = min(math.ceil(ub), math.floor(ub + self.integer_tol))
-                """
-                We have to make sure we do not make lb lower than the original lower bound
-                and make sure we do not make ub larger than the original upper bound. This is what
-                _check_and_reset_bounds is for.
-                """
-                lb, ub = _check_and_reset_bounds(node, lb, ub)
-                self.bnds_dict[node] = (lb, ub)
-
-            if lb != -interval.inf:
-                node.setlb(lb)
-            if ub != interval.inf:
-                node.setub(ub)
+            self.bnds_dict[node] = _tighten_var_bounds(
+                node, lb, ub, self.integer_tol, self.feasibility_tol
+            )
             return True, None
 
         if not node.is_potentially_variable():
@@ -1294,7 +1310,425 @@ class _FBBTVisitorRootToLeaf(ExpressionValueVisitor):
         return False, None
 
 
-def _fbbt_con(con, config):
+class _FBBTTapeState(object):
+    """
+    The state used by the _FBBTVisitorLeafToRoot handlers when they are
+    called from an _FBBTTape (without walking the expression).
+    """
+
+    __slots__ = ('bnds_dict', 'integer_tol', 'feasibility_tol', 'ignore_fixed')
+
+    def __init__(
+        self, bnds_dict, integer_tol=1e-4, feasibility_tol=1e-8, ignore_fixed=False
+    ):
+        self.bnds_dict = bnds_dict
+        self.integer_tol = integer_tol
+        self.feasibility_tol = feasibility_tol
+        self.ignore_fixed = ignore_fixed
+
+
+class _FBBTTape(object):
+    """
+    A constraint expression "compiled" into the sequences of operations
+    performed by _FBBTVisitorLeafToRoot and _FBBTVisitorRootToLeaf.
+
+    Walking the expression tree is a significant part of the cost of
+    performing FBBT on a constraint, and _fbbt_block can perform FBBT
+    on the same constraint many times. The tape records the nodes in
+    the order the two walkers would visit them (including every
+    occurrence of repeated subexpressions), so replaying the tape
+    performs exactly the same interval arithmetic without walking the
+    tree.
+    """
+
+    __slots__ = ('expr', 'named', 'leaf_to_root', 'root_to_leaf', 'vars')
+
+    def __init__(self, expr):
+        self.expr = expr
+        # (named expression, expression) pairs. The tape is only valid
+        # as long as the named expressions are not modified.
+        self.named = []
+        # (handler, node, args) tuples, with the handlers called by
+        # _FBBTVisitorLeafToRoot (in the same order)
+        self.leaf_to_root = []
+        # the nodes visited by _FBBTVisitorRootToLeaf (in the same order)
+        self.root_to_leaf = []
+        # the unique variables in the expression
+        self.vars = []
+
+        leaf_to_root = self.leaf_to_root
+        root_to_leaf = self.root_to_leaf
+        seen_vars = set()
+        stack = [[expr, None, 0]]
+        while stack:
+            frame = stack[-1]
+            node, args, idx = frame
+            if args is None:
+                root_to_leaf.append(node)
+                handler = _get_before_child_handler(node)
+                if handler is not _before_other:
+                    leaf_to_root.append((handler, node, ()))
+                    if handler is _before_var and id(node) not in seen_vars:
+                        seen_vars.add(id(node))
+                        self.vars.append(node)
+                    stack.pop()
+                    continue
+                if node.is_named_expression_type():
+                    self.named.append((node, node.expr))
+                args = frame[1] = tuple(node.args)
+            if idx < len(args):
+                frame[2] = idx + 1
+                stack.append([args[idx], None, 0])
+            else:
+                stack.pop()
+                leaf_to_root.append(
+                    (_prop_bnds_leaf_to_root_map[node.__class__], node, args)
+                )
+
+    def is_current(self, expr):
+        """Return True if this tape is valid for the expression ``expr``"""
+        if expr is not self.expr:
+            return False
+        for named_expr, e in self.named:
+            if named_expr.expr is not e:
+                return False
+        return True
+
+
+def _linear_terms(expr, sign, terms, npv_terms):
+    """
+    Collect the terms of a linear expression (with constant
+    coefficients) into ``terms`` (a dict mapping id(var) to a [var,
+    coef] list) and the terms that are not potentially variable into
+    ``npv_terms`` (a list of (sign, expr) tuples). Returns the constant
+    term, or None if the expression is not linear.
+    """
+    const = 0
+    stack = [(expr, sign)]
+    while stack:
+        node, sign = stack.pop()
+        node_type = node.__class__
+        if node_type in native_numeric_types:
+            const += sign * node
+        elif node_type in native_types or not hasattr(node, 'is_expression_type'):
+            return None
+        elif node.is_variable_type():
+            if id(node) in terms:
+                terms[id(node)][1] += sign
+            else:
+                terms[id(node)] = [node, sign]
+        elif not node.is_potentially_variable():
+            npv_terms.append((sign, node))
+        elif node_type is numeric_expr.MonomialTermExpression:
+            coef, var = node.args
+            if coef.__class__ not in native_numeric_types:
+                return None
+            if id(var) in terms:
+                terms[id(var)][1] += sign * coef
+            else:
+                terms[id(var)] = [var, sign * coef]
+        elif (
+            node_type is numeric_expr.SumExpression
+            or node_type is numeric_expr.LinearExpression
+        ):
+            stack.extend((arg, sign) for arg in node.args)
+        elif node_type is numeric_expr.NegationExpression:
+            stack.append((node.args[0], -sign))
+        else:
+            return None
+    return const
+
+
+class _LinearRow(object):
+    """
+    A linear constraint, lb <= sum(coef * var) <= ub, where the bounds
+    are the constants lb and ub plus the current value of the
+    expressions in npv_terms.
+    """
+
+    __slots__ = ('vars', 'coefs', 'lb', 'ub', 'npv_terms', 'is_equality')
+
+    def __init__(self, terms, lb, ub, npv_terms, is_equality):
+        self.vars = []
+        self.coefs = []
+        for var, coef in terms.values():
+            if coef:
+                self.vars.append(var)
+                self.coefs.append(coef)
+        self.lb = lb
+        self.ub = ub
+        # (which, sign, expr) tuples, where which is 0 for terms in the
+        # body, 1 for terms in the lower bound, and 2 for terms in the
+        # upper bound
+        self.npv_terms = npv_terms
+        self.is_equality = is_equality
+
+
+def _linear_row(expr):
+    """
+    Return a _LinearRow for the relational expression ``expr``, or None
+    if the expression is not linear in the variables.
+    """
+    expr_type = expr.__class__
+    if expr_type is relational_expr.RangedExpression:
+        bounds = []
+        npv_terms = []
+        for which, arg in ((1, expr.arg(0)), (2, expr.arg(2))):
+            terms = {}
+            npv = []
+            bound = _linear_terms(arg, 1, terms, npv)
+            if bound is None or terms:
+                return None
+            bounds.append(bound)
+            npv_terms.extend((which, sign, e) for sign, e in npv)
+        lb, ub = bounds
+        terms = {}
+        npv = []
+        const = _linear_terms(expr.arg(1), 1, terms, npv)
+        is_equality = False
+    elif (
+        expr_type is relational_expr.EqualityExpression
+        or expr_type is relational_expr.InequalityExpression
+    ):
+        terms = {}
+        npv = []
+        const = _linear_terms(expr.arg(0), 1, terms, npv)
+        rhs_const = _linear_terms(expr.arg(1), -1, terms, npv)
+        if const is None or rhs_const is None:
+            return None
+        const += rhs_const
+        is_equality = expr_type is relational_expr.EqualityExpression
+        lb = 0 if is_equality else -interval.inf
+        ub = 0
+        npv_terms = []
+    else:
+        return None
+    if const is None:
+        return None
+    npv_terms.extend((0, sign, e) for sign, e in npv)
+    row = _LinearRow(terms, lb - const, ub - const, npv_terms, is_equality)
+    if not row.vars:
+        return None
+    return row
+
+
+class _LinearFBBT(object):
+    """
+    Feasibility based bounds tightening for a set of linear constraints.
+
+    The constraints are stored as a sparse (CSR) matrix so that the
+    bounds implied by all (or a subset) of the constraints can be
+    computed at once with NumPy. For each constraint, the activity
+    bounds (the bounds on sum(coef * var)) are accumulated separately
+    for the finite and infinite contributions, so that the bounds on
+    each term implied by the constraint bounds and the remaining terms
+    can be computed without forming the n-1 partial sums.
+    """
+
+    def __init__(self, cons, rows):
+        self.cons = cons
+        self.rows = rows
+        self.vars = []
+        self.var_index = {}
+        # list of rows containing each variable (indexed by id(var))
+        self.var_rows = {}
+        indptr = [0]
+        indices = []
+        coefs = []
+        for i, row in enumerate(rows):
+            for var, coef in zip(row.vars, row.coefs):
+                k = self.var_index.get(id(var), None)
+                if k is None:
+                    k = self.var_index[id(var)] = len(self.vars)
+                    self.vars.append(var)
+                    self.var_rows[id(var)] = []
+                self.var_rows[id(var)].append(i)
+                indices.append(k)
+                coefs.append(coef)
+            indptr.append(len(indices))
+        self.indptr = np.array(indptr, dtype=np.int64)
+        self.indices = np.array(indices, dtype=np.int64)
+        self.coefs = np.array(coefs, dtype=float)
+        self.row_index = np.repeat(
+            np.arange(len(rows), dtype=np.int64), np.diff(self.indptr)
+        )
+        self.const_lb = np.array([row.lb for row in rows], dtype=float)
+        self.const_ub = np.array([row.ub for row in rows], dtype=float)
+        self.is_equality = np.array([row.is_equality for row in rows], dtype=bool)
+        self.npv_terms = [
+            (i, which, sign, e)
+            for i, row in enumerate(rows)
+            for which, sign, e in row.npv_terms
+        ]
+        self.var_lb = None
+        self.var_ub = None
+        self.row_lb = None
+        self.row_ub = None
+        self.active = None
+
+    def load(self, config):
+        """Load the current variable bounds and constraint bounds"""
+        n = len(self.vars)
+        var_lb = np.empty(n)
+        var_ub = np.empty(n)
+        for k, v in enumerate(self.vars):
+            if v.fixed:
+                var_lb[k] = var_ub[k] = value(v.value)
+            else:
+                lb, ub = v.bounds
+                var_lb[k] = -interval.inf if lb is None else lb
+                var_ub[k] = interval.inf if ub is None else ub
+        bad = np.nonzero(var_lb - config.feasibility_tol > var_ub)[0]
+        if len(bad):
+            raise InfeasibleConstraintException(
+                'Variable has a lower bound that is larger than its '
+                'upper bound: {0}'.format(str(self.vars[bad[0]]))
+            )
+        self.var_lb = var_lb
+        self.var_ub = var_ub
+
+        self.row_lb = self.const_lb.copy()
+        self.row_ub = self.const_ub.copy()
+        for i, which, sign, e in self.npv_terms:
+            val = sign * value(e)
+            if which != 2:
+                self.row_lb[i] += val if which else -val
+            if which != 1:
+                self.row_ub[i] += val if which else -val
+        self.active = np.ones(len(self.rows), dtype=bool)
+
+    def update_var_bounds(self, new_var_bounds):
+        """Record variable bounds computed outside of this object"""
+        var_index = self.var_index
+        for v, (lb, ub) in new_var_bounds.items():
+            k = var_index.get(id(v), None)
+            if k is not None:
+                self.var_lb[k] = -interval.inf if lb is None else lb
+                self.var_ub[k] = interval.inf if ub is None else ub
+
+    def get_var_bounds(self):
+        """Return a ComponentMap of the bounds on all variables"""
+        ans = ComponentMap()
+        for v, lb, ub in zip(self.vars, self.var_lb.tolist(), self.var_ub.tolist()):
+            ans[v] = (
+                None if lb == -interval.inf else lb,
+                None if ub == interval.inf else ub,
+            )
+        return ans
+
+    def fbbt(self, rows, config):
+        """
+        Perform FBBT on the (active) constraints with the specified
+        indices (or all constraints if rows is None). Returns a
+        ComponentMap with the new bounds for each variable whose bounds
+        improved.
+        """
+        inf = interval.inf
+        tol = config.feasibility_tol
+        if rows is None:
+            rows = np.nonzero(self.active)[0]
+            entries = np.nonzero(self.active[self.row_index])[0]
+        else:
+            rows = np.asarray(rows, dtype=np.int64)
+            rows = rows[self.active[rows]]
+            start = self.indptr[rows]
+            length = self.indptr[rows + 1] - start
+            offset = np.cumsum(length) - length
+            entries = np.repeat(start - offset, length) + np.arange(
+                length.sum(), dtype=np.int64
+            )
+        n_rows = len(rows)
+        # the position (in rows) of the row containing each entry
+        row_pos = np.repeat(
+            np.arange(n_rows, dtype=np.int64), np.diff(self.indptr)[rows]
+        )
+        coefs = self.coefs[entries]
+        cols = self.indices[entries]
+        var_lb = self.var_lb[cols]
+        var_ub = self.var_ub[cols]
+
+        # bounds on each term
+        pos = coefs > 0
+        term_lb = np.where(pos, coefs * var_lb, coefs * var_ub)
+        term_ub = np.where(pos, coefs * var_ub, coefs * var_lb)
+        lb_inf = term_lb == -inf
+        ub_inf = term_ub == inf
+        min_finite = np.bincount(row_pos, np.where(lb_inf, 0, term_lb), n_rows)
+        max_finite = np.bincount(row_pos, np.where(ub_inf, 0, term_ub), n_rows)
+        n_min_inf = np.bincount(row_pos, lb_inf, n_rows)
+        n_max_inf = np.bincount(row_pos, ub_inf, n_rows)
+        min_activity = np.where(n_min_inf > 0, -inf, min_finite)
+        max_activity = np.where(n_max_inf > 0, inf, max_finite)
+
+        row_lb = self.row_lb[rows]
+        row_ub = self.row_ub[rows]
+        feasible = (min_activity <= row_ub + tol) & (max_activity >= row_lb - tol)
+        if not feasible.all():
+            i = rows[np.argmin(feasible)]
+            raise InfeasibleConstraintException(
+                'Detected an infeasible constraint during FBBT: {0}'.format(
+                    str(self.cons[i])
+                )
+            )
+        if config.deactivate_satisfied_constraints:
+            with np.errstate(invalid='ignore'):
+                satisfied = np.where(
+                    self.is_equality[rows],
+                    (max_activity - min_activity <= tol)
+                    & (np.abs(min_activity - row_lb) <= tol),
+                    (max_activity <= row_ub + tol) & (min_activity >= row_lb - tol),
+                )
+            for i in rows[satisfied].tolist():
+                self.cons[i].deactivate()
+                self.active[i] = False
+
+        # bounds on the sum of the other terms in the row
+        others_max = np.where(
+            n_max_inf[row_pos] == 0,
+            max_finite[row_pos] - term_ub,
+            np.where((n_max_inf[row_pos] == 1) & ub_inf, max_finite[row_pos], inf),
+        )
+        others_min = np.where(
+            n_min_inf[row_pos] == 0,
+            min_finite[row_pos] - term_lb,
+            np.where((n_min_inf[row_pos] == 1) & lb_inf, min_finite[row_pos], -inf),
+        )
+        # bounds on each term implied by the constraint
+        term_lb = np.maximum(term_lb, row_lb[row_pos] - others_max)
+        term_ub = np.minimum(term_ub, row_ub[row_pos] - others_min)
+        # ... and the resulting bounds on the variables
+        inv = 1.0 / coefs
+        new_lb = np.where(pos, term_lb * inv, term_ub * inv)
+        new_ub = np.where(pos, term_ub * inv, term_lb * inv)
+        # (interval.inv does not provide bounds for tiny coefficients)
+        tiny = np.abs(coefs) <= tol
+        new_lb[tiny] = -inf
+        new_ub[tiny] = inf
+
+        var_lb = self.var_lb.copy()
+        var_ub = self.var_ub.copy()
+        np.maximum.at(var_lb, cols, new_lb)
+        np.minimum.at(var_ub, cols, new_ub)
+        improved = np.nonzero((var_lb > self.var_lb) | (var_ub < self.var_ub))[0]
+
+        new_var_bounds = ComponentMap()
+        for k, lb, ub in zip(
+            improved.tolist(), var_lb[improved].tolist(), var_ub[improved].tolist()
+        ):
+            v = self.vars[k]
+            lb, ub = _tighten_var_bounds(
+                v, lb, ub, config.integer_tol, config.feasibility_tol
+            )
+            self.var_lb[k] = lb
+            self.var_ub[k] = ub
+            new_var_bounds[v] = (
+                None if lb == -interval.inf else lb,
+                None if ub == interval.inf else ub,
+            )
+        return new_var_bounds
+
+
+def _fbbt_con(con, config, tape=None):
     """
     Feasibility based bounds tightening for a constraint. This function attempts to improve the bounds of each variable
     in the constraint based on the bounds of the constraint and the bounds of the other variables in the constraint.
@@ -1317,6 +1751,9 @@ def _fbbt_con(con, config):
         constraint on which to perform fbbt
     config: ConfigDict
         see documentation for fbbt
+    tape: _FBBTTape
+        If provided, the (current) tape for the constraint expression,
+        which is used instead of walking the expression
 
     Returns
     -------
@@ -1332,8 +1769,15 @@ def _fbbt_con(con, config):
     )  # a dictionary to store the bounds of every node in the tree
 
     # a walker to propagate bounds from the variables to the root
-    visitorA = _FBBTVisitorLeafToRoot(bnds_dict, feasibility_tol=config.feasibility_tol)
-    visitorA.walk_expression(con.expr)
+    if tape is None:
+        visitorA = _FBBTVisitorLeafToRoot(
+            bnds_dict, feasibility_tol=config.feasibility_tol
+        )
+        visitorA.walk_expression(con.expr)
+    else:
+        visitorA = _FBBTTapeState(bnds_dict, feasibility_tol=config.feasibility_tol)
+        for handler, node, args in tape.leaf_to_root:
+            handler(visitorA, node, *args)
 
     always_feasible, possibly_feasible = bnds_dict[con.expr]
 
@@ -1353,9 +1797,22 @@ def _fbbt_con(con, config):
         integer_tol=config.integer_tol,
         feasibility_tol=config.feasibility_tol,
     )
-    visitorB.dfs_postorder_stack(con.expr)
+    if tape is None:
+        visitorB.dfs_postorder_stack(con.expr)
+    else:
+        for node in tape.root_to_leaf:
+            visitorB.visiting_potential_leaf(node)
 
     new_var_bounds = ComponentMap()
+    if tape is not None:
+        for v in tape.vars:
+            lb, ub = bnds_dict[v]
+            if lb == -interval.inf:
+                lb = None
+            if ub == interval.inf:
+                ub = None
+            new_var_bounds[v] = (lb, ub)
+        return new_var_bounds
     for _node, _bnds in bnds_dict.items():
         if _node.__class__ in nonpyomo_leaf_types:
             continue
@@ -1369,6 +1826,27 @@ def _fbbt_con(con, config):
     return new_var_bounds
 
 
+def _update_improved_vars(
+    _new_var_bounds, new_var_bounds, var_lbs, var_ubs, improved_vars, config
+):
+    """
+    Record the bounds returned by _fbbt_con (or _LinearFBBT.fbbt) and
+    collect the variables whose bounds improved by more than
+    improvement_tol.
+    """
+    new_var_bounds.update(_new_var_bounds)
+    for v, bnds in _new_var_bounds.items():
+        vlb, vub = bnds
+        if vlb is not None:
+            if vlb > var_lbs[v] + config.improvement_tol:
+                improved_vars.add(v)
+                var_lbs[v] = vlb
+        if vub is not None:
+            if vub < var_ubs[v] - config.improvement_tol:
+                improved_vars.add(v)
+                var_ubs[v] = vub
+
+
 def _fbbt_block(m, config):
     """
     Feasibility based bounds tightening (FBBT) for a block or model. This
@@ -1380,6 +1858,13 @@ def _fbbt_block(m, config):
     This process is continued until no variable bounds are improved
     by more than tol.
 
+    Each constraint is compiled once into an _FBBTTape, and (if numpy
+    is available) the linear constraints are collected into a
+    _LinearFBBT object that performs FBBT on all of them at once. Both
+    are cached on the block and reused by subsequent calls until a
+    component is added to or removed from the model (or the
+    constraint expression changes).
+
     Parameters
     ----------
     m: pyomo.core.base.block.Block or pyomo.core.base.PyomoModel.ConcreteModel
@@ -1396,11 +1881,30 @@ def _fbbt_block(m, config):
     var_to_con_map = ComponentMap()
     var_lbs = ComponentMap()
     var_ubs = ComponentMap()
-    n_cons = 0
+
+    cache = _get_structure_cache(m, '_fbbt_cache')
+    tapes = cache.setdefault('tapes', {})
+    nonlinear_cons = []
+    linear_cons = []
+    linear_rows = []
     for c in m.component_data_objects(
         ctype=Constraint, active=True, descend_into=config.descend_into, sort=True
     ):
-        for v in identify_variables(c.expr):
+        entry = tapes.get(id(c), None)
+        if entry is None or entry[0] is not c or not entry[1].is_current(c.expr):
+            tape = _FBBTTape(c.expr)
+            entry = tapes[id(c)] = (
+                c,
+                tape,
+                _linear_row(c.expr) if numpy_available else None,
+            )
+        c, tape, row = entry
+        if row is not None:
+            linear_cons.append(c)
+            linear_rows.append(row)
+            continue
+        nonlinear_cons.append((c, tape))
+        for v in tape.vars:
             if v not in var_to_con_map:
                 var_to_con_map[v] = list()
             if v.lb is None:
@@ -1411,8 +1915,27 @@ def _fbbt_block(m, config):
                 var_ubs[v] = interval.inf
             else:
                 var_ubs[v] = v.ub
-            var_to_con_map[v].append(c)
-        n_cons += 1
+            var_to_con_map[v].append((c, tape))
+    n_cons = len(nonlinear_cons) + len(linear_cons)
+
+    linear = None
+    if linear_rows:
+        linear = cache.get('linear', None)
+        if (
+            linear is None
+            or len(linear.rows) != len(linear_rows)
+            or any(r1 is not r2 for r1, r2 in zip(linear.rows, linear_rows))
+        ):
+            linear = cache['linear'] = _LinearFBBT(linear_cons, linear_rows)
+        for v in linear.vars:
+            if v.lb is None:
+                var_lbs[v] = -interval.inf
+            else:
+                var_lbs[v] = v.lb
+            if v.ub is None:
+                var_ubs[v] = interval.inf
+            else:
+                var_ubs[v] = v.ub
 
     for _v in m.component_data_objects(
         ctype=Var, active=True, descend_into=True, sort=True
@@ -1425,42 +1948,51 @@ def _fbbt_block(m, config):
     n_fbbt = 0
 
     improved_vars = ComponentSet()
-    for c in m.component_data_objects(
-        ctype=Constraint, active=True, descend_into=config.descend_into, sort=True
-    ):
-        _new_var_bounds = _fbbt_con(c, config)
+    if linear is not None:
+        linear.load(config)
+        _new_var_bounds = linear.fbbt(None, config)
+        n_fbbt += len(linear_cons)
+        _update_improved_vars(
+            _new_var_bounds, new_var_bounds, var_lbs, var_ubs, improved_vars, config
+        )
+    for c, tape in nonlinear_cons:
+        _new_var_bounds = _fbbt_con(c, config, tape)
         n_fbbt += 1
-        new_var_bounds.update(_new_var_bounds)
-        for v, bnds in _new_var_bounds.items():
-            vlb, vub = bnds
-            if vlb is not None:
-                if vlb > var_lbs[v] + config.improvement_tol:
-                    improved_vars.add(v)
-                    var_lbs[v] = vlb
-            if vub is not None:
-                if vub < var_ubs[v] - config.improvement_tol:
-                    improved_vars.add(v)
-                    var_ubs[v] = vub
-
-    while len(improved_vars) > 0:
+        if linear is not None:
+            linear.update_var_bounds(_new_var_bounds)
+        _update_improved_vars(
+            _new_var_bounds, new_var_bounds, var_lbs, var_ubs, improved_vars, config
+        )
+
+    # Constraints are revisited one variable at a time, except for the
+    # linear constraints, which are collected and revisited together
+    # once no variables remain.
+    linear_worklist = set()
+    while len(improved_vars) > 0 or len(linear_worklist) > 0:
         if n_fbbt >= n_cons * config.max_iter:
             break
+        if len(improved_vars) == 0:
+            _new_var_bounds = linear.fbbt(sorted(linear_worklist), config)
+            n_fbbt += len(linear_worklist)
+            linear_worklist.clear()
+            _update_improved_vars(
+                _new_var_bounds, new_var_bounds, var_lbs, var_ubs, improved_vars, config
+            )
+            continue
         v = improved_vars.pop()
-        for c in var_to_con_map[v]:
-            _new_var_bounds = _fbbt_con(c, config)
+        if linear is not None:
+            linear_worklist.update(linear.var_rows.get(id(v), ()))
+        for c, tape in var_to_con_map.get(v, ()):
+            _new_var_bounds = _fbbt_con(c, config, tape)
             n_fbbt += 1
-            new_var_bounds.update(_new_var_bounds)
-            for _v, bnds in _new_var_bounds.items():
-                _vlb, _vub = bnds
-                if _vlb is not None:
-                    if _vlb > var_lbs[_v] + config.improvement_tol:
-                        improved_vars.add(_v)
-                        var_lbs[_v] = _vlb
-                if _vub is not None:
-                    if _vub < var_ubs[_v] - config.improvement_tol:
-                        improved_vars.add(_v)
-                        var_ubs[_v] = _vub
+            if linear is not None:
+                linear.update_var_bounds(_new_var_bounds)
+            _update_improved_vars(
+                _new_var_bounds, new_var_bounds, var_lbs, var_ubs, improved_vars, config
+            )
 
+    if linear is not None:
+        new_var_bounds.update(linear.get_var_bounds())
     return new_var_bounds
 
 
@@ -1536,7 +2068,7 @@ def fbbt(
     if comp.ctype == Constraint:
         if comp.is_indexed():
             for _c in comp.values():
-                _new_var_bounds = _fbbt_con(comp, config)
+                _new_var_bounds = _fbbt_con(_c, config)
                 new_var_bounds.update(_new_var_bounds)
         else:
             _new_var_bounds = _fbbt_con(comp, config)
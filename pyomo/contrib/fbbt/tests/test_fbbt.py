@@ -1390,3 +1390,105 @@ class TestFBBT(FbbtTestBase, unittest.TestCase):
                     _before_child_handlers.pop(t, None)
                 else:
                     _before_child_handlers[t] = fcn
+
+    def test_indexed_constraint(self):
+        m = pyo.ConcreteModel()
+        m.x = pyo.Var([1, 2], bounds=(0, 4))
+        m.y = pyo.Var()
+        m.c = pyo.Constraint([1, 2], rule=lambda m, i: m.y == m.x[i] ** 2)
+        fbbt(m.c)
+        self.assertEqual(m.y.bounds, (0, 16))
+
+    def test_tapes_reused(self):
+        m = pyo.ConcreteModel()
+        m.x = pyo.Var(bounds=(-1, 1))
+        m.y = pyo.Var()
+        m.z = pyo.Var()
+        m.c1 = pyo.Constraint(expr=m.x**2 + m.y == 3)
+        m.c2 = pyo.Constraint(expr=pyo.exp(m.x) <= m.z)
+        self.tightener(m)
+        self.assertAlmostEqual(m.y.lb, 2)
+        self.assertAlmostEqual(m.y.ub, 3)
+        tapes = dict(m._fbbt_cache['tapes'])
+        self.assertEqual(len(tapes), 2)
+
+        m.x.setlb(0)
+        m.y.setlb(None)
+        m.y.setub(None)
+        self.tightener(m)
+        self.assertAlmostEqual(m.y.lb, 2)
+        self.assertAlmostEqual(m.y.ub, 3)
+        self.assertAlmostEqual(m.z.lb, 1)
+        for key, entry in m._fbbt_cache['tapes'].items():
+            self.assertIs(entry, tapes[key])
+
+        # Changing the constraint expression recompiles its tape
+        m.c1.set_value(m.x**2 + m.y == 5)
+        m.y.setlb(None)
+        m.y.setub(None)
+        self.tightener(m)
+        self.assertAlmostEqual(m.y.lb, 4)
+        self.assertAlmostEqual(m.y.ub, 5)
+        self.assertIsNot(m._fbbt_cache['tapes'][id(m.c1)], tapes[id(m.c1)])
+        self.assertIs(m._fbbt_cache['tapes'][id(m.c2)], tapes[id(m.c2)])
+
+        # As does changing a named expression
+        m.e = pyo.Expression(expr=m.x)
+        m.w = pyo.Var()
+        m.c3 = pyo.Constraint(expr=m.w == m.e**2)
+        self.tightener(m)
+        self.assertEqual(m.w.bounds, (0, 1))
+        m.e.expr = m.x + 2
+        m.w.setlb(None)
+        m.w.setub(None)
+        self.tightener(m)
+        self.assertEqual(m.w.bounds, (4, 9))
+
+    def test_tapes_not_cloned(self):
+        m = pyo.ConcreteModel()
+        m.x = pyo.Var(bounds=(-1, 1))
+        m.y = pyo.Var()
+        m.c = pyo.Constraint(expr=m.x**2 + m.y == 3)
+        self.tightener(m)
+        m2 = m.clone()
+        self.assertEqual(len(m2._fbbt_cache), 0)
+        m2.x.setlb(0.5)
+        self.tightener(m2)
+        self.assertAlmostEqual(m2.y.ub, 2.75)
+        self.assertIs(m2._fbbt_cache['tapes'][id(m2.c)][0], m2.c)
+
+    @unittest.skipUnless(numpy_available, 'Test requires numpy')
+    def test_linear_constraints(self):
+        m = pyo.ConcreteModel()
+        m.I = pyo.RangeSet(5)
+        m.p = pyo.Param(initialize=10, mutable=True)
+        m.x = pyo.Var(m.I, bounds=(0, None))
+        m.y = pyo.Var(domain=pyo.Integers)
+        m.sum = pyo.Constraint(expr=sum(m.x[i] for i in m.I) <= m.p)
+        m.link = pyo.Constraint(expr=pyo.inequality(-m.p, 2 * m.x[1] - m.y, 3))
+        m.z = pyo.Var()
+        m.nl = pyo.Constraint(expr=pyo.exp(m.z) <= m.x[2] + 1)
+        self.tightener(m)
+        linear = m._fbbt_cache['linear']
+        self.assertEqual(linear.cons, [m.link, m.sum])
+        for i in m.I:
+            self.assertEqual(m.x[i].lb, 0)
+            self.assertAlmostEqual(m.x[i].ub, 10)
+        self.assertEqual(m.y.lb, -3)
+        self.assertEqual(m.y.ub, 30)
+        self.assertAlmostEqual(m.z.ub, math.log(11))
+
+        # The mutable Params are re-evaluated on every call
+        m.p = 4
+        self.tightener(m)
+        self.assertIs(m._fbbt_cache['linear'], linear)
+        self.assertAlmostEqual(m.x[1].ub, 4)
+        self.assertEqual(m.y.ub, 12)
+        self.assertAlmostEqual(m.z.ub, math.log(5))
+
+        m.p = -1
+        with self.assertRaisesRegex(
+            InfeasibleConstraintException,
+            'Detected an infeasible constraint during FBBT: sum',
+        ):
+            self.tightener(m)
@@ -17,7 +17,7 @@ from .scc_solver import (
     solve_strongly_connected_components,
 )
 from .incidence import get_incident_variables
-from .config import IncidenceMethod
+from .config import IncidenceMethod, IncidenceBackend
 
 #
 # declare deprecation paths for removed modules
@@ -11,7 +11,7 @@
 """Configuration options for incidence graph generation"""
 
 import enum
-from pyomo.common.config import ConfigDict, ConfigValue, InEnum
+from pyomo.common.config import ConfigDict, ConfigValue, InEnum, PositiveInt
 from pyomo.common.modeling import NOTSET
 from pyomo.repn.ampl import AMPLRepnVisitor
 from pyomo.repn.util import FileDeterminism, FileDeterminism_to_SortComponents
@@ -35,6 +35,19 @@ class IncidenceMethod(enum.Enum):
     """Use ``pyomo.repn.ampl.AMPLRepnVisitor``"""
 
 
+class IncidenceBackend(enum.Enum):
+    """Data structures and algorithms used to store and analyze the
+    incidence graph"""
+
+    networkx = 0
+    """Store the incidence graph as a ``networkx.Graph`` and use NetworkX
+    graph algorithms"""
+
+    scipy = 1
+    """Store the incidence graph as a SciPy sparse (CSR) incidence matrix
+    and use ``scipy.sparse.csgraph`` algorithms"""
+
+
 class IncidenceOrder(enum.Enum):
 
     dulmage_mendelsohn_upper = 0
@@ -71,6 +84,29 @@ _method = ConfigValue(
 )
 
 
+_backend = ConfigValue(
+    default=IncidenceBackend.networkx,
+    domain=InEnum(IncidenceBackend),
+    description="Data structure used to store the incidence graph",
+    doc=(
+        "Backend used by IncidenceGraphInterface to store and analyze the"
+        " incidence graph. Must be a value of the IncidenceBackend enum."
+    ),
+)
+
+
+_max_workers = ConfigValue(
+    default=None,
+    domain=PositiveInt,
+    description="Number of processes used to extract incidence",
+    doc=(
+        "Maximum number of worker processes used to identify the variables"
+        " incident on lists of constraints when constructing an incidence"
+        " graph. By default, incidence is extracted in the current process."
+    ),
+)
+
+
 def _amplrepnvisitor_validator(visitor):
     if not isinstance(visitor, AMPLRepnVisitor):
         raise TypeError(
@@ -95,6 +131,10 @@ IncidenceConfig = ConfigDict()
   should be included.
 - ``method`` -- Method used to identify incident variables. Must be a value of the
   ``IncidenceMethod`` enum.
+- ``backend`` -- Data structure used by ``IncidenceGraphInterface`` to store and
+  analyze the incidence graph. Must be a value of the ``IncidenceBackend`` enum.
+- ``max_workers`` -- Maximum number of worker processes used to extract the
+  incidence of large lists of constraints (see ``get_incidence_coo``).
 - ``_ampl_repn_visitor`` -- Expression visitor used to generate ``AMPLRepn`` of each
   constraint. Must be an instance of ``AMPLRepnVisitor``. *This option is constructed
   automatically when needed and should not be set by users!*
@@ -111,6 +151,12 @@ IncidenceConfig.declare("linear_only", _linear_only)
 IncidenceConfig.declare("method", _method)
 
 
+IncidenceConfig.declare("backend", _backend)
+
+
+IncidenceConfig.declare("max_workers", _max_workers)
+
+
 IncidenceConfig.declare("_ampl_repn_visitor", _ampl_repn_visitor)
 
 
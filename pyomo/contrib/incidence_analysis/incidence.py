@@ -10,8 +10,11 @@
 #  ___________________________________________________________________________
 """Functionality for identifying variables that participate in expressions"""
 
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 from contextlib import nullcontext
 
+from pyomo.common.dependencies import numpy as np
 from pyomo.core.expr.visitor import identify_variables
 from pyomo.core.expr.numvalue import value as pyo_value
 from pyomo.repn import generate_standard_repn
@@ -25,18 +28,30 @@ from pyomo.contrib.incidence_analysis.config import (
 #
 # Handlers for different methods of generating the incidence graph
 #
-def _get_incident_via_identify_variables(expr, include_fixed):
+def _get_incident_via_identify_variables(
+    expr, include_fixed, named_expression_cache=None
+):
     # Note that identify_variables will not identify the same variable
     # more than once.
-    return list(identify_variables(expr, include_fixed=include_fixed))
+    return list(
+        identify_variables(
+            expr,
+            include_fixed=include_fixed,
+            named_expression_cache=named_expression_cache,
+        )
+    )
 
 
 def _get_incident_via_standard_repn(
-    expr, include_fixed, linear_only, compute_values=False
+    expr, include_fixed, linear_only, compute_values=False, named_expression_cache=None
 ):
     if include_fixed:
         to_unfix = [
-            var for var in identify_variables(expr, include_fixed=True) if var.fixed
+            var
+            for var in identify_variables(
+                expr, include_fixed=True, named_expression_cache=named_expression_cache
+            )
+            if var.fixed
         ]
         context = TemporarySubsystemManager(to_unfix=to_unfix)
     else:
@@ -155,6 +170,18 @@ def get_incident_variables(expr, **kwds):
 
     """
     config = get_config_from_kwds(**kwds)
+    return _get_incidence_function(config)(expr)
+
+
+def _get_incidence_function(config, named_expression_cache=None):
+    """Validate the options in an ``IncidenceConfig`` and return a function
+    that maps an expression to the list of its incident variables
+
+    If a ``named_expression_cache`` dict is provided, the variables found
+    in named expressions are cached there and re-used by every call to
+    the returned function (when the method supports it).
+
+    """
     method = config.method
     include_fixed = config.include_fixed
     linear_only = config.linear_only
@@ -173,19 +200,208 @@ def get_incident_variables(expr, **kwds):
 
     # Dispatch to correct method
     if method is IncidenceMethod.identify_variables:
-        return _get_incident_via_identify_variables(expr, include_fixed)
+        return lambda expr: _get_incident_via_identify_variables(
+            expr, include_fixed, named_expression_cache
+        )
     elif method is IncidenceMethod.standard_repn:
-        return _get_incident_via_standard_repn(
-            expr, include_fixed, linear_only, compute_values=False
+        return lambda expr: _get_incident_via_standard_repn(
+            expr,
+            include_fixed,
+            linear_only,
+            compute_values=False,
+            named_expression_cache=named_expression_cache,
         )
     elif method is IncidenceMethod.standard_repn_compute_values:
-        return _get_incident_via_standard_repn(
-            expr, include_fixed, linear_only, compute_values=True
+        return lambda expr: _get_incident_via_standard_repn(
+            expr,
+            include_fixed,
+            linear_only,
+            compute_values=True,
+            named_expression_cache=named_expression_cache,
         )
     elif method is IncidenceMethod.ampl_repn:
-        return _get_incident_via_ampl_repn(expr, linear_only, amplrepnvisitor)
+        # Note that the visitor caches named expressions in its
+        # subexpression_cache
+        return lambda expr: _get_incident_via_ampl_repn(
+            expr, linear_only, amplrepnvisitor
+        )
     else:
         raise ValueError(
             f"Unrecognized value {method} for the method used to identify incident"
             f" variables. See the IncidenceMethod enum for valid methods."
         )
+
+
+# Data used by incidence extraction worker processes.  This is set by
+# _initialize_incidence_worker in each (forked) worker process.
+_worker_data = None
+
+
+def _initialize_incidence_worker(exprs, config, var_col_map):
+    global _worker_data
+    _worker_data = (exprs, config, var_col_map)
+
+
+def _get_incidence_of_chunk(start, stop):
+    """Return the rows and variable keys of the incidence of
+    ``exprs[start:stop]`` in a worker process
+
+    Workers are forked from the process that owns the model, so the
+    ``id()`` of every variable is the same in the worker and the parent.
+    If the column of each variable is known, we return columns;
+    otherwise we return variable ids and let the parent assign columns.
+
+    """
+    exprs, config, var_col_map = _worker_data
+    get_incident = _get_incidence_function(config, {})
+    rows = []
+    keys = []
+    for i in range(start, stop):
+        if var_col_map is None:
+            keys.extend(id(v) for v in get_incident(exprs[i]))
+        else:
+            keys.extend(
+                var_col_map[id(v)]
+                for v in get_incident(exprs[i])
+                if id(v) in var_col_map
+            )
+        rows.extend([i] * (len(keys) - len(rows)))
+    return np.array(rows, dtype=np.int64), np.array(keys, dtype=np.int64)
+
+
+def _get_incidence_in_workers(exprs, config, var_col_map, max_workers):
+    n_exprs = len(exprs)
+    # A few chunks per worker balances the load without too much overhead
+    chunksize = max(1, -(-n_exprs // (4 * max_workers)))
+    # Workers must be forked so that they share the model (and the ids of
+    # its variables) with this process.  Note that initargs are not
+    # pickled by the fork context.
+    with ProcessPoolExecutor(
+        max_workers,
+        mp_context=multiprocessing.get_context("fork"),
+        initializer=_initialize_incidence_worker,
+        initargs=(exprs, config, var_col_map),
+    ) as executor:
+        futures = [
+            executor.submit(
+                _get_incidence_of_chunk, start, min(start + chunksize, n_exprs)
+            )
+            for start in range(0, n_exprs, chunksize)
+        ]
+        results = [future.result() for future in futures]
+    rows = np.concatenate([r for r, _ in results] + [np.zeros(0, dtype=np.int64)])
+    keys = np.concatenate([k for _, k in results] + [np.zeros(0, dtype=np.int64)])
+    return rows, keys
+
+
+def get_incidence_coo(exprs, variables=None, **kwds):
+    """Get the incidence of a list of expressions in coordinate format
+
+    This is equivalent to calling ``get_incident_variables`` on every
+    expression, but the keyword arguments are processed once, named
+    expressions that are shared between expressions are only expanded
+    once (except with the ``standard_repn`` methods, which must expand
+    them in every expression), and, if ``max_workers`` is greater than
+    one, the expressions are processed in chunks by a pool of worker
+    processes.  Worker processes are only supported on platforms that
+    can ``fork``; on other platforms the expressions are processed
+    in the current process.
+
+    Keyword arguments must be valid options for ``IncidenceConfig``.
+
+    Parameters
+    ----------
+    exprs: list of ``NumericExpression``
+        Expressions to search for variables
+    variables: list of VarData, optional
+        Variables that define the columns of the incidence. Variables
+        that are not in this list are ignored. By default, the columns
+        are the incident variables, in the order in which they are
+        encountered.
+
+    Returns
+    -------
+    rows: ``numpy.ndarray``
+        Index of the expression of each incidence
+    cols: ``numpy.ndarray``
+        Index of the variable of each incidence
+    variables: list of VarData
+        The variables corresponding to the columns
+
+    Example
+    -------
+
+    .. doctest::
+       :skipif: not numpy_available
+
+       >>> import pyomo.environ as pyo
+       >>> from pyomo.contrib.incidence_analysis.incidence import get_incidence_coo
+       >>> m = pyo.ConcreteModel()
+       >>> m.x = pyo.Var([1, 2, 3])
+       >>> rows, cols, variables = get_incidence_coo(
+       ...     [m.x[1] + m.x[3], m.x[2]**2, m.x[3] * m.x[1]]
+       ... )
+       >>> print(list(zip(rows.tolist(), cols.tolist())))
+       [(0, 0), (0, 1), (1, 2), (2, 1), (2, 0)]
+       >>> print([v.name for v in variables])
+       ['x[1]', 'x[3]', 'x[2]']
+
+    """
+    config = get_config_from_kwds(**kwds)
+    # Validate the options before doing any work
+    get_incident = _get_incidence_function(config, {})
+    exprs = list(exprs)
+    if variables is not None:
+        variables = list(variables)
+        var_col_map = {id(v): i for i, v in enumerate(variables)}
+    else:
+        var_col_map = None
+
+    max_workers = config.max_workers
+    if (
+        max_workers is not None
+        and max_workers > 1
+        and len(exprs) > 1
+        and "fork" in multiprocessing.get_all_start_methods()
+    ):
+        rows, keys = _get_incidence_in_workers(exprs, config, var_col_map, max_workers)
+        if variables is not None:
+            return rows, keys, variables
+        # Assign columns in the order in which variables are first
+        # encountered, then recover the variable objects from the
+        # expressions where they first appear.
+        ids, first, inverse = np.unique(keys, return_index=True, return_inverse=True)
+        order = np.argsort(first, kind="stable")
+        col = np.empty(len(ids), dtype=np.int64)
+        col[order] = np.arange(len(ids))
+        cols = col[inverse.ravel()]
+        var_by_id = {}
+        cache = {}
+        for i in np.unique(rows[first]).tolist():
+            for v in identify_variables(
+                exprs[i], include_fixed=True, named_expression_cache=cache
+            ):
+                var_by_id[id(v)] = v
+        variables = [var_by_id[v_id] for v_id in ids[order].tolist()]
+        return rows, cols, variables
+
+    rows = []
+    cols = []
+    if variables is None:
+        variables = []
+        var_col_map = {}
+        for i, expr in enumerate(exprs):
+            for v in get_incident(expr):
+                v_id = id(v)
+                if v_id not in var_col_map:
+                    var_col_map[v_id] = len(variables)
+                    variables.append(v)
+                cols.append(var_col_map[v_id])
+            rows.extend([i] * (len(cols) - len(rows)))
+    else:
+        for i, expr in enumerate(exprs):
+            cols.extend(
+                var_col_map[id(v)] for v in get_incident(expr) if id(v) in var_col_map
+            )
+            rows.extend([i] * (len(cols) - len(rows)))
+    return (np.array(rows, dtype=np.int64), np.array(cols, dtype=np.int64), variables)
@@ -29,7 +29,12 @@ from pyomo.common.dependencies import (
     plotly,
 )
 from pyomo.common.deprecation import deprecated, deprecation_warning
-from pyomo.contrib.incidence_analysis.config import get_config_from_kwds
+from pyomo.contrib.incidence_analysis.config import (
+    IncidenceBackend,
+    get_config_from_kwds,
+)
+from pyomo.contrib.incidence_analysis import sparse_graph
+from pyomo.contrib.incidence_analysis.sparse_graph import SparseIncidenceGraph
 from pyomo.contrib.incidence_analysis.matching import maximum_matching
 from pyomo.contrib.incidence_analysis.connected import get_independent_submatrices
 from pyomo.contrib.incidence_analysis.triangularize import (
@@ -43,7 +48,7 @@ from pyomo.contrib.incidence_analysis.dulmage_mendelsohn import (
     RowPartition,
     ColPartition,
 )
-from pyomo.contrib.incidence_analysis.incidence import get_incident_variables
+from pyomo.contrib.incidence_analysis.incidence import get_incidence_coo
 from pyomo.contrib.pynumero.asl import AmplInterface
 
 pyomo_nlp, pyomo_nlp_available = attempt_import(
@@ -95,16 +100,17 @@ def get_bipartite_incidence_graph(variables, constraints, **kwds):
     # when constructing constraints.
     config = get_config_from_kwds(**kwds)
     _check_unindexed(variables + constraints)
-    N = len(variables)
-    M = len(constraints)
+    rows, cols, _ = get_incidence_coo(
+        [con.body for con in constraints], variables, **config
+    )
+    return _bipartite_graph_from_coo(rows, cols, len(constraints), len(variables))
+
+
+def _bipartite_graph_from_coo(rows, cols, M, N):
     graph = nx.Graph()
     graph.add_nodes_from(range(M), bipartite=0)
     graph.add_nodes_from(range(M, M + N), bipartite=1)
-    var_node_map = ComponentMap((v, M + i) for i, v in enumerate(variables))
-    for i, con in enumerate(constraints):
-        for var in get_incident_variables(con.body, **config):
-            if var in var_node_map:
-                graph.add_edge(i, var_node_map[var])
+    graph.add_edges_from(zip(rows.tolist(), (cols + M).tolist()))
     return graph
 
 
@@ -163,13 +169,8 @@ def extract_bipartite_subgraph(graph, nodes0, nodes1):
 
 def _generate_variables_in_constraints(constraints, **kwds):
     # Note: We construct a visitor here
-    config = get_config_from_kwds(**kwds)
-    known_vars = ComponentSet()
-    for con in constraints:
-        for var in get_incident_variables(con.body, **config):
-            if var not in known_vars:
-                known_vars.add(var)
-                yield var
+    _, _, variables = get_incidence_coo([con.body for con in constraints], **kwds)
+    yield from variables
 
 
 def get_structural_incidence_matrix(variables, constraints, **kwds):
@@ -194,22 +195,35 @@ def get_structural_incidence_matrix(variables, constraints, **kwds):
     config = get_config_from_kwds(**kwds)
     _check_unindexed(variables + constraints)
     N, M = len(variables), len(constraints)
-    var_idx_map = ComponentMap((v, i) for i, v in enumerate(variables))
-    rows = []
-    cols = []
-    for i, con in enumerate(constraints):
-        cols.extend(
-            var_idx_map[v]
-            for v in get_incident_variables(con.body, **config)
-            if v in var_idx_map
-        )
-        rows.extend([i] * (len(cols) - len(rows)))
-    assert len(rows) == len(cols)
+    rows, cols, _ = get_incidence_coo(
+        [con.body for con in constraints], variables, **config
+    )
     data = [1.0] * len(rows)
     matrix = sp.sparse.coo_matrix((data, (rows, cols)), shape=(M, N))
     return matrix
 
 
+def _get_incidence_graph(variables, constraints, config):
+    """Return the incidence graph of variables and constraints using the
+    data structure for the configured backend
+
+    If ``variables`` is None, the graph contains the variables incident
+    on the constraints.  Returns the graph and the list of variables.
+
+    """
+    rows, cols, variables = get_incidence_coo(
+        [con.body for con in constraints], variables, **config
+    )
+    M, N = len(constraints), len(variables)
+    if config.backend is IncidenceBackend.scipy:
+        graph = SparseIncidenceGraph(
+            sp.sparse.coo_matrix(([True] * len(rows), (rows, cols)), shape=(M, N))
+        )
+    else:
+        graph = _bipartite_graph_from_coo(rows, cols, M, N)
+    return graph, variables
+
+
 def get_numeric_incidence_matrix(variables, constraints):
     """Return the "numeric incidence matrix" (Jacobian) of Pyomo variables
     and constraints.
@@ -265,6 +279,16 @@ class IncidenceGraphInterface(object):
         If a PyomoNLP is provided, setting to ``False`` uses the
         ``evaluate_jacobian_eq`` method instead of ``evaluate_jacobian``
         rather than checking constraint expression types.
+    backend: ``IncidenceBackend``, default ``IncidenceBackend.networkx``
+        Data structure used to store the incidence graph.  With
+        ``IncidenceBackend.scipy``, the graph is stored as a sparse
+        incidence matrix and analyzed with ``scipy.sparse.csgraph``
+        (see :py:mod:`~pyomo.contrib.incidence_analysis.sparse_graph`),
+        which is much faster and uses much less memory for large
+        models.  The partitions computed by the two backends are the
+        same, although ties in the order of diagonal blocks and the
+        order of the variables and constraints in a Dulmage-Mendelsohn
+        subset (which depend on the maximum matching found) may differ.
 
     """
 
@@ -275,6 +299,7 @@ class IncidenceGraphInterface(object):
         # WARNING: This cache will become invalid if the user alters their
         # model.
         self._config = get_config_from_kwds(**kwds)
+        self._sparse = self._config.backend is IncidenceBackend.scipy
         if model is None:
             self._incidence_graph = None
             self._variables = None
@@ -285,8 +310,9 @@ class IncidenceGraphInterface(object):
                 for con in model.component_data_objects(Constraint, active=active)
                 if include_inequality or isinstance(con.expr, EqualityExpression)
             ]
-            self._variables = list(
-                _generate_variables_in_constraints(self._constraints, **self._config)
+            # Extract the incident variables and the graph in a single pass
+            self._incidence_graph, self._variables = _get_incidence_graph(
+                None, self._constraints, self._config
             )
             self._var_index_map = ComponentMap(
                 (var, i) for i, var in enumerate(self._variables)
@@ -294,9 +320,6 @@ class IncidenceGraphInterface(object):
             self._con_index_map = ComponentMap(
                 (con, i) for i, con in enumerate(self._constraints)
             )
-            self._incidence_graph = get_bipartite_incidence_graph(
-                self._variables, self._constraints, **self._config
-            )
         elif pyomo_nlp_available and isinstance(model, pyomo_nlp.PyomoNLP):
             if not active:
                 raise ValueError(
@@ -304,7 +327,7 @@ class IncidenceGraphInterface(object):
                     "nl interface (PyomoNLP).\nPlease set the `active` flag "
                     "to True."
                 )
-            if kwds:
+            if any(key != "backend" for key in kwds):
                 raise ValueError(
                     "Incidence graph generation options, e.g. include_fixed, method,"
                     " and linear_only, are not supported when generating a graph"
@@ -327,13 +350,28 @@ class IncidenceGraphInterface(object):
                 incidence_matrix = nlp.evaluate_jacobian()
             else:
                 incidence_matrix = nlp.evaluate_jacobian_eq()
-            nxb = nx.algorithms.bipartite
-            self._incidence_graph = nxb.from_biadjacency_matrix(incidence_matrix)
+            if self._sparse:
+                # Every stored Jacobian entry (even if zero) is an edge
+                incidence_matrix = incidence_matrix.tocoo()
+                self._incidence_graph = SparseIncidenceGraph(
+                    sp.sparse.coo_matrix(
+                        (
+                            [True] * incidence_matrix.nnz,
+                            (incidence_matrix.row, incidence_matrix.col),
+                        ),
+                        shape=incidence_matrix.shape,
+                    )
+                )
+            else:
+                nxb = nx.algorithms.bipartite
+                self._incidence_graph = nxb.from_biadjacency_matrix(incidence_matrix)
         elif isinstance(model, tuple):
-            # model is a tuple of (nx.Graph, list[pyo.Var], list[pyo.Constraint])
+            # model is a tuple of (graph, list[pyo.Var], list[pyo.Constraint]),
+            # where graph is a nx.Graph or a SparseIncidenceGraph
             # We could potentially accept a tuple (variables, constraints).
             # TODO: Disallow kwargs if this type of "model" is provided?
             nx_graph, variables, constraints = model
+            self._sparse = isinstance(nx_graph, SparseIncidenceGraph)
             self._variables = list(variables)
             self._constraints = list(constraints)
             self._var_index_map = ComponentMap(
@@ -375,6 +413,8 @@ class IncidenceGraphInterface(object):
             raise RuntimeError(
                 "Cannot get number of edges (nonzeros) when nothing is cached"
             )
+        if self._sparse:
+            return self._incidence_graph.n_edges
         return len(self._incidence_graph.edges)
 
     @property
@@ -484,7 +524,14 @@ class IncidenceGraphInterface(object):
         if self._incidence_graph is None:
             # Note that we pass along self._config here, so any kwds used
             # in construction will apply to these incidence graphs.
-            return get_bipartite_incidence_graph(variables, constraints, **self._config)
+            return _get_incidence_graph(variables, constraints, self._config)[0]
+        elif self._sparse:
+            if variables is self._variables and constraints is self._constraints:
+                return self._incidence_graph
+            return self._incidence_graph.subgraph(
+                [self._con_index_map[con] for con in constraints],
+                [self._var_index_map[var] for var in variables],
+            )
         else:
             constraint_nodes = [self._con_index_map[con] for con in constraints]
 
@@ -511,6 +558,9 @@ class IncidenceGraphInterface(object):
 
         """
         nx_subgraph = self._extract_subgraph(variables, constraints)
+        if nx_subgraph is self._incidence_graph:
+            # Do not share the (mutable) graph with the new interface
+            nx_subgraph = SparseIncidenceGraph(nx_subgraph.matrix)
         subgraph = IncidenceGraphInterface(
             (nx_subgraph, variables, constraints), **self._config
         )
@@ -526,6 +576,8 @@ class IncidenceGraphInterface(object):
         """
         if self._incidence_graph is None:
             return None
+        elif self._sparse:
+            return self._incidence_graph.matrix.astype(float).tocoo()
         else:
             M = len(self.constraints)
             N = len(self.variables)
@@ -586,7 +638,13 @@ class IncidenceGraphInterface(object):
         _check_unindexed([component])
         M = len(self.constraints)
         N = len(self.variables)
-        if component in self._var_index_map:
+        if self._sparse and component in self._var_index_map:
+            adj = self._incidence_graph.col_neighbors(self._var_index_map[component])
+            adj_comps = [self.constraints[i] for i in adj]
+        elif self._sparse and component in self._con_index_map:
+            adj = self._incidence_graph.row_neighbors(self._con_index_map[component])
+            adj_comps = [self.variables[j] for j in adj]
+        elif component in self._var_index_map:
             vnode = M + self._var_index_map[component]
             adj = self._incidence_graph[vnode]
             adj_comps = [self.constraints[i] for i in adj]
@@ -613,6 +671,13 @@ class IncidenceGraphInterface(object):
         """
         variables, constraints = self._validate_input(variables, constraints)
         graph = self._extract_subgraph(variables, constraints)
+        if self._sparse:
+            matching = sparse_graph.maximum_matching(graph.matrix)
+            return ComponentMap(
+                (constraints[i], variables[j])
+                for i, j in enumerate(matching.tolist())
+                if j >= 0
+            )
         con_nodes = list(range(len(constraints)))
         matching = maximum_matching(graph, top_nodes=con_nodes)
         # Matching maps constraint nodes to variable nodes. Here we need to
@@ -639,6 +704,11 @@ class IncidenceGraphInterface(object):
         """
         variables, constraints = self._validate_input(variables, constraints)
         graph = self._extract_subgraph(variables, constraints)
+        if self._sparse:
+            row_blocks, col_blocks = sparse_graph.connected_components(graph.matrix)
+            var_blocks = [[variables[j] for j in block] for block in col_blocks]
+            con_blocks = [[constraints[i] for i in block] for block in row_blocks]
+            return var_blocks, con_blocks
         nxc = nx.algorithms.components
         M = len(constraints)
         N = len(variables)
@@ -655,6 +725,19 @@ class IncidenceGraphInterface(object):
 
         return var_blocks, con_blocks
 
+    def _block_triangularize(self, variables, constraints):
+        """Return the row and column (coordinate) partitions of the block
+        triangularization of the incidence matrix"""
+        graph = self._extract_subgraph(variables, constraints)
+        if self._sparse:
+            return sparse_graph.block_triangularize(graph.matrix)
+        M = len(constraints)
+        con_nodes = list(range(M))
+        sccs = get_scc_of_projection(graph, con_nodes)
+        row_partition = [[i for i, _ in scc] for scc in sccs]
+        col_partition = [[j - M for _, j in scc] for scc in sccs]
+        return row_partition, col_partition
+
     # NOTE: That this replaces the <=6.4.4 block_triangularize function
     def map_nodes_to_block_triangular_indices(self, variables=None, constraints=None):
         """Map variables and constraints to indices of their diagonal blocks in
@@ -671,13 +754,9 @@ class IncidenceGraphInterface(object):
 
         """
         variables, constraints = self._validate_input(variables, constraints)
-        graph = self._extract_subgraph(variables, constraints)
-
-        M = len(constraints)
-        con_nodes = list(range(M))
-        sccs = get_scc_of_projection(graph, con_nodes)
-        row_idx_map = {r: idx for idx, scc in enumerate(sccs) for r, _ in scc}
-        col_idx_map = {c - M: idx for idx, scc in enumerate(sccs) for _, c in scc}
+        row_blocks, col_blocks = self._block_triangularize(variables, constraints)
+        row_idx_map = {r: idx for idx, rows in enumerate(row_blocks) for r in rows}
+        col_idx_map = {c: idx for idx, cols in enumerate(col_blocks) for c in cols}
         con_block_map = ComponentMap(
             (constraints[i], idx) for i, idx in row_idx_map.items()
         )
@@ -744,13 +823,9 @@ class IncidenceGraphInterface(object):
 
         """
         variables, constraints = self._validate_input(variables, constraints)
-        graph = self._extract_subgraph(variables, constraints)
-
-        M = len(constraints)
-        con_nodes = list(range(M))
-        sccs = get_scc_of_projection(graph, con_nodes)
-        var_partition = [[variables[j - M] for _, j in scc] for scc in sccs]
-        con_partition = [[constraints[i] for i, _ in scc] for scc in sccs]
+        row_blocks, col_blocks = self._block_triangularize(variables, constraints)
+        var_partition = [[variables[j] for j in cols] for cols in col_blocks]
+        con_partition = [[constraints[i] for i in rows] for rows in row_blocks]
         return var_partition, con_partition
 
     @deprecated(
@@ -763,12 +838,9 @@ class IncidenceGraphInterface(object):
     )
     def get_diagonal_blocks(self, variables=None, constraints=None):
         variables, constraints = self._validate_input(variables, constraints)
-        graph = self._extract_subgraph(variables, constraints)
-        M = len(constraints)
-        con_nodes = list(range(M))
-        sccs = get_scc_of_projection(graph, con_nodes)
-        block_cons = [[constraints[i] for i, _ in scc] for scc in sccs]
-        block_vars = [[variables[j - M] for _, j in scc] for scc in sccs]
+        row_blocks, col_blocks = self._block_triangularize(variables, constraints)
+        block_cons = [[constraints[i] for i in rows] for rows in row_blocks]
+        block_vars = [[variables[j] for j in cols] for cols in col_blocks]
         return block_vars, block_cons
 
     def dulmage_mendelsohn(self, variables=None, constraints=None):
@@ -859,12 +931,19 @@ class IncidenceGraphInterface(object):
         """
         variables, constraints = self._validate_input(variables, constraints)
         graph = self._extract_subgraph(variables, constraints)
-        M = len(constraints)
-        top_nodes = list(range(M))
-        row_partition, col_partition = dulmage_mendelsohn(graph, top_nodes=top_nodes)
+        if self._sparse:
+            row_partition, col_partition = sparse_graph.dulmage_mendelsohn(graph.matrix)
+            M = 0
+        else:
+            M = len(constraints)
+            top_nodes = list(range(M))
+            row_partition, col_partition = dulmage_mendelsohn(
+                graph, top_nodes=top_nodes
+            )
         con_partition = RowPartition(
             *[[constraints[i] for i in subset] for subset in row_partition]
         )
+        # Note that variable nodes in the NetworkX graph are offset by M
         var_partition = ColPartition(
             *[[variables[i - M] for i in subset] for subset in col_partition]
         )
@@ -961,6 +1040,8 @@ class IncidenceGraphInterface(object):
         variables, constraints = self._validate_input(variables, constraints)
         graph = self._extract_subgraph(variables, constraints)
         M = len(constraints)
+        if self._sparse:
+            graph = nx.algorithms.bipartite.from_biadjacency_matrix(graph.matrix)
 
         left_nodes = list(range(M))
         pos_dict = nx.drawing.bipartite_layout(graph, nodes=left_nodes)
@@ -1050,6 +1131,12 @@ class IncidenceGraphInterface(object):
                 "%s is not a constraint in the incidence graph" % constraint
             )
 
+        if self._sparse:
+            self._incidence_graph.add_edge(
+                self._con_index_map[constraint], self._var_index_map[variable]
+            )
+            return
+
         var_id = self._var_index_map[variable] + len(self._con_index_map)
         con_id = self._con_index_map[constraint]
 
@@ -11,7 +11,13 @@
 
 import logging
 
+from pyomo.common.dependencies import numpy as np, numpy_available, scipy_available
+from pyomo.core.base.block import _get_structure_cache
 from pyomo.core.base.constraint import Constraint
+from pyomo.core.expr.calculus.diff_with_pyomo import DifferentiationException
+from pyomo.core.expr.calculus.sparse_ad import DerivativeTape
+from pyomo.core.expr.numvalue import native_types, value
+from pyomo.core.expr.relational_expr import EqualityExpression
 from pyomo.util.calc_var_value import calculate_variable_from_constraint
 from pyomo.util.subsystems import TemporarySubsystemManager, generate_subsystem_blocks
 from pyomo.contrib.incidence_analysis.interface import (
@@ -23,6 +29,10 @@ from pyomo.contrib.incidence_analysis.config import IncidenceMethod
 
 _log = logging.getLogger(__name__)
 
+# Sufficient decrease parameter used in the Newton linesearch (matches
+# calculate_variable_from_constraint)
+_LINESEARCH_C1 = 0.999
+
 
 def generate_strongly_connected_components(
     constraints, variables=None, include_fixed=False, igraph=None
@@ -91,6 +101,212 @@ def generate_strongly_connected_components(
         yield (block, inputs)
 
 
+def _collect_leaves(exprs):
+    """Return the variables, mutable parameters, and named expressions
+    appearing in the expressions"""
+    variables = {}
+    params = {}
+    named = {}
+    stack = list(exprs)
+    while stack:
+        node = stack.pop()
+        if node.__class__ in native_types:
+            continue
+        if node.is_expression_type():
+            if node.is_named_expression_type():
+                if id(node) in named:
+                    continue
+                named[id(node)] = node
+            stack.extend(node.args)
+        elif node.is_variable_type():
+            variables[id(node)] = node
+        elif node.is_parameter_type():
+            params[id(node)] = node
+    return list(variables.values()), list(params.values()), list(named.values())
+
+
+def _leaf_states(variables, params):
+    # The incidence graph (generated from the AMPL representation)
+    # depends on which variables are fixed and on which fixed variables
+    # and mutable parameters are zero (zero coefficients are dropped).
+    states = [(v.value == 0) + 1 if v.fixed else 0 for v in variables]
+    states.extend(p.value == 0 for p in params)
+    return states
+
+
+class _SCCDecomposition(object):
+    """The block triangularization of the active equality constraints on
+    a block, as used by :py:func:`solve_strongly_connected_components`
+
+    The diagonal blocks are grouped into *levels*: the blocks in a level
+    only depend on blocks in previous levels, so blocks within a level
+    can be solved independently of each other.
+
+    """
+
+    def __init__(self, constraints, variables, igraph):
+        self.constraints = constraints
+        self.exprs = [con.expr for con in constraints]
+        self.variables, self.params, self.named = _collect_leaves(self.exprs)
+        self.named_exprs = [e.expr for e in self.named]
+        self.states = _leaf_states(self.variables, self.params)
+        self.blocks = list(
+            generate_strongly_connected_components(
+                constraints, variables, igraph=igraph
+            )
+        )
+
+        owner = {}
+        block_level = []
+        for idx, (scc, inputs) in enumerate(self.blocks):
+            level = 0
+            for v in inputs:
+                # Note: inputs may include variables from later blocks
+                # that only appear with zero coefficients
+                i = owner.get(id(v), idx)
+                if i < idx and block_level[i] >= level:
+                    level = block_level[i] + 1
+            block_level.append(level)
+            for v in scc.vars.values():
+                owner[id(v)] = idx
+        self.levels = [[] for _ in range(max(block_level, default=-1) + 1)]
+        for idx, level in enumerate(block_level):
+            self.levels[level].append(idx)
+        # Derivative tapes for the 1x1 blocks in each level (recorded
+        # the first time the level is solved)
+        self.tapes = {}
+
+    def is_current(self, constraints):
+        """Return True if this decomposition is still valid for the
+        (active equality) constraints"""
+        if len(constraints) != len(self.constraints):
+            return False
+        for con, cached, expr in zip(constraints, self.constraints, self.exprs):
+            if con is not cached or con.expr is not expr:
+                return False
+        for e, expr in zip(self.named, self.named_exprs):
+            if e.expr is not expr:
+                return False
+        return _leaf_states(self.variables, self.params) == self.states
+
+    def get_tape(self, level, indices):
+        """Return the derivative tape for the 1x1 blocks ``indices`` (in
+        ``level``) and the list of blocks that it covers"""
+        if level not in self.tapes:
+            blocks = self.blocks
+            tape = None
+            try:
+                covered = indices
+                tape = DerivativeTape(
+                    [blocks[i][0].cons[0] for i in covered],
+                    variables=[blocks[i][0].vars[0] for i in covered],
+                )
+            except DifferentiationException:
+                covered = []
+                for i in indices:
+                    try:
+                        DerivativeTape([blocks[i][0].cons[0]])
+                    except DifferentiationException:
+                        continue
+                    covered.append(i)
+                if covered:
+                    tape = DerivativeTape(
+                        [blocks[i][0].cons[0] for i in covered],
+                        variables=[blocks[i][0].vars[0] for i in covered],
+                    )
+            self.tapes[level] = (tape, covered)
+        return self.tapes[level]
+
+
+def _initialize_variable(variable):
+    # Initial guess used by calculate_variable_from_constraint
+    lb = variable.lb
+    ub = variable.ub
+    if lb is None:
+        val = 0 if ub is None else min(0, ub)
+    elif ub is None:
+        val = max(0, lb)
+    elif lb <= 0 and ub >= 0:
+        val = 0
+    else:
+        val = (lb + ub) / 2.0
+    variable.set_value(val, skip_validation=True)
+
+
+def _solve_one_by_one_blocks(
+    tape, eps=1e-8, iterlim=1000, linesearch=True, alpha_min=1e-8, **kwds
+):
+    """Solve the (independent) 1x1 blocks recorded on ``tape``
+    simultaneously using Newton's method
+
+    This follows the Newton iteration in
+    :py:func:`calculate_variable_from_constraint` (using exact
+    derivatives), but evaluates all blocks together.  Returns the
+    positions (on the tape) of the blocks that could not be solved;
+    the values of the corresponding variables are restored.
+
+    """
+    variables = tape.variables
+    original = [v.value for v in variables]
+    for v in variables:
+        if v.value is None:
+            _initialize_variable(v)
+    x = tape.get_variable_values()
+    rhs = np.array([value(con.upper) for con in tape.expressions], dtype=float)
+
+    f = tape.evaluate(x) - rhs
+    failed = ~np.isfinite(f)
+    todo = ~failed & (np.abs(f) > eps)
+    iters = 0
+    while todo.any():
+        iters += 1
+        if iters >= iterlim:
+            failed |= todo
+            break
+        d = tape.jacobian(x).diagonal()
+        failed |= todo & ~(np.abs(d) >= 1e-12)
+        idx = np.flatnonzero(todo & ~failed)
+        if not len(idx):
+            break
+        step = -f[idx] / d[idx]
+        fk2 = _LINESEARCH_C1 * f[idx] ** 2
+        alpha = np.ones(len(idx))
+        trial = x.copy()
+        pending = np.arange(len(idx))
+        while len(pending):
+            rows = idx[pending]
+            trial[rows] = x[rows] + alpha[pending] * step[pending]
+            with np.errstate(all='ignore'):
+                ft = tape.evaluate(trial)[rows] - rhs[rows]
+                ok = np.isfinite(ft)
+                if linesearch:
+                    ok &= ft**2 < fk2[pending]
+            pending = pending[~ok]
+            if linesearch:
+                alpha[pending] /= 2.0
+                stop = alpha[pending] <= alpha_min
+            else:
+                stop = np.ones(len(pending), dtype=bool)
+            # Blocks without an acceptable step have failed
+            rows = idx[pending[stop]]
+            failed[rows] = True
+            trial[rows] = x[rows]
+            pending = pending[~stop]
+        x = trial
+        f = tape.evaluate(x) - rhs
+        failed |= todo & ~np.isfinite(f)
+        todo &= ~failed & (np.abs(f) > eps)
+
+    for i, v in enumerate(variables):
+        if failed[i]:
+            v.set_value(original[i], skip_validation=True)
+        else:
+            # Set the final value (with validation) to trigger any
+            # warnings WRT the final variable state
+            v.set_value(float(x[i]))
+    return np.flatnonzero(failed)
+
+
 def solve_strongly_connected_components(
     block, *, solver=None, solve_kwds=None, use_calc_var=True, calc_var_kwds=None
 ):
@@ -107,6 +323,19 @@ def solve_strongly_connected_components(
     calculate_variable_from_constraint function, while higher-dimension
     blocks are solved using the user-provided solver object.
 
+    The block triangularization is cached on the block and reused by
+    subsequent calls as long as the structure of the system is unchanged
+    (i.e., no components were added or removed, no constraints were
+    activated, deactivated, or modified, no variables were fixed or
+    unfixed, and no fixed variable or mutable parameter changed to or
+    from zero).  One-by-one blocks that do not depend on each other are
+    solved simultaneously using a vectorized Newton method (requires
+    NumPy and SciPy; blocks that this method cannot solve fall back on
+    calculate_variable_from_constraint).  Higher-dimension blocks are
+    always solved one at a time, as solver objects (e.g., the
+    shell-based solver interfaces) keep per-solve state and are not
+    safe to call concurrently.
+
     Parameters
     ----------
     block: Pyomo Block
@@ -133,41 +362,71 @@ def solve_strongly_connected_components(
     if calc_var_kwds is None:
         calc_var_kwds = {}
 
-    igraph = IncidenceGraphInterface(
-        block,
-        active=True,
-        include_fixed=False,
-        include_inequality=False,
-        method=IncidenceMethod.ampl_repn,
-    )
-    constraints = igraph.constraints
-    variables = igraph.variables
+    constraints = [
+        con
+        for con in block.component_data_objects(Constraint, active=True)
+        if isinstance(con.expr, EqualityExpression)
+    ]
+    decomposition = _get_structure_cache(block, '_scc_cache').get('decomposition')
+    if decomposition is None or not decomposition.is_current(constraints):
+        igraph = IncidenceGraphInterface(
+            block,
+            active=True,
+            include_fixed=False,
+            include_inequality=False,
+            method=IncidenceMethod.ampl_repn,
+        )
+        decomposition = _SCCDecomposition(igraph.constraints, igraph.variables, igraph)
+        # Note that creating the subsystem blocks invalidated any
+        # previous cache, so we must look up the cache again
+        _get_structure_cache(block, '_scc_cache')['decomposition'] = decomposition
 
-    res_list = []
+    blocks = decomposition.blocks
+    vectorize = use_calc_var and numpy_available and scipy_available
+    res_list = [None] * len(blocks)
     log_blocks = _log.isEnabledFor(logging.DEBUG)
-    for scc, inputs in generate_strongly_connected_components(
-        constraints, variables, igraph=igraph
-    ):
-        with TemporarySubsystemManager(to_fix=inputs, remove_bounds_on_fix=True):
+    for level, indices in enumerate(decomposition.levels):
+        one_by_one = []
+        others = []
+        for i in indices:
+            if use_calc_var and len(blocks[i][0].vars) == 1:
+                one_by_one.append(i)
+            else:
+                others.append(i)
+        if others and solver is None:
+            scc = blocks[others[0]][0]
             N = len(scc.vars)
-            if N == 1 and use_calc_var:
+            var_names = [var.name for var in scc.vars.values()][:10]
+            con_names = [con.name for con in scc.cons.values()][:10]
+            raise RuntimeError(
+                "An external solver is required if block has strongly\n"
+                "connected components of size greater than one (is not"
+                " a DAG).\nGot an SCC of size %sx%s including"
+                " components:\n%s\n%s" % (N, N, var_names, con_names)
+            )
+
+        if vectorize and len(one_by_one) > 1:
+            tape, covered = decomposition.get_tape(level, one_by_one)
+            if tape is not None:
+                if log_blocks:
+                    _log.debug(f"Solving {len(covered)} 1x1 blocks together.")
+                unsolved = _solve_one_by_one_blocks(tape, **calc_var_kwds)
+                solved = set(covered).difference(covered[i] for i in unsolved)
+                one_by_one = [i for i in one_by_one if i not in solved]
+        for i in one_by_one:
+            scc, inputs = blocks[i]
+            with TemporarySubsystemManager(to_fix=inputs, remove_bounds_on_fix=True):
                 if log_blocks:
                     _log.debug(f"Solving 1x1 block: {scc.cons[0].name}.")
-                results = calculate_variable_from_constraint(
+                res_list[i] = calculate_variable_from_constraint(
                     scc.vars[0], scc.cons[0], **calc_var_kwds
                 )
-            else:
-                if solver is None:
-                    var_names = [var.name for var in scc.vars.values()][:10]
-                    con_names = [con.name for con in scc.cons.values()][:10]
-                    raise RuntimeError(
-                        "An external solver is required if block has strongly\n"
-                        "connected components of size greater than one (is not"
-                        " a DAG).\nGot an SCC of size %sx%s including"
-                        " components:\n%s\n%s" % (N, N, var_names, con_names)
-                    )
+
+        for i in others:
+            scc, inputs = blocks[i]
+            with TemporarySubsystemManager(to_fix=inputs, remove_bounds_on_fix=True):
                 if log_blocks:
+                    N = len(scc.vars)
                     _log.debug(f"Solving {N}x{N} block.")
-                results = solver.solve(scc, **solve_kwds)
-            res_list.append(results)
+                res_list[i] = solver.solve(scc, **solve_kwds)
     return res_list
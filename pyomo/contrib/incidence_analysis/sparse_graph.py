@@ -0,0 +1,372 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright (c) 2008-2025
+#  National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+"""Graph algorithms on (bipartite) incidence matrices stored as SciPy
+sparse matrices
+
+These functions implement the algorithms used by
+:py:class:`~pyomo.contrib.incidence_analysis.interface.IncidenceGraphInterface`
+with ``backend=IncidenceBackend.scipy``.  Rows of the incidence matrix
+correspond to constraints and columns correspond to variables.  Rather
+than constructing a graph object with a node per row and column, the
+algorithms operate directly on the compressed sparse incidence matrix
+using ``scipy.sparse.csgraph``, which scales to systems with millions of
+variables and constraints.
+
+"""
+
+import heapq
+
+from pyomo.common.dependencies import numpy as np, scipy as sp
+
+
+class SparseIncidenceGraph(object):
+    """A bipartite incidence graph stored as a sparse incidence matrix
+
+    Edges may be added incrementally (with :py:meth:`add_edge`); new edges
+    are buffered and merged into the matrix the next time it is accessed.
+
+    Parameters
+    ----------
+    matrix: scipy.sparse matrix
+        The incidence matrix.  Rows correspond to constraints and columns
+        correspond to variables; any stored entry is an edge.
+
+    """
+
+    def __init__(self, matrix):
+        self._matrix = _to_csr(matrix)
+        self._csc = None
+        self._new_edges = []
+
+    @property
+    def shape(self):
+        return self._matrix.shape
+
+    @property
+    def matrix(self):
+        """The incidence matrix, as a ``scipy.sparse.csr_matrix`` of bools"""
+        if self._new_edges:
+            rows, cols = zip(*self._new_edges)
+            self._new_edges = []
+            new = sp.sparse.csr_matrix(
+                (np.ones(len(rows), dtype=bool), (rows, cols)), shape=self.shape
+            )
+            self._matrix = _to_csr(self._matrix + new)
+            self._csc = None
+        return self._matrix
+
+    @property
+    def n_edges(self):
+        return self.matrix.nnz
+
+    def add_edge(self, row, col):
+        """Add an edge between row ``row`` and column ``col``"""
+        self._new_edges.append((row, col))
+
+    def row_neighbors(self, row):
+        """Return the (sorted) columns adjacent to row ``row``"""
+        matrix = self.matrix
+        return matrix.indices[matrix.indptr[row] : matrix.indptr[row + 1]].tolist()
+
+    def col_neighbors(self, col):
+        """Return the (sorted) rows adjacent to column ``col``"""
+        matrix = self.matrix
+        if self._csc is None:
+            self._csc = matrix.tocsc()
+            self._csc.sort_indices()
+        csc = self._csc
+        return csc.indices[csc.indptr[col] : csc.indptr[col + 1]].tolist()
+
+    def submatrix(self, rows, cols):
+        """Return the incidence matrix of the rows and columns with the
+        provided (lists of) coordinates"""
+        matrix = self.matrix
+        if len(rows) != matrix.shape[0] or not _is_range(rows):
+            matrix = matrix[np.asarray(rows, dtype=np.intp)]
+        if len(cols) != matrix.shape[1] or not _is_range(cols):
+            matrix = matrix[:, np.asarray(cols, dtype=np.intp)]
+        return matrix
+
+    def subgraph(self, rows, cols):
+        """Return the graph induced by the provided rows and columns"""
+        return SparseIncidenceGraph(self.submatrix(rows, cols))
+
+
+def _is_range(coords):
+    return all(i == c for i, c in enumerate(coords))
+
+
+def _to_csr(matrix):
+    if not (
+        sp.sparse.issparse(matrix) and matrix.format == "csr" and matrix.dtype == bool
+    ):
+        matrix = sp.sparse.csr_matrix(matrix, dtype=bool, copy=True)
+        matrix.eliminate_zeros()
+    if not matrix.has_canonical_format:
+        matrix = matrix.copy()
+        matrix.sum_duplicates()
+    return matrix
+
+
+def maximum_matching(matrix):
+    """Return a maximum cardinality matching of the rows and columns of
+    an incidence matrix (computed using the Hopcroft-Karp algorithm)
+
+    Returns
+    -------
+    numpy.ndarray
+        The column matched with each row (or -1 for unmatched rows)
+
+    """
+    matrix = _to_csr(matrix)
+    if not matrix.shape[0] or not matrix.shape[1]:
+        return np.full(matrix.shape[0], -1, dtype=np.intp)
+    matching = sp.sparse.csgraph.maximum_bipartite_matching(matrix, perm_type="column")
+    return matching.astype(np.intp)
+
+
+def _inverse_matching(row_matching, ncols):
+    col_matching = np.full(ncols, -1, dtype=np.intp)
+    matched = np.flatnonzero(row_matching >= 0)
+    col_matching[row_matching[matched]] = matched
+    return col_matching
+
+
+def connected_components(matrix):
+    """Partition the rows and columns of an incidence matrix into the
+    connected components of its bipartite graph
+
+    Components are ordered by their first node, where rows precede
+    columns (i.e., as in the bipartite graph where rows are the nodes
+    ``0..M-1`` and columns are the nodes ``M..M+N-1``), and the rows
+    and columns within each component are sorted.
+
+    Returns
+    -------
+    row_blocks: list of lists
+        Partition of row coordinates
+    col_blocks: list of lists
+        Partition of column coordinates
+
+    """
+    matrix = _to_csr(matrix)
+    M, N = matrix.shape
+    if not M + N:
+        return [], []
+    graph = sp.sparse.bmat([[None, matrix], [matrix.T, None]], format="csr")
+    ncomp, labels = sp.sparse.csgraph.connected_components(graph, directed=False)
+    # Relabel the components in order of their first node
+    first = np.full(ncomp, M + N, dtype=np.intp)
+    np.minimum.at(first, labels, np.arange(M + N))
+    order = np.empty(ncomp, dtype=np.intp)
+    order[np.argsort(first, kind="stable")] = np.arange(ncomp)
+    labels = order[labels]
+    return (_partition(labels[:M], ncomp), _partition(labels[M:], ncomp))
+
+
+def _partition(labels, nparts):
+    """Group the (sorted) coordinates by label"""
+    order = np.argsort(labels, kind="stable")
+    counts = np.bincount(labels, minlength=nparts)
+    return [part.tolist() for part in np.split(order, np.cumsum(counts)[:-1])]
+
+
+def block_triangularize(matrix, row_matching=None):
+    """Partition the rows and columns of a square incidence matrix into
+    the diagonal blocks of a block lower triangular permutation
+
+    The diagonal blocks are the strongly connected components of the
+    bipartite graph, projected with respect to a perfect matching.
+    Blocks are returned in a topological order, where ties are broken
+    by the smallest row in each block.  Rows within a block are sorted,
+    and the columns are ordered such that each column is matched with
+    the corresponding row.
+
+    Parameters
+    ----------
+    matrix: scipy.sparse matrix
+        The (square) incidence matrix
+    row_matching: numpy.ndarray
+        A perfect matching (the column matched with each row).  If not
+        provided, a maximum matching is computed.
+
+    Returns
+    -------
+    row_partition: list of lists
+        A partition of row coordinates
+    col_partition: list of lists
+        A partition of column coordinates
+
+    """
+    matrix = _to_csr(matrix)
+    M, N = matrix.shape
+    if M != N:
+        raise RuntimeError(
+            "get_scc_of_projection does not support bipartite graphs with"
+            " bipartite sets of different cardinalities. Got sizes %s and"
+            " %s." % (M, N)
+        )
+    if row_matching is None:
+        row_matching = maximum_matching(matrix)
+    n_matched = np.count_nonzero(row_matching >= 0)
+    if n_matched != M:
+        raise RuntimeError(
+            "get_scc_of_projection does not support bipartite graphs without"
+            " a perfect matching. Got a graph with %s nodes per bipartite set"
+            " and a matching of cardinality %s." % (M, float(n_matched))
+        )
+    if not M:
+        return [], []
+
+    # Permute the columns so that each row is matched with the column
+    # on the diagonal.  Then an entry (i, j) means that row i depends on
+    # (the variable matched with) row j, i.e., an edge j -> i.
+    projected = matrix[:, row_matching]
+    ncomp, labels = sp.sparse.csgraph.connected_components(
+        projected, directed=True, connection="strong"
+    )
+    # Relabel the components in order of their smallest row
+    first = np.full(ncomp, M, dtype=np.intp)
+    np.minimum.at(first, labels, np.arange(M))
+    order = np.empty(ncomp, dtype=np.intp)
+    order[np.argsort(first, kind="stable")] = np.arange(ncomp)
+    labels = order[labels]
+
+    # The DAG of strongly connected components
+    coo = projected.tocoo()
+    src = labels[coo.col]
+    dst = labels[coo.row]
+    between = src != dst
+    dag = sp.sparse.csr_matrix(
+        (np.ones(np.count_nonzero(between), dtype=bool), (src[between], dst[between])),
+        shape=(ncomp, ncomp),
+    )
+    dag.sum_duplicates()
+
+    # Topological sort (Kahn's algorithm), breaking ties with the
+    # smallest component label
+    indptr = dag.indptr.tolist()
+    indices = dag.indices.tolist()
+    in_degree = np.bincount(dag.indices, minlength=ncomp).tolist()
+    heap = [k for k in range(ncomp) if not in_degree[k]]
+    position = [0] * ncomp
+    n = 0
+    while heap:
+        k = heapq.heappop(heap)
+        position[k] = n
+        n += 1
+        for succ in indices[indptr[k] : indptr[k + 1]]:
+            in_degree[succ] -= 1
+            if not in_degree[succ]:
+                heapq.heappush(heap, succ)
+
+    row_partition = _partition(np.array(position, dtype=np.intp)[labels], ncomp)
+    col_partition = [row_matching[rows].tolist() for rows in row_partition]
+    return row_partition, col_partition
+
+
+def _reachable_from(digraph, sources):
+    """Return the nodes reachable from any of the sources (in BFS
+    order, not including the sources themselves)"""
+    n = digraph.shape[0]
+    if not len(sources):
+        return np.zeros(0, dtype=np.intp)
+    # Add a "super source" (node n) adjacent to all the sources
+    coo = digraph.tocoo()
+    digraph = sp.sparse.csr_matrix(
+        (
+            np.ones(coo.nnz + len(sources), dtype=bool),
+            (
+                np.concatenate((coo.row, np.full(len(sources), n))),
+                np.concatenate((coo.col, sources)),
+            ),
+        ),
+        shape=(n + 1, n + 1),
+    )
+    order = sp.sparse.csgraph.breadth_first_order(
+        digraph, n, directed=True, return_predecessors=False
+    )
+    return order[1 + len(sources) :].astype(np.intp)
+
+
+def _alternating_digraph(matrix, matching):
+    """The digraph with an edge from row i to the row matched with each
+    (matched) column adjacent to row i"""
+    coo = matrix.tocoo()
+    target = matching[coo.col]
+    keep = (target >= 0) & (target != coo.row)
+    n = matrix.shape[0]
+    return sp.sparse.csr_matrix(
+        (np.ones(np.count_nonzero(keep), dtype=bool), (coo.row[keep], target[keep])),
+        shape=(n, n),
+    )
+
+
+def dulmage_mendelsohn(matrix, row_matching=None):
+    """Partition the rows and columns of an incidence matrix according to
+    the (coarse) Dulmage-Mendelsohn decomposition
+
+    See :py:func:`pyomo.contrib.incidence_analysis.dulmage_mendelsohn.dulmage_mendelsohn`
+    for a description of the subsets.  As there, zipping "corresponding"
+    row and column subsets yields pairs in the maximum matching.
+
+    Returns
+    -------
+    row_partition: tuple of lists
+        Rows partitioned into unmatched, overconstrained,
+        underconstrained, and square rows
+    col_partition: tuple of lists
+        Columns partitioned into unmatched, underconstrained,
+        overconstrained, and square columns
+
+    """
+    matrix = _to_csr(matrix)
+    M, N = matrix.shape
+    if row_matching is None:
+        row_matching = maximum_matching(matrix)
+    col_matching = _inverse_matching(row_matching, N)
+
+    row_unmatched = np.flatnonzero(row_matching < 0)
+    col_unmatched = np.flatnonzero(col_matching < 0)
+
+    # Nodes reachable by an alternating path from unmatched nodes
+    row_reachable = _reachable_from(
+        _alternating_digraph(matrix, col_matching), row_unmatched
+    )
+    col_reachable = _reachable_from(
+        _alternating_digraph(_to_csr(matrix.T), row_matching), col_unmatched
+    )
+
+    # Nodes matched with those reachable from unmatched nodes
+    row_matched_with_reachable = col_matching[col_reachable]
+    col_matched_with_reachable = row_matching[row_reachable]
+
+    other = np.ones(M, dtype=bool)
+    other[row_unmatched] = False
+    other[row_reachable] = False
+    other[row_matched_with_reachable] = False
+    row_other = np.flatnonzero(other)
+    col_other = row_matching[row_other]
+
+    return (
+        (
+            row_unmatched.tolist(),
+            row_reachable.tolist(),
+            row_matched_with_reachable.tolist(),
+            row_other.tolist(),
+        ),
+        (
+            col_unmatched.tolist(),
+            col_reachable.tolist(),
+            col_matched_with_reachable.tolist(),
+            col_other.tolist(),
+        ),
+    )
@@ -9,15 +9,21 @@
 #  This software is distributed under the 3-clause BSD License.
 #  ___________________________________________________________________________
 
+import multiprocessing
+
 import pyomo.environ as pyo
 from pyomo.repn import generate_standard_repn
 import pyomo.common.unittest as unittest
 from pyomo.common.collections import ComponentSet
+from pyomo.common.dependencies import numpy_available
 from pyomo.contrib.incidence_analysis.incidence import (
     IncidenceMethod,
     get_incident_variables,
+    get_incidence_coo,
 )
 
+fork_available = "fork" in multiprocessing.get_all_start_methods()
+
 
 class TestAssumedBehavior(unittest.TestCase):
     """Tests for non-obvious behavior we rely on
@@ -258,5 +264,104 @@ class TestIncidenceStandardRepnComputeValues(
         return get_incident_variables(expr, method=method, **kwds)
 
 
+def _make_coo_model():
+    m = pyo.ConcreteModel()
+    m.I = pyo.RangeSet(12)
+    m.x = pyo.Var(m.I, initialize=1.0)
+    m.y = pyo.Var(m.I, initialize=2.0)
+    m.p = pyo.Param(mutable=True, initialize=0.0)
+    m.e = pyo.Expression(m.I, rule=lambda m, i: m.x[i] ** 2 + m.p * m.y[i])
+    m.c = pyo.ConstraintList()
+    for i in m.I:
+        m.c.add(m.e[i] * m.y[i % 12 + 1] + 3 * m.x[i] == 1)
+        m.c.add(m.e[i % 12 + 1] + m.y[i] - m.y[i] + 0 * m.x[i] == 1)
+    m.x[4].fix()
+    return m
+
+
+@unittest.skipUnless(numpy_available, "numpy is not available")
+class TestIncidenceCOO(unittest.TestCase):
+    def _check_coo(self, exprs, variables=None, **kwds):
+        rows, cols, coo_vars = get_incidence_coo(exprs, variables, **kwds)
+        if variables is not None:
+            self.assertEqual(coo_vars, list(variables))
+        col_map = {id(v): j for j, v in enumerate(coo_vars)}
+        expected = [
+            (i, col_map[id(v)])
+            for i, expr in enumerate(exprs)
+            for v in get_incident_variables(expr, **kwds)
+            if id(v) in col_map
+        ]
+        self.assertEqual(list(zip(rows.tolist(), cols.tolist())), expected)
+        if variables is None:
+            # Variables are numbered in the order they are encountered
+            first = []
+            for j in cols.tolist():
+                if j not in first:
+                    first.append(j)
+            self.assertEqual(first, list(range(len(coo_vars))))
+        return rows, cols, coo_vars
+
+    def test_methods(self):
+        m = _make_coo_model()
+        exprs = [con.body for con in m.c.values()]
+        for method in IncidenceMethod:
+            rows, cols, variables = self._check_coo(exprs, method=method)
+            self.assertEqual(len(rows), len(cols))
+            self.assertNotIn(m.x[4], ComponentSet(variables))
+        rows, cols, variables = self._check_coo(
+            exprs, method=IncidenceMethod.standard_repn, include_fixed=True
+        )
+        self.assertIn(m.x[4], ComponentSet(variables))
+        for method in (IncidenceMethod.standard_repn, IncidenceMethod.ampl_repn):
+            self._check_coo(exprs, method=method, linear_only=True)
+
+    def test_variables(self):
+        m = _make_coo_model()
+        exprs = [con.body for con in m.c.values()]
+        variables = list(m.y.values())
+        rows, cols, _ = self._check_coo(exprs, variables)
+        self.assertEqual(len(rows), 24)
+        rows, cols, _ = self._check_coo(exprs, [])
+        self.assertEqual(len(rows), 0)
+
+    def test_named_expression_cache(self):
+        m = _make_coo_model()
+        exprs = [con.body for con in m.c.values()]
+        rows, cols, variables = get_incidence_coo(
+            exprs, method=IncidenceMethod.identify_variables
+        )
+        # Changing a named expression between calls is still detected
+        m.e[1].expr = m.y[7]
+        rows2, cols2, variables2 = self._check_coo(
+            exprs, method=IncidenceMethod.identify_variables
+        )
+        self.assertEqual(len(rows2), len(rows) - 1)
+
+    def test_invalid_options(self):
+        m = _make_coo_model()
+        with self.assertRaisesRegex(RuntimeError, "linear_only=True is not"):
+            get_incidence_coo(
+                [m.x[1]], method=IncidenceMethod.identify_variables, linear_only=True
+            )
+        with self.assertRaisesRegex(ValueError, "invalid value"):
+            get_incidence_coo([m.x[1]], max_workers=0)
+
+    @unittest.skipUnless(fork_available, "Worker processes require fork")
+    def test_max_workers(self):
+        m = _make_coo_model()
+        exprs = [con.body for con in m.c.values()]
+        for method in IncidenceMethod:
+            serial = get_incidence_coo(exprs, method=method)
+            parallel = self._check_coo(exprs, method=method, max_workers=3)
+            self.assertEqual(serial[0].tolist(), parallel[0].tolist())
+            self.assertEqual(serial[1].tolist(), parallel[1].tolist())
+            self.assertEqual(serial[2], parallel[2])
+            variables = list(m.x.values())
+            parallel = self._check_coo(exprs, variables, method=method, max_workers=2)
+        rows, cols, variables = get_incidence_coo([], max_workers=2)
+        self.assertEqual((len(rows), len(cols), variables), (0, 0, []))
+
+
 if __name__ == "__main__":
     unittest.main()
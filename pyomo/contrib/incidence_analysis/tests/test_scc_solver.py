@@ -9,10 +9,12 @@
 #  This software is distributed under the 3-clause BSD License.
 #  ___________________________________________________________________________
 
+import math
+
 import pyomo.environ as pyo
 import pyomo.dae as dae
 from pyomo.common.dependencies import networkx_available
-from pyomo.common.dependencies import scipy_available
+from pyomo.common.dependencies import numpy_available, scipy_available
 from pyomo.common.collections import ComponentSet, ComponentMap
 from pyomo.contrib.incidence_analysis.scc_solver import (
     TemporarySubsystemManager,
@@ -501,6 +503,154 @@ class TestSolveSCC(unittest.TestCase):
         self.assertEqual(m.x[3].value, 1.0)
 
 
+class _NewtonSolver(object):
+    """A minimal "solver" for square subsystem blocks"""
+
+    def solve(self, block, tol=1e-10):
+        import numpy as np
+        import scipy.sparse.linalg
+        from pyomo.core.expr.calculus.sparse_ad import DerivativeTape
+
+        cons = list(block.cons.values())
+        tape = DerivativeTape(cons, variables=list(block.vars.values()))
+        rhs = np.array([pyo.value(con.upper) for con in cons])
+        x = tape.get_variable_values()
+        for _ in range(50):
+            f = tape.evaluate(x) - rhs
+            if max(abs(f)) < tol:
+                break
+            x = x - scipy.sparse.linalg.spsolve(tape.jacobian(x).tocsc(), f)
+        for v, val in zip(tape.variables, x):
+            v.set_value(val)
+        return len(cons)
+
+
+def _make_independent_blocks(n):
+    m = pyo.ConcreteModel()
+    m.I = pyo.RangeSet(n)
+    m.p = pyo.Param(mutable=True, initialize=2.0)
+    m.x = pyo.Var(m.I, initialize=1.0)
+    m.y = pyo.Var(m.I, initialize=1.0)
+    m.z = pyo.Var(m.I, initialize=1.0)
+    m.w = pyo.Var(initialize=1.0)
+    # 1x1 blocks (independent of each other)
+    m.eq_x = pyo.Constraint(m.I, rule=lambda m, i: m.x[i] ** 3 + m.x[i] == i + m.p)
+    # 2x2 blocks that depend on x
+    m.eq_y = pyo.Constraint(m.I, rule=lambda m, i: m.y[i] + m.z[i] == m.x[i])
+    m.eq_z = pyo.Constraint(
+        m.I, rule=lambda m, i: m.y[i] - pyo.exp(m.z[i]) == 2 * m.x[i]
+    )
+    # 1x1 block depending on everything
+    m.eq_w = pyo.Constraint(expr=m.w == sum(m.y[i] for i in m.I))
+    return m
+
+
+def _assert_solved(test, m):
+    for con in m.component_data_objects(pyo.Constraint, active=True):
+        test.assertAlmostEqual(pyo.value(con.body), pyo.value(con.upper), delta=1e-7)
+
+
+@unittest.skipUnless(numpy_available, "NumPy is not available")
+@unittest.skipUnless(scipy_available, "SciPy is not available")
+@unittest.skipUnless(networkx_available, "NetworkX is not available")
+class TestSolveSCCCachedDecomposition(unittest.TestCase):
+    def test_levels(self):
+        m = _make_independent_blocks(3)
+        res = solve_strongly_connected_components(m, solver=_NewtonSolver())
+        _assert_solved(self, m)
+        decomposition = m._scc_cache['decomposition']
+        levels = [
+            sorted(len(decomposition.blocks[i][0].vars) for i in level)
+            for level in decomposition.levels
+        ]
+        self.assertEqual(levels, [[1, 1, 1], [2, 2, 2], [1]])
+        # The 1x1 blocks in the first level were solved together
+        self.assertEqual(list(decomposition.tapes), [0])
+        # Results are returned in the (topological) order of the blocks
+        self.assertEqual(len(res), 7)
+        self.assertEqual([r for r in res if r is not None], [2, 2, 2])
+
+    def test_reuse_decomposition(self):
+        m = _make_independent_blocks(3)
+        solver = _NewtonSolver()
+        solve_strongly_connected_components(m, solver=solver)
+        decomposition = m._scc_cache['decomposition']
+
+        m.p = 5
+        for v in m.component_data_objects(pyo.Var):
+            v.set_value(1)
+        solve_strongly_connected_components(m, solver=solver)
+        _assert_solved(self, m)
+        self.assertIs(m._scc_cache['decomposition'], decomposition)
+
+        # Modifying the system results in a new decomposition
+        m.eq_x[1].set_value(m.x[1] == 3)
+        solve_strongly_connected_components(m, solver=solver)
+        _assert_solved(self, m)
+        self.assertIsNot(m._scc_cache['decomposition'], decomposition)
+        self.assertEqual(m.x[1].value, 3)
+        decomposition = m._scc_cache['decomposition']
+
+        m.w.fix(0)
+        m.eq_w.deactivate()
+        solve_strongly_connected_components(m, solver=solver)
+        self.assertIsNot(m._scc_cache['decomposition'], decomposition)
+        self.assertEqual(m.w.value, 0)
+        decomposition = m._scc_cache['decomposition']
+
+        m.extra = pyo.Var(initialize=3)
+        m.eq_extra = pyo.Constraint(expr=m.extra == 2 * m.w + 1)
+        solve_strongly_connected_components(m, solver=solver)
+        self.assertIsNot(m._scc_cache['decomposition'], decomposition)
+        self.assertEqual(m.extra.value, 1)
+
+    def test_zero_coefficient_invalidates(self):
+        m = pyo.ConcreteModel()
+        m.x = pyo.Var([1, 2], initialize=1.0)
+        m.p = pyo.Param(mutable=True, initialize=0)
+        m.eq1 = pyo.Constraint(expr=m.x[1] + m.p * m.x[2] ** 2 == 1)
+        m.eq2 = pyo.Constraint(expr=m.x[2] - m.x[1] == 3)
+        solve_strongly_connected_components(m)
+        self.assertEqual((m.x[1].value, m.x[2].value), (1, 4))
+
+        # With p != 0 this is no longer a DAG
+        m.p = 1
+        with self.assertRaisesRegex(RuntimeError, "An external solver is required"):
+            solve_strongly_connected_components(m)
+        solve_strongly_connected_components(m, solver=_NewtonSolver())
+        _assert_solved(self, m)
+
+    def test_vectorized_fallback(self):
+        m = pyo.ConcreteModel()
+        m.x = pyo.Var([1, 2, 3, 4, 5])
+        m.x[5].setlb(1)
+        m.eq = pyo.ConstraintList()
+        m.eq.add(pyo.exp(m.x[1]) == 2)
+        # The derivative of abs() is not defined at the initial point;
+        # calculate_variable_from_constraint solves this using a secant step
+        m.eq.add(abs(m.x[2]) + m.x[2] == 2)
+        # Expr_if is not supported by the vectorized Newton method
+        m.eq.add(pyo.Expr_if(m.x[3] >= 0, m.x[3], -m.x[3]) == 4)
+        m.eq.add(m.x[4] ** 2 == 9)
+        m.eq.add(pyo.log(m.x[5]) == 1)
+        m.x[4].set_value(1)
+        solve_strongly_connected_components(m)
+        self.assertAlmostEqual(m.x[1].value, math.log(2))
+        self.assertAlmostEqual(m.x[2].value, 1)
+        self.assertAlmostEqual(m.x[3].value, 4)
+        self.assertAlmostEqual(m.x[4].value, 3)
+        self.assertAlmostEqual(m.x[5].value, math.e)
+        tape, covered = m._scc_cache['decomposition'].tapes[0]
+        self.assertEqual(len(covered), 4)
+
+        # Blocks that fail (on their own) raise the same exception
+        m.x[4].set_value(0)
+        with self.assertRaisesRegex(ValueError, "very close to zero"):
+            solve_strongly_connected_components(m)
+        # ... and the variables in the block were restored
+        self.assertEqual(m.x[4].value, 0)
+
+
 @unittest.skipUnless(scipy_available, "SciPy is not available")
 @unittest.skipUnless(networkx_available, "NetworkX is not available")
 class TestExceptions(unittest.TestCase):
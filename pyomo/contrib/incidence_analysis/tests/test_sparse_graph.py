@@ -0,0 +1,313 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright (c) 2008-2025
+#  National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+
+import pyomo.environ as pyo
+from pyomo.common.collections import ComponentSet
+from pyomo.common.dependencies import (
+    networkx_available,
+    numpy as np,
+    numpy_available,
+    scipy,
+    scipy_available,
+)
+from pyomo.contrib.incidence_analysis import IncidenceBackend, IncidenceGraphInterface
+from pyomo.contrib.incidence_analysis import sparse_graph
+from pyomo.contrib.incidence_analysis.connected import get_independent_submatrices
+from pyomo.contrib.incidence_analysis.dulmage_mendelsohn import dulmage_mendelsohn
+from pyomo.contrib.incidence_analysis.triangularize import block_triangularize
+from pyomo.contrib.incidence_analysis.tests.models_for_testing import (
+    make_gas_expansion_model,
+    make_degenerate_solid_phase_model,
+    make_dynamic_model,
+)
+import pyomo.common.unittest as unittest
+
+
+def _random_matrix(M, N, density, seed):
+    rng = np.random.default_rng(seed)
+    return scipy.sparse.random(M, N, density=density, format="csr", random_state=rng)
+
+
+def _permuted_square_matrix(N, seed):
+    # A (structurally nonsingular) matrix with a few nontrivial
+    # diagonal blocks, with rows and columns permuted
+    rng = np.random.default_rng(seed)
+    matrix = scipy.sparse.random(N, N, density=2 / N, random_state=rng)
+    matrix = scipy.sparse.tril(matrix) + scipy.sparse.eye(N)
+    for i in range(0, N - 3, 5):
+        matrix = matrix + scipy.sparse.coo_matrix(([1.0], ([i], [i + 3])), (N, N))
+    rows = rng.permutation(N)
+    cols = rng.permutation(N)
+    return matrix.tocsr()[rows][:, cols]
+
+
+@unittest.skipUnless(numpy_available, "numpy is not available")
+@unittest.skipUnless(scipy_available, "scipy is not available")
+@unittest.skipUnless(networkx_available, "networkx is not available")
+class TestSparseGraphAlgorithms(unittest.TestCase):
+    def _check_matching(self, matrix, matching):
+        cols = matching[matching >= 0]
+        self.assertEqual(len(cols), len(set(cols.tolist())))
+        dense = matrix.toarray()
+        for i, j in enumerate(matching):
+            if j >= 0:
+                self.assertTrue(dense[i, j])
+
+    def test_maximum_matching(self):
+        for M, N, seed in [(10, 10, 0), (30, 20, 1), (20, 35, 2)]:
+            matrix = _random_matrix(M, N, 0.1, seed)
+            matching = sparse_graph.maximum_matching(matrix)
+            self.assertEqual(matching.shape, (M,))
+            self._check_matching(matrix, matching)
+            # The cardinality matches the structural rank
+            self.assertEqual(
+                np.count_nonzero(matching >= 0),
+                scipy.sparse.csgraph.structural_rank(matrix),
+            )
+
+    def test_connected_components(self):
+        for M, N, seed in [(10, 10, 0), (30, 20, 1), (20, 35, 2)]:
+            matrix = _random_matrix(M, N, 0.05, seed)
+            self.assertEqual(
+                sparse_graph.connected_components(matrix),
+                get_independent_submatrices(matrix.tocoo()),
+            )
+
+    def test_block_triangularize(self):
+        for N, seed in [(10, 0), (50, 1), (200, 2)]:
+            matrix = _permuted_square_matrix(N, seed)
+            row_blocks, col_blocks = sparse_graph.block_triangularize(matrix)
+            nx_row_blocks, nx_col_blocks = block_triangularize(matrix.tocoo())
+            # The diagonal blocks are unique (the order may differ
+            # between topological orders)
+            self.assertEqual(
+                sorted(map(sorted, row_blocks)), sorted(map(sorted, nx_row_blocks))
+            )
+            self.assertEqual(
+                sorted(map(sorted, col_blocks)), sorted(map(sorted, nx_col_blocks))
+            )
+            # The permuted matrix is block lower triangular
+            rows = np.concatenate(row_blocks)
+            cols = np.concatenate(col_blocks)
+            permuted = matrix[rows][:, cols].toarray()
+            block_start = np.cumsum([0] + [len(b) for b in row_blocks])
+            for k in range(len(row_blocks)):
+                self.assertFalse(
+                    permuted[
+                        block_start[k] : block_start[k + 1], block_start[k + 1] :
+                    ].any()
+                )
+
+    def test_block_triangularize_order(self):
+        # Ties are broken by the smallest row in each block
+        matrix = scipy.sparse.csr_matrix(
+            np.array(
+                [
+                    [1, 0, 0, 1, 0],
+                    [0, 1, 0, 0, 0],
+                    [0, 0, 1, 0, 0],
+                    [1, 0, 0, 1, 0],
+                    [0, 0, 1, 1, 1],
+                ]
+            )
+        )
+        row_blocks, col_blocks = sparse_graph.block_triangularize(matrix)
+        self.assertEqual(row_blocks, [[0, 3], [1], [2], [4]])
+        self.assertEqual(sorted(col_blocks[0]), [0, 3])
+        self.assertEqual(col_blocks[1:], [[1], [2], [4]])
+
+    def test_block_triangularize_exceptions(self):
+        with self.assertRaisesRegex(RuntimeError, "different cardinalities"):
+            sparse_graph.block_triangularize(scipy.sparse.eye(3, 4))
+        matrix = scipy.sparse.csr_matrix(np.array([[1, 1], [0, 0]]))
+        with self.assertRaisesRegex(RuntimeError, "without a perfect matching"):
+            sparse_graph.block_triangularize(matrix)
+
+    def test_dulmage_mendelsohn(self):
+        for M, N, seed in [(10, 10, 0), (30, 20, 1), (20, 35, 2), (40, 40, 3)]:
+            matrix = _random_matrix(M, N, 0.06, seed)
+            row_dmp, col_dmp = sparse_graph.dulmage_mendelsohn(matrix)
+            nx_row_dmp, nx_col_dmp = dulmage_mendelsohn(matrix.tocoo())
+            # The unions of the unmatched and reachable subsets, and the
+            # square subsets, do not depend on the matching
+            self.assertEqual(
+                sorted(row_dmp[0] + row_dmp[1]), sorted(nx_row_dmp[0] + nx_row_dmp[1])
+            )
+            self.assertEqual(
+                sorted(col_dmp[0] + col_dmp[1]), sorted(nx_col_dmp[0] + nx_col_dmp[1])
+            )
+            self.assertEqual(sorted(row_dmp[3]), sorted(nx_row_dmp[3]))
+            self.assertEqual(sorted(col_dmp[3]), sorted(nx_col_dmp[3]))
+            # Zipping the corresponding subsets recovers a maximum matching
+            matching = np.full(M, -1)
+            for rows, cols in [
+                (row_dmp[2], col_dmp[1]),
+                (row_dmp[3], col_dmp[3]),
+                (row_dmp[1], col_dmp[2]),
+            ]:
+                self.assertEqual(len(rows), len(cols))
+                matching[rows] = cols
+            self._check_matching(matrix, matching)
+            self.assertEqual(
+                np.count_nonzero(matching >= 0),
+                scipy.sparse.csgraph.structural_rank(matrix),
+            )
+
+    def test_incremental_graph(self):
+        matrix = scipy.sparse.csr_matrix(np.array([[1, 0, 0], [0, 1, 1]]))
+        graph = sparse_graph.SparseIncidenceGraph(matrix)
+        self.assertEqual(graph.n_edges, 3)
+        graph.add_edge(0, 2)
+        graph.add_edge(1, 1)
+        self.assertEqual(graph.n_edges, 4)
+        self.assertEqual(graph.row_neighbors(0), [0, 2])
+        self.assertEqual(graph.col_neighbors(2), [0, 1])
+        sub = graph.subgraph([1], [2, 0])
+        self.assertEqual(sub.matrix.toarray().tolist(), [[True, False]])
+        # The original matrix is not modified
+        self.assertEqual(matrix.nnz, 3)
+
+
+@unittest.skipUnless(numpy_available, "numpy is not available")
+@unittest.skipUnless(scipy_available, "scipy is not available")
+@unittest.skipUnless(networkx_available, "networkx is not available")
+class TestSparseBackendInterface(unittest.TestCase):
+    def _interfaces(self, m, **kwds):
+        return (
+            IncidenceGraphInterface(m, backend=IncidenceBackend.networkx, **kwds),
+            IncidenceGraphInterface(m, backend=IncidenceBackend.scipy, **kwds),
+        )
+
+    def assertSamePartition(self, first, second):
+        self.assertEqual(
+            sorted(sorted(c.name for c in part) for part in first),
+            sorted(sorted(c.name for c in part) for part in second),
+        )
+
+    def test_gas_expansion(self):
+        m = make_gas_expansion_model(10)
+        nx_igraph, igraph = self._interfaces(m)
+        self.assertEqual(igraph.n_edges, nx_igraph.n_edges)
+        self.assertEqual((igraph.incidence_matrix != nx_igraph.incidence_matrix).nnz, 0)
+        # The system is underconstrained
+        var_dmp, con_dmp = igraph.dulmage_mendelsohn()
+        nx_var_dmp, nx_con_dmp = nx_igraph.dulmage_mendelsohn()
+        self.assertEqual(
+            ComponentSet(var_dmp.unmatched + var_dmp.underconstrained),
+            ComponentSet(nx_var_dmp.unmatched + nx_var_dmp.underconstrained),
+        )
+        self.assertEqual(ComponentSet(con_dmp.square), ComponentSet(nx_con_dmp.square))
+        self.assertEqual(len(igraph.maximum_matching()), len(igraph.constraints))
+
+        m.rho[0].fix()
+        m.F[0].fix()
+        m.T[0].fix()
+        nx_igraph, igraph = self._interfaces(m)
+        # Here the block triangular order is unique
+        vblocks, cblocks = igraph.block_triangularize()
+        nx_vblocks, nx_cblocks = nx_igraph.block_triangularize()
+        self.assertEqual(
+            [ComponentSet(b) for b in vblocks], [ComponentSet(b) for b in nx_vblocks]
+        )
+        self.assertEqual(
+            [ComponentSet(b) for b in cblocks], [ComponentSet(b) for b in nx_cblocks]
+        )
+        var_map, con_map = igraph.map_nodes_to_block_triangular_indices()
+        for idx, block in enumerate(vblocks):
+            for var in block:
+                self.assertEqual(var_map[var], idx)
+
+    def test_dynamic_model(self):
+        m = make_dynamic_model(nfe=5, scheme="BACKWARD")
+        m.height[0].fix()
+        nx_igraph, igraph = self._interfaces(m)
+        var_blocks, con_blocks = igraph.get_connected_components()
+        nx_var_blocks, nx_con_blocks = nx_igraph.get_connected_components()
+        self.assertEqual(var_blocks, nx_var_blocks)
+        self.assertEqual(con_blocks, nx_con_blocks)
+
+        m.flow_in.fix()
+        nx_igraph, igraph = self._interfaces(m)
+        vblocks, cblocks = igraph.block_triangularize()
+        nx_vblocks, nx_cblocks = nx_igraph.block_triangularize()
+        self.assertSamePartition(vblocks, nx_vblocks)
+        self.assertSamePartition(cblocks, nx_cblocks)
+
+    def test_degenerate_solid_phase_model(self):
+        m = make_degenerate_solid_phase_model()
+        nx_igraph, igraph = self._interfaces(m)
+        var_dmp, con_dmp = igraph.dulmage_mendelsohn()
+        nx_var_dmp, nx_con_dmp = nx_igraph.dulmage_mendelsohn()
+        self.assertEqual(
+            ComponentSet(con_dmp.unmatched + con_dmp.overconstrained),
+            ComponentSet(nx_con_dmp.unmatched + nx_con_dmp.overconstrained),
+        )
+        self.assertEqual(
+            ComponentSet(var_dmp.overconstrained),
+            ComponentSet(nx_var_dmp.overconstrained),
+        )
+        self.assertEqual(ComponentSet(var_dmp.square), ComponentSet(nx_var_dmp.square))
+
+    def test_add_edge_and_remove_nodes(self):
+        m = pyo.ConcreteModel()
+        m.x = pyo.Var([1, 2, 3, 4])
+        m.eq1 = pyo.Constraint(expr=m.x[1] ** 2 + m.x[2] ** 2 + m.x[3] ** 2 == 1)
+        m.eq2 = pyo.Constraint(expr=pyo.sqrt(m.x[1]) + pyo.exp(m.x[3]) == 1)
+        m.eq3 = pyo.Constraint(expr=m.x[3] + m.x[2] + m.x[4] == 1)
+        m.eq4 = pyo.Constraint(expr=m.x[1] == 5 * m.x[2])
+
+        for igraph in self._interfaces(m):
+            # Eliminate x[1] using eq4
+            for adj_con in igraph.get_adjacent_to(m.x[1]):
+                for adj_var in igraph.get_adjacent_to(m.eq4):
+                    igraph.add_edge(adj_var, adj_con)
+            igraph.remove_nodes([m.x[1]], [m.eq4])
+            self.assertEqual(igraph.n_edges, 7)
+            self.assertEqual(igraph.variables, [m.x[2], m.x[3], m.x[4]])
+            self.assertEqual(igraph.constraints, [m.eq1, m.eq2, m.eq3])
+            self.assertEqual(
+                ComponentSet(igraph.get_adjacent_to(m.eq2)),
+                ComponentSet([m.x[2], m.x[3]]),
+            )
+            self.assertEqual(
+                ComponentSet(igraph.get_adjacent_to(m.x[2])),
+                ComponentSet([m.eq1, m.eq2, m.eq3]),
+            )
+            vblocks, cblocks = igraph.block_triangularize()
+            self.assertEqual(
+                [ComponentSet(b) for b in vblocks],
+                [ComponentSet([m.x[2], m.x[3]]), ComponentSet([m.x[4]])],
+            )
+
+    def test_subgraph(self):
+        m = make_gas_expansion_model(4)
+        nx_igraph, igraph = self._interfaces(m)
+        variables = [m.P[1], m.rho[1], m.F[1], m.T[1]]
+        constraints = [m.ideal_gas[1], m.mbal[1], m.ebal[1], m.expansion[1]]
+        subgraph = igraph.subgraph(variables, constraints)
+        nx_subgraph = nx_igraph.subgraph(variables, constraints)
+        self.assertEqual(subgraph.variables, variables)
+        self.assertEqual(subgraph.n_edges, nx_subgraph.n_edges)
+        self.assertEqual(
+            (subgraph.incidence_matrix != nx_subgraph.incidence_matrix).nnz, 0
+        )
+        vblocks, cblocks = subgraph.block_triangularize()
+        self.assertEqual(len(vblocks), 1)
+        # Edges added to the subgraph do not change the original graph
+        n_edges = igraph.n_edges
+        full = igraph.subgraph(igraph.variables, igraph.constraints)
+        full.add_edge(m.P[0], m.ideal_gas[4])
+        self.assertEqual(full.n_edges, n_edges + 1)
+        self.assertEqual(igraph.n_edges, n_edges)
+
+
+if __name__ == "__main__":
+    unittest.main()
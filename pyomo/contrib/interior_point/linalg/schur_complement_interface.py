@@ -0,0 +1,296 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright (c) 2008-2025
+#  National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+
+from .base_linear_solver_interface import IPLinearSolverInterface
+from .scipy_interface import ScipyInterface
+from pyomo.contrib.pynumero.linalg.base import LinearSolverStatus, LinearSolverResults
+from pyomo.contrib.pynumero.sparse import BlockVector, BlockMatrix
+from concurrent.futures import ThreadPoolExecutor
+from scipy.linalg import eigh
+from scipy.sparse import spmatrix
+import numpy as np
+from typing import Union, Optional, Tuple
+
+
+def _default_block_solver():
+    return ScipyInterface(compute_inertia=True)
+
+
+class SchurComplementInterface(IPLinearSolverInterface):
+    """
+    Linear solver for symmetric KKT systems with an arrowhead
+    (block-angular) structure, e.g., from stochastic programs or
+    multi-period problems where the scenarios or periods are linked by a
+    small number of coupling variables.
+
+    The matrix must be a BlockMatrix with N + 1 block rows and block
+    columns whose only nonempty blocks are the diagonal blocks and the
+    blocks in the last block row and column:
+
+    .. code-block:: none
+
+       [ A_0                        B_0^T   ]
+       [       A_1                  B_1^T   ]
+       [             ...            ...     ]
+       [                   A_{N-1}  B_{N-1}^T ]
+       [ B_0   B_1   ...   B_{N-1}  C       ]
+
+    Each diagonal block A_i is factored with its own linear solver.
+    These factorizations are independent, so they may be performed
+    concurrently (see ``max_workers``).  The coupling system is then
+    solved using the dense Schur complement
+
+    .. math::
+
+       S = C - \\sum_i B_i A_i^{-1} B_i^T
+
+    which is factored with a symmetric eigenvalue decomposition.  The
+    inertia of the KKT matrix is the sum of the inertia of each A_i and
+    the inertia of S (Haynsworth inertia additivity), so this interface
+    can be used with the regularization and inertia correction in
+    :py:class:`InteriorPointSolver`.
+
+    Parameters
+    ----------
+    block_solver_factory: callable, optional
+        Called with no arguments to create the IPLinearSolverInterface
+        used for each diagonal block.  The default creates a
+        ``ScipyInterface(compute_inertia=True)``.
+    max_workers: int, optional
+        If provided, the diagonal blocks are factored (and the
+        corresponding back solves are performed) concurrently using a
+        pool of this many threads.  This is only beneficial if the block
+        solvers release the GIL (e.g., MA27, MUMPS, and SuperLU).
+    """
+
+    @classmethod
+    def getLoggerName(cls):
+        return 'schur_complement'
+
+    def __init__(self, block_solver_factory=None, max_workers=None):
+        if block_solver_factory is None:
+            block_solver_factory = _default_block_solver
+        self.block_solver_factory = block_solver_factory
+        self.max_workers = max_workers
+        self._executor = None
+        self._block_solvers = []
+        self._nblocks = None
+        # per diagonal block: (coupling block B_i in CSR format, indices
+        # of the nonzero rows of B_i, A_i^{-1} B_i^T for those rows)
+        self._border = None
+        self._border_rows = None
+        self._border_solves = None
+        self._block_sizes = None
+        self._schur_eigenvalues = None
+        self._schur_eigenvectors = None
+        self._schur_inertia = None
+
+    def _map(self, func, iterable):
+        if not self.max_workers:
+            return list(map(func, iterable))
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(self.max_workers)
+        return list(self._executor.map(func, iterable))
+
+    def _get_structure(self, matrix):
+        """Verify that matrix is an arrowhead BlockMatrix and return the
+        diagonal blocks, the coupling blocks (B_i), and C"""
+        if not isinstance(matrix, BlockMatrix):
+            raise ValueError(
+                'SchurComplementInterface requires a BlockMatrix; received %s'
+                % (type(matrix).__name__,)
+            )
+        nbrows, nbcols = matrix.bshape
+        if nbrows != nbcols or nbrows < 2:
+            raise ValueError(
+                'SchurComplementInterface requires a square BlockMatrix with '
+                'at least 2 block rows; received a BlockMatrix with bshape %s'
+                % (matrix.bshape,)
+            )
+        N = nbrows - 1
+        for i in range(N):
+            for j in range(N):
+                if i != j and not matrix.is_empty_block(i, j):
+                    raise ValueError(
+                        'SchurComplementInterface requires a BlockMatrix with '
+                        'an arrowhead structure: block (%s, %s) is not empty' % (i, j)
+                    )
+        diag = [matrix.get_block(i, i) for i in range(N)]
+        border = []
+        for i in range(N):
+            if not matrix.is_empty_block(N, i):
+                border.append(matrix.get_block(N, i).tocsr())
+            elif not matrix.is_empty_block(i, N):
+                border.append(matrix.get_block(i, N).transpose().tocsr())
+            else:
+                border.append(None)
+        coupling = None if matrix.is_empty_block(N, N) else matrix.get_block(N, N)
+        return diag, border, coupling
+
+    def do_symbolic_factorization(
+        self, matrix: Union[spmatrix, BlockMatrix], raise_on_error: bool = True
+    ) -> LinearSolverResults:
+        diag, border, coupling = self._get_structure(matrix)
+        N = len(diag)
+        if N != self._nblocks:
+            self._block_solvers = [self.block_solver_factory() for i in range(N)]
+            self._nblocks = N
+        self._schur_eigenvalues = None
+        self._schur_eigenvectors = None
+        self._schur_inertia = None
+
+        results = self._map(
+            lambda i: self._block_solvers[i].do_symbolic_factorization(
+                diag[i], raise_on_error=raise_on_error
+            ),
+            range(N),
+        )
+        for res in results:
+            if res.status != LinearSolverStatus.successful:
+                return res
+        return LinearSolverResults(LinearSolverStatus.successful)
+
+    def _factor_block(self, i, A, B, raise_on_error):
+        solver = self._block_solvers[i]
+        res = solver.do_numeric_factorization(A, raise_on_error=raise_on_error)
+        if res.status != LinearSolverStatus.successful or B is None:
+            return res, None, None, None
+        # Only the nonzero rows of B_i contribute to the Schur complement
+        rows = np.flatnonzero(np.diff(B.indptr))
+        rhs = B[rows].transpose().toarray()
+        sol = np.empty(rhs.shape)
+        for j in range(len(rows)):
+            sol[:, j], res = solver.do_back_solve(
+                rhs[:, j], raise_on_error=raise_on_error
+            )
+            if res.status != LinearSolverStatus.successful:
+                return res, None, None, None
+        return res, rows, sol, B @ sol
+
+    def do_numeric_factorization(
+        self, matrix: Union[spmatrix, BlockMatrix], raise_on_error: bool = True
+    ) -> LinearSolverResults:
+        diag, border, coupling = self._get_structure(matrix)
+        N = len(diag)
+        if N != self._nblocks:
+            raise RuntimeError(
+                'The number of diagonal blocks (%s) does not match the '
+                'symbolic factorization (%s); call do_symbolic_factorization '
+                'first' % (N, self._nblocks)
+            )
+        self._schur_eigenvalues = None
+        self._schur_eigenvectors = None
+        self._schur_inertia = None
+
+        results = self._map(
+            lambda i: self._factor_block(i, diag[i], border[i], raise_on_error),
+            range(N),
+        )
+        for res, rows, sol, contrib in results:
+            if res.status != LinearSolverStatus.successful:
+                return res
+
+        n_coupling = matrix.get_row_size(N)
+        if coupling is None:
+            schur = np.zeros((n_coupling, n_coupling))
+        else:
+            schur = coupling.toarray()
+        for res, rows, sol, contrib in results:
+            if rows is not None:
+                schur[:, rows] -= contrib
+
+        self._border = border
+        self._border_rows = [rows for res, rows, sol, contrib in results]
+        self._border_solves = [sol for res, rows, sol, contrib in results]
+        self._block_sizes = [matrix.get_row_size(i) for i in range(N + 1)]
+
+        eig, vecs = eigh(schur)
+        tol = np.finfo(float).eps * max(n_coupling, 1) * np.abs(eig).max(initial=0)
+        n_zero = int(np.count_nonzero(np.abs(eig) <= tol))
+        if n_zero:
+            if raise_on_error:
+                raise RuntimeError('The Schur complement is singular')
+            return LinearSolverResults(LinearSolverStatus.singular)
+
+        # inertia of the Schur complement (the inertia of the diagonal
+        # blocks is added in get_inertia)
+        self._schur_inertia = (
+            int(np.count_nonzero(eig > 0)),
+            int(np.count_nonzero(eig < 0)),
+            0,
+        )
+        self._schur_eigenvalues = eig
+        self._schur_eigenvectors = vecs
+        return LinearSolverResults(LinearSolverStatus.successful)
+
+    def do_back_solve(
+        self, rhs: Union[np.ndarray, BlockVector], raise_on_error: bool = True
+    ) -> Tuple[Optional[Union[np.ndarray, BlockVector]], LinearSolverResults]:
+        if self._schur_eigenvectors is None:
+            raise RuntimeError(
+                'do_numeric_factorization must be successful before calling '
+                'do_back_solve'
+            )
+        N = self._nblocks
+        if isinstance(rhs, BlockVector):
+            _rhs = rhs.flatten()
+        else:
+            _rhs = np.array(rhs, dtype=float)
+        pieces = np.split(_rhs, np.cumsum(self._block_sizes)[:-1])
+
+        results = self._map(
+            lambda i: self._block_solvers[i].do_back_solve(
+                pieces[i], raise_on_error=raise_on_error
+            ),
+            range(N),
+        )
+        for sol, res in results:
+            if res.status != LinearSolverStatus.successful:
+                return None, res
+
+        # Solve for the coupling variables
+        coupling_rhs = pieces[N].astype(float)
+        for B, (sol, res) in zip(self._border, results):
+            if B is not None:
+                coupling_rhs -= B @ sol
+        V = self._schur_eigenvectors
+        coupling_sol = V @ ((V.T @ coupling_rhs) / self._schur_eigenvalues)
+
+        result = []
+        for i, (sol, res) in enumerate(results):
+            rows = self._border_rows[i]
+            if rows is not None:
+                sol = sol - self._border_solves[i] @ coupling_sol[rows]
+            result.append(sol)
+        result.append(coupling_sol)
+        result = np.concatenate(result)
+
+        if isinstance(rhs, BlockVector):
+            _result = rhs.copy_structure()
+            _result.copyfrom(result)
+            result = _result
+
+        return result, LinearSolverResults(LinearSolverStatus.successful)
+
+    def increase_memory_allocation(self, factor):
+        for solver in self._block_solvers:
+            solver.increase_memory_allocation(factor)
+
+    def get_inertia(self):
+        if self._schur_inertia is None:
+            raise RuntimeError(
+                'The inertia is only available after a successful call to '
+                'do_numeric_factorization'
+            )
+        inertia = np.array(self._schur_inertia)
+        for solver in self._block_solvers:
+            inertia += solver.get_inertia()
+        return tuple(int(i) for i in inertia)
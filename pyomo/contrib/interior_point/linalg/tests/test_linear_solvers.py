@@ -20,10 +20,17 @@ if not np_available or not scipy_available:
 import numpy as np
 from scipy.sparse import coo_matrix, tril
 from pyomo.contrib import interior_point as ip
+from pyomo.contrib.interior_point.interior_point import (
+    try_factorization_and_reallocation,
+)
 from pyomo.contrib.pynumero.linalg.base import LinearSolverStatus
+from pyomo.contrib.pynumero.sparse import BlockMatrix, BlockVector
 
 if scipy_available:
     from pyomo.contrib.interior_point.linalg.scipy_interface import ScipyInterface
+    from pyomo.contrib.interior_point.linalg.schur_complement_interface import (
+        SchurComplementInterface,
+    )
 if mumps_available:
     from pyomo.contrib.interior_point.linalg.mumps_interface import MumpsInterface
 from pyomo.contrib.pynumero.linalg.ma27 import MA27Interface
@@ -152,3 +159,146 @@ class TestWrongNonzeroOrdering(unittest.TestCase):
     def test_ma27(self):
         solver = InteriorPointMA27Interface()
         self._test_solvers(solver, use_tril=True)
+
+
+def get_arrowhead_matrix(n_blocks=3, seed=0):
+    """Return a symmetric, indefinite BlockMatrix with an arrowhead
+    structure (and the flattened equivalent)"""
+    rng = np.random.default_rng(seed)
+    kkt = BlockMatrix(n_blocks + 1, n_blocks + 1)
+    for i in range(n_blocks):
+        # [[H, J^T], [J, 0]] with H positive definite (3 x 3) and J (1 x 3)
+        H = rng.uniform(-1, 1, size=(3, 3))
+        H = H @ H.T + 3 * np.eye(3)
+        J = rng.uniform(1, 2, size=(1, 3))
+        A = np.zeros((4, 4))
+        A[:3, :3] = H
+        A[3, :3] = J
+        A[:3, 3] = J
+        kkt.set_block(i, i, coo_matrix(A))
+        # only couple to the first and last entry of each block
+        B = np.zeros((2, 4))
+        B[0, 0] = rng.uniform(1, 2)
+        B[1, 3] = rng.uniform(1, 2)
+        kkt.set_block(n_blocks, i, coo_matrix(B))
+        kkt.set_block(i, n_blocks, coo_matrix(B.T))
+    kkt.set_block(n_blocks, n_blocks, coo_matrix(np.diag([2.0, -1.0])))
+    return kkt
+
+
+class TestSchurComplementInterface(unittest.TestCase):
+    def _check_solve(self, solver, kkt):
+        res = solver.do_symbolic_factorization(kkt)
+        self.assertEqual(res.status, LinearSolverStatus.successful)
+        res = solver.do_numeric_factorization(kkt)
+        self.assertEqual(res.status, LinearSolverStatus.successful)
+
+        full = kkt.toarray()
+        eig = np.linalg.eigvalsh(full)
+        self.assertEqual(
+            solver.get_inertia(),
+            (np.count_nonzero(eig > 0), np.count_nonzero(eig < 0), 0),
+        )
+
+        x_true = np.arange(1, full.shape[0] + 1, dtype=float)
+        rhs = full @ x_true
+        x, res = solver.do_back_solve(rhs)
+        self.assertEqual(res.status, LinearSolverStatus.successful)
+        self.assertTrue(np.allclose(x, x_true))
+        # the rhs is not modified
+        self.assertTrue(np.allclose(rhs, full @ x_true))
+
+        block_rhs = BlockVector(kkt.bshape[0])
+        offset = 0
+        for i in range(kkt.bshape[0]):
+            n = kkt.get_row_size(i)
+            block_rhs.set_block(i, rhs[offset : offset + n])
+            offset += n
+        x, res = solver.do_back_solve(block_rhs)
+        self.assertIsInstance(x, BlockVector)
+        self.assertTrue(np.allclose(x.flatten(), x_true))
+
+    def test_solve(self):
+        kkt = get_arrowhead_matrix()
+        self._check_solve(SchurComplementInterface(), kkt)
+
+    def test_solve_threaded(self):
+        kkt = get_arrowhead_matrix(n_blocks=5, seed=1)
+        solver = SchurComplementInterface(max_workers=2)
+        self._check_solve(solver, kkt)
+        # reuse the block solvers for a second factorization
+        kkt = get_arrowhead_matrix(n_blocks=5, seed=2)
+        solvers = list(solver._block_solvers)
+        self._check_solve(solver, kkt)
+        self.assertEqual(solver._block_solvers, solvers)
+
+    def test_uncoupled_block(self):
+        kkt = get_arrowhead_matrix()
+        kkt.set_block(3, 1, None)
+        kkt.set_block(1, 3, None)
+        self._check_solve(SchurComplementInterface(), kkt)
+
+    def test_inertia_correction(self):
+        # Factorize with the helper used by InteriorPointSolver.factorize
+        # and check that regularizing the Hessian blocks (as the inertia
+        # correction does) is reflected in the inertia
+        kkt = get_arrowhead_matrix()
+        shift = np.diag([20.0, 20, 20, 0])
+        for i in range(3):
+            kkt.set_block(i, i, coo_matrix(kkt.get_block(i, i).toarray() - shift))
+        solver = SchurComplementInterface()
+        status, num_realloc = try_factorization_and_reallocation(
+            kkt=kkt, linear_solver=solver, reallocation_factor=2, max_iter=1
+        )
+        self.assertEqual(status, LinearSolverStatus.successful)
+        eig = np.linalg.eigvalsh(kkt.toarray())
+        self.assertEqual(
+            solver.get_inertia(),
+            (np.count_nonzero(eig > 0), np.count_nonzero(eig < 0), 0),
+        )
+        self.assertNotEqual(solver.get_inertia(), (10, 4, 0))
+
+        for i in range(3):
+            kkt.set_block(i, i, coo_matrix(kkt.get_block(i, i).toarray() + shift))
+        status, num_realloc = try_factorization_and_reallocation(
+            kkt=kkt, linear_solver=solver, reallocation_factor=2, max_iter=1
+        )
+        self.assertEqual(status, LinearSolverStatus.successful)
+        self.assertEqual(solver.get_inertia(), (10, 4, 0))
+        self._check_solve(solver, kkt)
+
+    def test_singular(self):
+        kkt = get_arrowhead_matrix()
+        # make the Schur complement singular
+        solver = SchurComplementInterface()
+        solver.do_symbolic_factorization(kkt)
+        solver.do_numeric_factorization(kkt)
+        eig = solver._schur_eigenvalues
+        C = kkt.get_block(3, 3).toarray() - eig[0] * np.eye(2)
+        kkt.set_block(3, 3, coo_matrix(C))
+        res = solver.do_numeric_factorization(kkt, raise_on_error=False)
+        self.assertEqual(res.status, LinearSolverStatus.singular)
+        with self.assertRaisesRegex(RuntimeError, 'Schur complement is singular'):
+            solver.do_numeric_factorization(kkt)
+        with self.assertRaisesRegex(RuntimeError, 'inertia is only available'):
+            solver.get_inertia()
+
+        # a singular diagonal block
+        kkt = get_arrowhead_matrix()
+        kkt.set_block(1, 1, coo_matrix((4, 4)))
+        solver.do_symbolic_factorization(kkt)
+        res = solver.do_numeric_factorization(kkt, raise_on_error=False)
+        self.assertEqual(res.status, LinearSolverStatus.singular)
+
+    def test_structure_errors(self):
+        solver = SchurComplementInterface()
+        with self.assertRaisesRegex(ValueError, 'requires a BlockMatrix'):
+            solver.do_symbolic_factorization(get_base_matrix(use_tril=False))
+        kkt = get_arrowhead_matrix()
+        kkt.set_block(0, 1, coo_matrix((4, 4)))
+        with self.assertRaisesRegex(ValueError, r'block \(0, 1\) is not empty'):
+            solver.do_symbolic_factorization(kkt)
+        kkt = BlockMatrix(1, 1)
+        kkt.set_block(0, 0, get_base_matrix(use_tril=False))
+        with self.assertRaisesRegex(ValueError, 'at least 2 block rows'):
+            solver.do_symbolic_factorization(kkt)
@@ -10,7 +10,7 @@
 #  ___________________________________________________________________________
 
 from .interfaces.model_interface import DynamicModelInterface
-from .data.series_data import TimeSeriesData
+from .data.series_data import TimeSeriesData, ColumnarTimeSeriesData
 from .data.interval_data import IntervalData
 from .data.scalar_data import ScalarData
 from .data.get_cuid import get_indexed_cuid
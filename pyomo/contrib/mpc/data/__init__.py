@@ -10,7 +10,7 @@
 #  ___________________________________________________________________________
 
 from .scalar_data import ScalarData
-from .series_data import TimeSeriesData
+from .series_data import TimeSeriesData, ColumnarTimeSeriesData
 from .interval_data import IntervalData
 from .convert import series_to_interval, interval_to_series
 
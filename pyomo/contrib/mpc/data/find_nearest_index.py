@@ -11,6 +11,8 @@
 
 import bisect
 
+from pyomo.common.dependencies import numpy as np
+
 
 def find_nearest_index(array, target, tolerance=None):
     # array needs to be sorted and we assume it is zero-indexed
@@ -42,6 +44,45 @@ def find_nearest_index(array, target, tolerance=None):
     return nearest_index
 
 
+def find_nearest_indices(array, targets, tolerance=None):
+    """Vectorized version of ``find_nearest_index``
+
+    Parameters
+    ----------
+    array: numpy.ndarray
+        Sorted, one-dimensional array of points
+    targets: numpy.ndarray
+        Points whose nearest neighbors in ``array`` we want to find
+    tolerance: float
+        Maximum allowable distance between a target and its nearest
+        neighbor
+
+    Returns
+    -------
+    numpy.ndarray
+        Integer array containing, for each target, the index of the
+        nearest point in ``array``. As in ``find_nearest_index``, ties
+        go to the index on the left. Targets with no point within the
+        tolerance are assigned an index of -1.
+
+    """
+    array = np.asarray(array, dtype=float)
+    targets = np.asarray(targets, dtype=float)
+    n = len(array)
+    i = np.searchsorted(array, targets, side="right")
+    left = np.clip(i - 1, 0, n - 1)
+    right = np.clip(i, 0, n - 1)
+    delta_left = np.abs(targets - array[left])
+    delta_right = np.abs(array[right] - targets)
+    # Tie goes to the index on the left.
+    use_right = delta_right < delta_left
+    nearest_index = np.where(use_right, right, left)
+    if tolerance is not None:
+        delta = np.where(use_right, delta_right, delta_left)
+        nearest_index[delta > tolerance] = -1
+    return nearest_index
+
+
 def _distance_from_interval(point, interval, tolerance=None):
     lo, hi = interval
     if tolerance is None:
@@ -11,6 +11,8 @@
 
 from bisect import bisect_right
 
+from pyomo.common.dependencies import numpy as np
+
 
 def _get_time_index_vec(time_set, time_data):
     """Get the position index of time_data above and below the times in
@@ -77,3 +79,62 @@ def _get_interp_expr_vec(time_set, time_data, data, indexes=None):
             t - time_data[l]
         )
     return expr
+
+
+def _get_time_index_array(time_set, time_data):
+    """Vectorized version of ``_get_time_index_vec``
+
+    Parameters
+    ----------
+    time_set: numpy.ndarray
+        Time points to locate
+    time_data: numpy.ndarray
+        Sorted time points to locate time_set in
+
+    Returns
+    -------
+    numpy.ndarray
+        Integer array of position indexes in the same format as returned
+        by ``_get_time_index_vec()``. If time_data contains a single
+        point, all the indexes are 0.
+    """
+    if len(time_data) < 2:
+        return np.zeros(len(time_set), dtype=np.intp)
+    pos = np.searchsorted(time_data, time_set, side="right")
+    return np.clip(pos, 1, len(time_data) - 1)
+
+
+def _get_interp_array(time_set, time_data, data, indexes=None):
+    """Return a two-dimensional array of values interpolated at the time
+    points in time_set from data defined at time_data.
+
+    Parameters
+    ----------
+    time_set: numpy.ndarray
+        Time points to locate
+    time_data: numpy.ndarray
+        Sorted time points to locate time_set in
+    data: numpy.ndarray
+        Two-dimensional array with one row per data series and one column
+        per time point in time_data.
+    indexes: numpy.ndarray
+        Array of position indexes in the format returned by
+        ``_get_time_index_array()``. If this is None,
+        ``_get_time_index_array()`` is called.
+
+    Returns
+    -------
+    numpy.ndarray
+        Array with one row per data series and one column per time point
+        in time_set. If time_data contains a single point, the data are
+        treated as constant.
+    """
+    if len(time_data) < 2:
+        return np.repeat(data[:, :1], len(time_set), axis=1)
+    if indexes is None:
+        indexes = _get_time_index_array(time_set, time_data)
+    hi = indexes
+    lo = indexes - 1
+    weight = (time_set - time_data[lo]) / (time_data[hi] - time_data[lo])
+    data_lo = data[:, lo]
+    return data_lo + (data[:, hi] - data_lo) * weight
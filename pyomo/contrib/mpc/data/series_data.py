@@ -10,14 +10,19 @@
 #  ___________________________________________________________________________
 
 from collections import namedtuple
+from pyomo.common.dependencies import numpy as np
 from pyomo.core.expr.numvalue import value as pyo_value
-from pyomo.contrib.mpc.data.find_nearest_index import find_nearest_index
+from pyomo.contrib.mpc.data.find_nearest_index import (
+    find_nearest_index,
+    find_nearest_indices,
+)
 from pyomo.contrib.mpc.data.get_cuid import get_indexed_cuid
 from pyomo.contrib.mpc.data.dynamic_data_base import _is_iterable, _DynamicDataBase
 from pyomo.contrib.mpc.data.scalar_data import ScalarData
 from pyomo.contrib.mpc.data.interpolation import (
     _get_time_index_vec,
     _get_interp_expr_vec,
+    _get_interp_array,
 )
 
 TimeSeriesTuple = namedtuple("TimeSeriesTuple", ["data", "time"])
@@ -266,3 +271,372 @@ class TimeSeriesData(_DynamicDataBase):
             cuid = get_indexed_cuid(var, (self._orig_time_set,), context=context)
             data[cuid] = self._data[cuid]
         return TimeSeriesData(data, self._time, time_set=self._orig_time_set)
+
+
+class ColumnarTimeSeriesData(TimeSeriesData):
+    """
+    A TimeSeriesData object that stores its values in a single
+    two-dimensional NumPy array, with one row per variable and one column
+    per time point, and its time points in a sorted one-dimensional array.
+
+    Lookup, interpolation, concatenation, and time-shifting operations are
+    vectorized over all variables and time points. Unlike TimeSeriesData,
+    values must be numeric; Pyomo expressions are not supported. The
+    dict returned by ``get_data`` maps CUIDs to (read-only) rows of the
+    underlying array.
+
+    Parameters
+    ----------
+    data : dict or ComponentMap
+        Maps variables, names, or CUIDs to sequences of values
+
+    time : list or numpy.ndarray
+        Contains the time points corresponding to variable data points.
+
+    time_set : ContinuousSetData
+
+    context : BlockData
+    """
+
+    def __init__(self, data, time, time_set=None, context=None):
+        self._orig_time_set = time_set
+        cuids = [get_indexed_cuid(key, (time_set,), context=context) for key in data]
+        time = np.array(time, dtype=float)
+        n_time = len(time)
+        for key, data_list in data.items():
+            if len(data_list) != n_time:
+                raise ValueError(
+                    "Data lists must have same length as time. "
+                    "Length of time is %s while length of data for "
+                    "key %s is %s." % (n_time, key, len(data_list))
+                )
+        values = np.array(list(data.values()), dtype=float).reshape(
+            (len(cuids), n_time)
+        )
+        self._set_arrays(cuids, values, time)
+
+    @classmethod
+    def from_array(cls, keys, values, time, time_set=None, context=None):
+        """
+        Construct a ColumnarTimeSeriesData object directly from a
+        two-dimensional array of values
+
+        Parameters
+        ----------
+        keys : list
+            Variables, names, or CUIDs corresponding to rows of values
+
+        values : numpy.ndarray
+            Array with one row per key and one column per time point.
+            The array is used without copying if it is already a
+            C-contiguous array of floats.
+
+        time : list or numpy.ndarray
+            Time points corresponding to the columns of values
+
+        time_set : ContinuousSetData
+
+        context : BlockData
+
+        """
+        obj = cls.__new__(cls)
+        obj._orig_time_set = time_set
+        cuids = [get_indexed_cuid(key, (time_set,), context=context) for key in keys]
+        time = np.array(time, dtype=float)
+        values = np.ascontiguousarray(values, dtype=float)
+        if values.shape != (len(cuids), len(time)):
+            raise ValueError(
+                "Shape of values array, %s, does not match the number of "
+                "keys, %s, and the number of time points, %s."
+                % (values.shape, len(cuids), len(time))
+            )
+        obj._set_arrays(cuids, values, time)
+        return obj
+
+    def _set_arrays(self, cuids, values, time):
+        if np.any(time[1:] < time[:-1]):
+            raise ValueError("Time points are not sorted in increasing order")
+        self._cuids = cuids
+        self._cuid_idx_map = {cuid: i for i, cuid in enumerate(cuids)}
+        if len(self._cuid_idx_map) != len(cuids):
+            raise ValueError("Keys do not correspond to unique CUIDs")
+        self._values = values
+        self._time = time
+        self._data_cache = None
+        self._time_list = None
+
+    @property
+    def _data(self):
+        # Map from CUIDs to rows of the values array. This is rebuilt
+        # lazily whenever the underlying array is replaced.
+        if self._data_cache is None:
+            values = self._values.view()
+            values.flags.writeable = False
+            self._data_cache = dict(zip(self._cuids, values))
+        return self._data_cache
+
+    def __eq__(self, other):
+        if isinstance(other, ColumnarTimeSeriesData):
+            if self._cuid_idx_map.keys() != other._cuid_idx_map.keys():
+                return False
+            rows = [other._cuid_idx_map[cuid] for cuid in self._cuids]
+            return np.array_equal(self._time, other._time) and np.array_equal(
+                self._values, other._values[rows]
+            )
+        elif isinstance(other, TimeSeriesData):
+            other_data = other.get_data()
+            return (
+                self.get_time_points() == list(other.get_time_points())
+                and self._cuid_idx_map.keys() == other_data.keys()
+                and all(
+                    self._values[i].tolist() == list(other_data[cuid])
+                    for cuid, i in self._cuid_idx_map.items()
+                )
+            )
+        else:
+            raise TypeError(
+                "%s and %s are not comparable" % (self.__class__, other.__class__)
+            )
+
+    def get_cuids(self):
+        """
+        Get the CUIDs corresponding to rows of the values array
+
+        """
+        return self._cuids
+
+    def get_array(self):
+        """
+        Get the two-dimensional array of values, with one row per CUID
+        (in the order returned by ``get_cuids``) and one column per time
+        point
+
+        """
+        return self._values
+
+    def get_time_array(self):
+        """
+        Get time points of the time series data as a NumPy array
+
+        """
+        return self._time
+
+    def get_time_points(self):
+        """
+        Get time points of the time series data
+
+        """
+        if self._time_list is None:
+            self._time_list = self._time.tolist()
+        return self._time_list
+
+    def get_data_from_key(self, key, context=None):
+        cuid = get_indexed_cuid(key, (self._orig_time_set,), context=context)
+        return self._data[cuid]
+
+    def contains_key(self, key, context=None):
+        cuid = get_indexed_cuid(key, (self._orig_time_set,), context=context)
+        return cuid in self._cuid_idx_map
+
+    def update_data(self, other, context=None):
+        """
+        Updates this object's data with values from a dict or another
+        data object. Rows for CUIDs that are already present are
+        overwritten and rows for new CUIDs are appended.
+
+        """
+        if not isinstance(other, _DynamicDataBase):
+            other = {
+                get_indexed_cuid(key, (self._orig_time_set,), context=context): val
+                for key, val in other.items()
+            }
+        else:
+            other = other.get_data()
+        n_time = len(self._time)
+        new_cuids = []
+        new_rows = []
+        values = self._values.copy()
+        for cuid, val in other.items():
+            if len(val) != n_time:
+                raise ValueError(
+                    "Data lists must have same length as time. "
+                    "Length of time is %s while length of data for "
+                    "key %s is %s." % (n_time, cuid, len(val))
+                )
+            if cuid in self._cuid_idx_map:
+                values[self._cuid_idx_map[cuid]] = val
+            else:
+                new_cuids.append(cuid)
+                new_rows.append(val)
+        if new_rows:
+            values = np.vstack((values, np.array(new_rows, dtype=float)))
+        self._set_arrays(self._cuids + new_cuids, values, self._time)
+
+    def get_data_at_time_indices(self, indices):
+        """
+        Returns data at the specified index or indices of this object's
+        array of time points.
+
+        """
+        if _is_iterable(indices):
+            index_array = np.sort(np.asarray(list(indices), dtype=int))
+            obj = self.__class__.__new__(self.__class__)
+            obj._orig_time_set = self._orig_time_set
+            obj._set_arrays(
+                list(self._cuids),
+                np.ascontiguousarray(self._values[:, index_array]),
+                self._time[index_array],
+            )
+            return obj
+        else:
+            return ScalarData(dict(zip(self._cuids, self._values[:, indices].tolist())))
+
+    def get_data_at_time(self, time=None, tolerance=0.0):
+        """
+        Returns the data associated with the provided time point or points.
+        The nearest time point within the specified tolerance is located
+        for every requested time point in a single vectorized search.
+
+        Parameters
+        ----------
+        time: Float or iterable
+            The time point or points corresponding to returned data.
+        tolerance: Float
+            Tolerance within which we will search for a matching time point.
+            The default is 0.0, meaning time points must be specified exactly.
+
+        Returns
+        -------
+        ColumnarTimeSeriesData or ~scalar_data.ScalarData
+            ColumnarTimeSeriesData containing only the specified time points
+            or dict mapping CUIDs to values at the specified scalar time
+            point.
+
+        """
+        if time is None:
+            return self
+        is_iterable = _is_iterable(time)
+        time_array = np.array(list(time) if is_iterable else [time], dtype=float)
+        indices = find_nearest_indices(self._time, time_array, tolerance=tolerance)
+        invalid = indices < 0
+        if invalid.any():
+            raise RuntimeError(
+                "Time point %s is invalid within tolerance %s"
+                % (time_array[invalid][0], tolerance)
+            )
+        if not is_iterable:
+            indices = int(indices[0])
+        return self.get_data_at_time_indices(indices)
+
+    def get_interpolated_data(self, time=None, tolerance=0.0):
+        """
+        Returns the data associated with the provided time point or points by
+        linear interpolation. All variables are interpolated at all
+        requested time points with array operations. The requested time
+        points are sorted (as in ``get_data_at_time``).
+
+        Parameters
+        ----------
+        time: Float or iterable
+            The time point or points corresponding to returned data.
+        tolerance: float
+            Tolerance used when checking if time points are inside the data
+            range.
+
+        Returns
+        -------
+        ColumnarTimeSeriesData or ~scalar_data.ScalarData
+            ColumnarTimeSeriesData containing only the specified time points
+            or dict mapping CUIDs to values at the specified scalar time
+            point.
+
+        """
+        if time is None:
+            return self
+        is_iterable = _is_iterable(time)
+        time_array = np.array(list(time) if is_iterable else [time], dtype=float)
+        time_array.sort()
+        if len(time_array) and (
+            time_array.max() > self._time[-1] + tolerance
+            or time_array.min() < self._time[0] - tolerance
+        ):
+            raise RuntimeError("Requesting interpolation outside data range.")
+        values = _get_interp_array(time_array, self._time, self._values)
+        if is_iterable:
+            obj = self.__class__.__new__(self.__class__)
+            obj._orig_time_set = None
+            obj._set_arrays(list(self._cuids), values, time_array)
+            return obj
+        else:
+            return ScalarData(dict(zip(self._cuids, values[:, 0].tolist())))
+
+    def to_serializable(self):
+        """
+        Convert to json-serializable object.
+
+        """
+        data = dict(zip(map(str, self._cuids), self._values.tolist()))
+        return TimeSeriesTuple(data, self._time.tolist())
+
+    def concatenate(self, other, tolerance=0.0):
+        """
+        Extend the time points and the values array with the time points
+        and variable values in the provided TimeSeriesData.
+        The new time points must be strictly greater than the old time
+        points.
+
+        """
+        if isinstance(other, ColumnarTimeSeriesData):
+            other_time = other._time
+        else:
+            other_time = np.array(other.get_time_points(), dtype=float)
+        time = self._time
+        if other_time[0] < time[-1] + tolerance:
+            raise ValueError(
+                "Initial time point of target, %s, is not greater than"
+                " final time point of source, %s, within tolerance %s."
+                % (other_time[0], time[-1], tolerance)
+            )
+        # We assume that other contains all the cuids in self.
+        # We make no assumption the other way around.
+        if isinstance(other, ColumnarTimeSeriesData):
+            if other._cuids == self._cuids:
+                other_values = other._values
+            else:
+                rows = [other._cuid_idx_map[cuid] for cuid in self._cuids]
+                other_values = other._values[rows]
+        else:
+            other_data = other.get_data()
+            other_values = np.array(
+                [other_data[cuid] for cuid in self._cuids], dtype=float
+            ).reshape((len(self._cuids), len(other_time)))
+        self._set_arrays(
+            self._cuids,
+            np.hstack((self._values, other_values)),
+            np.concatenate((time, other_time)),
+        )
+
+    def shift_time_points(self, offset):
+        """
+        Apply an offset to stored time points.
+
+        """
+        self._time = self._time + offset
+        self._time_list = None
+
+    def extract_variables(self, variables, context=None, copy_values=False):
+        """
+        Only keep variables specified.
+
+        """
+        cuids = [
+            get_indexed_cuid(var, (self._orig_time_set,), context=context)
+            for var in variables
+        ]
+        rows = [self._cuid_idx_map[cuid] for cuid in cuids]
+        # Fancy indexing always copies, so copy_values is trivially
+        # supported here.
+        obj = self.__class__.__new__(self.__class__)
+        obj._orig_time_set = self._orig_time_set
+        obj._set_arrays(cuids, self._values[rows], self._time)
+        return obj
@@ -12,8 +12,10 @@
 import pyomo.common.unittest as unittest
 import pytest
 
+from pyomo.common.dependencies import numpy as np, numpy_available
 from pyomo.contrib.mpc.data.find_nearest_index import (
     find_nearest_index,
+    find_nearest_indices,
     find_nearest_interval_index,
 )
 
@@ -81,6 +83,16 @@ class TestFindNearestIndex(unittest.TestCase):
         i = find_nearest_index(array, 0, tolerance=0)
         self.assertEqual(i, 0)
 
+    @unittest.skipUnless(numpy_available, "numpy is not available")
+    def test_vectorized_matches_scalar(self):
+        array = [0.0, 0.15, 0.64, 1.0, 1.15, 1.64, 2.0, 5.0]
+        targets = [-1.0, 0.0, 0.075, 0.1, 1.01, 1.5, 3.5, 5.0, 7.0]
+        for tol in (None, 0.0, 0.05, 1.0):
+            expected = [find_nearest_index(array, t, tolerance=tol) for t in targets]
+            expected = [-1 if i is None else i for i in expected]
+            indices = find_nearest_indices(array, targets, tolerance=tol)
+            self.assertEqual(indices.tolist(), expected)
+
 
 class TestFindNearestIntervalIndex(unittest.TestCase):
     def test_find_interval(self):
@@ -12,8 +12,9 @@
 import pyomo.common.unittest as unittest
 
 import pyomo.environ as pyo
+from pyomo.common.dependencies import numpy as np, numpy_available
 from pyomo.contrib.mpc.data.scalar_data import ScalarData
-from pyomo.contrib.mpc.data.series_data import TimeSeriesData
+from pyomo.contrib.mpc.data.series_data import TimeSeriesData, ColumnarTimeSeriesData
 
 
 class TestSeriesData(unittest.TestCase):
@@ -264,5 +265,181 @@ class TestSeriesData(unittest.TestCase):
         self.assertEqual(t1_data, ScalarData({m.var[:, "A"]: 1, m.var[:, "B"]: 2}))
 
 
+@unittest.skipUnless(numpy_available, "numpy is not available")
+class TestColumnarSeriesData(unittest.TestCase):
+    def _make_model(self):
+        m = pyo.ConcreteModel()
+        m.time = pyo.Set(initialize=[0.0, 0.1, 0.2])
+        m.comp = pyo.Set(initialize=["A", "B"])
+        m.var = pyo.Var(m.time, m.comp, initialize=1.0)
+        return m
+
+    def _make_data(self, m):
+        data_dict = {m.var[:, "A"]: [1, 2, 3], m.var[:, "B"]: [2, 4, 6]}
+        return data_dict, ColumnarTimeSeriesData(data_dict, m.time)
+
+    def test_construct_and_get_data(self):
+        m = self._make_model()
+        data_dict, data = self._make_data(m)
+        cuids = [pyo.ComponentUID(key) for key in data_dict]
+        self.assertEqual(data.get_cuids(), cuids)
+        self.assertEqual(data.get_array().tolist(), [[1, 2, 3], [2, 4, 6]])
+        self.assertEqual(data.get_time_points(), list(m.time))
+        self.assertEqual(data.get_time_array().tolist(), list(m.time))
+        self.assertEqual(data.get_data_from_key(m.var[:, "B"]).tolist(), [2, 4, 6])
+        self.assertTrue(data.contains_key(m.var[:, "A"]))
+        # Rows of the array are exposed as read-only views
+        with self.assertRaises(ValueError):
+            data.get_data()[cuids[0]][0] = 5.0
+
+        # Comparison with list-backed data
+        self.assertEqual(data, TimeSeriesData(data_dict, m.time))
+        self.assertEqual(TimeSeriesData(data_dict, m.time), data)
+        other = ColumnarTimeSeriesData.from_array(
+            [m.var[:, "B"], m.var[:, "A"]], [[2, 4, 6], [1, 2, 3]], m.time
+        )
+        self.assertEqual(data, other)
+
+    def test_construct_exception(self):
+        m = self._make_model()
+        data_dict = {m.var[:, "A"]: [1, 2, 3], m.var[:, "B"]: [2, 4]}
+        with self.assertRaisesRegex(ValueError, "must have same length"):
+            ColumnarTimeSeriesData(data_dict, m.time)
+
+        data_dict = {m.var[:, "A"]: [1, 2], m.var[:, "B"]: [2, 4]}
+        with self.assertRaisesRegex(ValueError, "not sorted"):
+            ColumnarTimeSeriesData(data_dict, [0, -1])
+
+        with self.assertRaisesRegex(ValueError, "does not match"):
+            ColumnarTimeSeriesData.from_array([m.var[:, "A"]], np.zeros((2, 3)), m.time)
+
+    def test_get_data_at_time(self):
+        m = self._make_model()
+        data_dict, data = self._make_data(m)
+        new_data = data.get_data_at_time(0.1)
+        self.assertEqual(ScalarData({m.var[:, "A"]: 2, m.var[:, "B"]: 4}), new_data)
+
+        new_data = data.get_data_at_time([0.0, 0.2])
+        self.assertIsInstance(new_data, ColumnarTimeSeriesData)
+        self.assertEqual(
+            new_data,
+            TimeSeriesData({m.var[:, "A"]: [1, 3], m.var[:, "B"]: [2, 6]}, [0.0, 0.2]),
+        )
+
+        new_data = data.get_data_at_time([0.099, 0.201], tolerance=1e-2)
+        self.assertEqual(new_data.get_array().tolist(), [[2, 3], [4, 6]])
+
+        msg = "Time point.*is invalid"
+        with self.assertRaisesRegex(RuntimeError, msg):
+            data.get_data_at_time(0.05)
+
+    def test_get_data_interpolate(self):
+        m = self._make_model()
+        data_dict, data = self._make_data(m)
+        expected = TimeSeriesData(data_dict, m.time).get_interpolated_data(
+            [0.0, 0.05, 0.15, 0.2]
+        )
+        new_data = data.get_interpolated_data([0.0, 0.05, 0.15, 0.2])
+        self.assertIsInstance(new_data, ColumnarTimeSeriesData)
+        np.testing.assert_allclose(
+            new_data.get_array(),
+            [expected.get_data()[cuid] for cuid in new_data.get_cuids()],
+        )
+
+        new_data = data.get_interpolated_data(0.05)
+        self.assertStructuredAlmostEqual(
+            new_data.get_data(),
+            {pyo.ComponentUID(m.var[:, "A"]): 1.5, pyo.ComponentUID(m.var[:, "B"]): 3},
+        )
+
+        msg = "outside data range"
+        with self.assertRaisesRegex(RuntimeError, msg):
+            data.get_interpolated_data(0.3)
+        data.get_interpolated_data(0.3, tolerance=0.2)
+
+    def test_get_data_interpolate_unsorted(self):
+        m = self._make_model()
+        data_dict, data = self._make_data(m)
+        # Requested time points are sorted (as in get_data_at_time)
+        new_data = data.get_interpolated_data([0.15, 0.0, 0.05])
+        self.assertEqual(new_data.get_time_points(), [0.0, 0.05, 0.15])
+        np.testing.assert_allclose(new_data.get_array(), [[1, 1.5, 2.5], [2, 3, 5]])
+        new_data = data.get_data_at_time([0.2, 0.0])
+        self.assertEqual(new_data.get_time_points(), [0.0, 0.2])
+        self.assertEqual(new_data.get_array().tolist(), [[1, 3], [2, 6]])
+
+    def test_get_data_interpolate_single_point(self):
+        m = self._make_model()
+        data = ColumnarTimeSeriesData({m.var[:, "A"]: [1], m.var[:, "B"]: [2]}, [0.1])
+        new_data = data.get_interpolated_data(0.1)
+        self.assertEqual(
+            new_data.get_data(),
+            {pyo.ComponentUID(m.var[:, "A"]): 1, pyo.ComponentUID(m.var[:, "B"]): 2},
+        )
+        new_data = data.get_interpolated_data([0.0, 0.1, 0.2], tolerance=0.1)
+        self.assertEqual(new_data.get_array().tolist(), [[1, 1, 1], [2, 2, 2]])
+
+    def test_update_data(self):
+        m = self._make_model()
+        data_dict, data = self._make_data(m)
+        data.update_data({m.var[:, "B"]: [5, 5, 5]})
+        self.assertEqual(data.get_array().tolist(), [[1, 2, 3], [5, 5, 5]])
+
+        m.v2 = pyo.Var(m.time)
+        data.update_data(TimeSeriesData({m.v2: [7, 8, 9]}, m.time))
+        self.assertEqual(data.get_array().tolist(), [[1, 2, 3], [5, 5, 5], [7, 8, 9]])
+        self.assertEqual(data.get_data_from_key(m.v2).tolist(), [7, 8, 9])
+
+    def test_to_serializable(self):
+        m = self._make_model()
+        data_dict, data = self._make_data(m)
+        self.assertEqual(
+            data.to_serializable(), TimeSeriesData(data_dict, m.time).to_serializable()
+        )
+
+    def test_concatenate(self):
+        m = self._make_model()
+        data_dict, data = self._make_data(m)
+        other = ColumnarTimeSeriesData.from_array(
+            [m.var[:, "B"], m.var[:, "A"]], [[8, 10], [4, 5]], [0.3, 0.4]
+        )
+        data.concatenate(other)
+        self.assertEqual(data.get_time_points(), [0.0, 0.1, 0.2, 0.3, 0.4])
+        self.assertEqual(data.get_array().tolist(), [[1, 2, 3, 4, 5], [2, 4, 6, 8, 10]])
+        self.assertEqual(
+            data.get_data_at_time(0.4),
+            ScalarData({m.var[:, "A"]: 5, m.var[:, "B"]: 10}),
+        )
+
+        data.concatenate(
+            TimeSeriesData({m.var[:, "A"]: [6], m.var[:, "B"]: [12]}, [0.5])
+        )
+        self.assertEqual(data.get_array()[:, -1].tolist(), [6, 12])
+
+        msg = "Initial time point of target, 0.1"
+        with self.assertRaisesRegex(ValueError, msg):
+            data.concatenate(
+                ColumnarTimeSeriesData(data_dict, m.time).get_data_at_time([0.1])
+            )
+
+    def test_shift_then_get_data(self):
+        m = self._make_model()
+        data_dict, data = self._make_data(m)
+        data.shift_time_points(0.1)
+        self.assertEqual(data.get_time_points(), [t + 0.1 for t in m.time])
+        msg = "Time point.*is invalid"
+        with self.assertRaisesRegex(RuntimeError, msg):
+            data.get_data_at_time(0.0, tolerance=1e-3)
+        t1_data = data.get_data_at_time(0.1)
+        self.assertEqual(t1_data, ScalarData({m.var[:, "A"]: 1, m.var[:, "B"]: 2}))
+
+    def test_extract_variables(self):
+        m = self._make_model()
+        data_dict, data = self._make_data(m)
+        new_data = data.extract_variables([m.var[:, "B"]])
+        self.assertEqual(new_data, TimeSeriesData({m.var[:, "B"]: [2, 4, 6]}, m.time))
+        self.assertIsNot(new_data.get_array().base, data.get_array())
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -93,6 +93,27 @@ class DynamicModelInterface(object):
             for expr in self._dae_expr
         ]
 
+        # Precompute a (variable x time) matrix of VarData objects, stored
+        # row-major in a flat list, so that bulk operations (shifts, copies,
+        # and loads) do not have to go through each reference's __getitem__
+        # for every data point. References to the same variable (identified,
+        # as in shift_values_by_time, by their data object at the final time
+        # point) share a row.
+        self._time_list = list(time)
+        self._time_idx_map = {t: i for i, t in enumerate(self._time_list)}
+        self._var_matrix = []
+        self._dae_var_rows = []
+        row_map = {}
+        for var in self._dae_vars:
+            var_data = [var[t] for t in self._time_list]
+            key = id(var_data[-1]) if var_data else id(var)
+            if key not in row_map:
+                row_map[key] = len(row_map)
+                self._var_matrix.extend(var_data)
+            self._dae_var_rows.append(row_map[key])
+        self._n_var_rows = len(row_map)
+        self._dae_var_row_map = dict(zip(self._dae_var_cuids, self._dae_var_rows))
+
     def get_scalar_variables(self):
         return self._scalar_vars
 
@@ -213,10 +234,10 @@ class DynamicModelInterface(object):
             # This covers the case of non-time-indexed variables
             # as keys.
             _error_if_used(prefer_left, excl_left, excl_right, type(data))
-            load_data_from_scalar(data, self.model, time_points)
+            self._load_data_from_scalar(data, time_points)
         elif isinstance(data, TimeSeriesData):
             _error_if_used(prefer_left, excl_left, excl_right, type(data))
-            load_data_from_series(data, self.model, time_points, tolerance=tolerance)
+            self._load_data_from_series(data, time_points, tolerance)
         elif isinstance(data, IntervalData):
             prefer_left = True if prefer_left is None else prefer_left
             excl_left = prefer_left if excl_left is None else excl_left
@@ -231,6 +252,81 @@ class DynamicModelInterface(object):
                 exclude_right_endpoint=excl_right,
             )
 
+    def _get_time_indices(self, time_points):
+        """Return the column indices of the provided time points in the
+        variable matrix, or None if any of them is not in the time set
+
+        """
+        idx_map = self._time_idx_map
+        try:
+            return [idx_map[t] for t in time_points]
+        except (KeyError, TypeError):
+            return None
+
+    def _split_matrix_data(self, data):
+        """Partition a data dict into (row, values) pairs for variables in
+        the variable matrix and a dict of the remaining entries
+
+        """
+        row_map = self._dae_var_row_map
+        rows = []
+        remainder = {}
+        for cuid, values in data.items():
+            row = row_map.get(cuid)
+            if row is None:
+                remainder[cuid] = values
+            else:
+                rows.append((row, values))
+        return rows, remainder
+
+    def _load_data_from_scalar(self, data, time_points):
+        t_iter = time_points if _is_iterable(time_points) else (time_points,)
+        cols = self._get_time_indices(t_iter)
+        if cols is None:
+            load_data_from_scalar(data, self.model, time_points)
+            return
+        rows, remainder = self._split_matrix_data(data.get_data())
+        n_time = len(self._time_list)
+        var_matrix = self._var_matrix
+        for row, val in rows:
+            start = row * n_time
+            for col in cols:
+                var_matrix[start + col].set_value(val)
+        if remainder:
+            load_data_from_scalar(ScalarData(remainder), self.model, time_points)
+
+    def _load_data_from_series(self, data, time_points, tolerance):
+        time_list = list(time_points)
+        data_time = data.get_time_points()
+        if len(time_list) != len(data_time):
+            # Defer to load_data_from_series for error handling
+            load_data_from_series(data, self.model, time_list, tolerance=tolerance)
+            return
+        time_indices = [
+            find_nearest_index(time_list, t, tolerance=tolerance) for t in data_time
+        ]
+        if any(idx is None for idx in time_indices):
+            load_data_from_series(data, self.model, time_list, tolerance=tolerance)
+            return
+        cols = self._get_time_indices(time_list[idx] for idx in time_indices)
+        if cols is None:
+            load_data_from_series(data, self.model, time_list, tolerance=tolerance)
+            return
+        rows, remainder = self._split_matrix_data(data.get_data())
+        n_time = len(self._time_list)
+        var_matrix = self._var_matrix
+        for row, values in rows:
+            start = row * n_time
+            for col, val in zip(cols, values):
+                var_matrix[start + col].set_value(val)
+        if remainder:
+            load_data_from_series(
+                TimeSeriesData(remainder, data_time, time_set=self.time),
+                self.model,
+                time_list,
+                tolerance=tolerance,
+            )
+
     def copy_values_at_time(self, source_time=None, target_time=None):
         """
         Copy values of all time-indexed variables from source time point
@@ -248,42 +344,51 @@ class DynamicModelInterface(object):
             source_time = self.time.first()
         if target_time is None:
             target_time = self.time
-        copy_values_at_time(self._dae_vars, self._dae_vars, source_time, target_time)
+        source_cols = self._get_time_indices(_to_iterable(source_time))
+        target_cols = self._get_time_indices(_to_iterable(target_time))
+        if (
+            source_cols is None
+            or target_cols is None
+            or len(source_cols) not in (1, len(target_cols))
+        ):
+            # Defer to copy_values_at_time for argument checking
+            copy_values_at_time(
+                self._dae_vars, self._dae_vars, source_time, target_time
+            )
+            return
+        if len(source_cols) == 1:
+            source_cols = source_cols * len(target_cols)
+        col_pairs = list(zip(source_cols, target_cols))
+        n_time = len(self._time_list)
+        var_matrix = self._var_matrix
+        for start in range(0, len(var_matrix), n_time):
+            for s_col, t_col in col_pairs:
+                var_matrix[start + t_col].set_value(var_matrix[start + s_col].value)
 
     def shift_values_by_time(self, dt):
         """
         Shift values in time indexed variables by a specified time offset.
         """
-        seen = set()
-        t0 = self.time.first()
-        tf = self.time.last()
-        time_map = {}
-        time_list = list(self.time)
-        for var in self._dae_vars:
-            if id(var[tf]) in seen:
-                # Assume that if var[tf] has been encountered, this is a
-                # reference to a "variable" we have already processed.
-                continue
-            else:
-                seen.add(id(var[tf]))
-            new_values = []
-            for t in time_list:
-                if t not in time_map:
-                    # Build up a map from target to source time points,
-                    # as I don't want to call find_nearest_index more
-                    # frequently than I have to.
-                    t_new = t + dt
-                    idx = find_nearest_index(time_list, t_new, tolerance=None)
-                    # If t_new is not a valid time point, we proceed with the
-                    # closest valid time point.
-                    # We're relying on the fact that indices of t0 or tf are
-                    # returned if t_new is outside the bounds of the time set.
-                    t_new = time_list[idx]
-                    time_map[t] = t_new
-                t_new = time_map[t]
-                new_values.append(var[t_new].value)
-            for i, t in enumerate(self.time):
-                var[t].set_value(new_values[i])
+        time_list = self._time_list
+        n_time = len(time_list)
+        if not n_time:
+            return
+        # Map each time point to the index of the time point from which it
+        # takes its new value. If t + dt is not a valid time point, we
+        # proceed with the closest valid time point. We're relying on the
+        # fact that indices of t0 or tf are returned if t + dt is outside
+        # the bounds of the time set.
+        source_cols = [
+            find_nearest_index(time_list, t + dt, tolerance=None) for t in time_list
+        ]
+        var_matrix = self._var_matrix
+        values = [var_data.value for var_data in var_matrix]
+        new_values = []
+        for start in range(0, len(values), n_time):
+            row = values[start : start + n_time]
+            new_values.extend(map(row.__getitem__, source_cols))
+        for var_data, val in zip(var_matrix, new_values):
+            var_data.set_value(val)
 
     def get_penalty_from_target(
         self,
@@ -411,6 +411,29 @@ class TestDynamicModelInterface(unittest.TestCase):
         self.assertEqual(m.var[t, "B"].value, 1.2)
         self.assertEqual(m.input[t].value, 0.8)
 
+    def test_shift_values_by_time_with_reference(self):
+        m = self._make_model()
+        # A reference to an existing variable must only be shifted once
+        m.ref = pyo.Reference(m.var[:, "A"])
+        interface = DynamicModelInterface(m, m.time)
+        self.assertEqual(len(interface.get_indexed_variables()), 4)
+        interface.shift_values_by_time(1.0)
+        self.assertEqual([m.var[t, "A"].value for t in m.time], [1.1, 1.2, 1.2])
+        self.assertEqual([m.ref[t].value for t in m.time], [1.1, 1.2, 1.2])
+
+        interface.copy_values_at_time(source_time=0, target_time=[1, 2])
+        self.assertEqual([m.var[t, "A"].value for t in m.time], [1.1, 1.1, 1.1])
+        self.assertEqual([m.input[t].value for t in m.time], [0.9, 0.9, 0.9])
+
+    def test_load_data_mixed_variables(self):
+        m = self._make_model()
+        interface = DynamicModelInterface(m, m.time)
+        # Time-indexed and scalar variables are loaded together
+        data = ScalarData({"var[*,A]": 5.5, "scalar": 6.6})
+        interface.load_data(data, time_points=[1, 2])
+        self.assertEqual([m.var[t, "A"].value for t in m.time], [1.0, 5.5, 5.5])
+        self.assertEqual(m.scalar.value, 6.6)
+
     def test_get_penalty_from_constant_target(self):
         m = self._make_model()
         interface = DynamicModelInterface(m, m.time)
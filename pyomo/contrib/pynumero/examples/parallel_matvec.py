@@ -16,8 +16,9 @@ from pyomo.contrib.pynumero.sparse.mpi_block_matrix import MPIBlockMatrix
 from scipy.sparse import random
 
 
-def main():
-    comm = mpi4py.MPI.COMM_WORLD
+def main(comm=None):
+    if comm is None:
+        comm = mpi4py.MPI.COMM_WORLD
     rank = comm.Get_rank()
 
     owners = [0, 1, 2, -1]
@@ -14,8 +14,9 @@ from pyomo.common.dependencies import mpi4py
 from pyomo.contrib.pynumero.sparse.mpi_block_vector import MPIBlockVector
 
 
-def main():
-    comm = mpi4py.MPI.COMM_WORLD
+def main(comm=None):
+    if comm is None:
+        comm = mpi4py.MPI.COMM_WORLD
     rank = comm.Get_rank()
 
     owners = [2, 0, 1, -1]
@@ -137,6 +137,47 @@ class ExternalGreyBoxModel(object):
     Examples that show Hessian support are also found in:
     pyomo/contrib/pynumero/examples/external_grey_box/react-example/
 
+    Batched evaluation support:
+
+    If a model contains many ExternalGreyBoxBlocks whose external models
+    are instances of the same class (e.g., a surrogate model for each
+    time period), the cost of calling the methods above on every
+    instance can dominate the solve time. Such classes can implement
+    the following classmethods, which evaluate all the instances at
+    once. Here, models is a list of N instances of the class and inputs
+    is an (N, n_inputs) numpy array with the input values of each
+    instance (row k holds the inputs of models[k]).
+
+    @classmethod
+    def evaluate_equality_constraints_batch(cls, models, inputs):
+        Return an (N, n_equality_constraints) array with the residuals
+        of each instance (required if there are equality constraints)
+
+    @classmethod
+    def evaluate_jacobian_equality_constraints_batch(cls, models, inputs):
+        Return an (N, n_equality_constraints, n_inputs) array with the
+        (dense) Jacobian of the residuals of each instance (required if
+        there are equality constraints)
+
+    @classmethod
+    def evaluate_outputs_batch(cls, models, inputs):
+        Return an (N, n_outputs) array with the outputs of each
+        instance (required if there are outputs)
+
+    @classmethod
+    def evaluate_jacobian_outputs_batch(cls, models, inputs):
+        Return an (N, n_outputs, n_inputs) array with the (dense)
+        Jacobian of the outputs of each instance (required if there are
+        outputs)
+
+    PyomoNLPWithGreyBoxBlocks groups the blocks whose models implement
+    these methods (and do not have an objective) by model class, and
+    evaluates the constraints and the (block-diagonal) Jacobian of each
+    group with a single call to these methods. For these models,
+    set_input_values and the multiplier methods are only called when
+    the instances have to be evaluated individually (e.g., for the
+    Hessian).
+
     """
 
     def n_inputs(self):
@@ -206,6 +206,22 @@ class ExternalPyomoModel(ExternalGreyBoxModel):
             input_vars + external_vars
         )
 
+        # The Jacobian and Hessian submatrices that we need are extracted
+        # every iteration, so we precompute where their nonzeros live in
+        # the full NLP matrices
+        x = input_vars
+        y = external_vars
+        f = residual_cons
+        g = external_cons
+        nlp = self._nlp
+        self._jfx_extractor = nlp.get_submatrix_jacobian_extractor(x, f)
+        self._jfy_extractor = nlp.get_submatrix_jacobian_extractor(y, f)
+        self._jgx_extractor = nlp.get_submatrix_jacobian_extractor(x, g)
+        self._jgy_extractor = nlp.get_submatrix_jacobian_extractor(y, g)
+        self._hlxx_extractor = nlp.get_submatrix_hessian_lag_extractor(x, x)
+        self._hlxy_extractor = nlp.get_submatrix_hessian_lag_extractor(x, y)
+        self._hlyy_extractor = nlp.get_submatrix_hessian_lag_extractor(y, y)
+
         self._timer.stop("__init__")
 
     def n_inputs(self):
@@ -280,11 +296,9 @@ class ExternalPyomoModel(ExternalGreyBoxModel):
         # residual multipliers and once with the full multipliers.
         # I like the current approach better for now.
         nlp = self._nlp
-        y = self.external_vars
-        f = self.residual_cons
-        g = self.external_cons
-        jfy = nlp.extract_submatrix_jacobian(y, f)
-        jgy = nlp.extract_submatrix_jacobian(y, g)
+        jac = nlp.evaluate_jacobian()
+        jfy = self._jfy_extractor.extract(jac)
+        jgy = self._jgy_extractor.extract(jac)
 
         jgy_t = jgy.transpose()
         jfy_t = jfy.transpose()
@@ -303,11 +317,10 @@ class ExternalPyomoModel(ExternalGreyBoxModel):
 
         """
         nlp = self._nlp
-        x = self.input_vars
-        y = self.external_vars
-        hlxx = nlp.extract_submatrix_hessian_lag(x, x)
-        hlxy = nlp.extract_submatrix_hessian_lag(x, y)
-        hlyy = nlp.extract_submatrix_hessian_lag(y, y)
+        hess = nlp.evaluate_hessian_lag()
+        hlxx = self._hlxx_extractor.extract(hess)
+        hlxy = self._hlxy_extractor.extract(hess)
+        hlyy = self._hlyy_extractor.extract(hess)
         return hlxx, hlxy, hlyy
 
     def calculate_reduced_hessian_lagrangian(self, hlxx, hlxy, hlyy):
@@ -341,10 +354,11 @@ class ExternalPyomoModel(ExternalGreyBoxModel):
         y = self.external_vars
         f = self.residual_cons
         g = self.external_cons
-        jfx = nlp.extract_submatrix_jacobian(x, f)
-        jfy = nlp.extract_submatrix_jacobian(y, f)
-        jgx = nlp.extract_submatrix_jacobian(x, g)
-        jgy = nlp.extract_submatrix_jacobian(y, g)
+        jac = nlp.evaluate_jacobian()
+        jfx = self._jfx_extractor.extract(jac)
+        jfy = self._jfy_extractor.extract(jac)
+        jgx = self._jgx_extractor.extract(jac)
+        jgy = self._jgy_extractor.extract(jac)
 
         nf = len(f)
         nx = len(x)
@@ -367,11 +381,9 @@ class ExternalPyomoModel(ExternalGreyBoxModel):
 
     def evaluate_jacobian_external_variables(self):
         nlp = self._nlp
-        x = self.input_vars
-        y = self.external_vars
-        g = self.external_cons
-        jgx = nlp.extract_submatrix_jacobian(x, g)
-        jgy = nlp.extract_submatrix_jacobian(y, g)
+        jac = nlp.evaluate_jacobian()
+        jgx = self._jgx_extractor.extract(jac)
+        jgy = self._jgy_extractor.extract(jac)
         jgy_csc = jgy.tocsc()
         dydx = -1 * sps.linalg.splu(jgy_csc).solve(jgx.toarray())
         return dydx
@@ -381,8 +393,9 @@ class ExternalPyomoModel(ExternalGreyBoxModel):
         x = self.input_vars
         y = self.external_vars
         g = self.external_cons
-        jgx = nlp.extract_submatrix_jacobian(x, g)
-        jgy = nlp.extract_submatrix_jacobian(y, g)
+        jac = nlp.evaluate_jacobian()
+        jgx = self._jgx_extractor.extract(jac)
+        jgy = self._jgy_extractor.extract(jac)
         jgy_csc = jgy.tocsc()
         jgy_fact = sps.linalg.splu(jgy_csc)
         dydx = -1 * jgy_fact.solve(jgx.toarray())
@@ -434,8 +447,9 @@ class ExternalPyomoModel(ExternalGreyBoxModel):
         y = self.external_vars
         f = self.residual_cons
         g = self.external_cons
-        jfx = nlp.extract_submatrix_jacobian(x, f)
-        jfy = nlp.extract_submatrix_jacobian(y, f)
+        jac = nlp.evaluate_jacobian()
+        jfx = self._jfx_extractor.extract(jac)
+        jfy = self._jfy_extractor.extract(jac)
 
         dydx = self.evaluate_jacobian_external_variables()
 
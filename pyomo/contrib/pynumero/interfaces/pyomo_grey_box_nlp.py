@@ -17,7 +17,7 @@ import os
 import numpy as np
 import logging
 
-from scipy.sparse import coo_matrix, identity
+from scipy.sparse import block_diag, coo_matrix, identity
 from pyomo.common.deprecation import deprecated
 import pyomo.core.base as pyo
 from pyomo.common.collections import ComponentMap
@@ -137,6 +137,11 @@ class PyomoNLPWithGreyBoxBlocks(NLP):
                 'PyomoNLPWithGreyBoxBlocks does not support fixed inputs or outputs'
             )
 
+        # evaluate the grey box models that support batched evaluation
+        # together (this groups them, so it changes the order of the
+        # grey box constraints)
+        greybox_nlps, greybox_members = _group_batched_greybox_nlps(greybox_nlps)
+
         # let's build up the union of all the primal variables names
         # RBP: Why use names here? Why not just ComponentSet of all
         # data objects?
@@ -157,7 +162,7 @@ class PyomoNLPWithGreyBoxBlocks(NLP):
             self._pyomo_model_constraint_names_to_datas.get(nm)
             for nm in self._constraint_names
         ]
-        for gbnlp in greybox_nlps:
+        for gbnlp in greybox_members:
             self._constraint_names.extend(gbnlp.constraint_names())
             self._constraint_datas.extend(
                 [(gbnlp._block, nm) for nm in gbnlp.constraint_names()]
@@ -925,3 +930,334 @@ class _ExternalGreyBoxAsNLP(NLP):
 
     def report_solver_status(self, status_code, status_message):
         raise NotImplementedError('report_solver_status not implemented')
+
+
+def _supports_batch_evaluation(ex_model):
+    cls = type(ex_model)
+    if ex_model.has_objective():
+        return False
+    if ex_model.n_equality_constraints() > 0 and not (
+        hasattr(cls, 'evaluate_equality_constraints_batch')
+        and hasattr(cls, 'evaluate_jacobian_equality_constraints_batch')
+    ):
+        return False
+    if ex_model.n_outputs() > 0 and not (
+        hasattr(cls, 'evaluate_outputs_batch')
+        and hasattr(cls, 'evaluate_jacobian_outputs_batch')
+    ):
+        return False
+    return True
+
+
+def _group_batched_greybox_nlps(greybox_nlps):
+    """Group the _ExternalGreyBoxAsNLP objects whose external models
+    support batched evaluation by model class
+
+    Returns the list of NLPs (with each group replaced by a single
+    _ExternalGreyBoxBatchAsNLP at the position of its first member) and
+    the list of the original NLPs in the corresponding order.
+    """
+    groups = {}
+    for gbnlp in greybox_nlps:
+        ex_model = gbnlp._ex_model
+        if _supports_batch_evaluation(ex_model):
+            key = (
+                type(ex_model),
+                ex_model.n_inputs(),
+                ex_model.n_equality_constraints(),
+                ex_model.n_outputs(),
+            )
+        else:
+            key = id(gbnlp)
+        groups.setdefault(key, []).append(gbnlp)
+
+    nlps = []
+    members = []
+    for group in groups.values():
+        if len(group) > 1:
+            nlps.append(_ExternalGreyBoxBatchAsNLP(group))
+        else:
+            nlps.extend(group)
+        members.extend(group)
+    return nlps, members
+
+
+class _ExternalGreyBoxBatchAsNLP(NLP):
+    """
+    This class combines the _ExternalGreyBoxAsNLP objects for several
+    ExternalGreyBoxBlocks whose external models are instances of the
+    same class and implement the batched evaluation methods (see
+    ExternalGreyBoxModel). The primals and constraints are those of the
+    individual NLPs (in order), and the constraints and Jacobian are
+    computed for all the models with one call to the batched methods.
+    Everything else (e.g., the Hessian) is delegated to the individual
+    NLPs.
+    """
+
+    def __init__(self, greybox_nlps):
+        self._greybox_nlps = greybox_nlps
+        self._models = [gbnlp._ex_model for gbnlp in greybox_nlps]
+        self._model_class = type(self._models[0])
+        ex_model = self._models[0]
+        self._n_inputs = ex_model.n_inputs()
+        self._n_eq_constraints = ex_model.n_equality_constraints()
+        self._n_outputs = ex_model.n_outputs()
+        n_models = len(greybox_nlps)
+        n_primals = self._n_inputs + self._n_outputs
+        n_constraints = self._n_eq_constraints + self._n_outputs
+
+        self._primals_names = []
+        self._constraint_names = []
+        for gbnlp in greybox_nlps:
+            self._primals_names.extend(gbnlp.primals_names())
+            self._constraint_names.extend(gbnlp.constraint_names())
+
+        self._primal_values = self._concatenate(lambda nlp: nlp.get_primals())
+        self._dual_values = self._concatenate(lambda nlp: nlp.get_duals())
+        # True if the primals/duals of the individual NLPs are out of date
+        self._stale_primals = False
+        self._stale_duals = False
+
+        self._has_hessian_support = all(
+            gbnlp.has_hessian_support() for gbnlp in greybox_nlps
+        )
+
+        # The Jacobian is block diagonal. Each block is made of the
+        # (dense) Jacobians of the equality constraints and outputs with
+        # respect to the inputs, and -I for the outputs.
+        n_in = self._n_inputs
+        n_eq = self._n_eq_constraints
+        n_out = self._n_outputs
+        row = np.concatenate(
+            (
+                np.repeat(np.arange(n_eq), n_in),
+                n_eq + np.repeat(np.arange(n_out), n_in),
+                n_eq + np.arange(n_out),
+            )
+        )
+        col = np.concatenate(
+            (np.tile(np.arange(n_in), n_eq + n_out), n_in + np.arange(n_out))
+        )
+        offsets = np.arange(n_models).reshape(-1, 1)
+        self._jacobian_row = (row + offsets * n_constraints).ravel()
+        self._jacobian_col = (col + offsets * n_primals).ravel()
+        self._jacobian_data = np.empty((n_models, len(row)))
+        self._jacobian_data[:, n_in * (n_eq + n_out) :] = -1.0
+
+        self._cached_constraint_residuals = None
+        self._cached_jacobian = None
+
+    def _concatenate(self, func):
+        return np.concatenate([func(gbnlp) for gbnlp in self._greybox_nlps])
+
+    def _split(self, values):
+        return np.split(values, len(self._greybox_nlps))
+
+    def _update_greybox_nlps(self):
+        # pass the current primals and duals to the individual NLPs
+        if self._stale_primals:
+            for gbnlp, primals in zip(
+                self._greybox_nlps, self._split(self._primal_values)
+            ):
+                gbnlp.set_primals(primals)
+            self._stale_primals = False
+        if self._stale_duals:
+            for gbnlp, duals in zip(self._greybox_nlps, self._split(self._dual_values)):
+                gbnlp.set_duals(duals)
+            self._stale_duals = False
+
+    def _batch_inputs(self):
+        primals = self._primal_values.reshape(len(self._greybox_nlps), -1)
+        return primals[:, : self._n_inputs], primals[:, self._n_inputs :]
+
+    def _call_batch(self, method, shape):
+        inputs, outputs = self._batch_inputs()
+        ret = np.asarray(
+            getattr(self._model_class, method)(self._models, np.array(inputs))
+        )
+        expected = (len(self._models),) + shape
+        if ret.shape != expected:
+            raise ValueError(
+                '%s.%s returned an array with shape %s; expected %s'
+                % (self._model_class.__name__, method, ret.shape, expected)
+            )
+        return ret
+
+    def n_primals(self):
+        return len(self._primals_names)
+
+    def primals_names(self):
+        return list(self._primals_names)
+
+    def n_constraints(self):
+        return len(self._constraint_names)
+
+    def constraint_names(self):
+        return list(self._constraint_names)
+
+    def nnz_jacobian(self):
+        return len(self._jacobian_row)
+
+    def nnz_hessian_lag(self):
+        return len(self.evaluate_hessian_lag().data)
+
+    def primals_lb(self):
+        return self._concatenate(lambda nlp: nlp.primals_lb())
+
+    def primals_ub(self):
+        return self._concatenate(lambda nlp: nlp.primals_ub())
+
+    def constraints_lb(self):
+        return self._concatenate(lambda nlp: nlp.constraints_lb())
+
+    def constraints_ub(self):
+        return self._concatenate(lambda nlp: nlp.constraints_ub())
+
+    def init_primals(self):
+        return self._concatenate(lambda nlp: nlp.init_primals())
+
+    def init_duals(self):
+        return self._concatenate(lambda nlp: nlp.init_duals())
+
+    def create_new_vector(self, vector_type):
+        if vector_type == 'primals':
+            return np.zeros(self.n_primals(), dtype=np.float64)
+        elif vector_type == 'constraints' or vector_type == 'duals':
+            return np.zeros(self.n_constraints(), dtype=np.float64)
+
+    def set_primals(self, primals):
+        assert len(primals) == self.n_primals()
+        np.copyto(self._primal_values, primals)
+        self._cached_constraint_residuals = None
+        self._cached_jacobian = None
+        self._stale_primals = True
+
+    def get_primals(self):
+        return np.copy(self._primal_values)
+
+    def set_duals(self, duals):
+        assert len(duals) == self.n_constraints()
+        np.copyto(self._dual_values, duals)
+        self._stale_duals = True
+
+    def get_duals(self):
+        return np.copy(self._dual_values)
+
+    def set_obj_factor(self, obj_factor):
+        for gbnlp in self._greybox_nlps:
+            gbnlp.set_obj_factor(obj_factor)
+
+    def get_obj_factor(self):
+        return self._greybox_nlps[0].get_obj_factor()
+
+    def get_obj_scaling(self):
+        raise NotImplementedError(
+            '_ExternalGreyBoxBatchAsNLP does not support objective scaling'
+        )
+
+    def get_primals_scaling(self):
+        raise NotImplementedError(
+            '_ExternalGreyBoxBatchAsNLP does not support scaling of primals '
+            'directly. This should be handled at a higher level using '
+            'suffixes on the Pyomo variables.'
+        )
+
+    def get_constraints_scaling(self):
+        scaling = [gbnlp.get_constraints_scaling() for gbnlp in self._greybox_nlps]
+        if all(s is None for s in scaling):
+            return None
+        return np.concatenate(
+            [
+                np.ones(gbnlp.n_constraints()) if s is None else s
+                for gbnlp, s in zip(self._greybox_nlps, scaling)
+            ]
+        )
+
+    def evaluate_objective(self):
+        # models with objectives are not evaluated in batches
+        return 0
+
+    def evaluate_grad_objective(self, out=None):
+        if out is not None:
+            out.fill(0)
+            return out
+        return np.zeros(self.n_primals(), dtype=float)
+
+    def _evaluate_constraints_if_necessary_and_cache(self):
+        if self._cached_constraint_residuals is None:
+            n_eq = self._n_eq_constraints
+            c = np.empty((len(self._models), n_eq + self._n_outputs))
+            if n_eq > 0:
+                c[:, :n_eq] = self._call_batch(
+                    'evaluate_equality_constraints_batch', (n_eq,)
+                )
+            if self._n_outputs > 0:
+                inputs, outputs = self._batch_inputs()
+                c[:, n_eq:] = (
+                    self._call_batch('evaluate_outputs_batch', (self._n_outputs,))
+                    - outputs
+                )
+            self._cached_constraint_residuals = c.ravel()
+
+    def evaluate_constraints(self, out=None):
+        self._evaluate_constraints_if_necessary_and_cache()
+        if out is not None:
+            assert len(out) == self.n_constraints()
+            np.copyto(out, self._cached_constraint_residuals)
+            return out
+        return np.copy(self._cached_constraint_residuals)
+
+    def _evaluate_jacobian_if_necessary_and_cache(self):
+        if self._cached_jacobian is None:
+            n_in = self._n_inputs
+            n_eq = self._n_eq_constraints
+            data = self._jacobian_data
+            if n_eq > 0:
+                jac = self._call_batch(
+                    'evaluate_jacobian_equality_constraints_batch', (n_eq, n_in)
+                )
+                data[:, : n_eq * n_in] = jac.reshape(len(self._models), -1)
+            if self._n_outputs > 0:
+                jac = self._call_batch(
+                    'evaluate_jacobian_outputs_batch', (self._n_outputs, n_in)
+                )
+                data[:, n_eq * n_in : (n_eq + self._n_outputs) * n_in] = jac.reshape(
+                    len(self._models), -1
+                )
+            self._cached_jacobian = coo_matrix(
+                (data.ravel(), (self._jacobian_row, self._jacobian_col)),
+                shape=(self.n_constraints(), self.n_primals()),
+            )
+
+    def evaluate_jacobian(self, out=None):
+        self._evaluate_jacobian_if_necessary_and_cache()
+        if out is not None:
+            jac = self._cached_jacobian
+            assert np.array_equal(jac.row, out.row)
+            assert np.array_equal(jac.col, out.col)
+            np.copyto(out.data, jac.data)
+            return out
+        return self._cached_jacobian.copy()
+
+    def has_hessian_support(self):
+        return self._has_hessian_support
+
+    def evaluate_hessian_lag(self, out=None):
+        if not self._has_hessian_support:
+            raise NotImplementedError(
+                'Hessians not supported for all of the external grey box'
+                ' models. Therefore, Hessians are not supported overall.'
+            )
+        self._update_greybox_nlps()
+        hess = block_diag(
+            [gbnlp.evaluate_hessian_lag() for gbnlp in self._greybox_nlps], format='coo'
+        )
+        if out is not None:
+            assert np.array_equal(hess.row, out.row)
+            assert np.array_equal(hess.col, out.col)
+            np.copyto(out.data, hess.data)
+            return out
+        return hess
+
+    def report_solver_status(self, status_code, status_message):
+        raise NotImplementedError('report_solver_status not implemented')
@@ -26,6 +26,7 @@ from pyomo.solvers.amplfunc_merge import amplfunc_merge
 from ..sparse.block_matrix import BlockMatrix
 from pyomo.contrib.pynumero.interfaces.ampl_nlp import AslNLP
 from pyomo.contrib.pynumero.interfaces.nlp import NLP
+from pyomo.contrib.pynumero.interfaces.utils import SubmatrixExtractor
 from pyomo.core.base.suffix import SuffixFinder
 from .external_grey_box import ExternalGreyBoxBlock
 
@@ -357,45 +358,81 @@ class PyomoNLP(AslNLP):
         residuals = self.evaluate_constraints()
         return residuals[self.get_constraint_indices(pyomo_constraints)]
 
+    def get_submatrix_jacobian_extractor(self, pyomo_variables, pyomo_constraints):
+        """
+        Return a SubmatrixExtractor for the submatrix of the jacobian
+        that corresponds to the list of Pyomo variables and list of
+        Pyomo constraints provided. The extractor can be reused to
+        (cheaply) extract the same submatrix from the result of any
+        subsequent call to evaluate_jacobian:
+
+            extractor = nlp.get_submatrix_jacobian_extractor(variables, constraints)
+            submatrix = extractor.extract(nlp.evaluate_jacobian())
+
+        Parameters
+        ----------
+        pyomo_variables : list of Pyomo Var or VarData objects
+        pyomo_constraints : list of Pyomo Constraint or ConstraintData objects
+        """
+        return SubmatrixExtractor(
+            self._irows_jac_full,
+            self._jcols_jac_full,
+            (self._n_con_full, self._n_primals),
+            self.get_constraint_indices(pyomo_constraints),
+            self.get_primal_indices(pyomo_variables),
+        )
+
+    def get_submatrix_hessian_lag_extractor(
+        self, pyomo_variables_rows, pyomo_variables_cols
+    ):
+        """
+        Return a SubmatrixExtractor for the submatrix of the hessian of
+        the lagrangian that corresponds to the list of Pyomo variables
+        provided. The extractor can be reused to (cheaply) extract the
+        same submatrix from the result of any subsequent call to
+        evaluate_hessian_lag.
+
+        Parameters
+        ----------
+        pyomo_variables_rows : list of Pyomo Var or VarData objects
+            List of Pyomo Var or VarData objects corresponding to the desired rows
+        pyomo_variables_cols : list of Pyomo Var or VarData objects
+            List of Pyomo Var or VarData objects corresponding to the desired columns
+        """
+        return SubmatrixExtractor(
+            self._irows_hess,
+            self._jcols_hess,
+            (self._n_primals, self._n_primals),
+            self.get_primal_indices(pyomo_variables_rows),
+            self.get_primal_indices(pyomo_variables_cols),
+        )
+
     def extract_submatrix_jacobian(self, pyomo_variables, pyomo_constraints):
         """
         Return the submatrix of the jacobian that corresponds to the list
         of Pyomo variables and list of Pyomo constraints provided
 
+        Note that when extracting the same submatrix repeatedly, it is
+        more efficient to use get_submatrix_jacobian_extractor
+
         Parameters
         ----------
         pyomo_variables : list of Pyomo Var or VarData objects
         pyomo_constraints : list of Pyomo Constraint or ConstraintData objects
         """
-        jac = self.evaluate_jacobian()
-        primal_indices = self.get_primal_indices(pyomo_variables)
-        constraint_indices = self.get_constraint_indices(pyomo_constraints)
-        row_mask = np.isin(jac.row, constraint_indices)
-        col_mask = np.isin(jac.col, primal_indices)
-        submatrix_mask = row_mask & col_mask
-        submatrix_irows = np.compress(submatrix_mask, jac.row)
-        submatrix_jcols = np.compress(submatrix_mask, jac.col)
-        submatrix_data = np.compress(submatrix_mask, jac.data)
-
-        # ToDo: this is expensive - have to think about how to do this with numpy
-        row_submatrix_map = {j: i for i, j in enumerate(constraint_indices)}
-        for i, v in enumerate(submatrix_irows):
-            submatrix_irows[i] = row_submatrix_map[v]
-
-        col_submatrix_map = {j: i for i, j in enumerate(primal_indices)}
-        for i, v in enumerate(submatrix_jcols):
-            submatrix_jcols[i] = col_submatrix_map[v]
-
-        return coo_matrix(
-            (submatrix_data, (submatrix_irows, submatrix_jcols)),
-            shape=(len(constraint_indices), len(primal_indices)),
+        extractor = self.get_submatrix_jacobian_extractor(
+            pyomo_variables, pyomo_constraints
         )
+        return extractor.extract(self.evaluate_jacobian())
 
     def extract_submatrix_hessian_lag(self, pyomo_variables_rows, pyomo_variables_cols):
         """
         Return the submatrix of the hessian of the lagrangian that
         corresponds to the list of Pyomo variables provided
 
+        Note that when extracting the same submatrix repeatedly, it is
+        more efficient to use get_submatrix_hessian_lag_extractor
+
         Parameters
         ----------
         pyomo_variables_rows : list of Pyomo Var or VarData objects
@@ -403,29 +440,10 @@ class PyomoNLP(AslNLP):
         pyomo_variables_cols : list of Pyomo Var or VarData objects
             List of Pyomo Var or VarData objects corresponding to the desired columns
         """
-        hess_lag = self.evaluate_hessian_lag()
-        primal_indices_rows = self.get_primal_indices(pyomo_variables_rows)
-        primal_indices_cols = self.get_primal_indices(pyomo_variables_cols)
-        row_mask = np.isin(hess_lag.row, primal_indices_rows)
-        col_mask = np.isin(hess_lag.col, primal_indices_cols)
-        submatrix_mask = row_mask & col_mask
-        submatrix_irows = np.compress(submatrix_mask, hess_lag.row)
-        submatrix_jcols = np.compress(submatrix_mask, hess_lag.col)
-        submatrix_data = np.compress(submatrix_mask, hess_lag.data)
-
-        # ToDo: this is expensive - have to think about how to do this with numpy
-        submatrix_map = {j: i for i, j in enumerate(primal_indices_rows)}
-        for i, v in enumerate(submatrix_irows):
-            submatrix_irows[i] = submatrix_map[v]
-
-        submatrix_map = {j: i for i, j in enumerate(primal_indices_cols)}
-        for i, v in enumerate(submatrix_jcols):
-            submatrix_jcols[i] = submatrix_map[v]
-
-        return coo_matrix(
-            (submatrix_data, (submatrix_irows, submatrix_jcols)),
-            shape=(len(primal_indices_rows), len(primal_indices_cols)),
+        extractor = self.get_submatrix_hessian_lag_extractor(
+            pyomo_variables_rows, pyomo_variables_cols
         )
+        return extractor.extract(self.evaluate_hessian_lag())
 
     def load_state_into_pyomo(self, bound_multipliers=None):
         primals = self.get_primals()
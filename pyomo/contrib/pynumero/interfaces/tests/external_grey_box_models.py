@@ -470,6 +470,47 @@ class PressureDropTwoEqualitiesTwoOutputsWithHessian(
         return hess
 
 
+class PressureDropTwoEqualitiesTwoOutputsBatch(
+    PressureDropTwoEqualitiesTwoOutputsWithHessian
+):
+    # same model as above, with the batched evaluation methods
+    @classmethod
+    def evaluate_equality_constraints_batch(cls, models, inputs):
+        Pin, c, F, P1, P3 = inputs.T
+        return np.column_stack((P1 - (Pin - c * F**2), P3 - (P1 - 2 * c * F**2)))
+
+    @classmethod
+    def evaluate_outputs_batch(cls, models, inputs):
+        Pin, c, F, P1, P3 = inputs.T
+        return np.column_stack((P1 - c * F**2, Pin - 4 * c * F**2))
+
+    @classmethod
+    def evaluate_jacobian_equality_constraints_batch(cls, models, inputs):
+        Pin, c, F, P1, P3 = inputs.T
+        jac = np.zeros((len(models), 2, 5))
+        jac[:, 0, 0] = -1
+        jac[:, 0, 1] = F**2
+        jac[:, 0, 2] = 2 * c * F
+        jac[:, 0, 3] = 1
+        jac[:, 1, 1] = 2 * F**2
+        jac[:, 1, 2] = 4 * c * F
+        jac[:, 1, 3] = -1
+        jac[:, 1, 4] = 1
+        return jac
+
+    @classmethod
+    def evaluate_jacobian_outputs_batch(cls, models, inputs):
+        Pin, c, F, P1, P3 = inputs.T
+        jac = np.zeros((len(models), 2, 5))
+        jac[:, 0, 1] = -(F**2)
+        jac[:, 0, 2] = -c * 2 * F
+        jac[:, 0, 3] = 1
+        jac[:, 1, 0] = 1
+        jac[:, 1, 1] = -4 * F**2
+        jac[:, 1, 2] = -4 * c * 2 * F
+        return jac
+
+
 class PressureDropTwoEqualitiesTwoOutputsScaleBoth(PressureDropTwoEqualitiesTwoOutputs):
     def get_equality_constraint_scaling_factors(self):
         return np.asarray([3.1, 3.2], dtype=np.float64)
@@ -0,0 +1,190 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright (c) 2008-2025
+#  National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+
+import pyomo.common.unittest as unittest
+import pyomo.environ as pyo
+
+from pyomo.contrib.pynumero.dependencies import (
+    numpy as np,
+    numpy_available,
+    scipy,
+    scipy_available,
+)
+
+if not (numpy_available and scipy_available):
+    raise unittest.SkipTest("Pynumero needs scipy and numpy to run NLP tests")
+
+from scipy.sparse import block_diag
+
+from pyomo.contrib.pynumero.asl import AmplInterface
+from pyomo.contrib.pynumero.interfaces.external_grey_box import ExternalGreyBoxBlock
+from pyomo.contrib.pynumero.interfaces.pyomo_grey_box_nlp import (
+    PyomoNLPWithGreyBoxBlocks,
+    _ExternalGreyBoxAsNLP,
+    _ExternalGreyBoxBatchAsNLP,
+    _group_batched_greybox_nlps,
+)
+import pyomo.contrib.pynumero.interfaces.tests.external_grey_box_models as ex_models
+
+
+class BadShapeBatch(ex_models.PressureDropTwoEqualitiesTwoOutputsBatch):
+    @classmethod
+    def evaluate_outputs_batch(cls, models, inputs):
+        return np.zeros((len(models), 3))
+
+
+def create_model(model_classes):
+    m = pyo.ConcreteModel()
+    m.egb = ExternalGreyBoxBlock(range(len(model_classes)))
+    for i, cls in enumerate(model_classes):
+        blk = m.egb[i]
+        blk.set_external_model(cls())
+        blk.inputs['Pin'].value = 100 + i
+        blk.inputs['Pin'].setlb(50)
+        blk.inputs['Pin'].setub(150)
+        blk.inputs['c'].value = 2 + 0.1 * i
+        blk.inputs['c'].setlb(1)
+        blk.inputs['c'].setub(5)
+        blk.inputs['F'].value = 3 - 0.2 * i
+        blk.inputs['F'].setlb(1)
+        blk.inputs['F'].setub(5)
+        blk.inputs['P1'].value = 80
+        blk.inputs['P3'].value = 70
+        blk.outputs['P2'].value = 75
+        blk.outputs['Pout'].value = 50 - i
+    return m
+
+
+class TestExternalGreyBoxBatch(unittest.TestCase):
+    def _create_nlps(self, model_classes):
+        m = create_model(model_classes)
+        return m, [_ExternalGreyBoxAsNLP(m.egb[i]) for i in m.egb]
+
+    def test_grouping(self):
+        Batch = ex_models.PressureDropTwoEqualitiesTwoOutputsBatch
+        Unbatched = ex_models.PressureDropTwoEqualitiesTwoOutputsWithHessian
+        m, gbnlps = self._create_nlps([Batch, Unbatched, Batch, Batch])
+        nlps, members = _group_batched_greybox_nlps(gbnlps)
+        self.assertEqual(len(nlps), 2)
+        self.assertIsInstance(nlps[0], _ExternalGreyBoxBatchAsNLP)
+        self.assertIs(nlps[1], gbnlps[1])
+        self.assertEqual(members, [gbnlps[0], gbnlps[2], gbnlps[3], gbnlps[1]])
+
+        # a single model is not worth batching
+        m, gbnlps = self._create_nlps([Batch, Unbatched])
+        nlps, members = _group_batched_greybox_nlps(gbnlps)
+        self.assertEqual(nlps, gbnlps)
+        self.assertEqual(members, gbnlps)
+
+    def test_batch_nlp(self):
+        Batch = ex_models.PressureDropTwoEqualitiesTwoOutputsBatch
+        m, gbnlps = self._create_nlps([Batch] * 3)
+        nlps, members = _group_batched_greybox_nlps(gbnlps)
+        self.assertEqual(len(nlps), 1)
+        batch = nlps[0]
+
+        self.assertEqual(batch.n_primals(), 21)
+        self.assertEqual(batch.n_constraints(), 12)
+        self.assertEqual(batch.nnz_jacobian(), 3 * (4 * 5 + 2))
+        self.assertTrue(batch.has_hessian_support())
+        self.assertEqual(
+            batch.primals_names(), sum((nlp.primals_names() for nlp in gbnlps), [])
+        )
+        self.assertEqual(
+            batch.constraint_names(),
+            sum((nlp.constraint_names() for nlp in gbnlps), []),
+        )
+        for attr in ('primals_lb', 'primals_ub', 'init_primals', 'constraints_lb'):
+            self.assertTrue(
+                np.array_equal(
+                    getattr(batch, attr)(),
+                    np.concatenate([getattr(nlp, attr)() for nlp in gbnlps]),
+                )
+            )
+        self.assertIsNone(batch.get_constraints_scaling())
+
+        x = batch.init_primals() + np.arange(21) / 10.0
+        y = np.arange(12, dtype=float) + 1
+        batch.set_primals(x)
+        batch.set_duals(y)
+        for nlp, xi, yi in zip(gbnlps, np.split(x, 3), np.split(y, 3)):
+            nlp.set_primals(xi)
+            nlp.set_duals(yi)
+
+        self.assertTrue(np.array_equal(batch.get_primals(), x))
+        self.assertTrue(np.array_equal(batch.get_duals(), y))
+        self.assertTrue(
+            np.allclose(
+                batch.evaluate_constraints(),
+                np.concatenate([nlp.evaluate_constraints() for nlp in gbnlps]),
+            )
+        )
+        expected = block_diag([nlp.evaluate_jacobian() for nlp in gbnlps])
+        jac = batch.evaluate_jacobian()
+        self.assertTrue(np.allclose(jac.toarray(), expected.toarray()))
+        # evaluate into an existing matrix
+        jac.data.fill(0)
+        batch.evaluate_jacobian(out=jac)
+        self.assertTrue(np.allclose(jac.toarray(), expected.toarray()))
+
+        expected = block_diag([nlp.evaluate_hessian_lag() for nlp in gbnlps])
+        hess = batch.evaluate_hessian_lag()
+        self.assertTrue(np.allclose(hess.toarray(), expected.toarray()))
+
+        # the individual NLPs are only updated when needed (for the Hessian)
+        batch.set_primals(x + 1)
+        self.assertTrue(np.array_equal(gbnlps[0].get_primals(), np.split(x, 3)[0]))
+        batch.evaluate_hessian_lag()
+        self.assertTrue(np.array_equal(gbnlps[0].get_primals(), np.split(x + 1, 3)[0]))
+
+    def test_bad_shape(self):
+        m, gbnlps = self._create_nlps([BadShapeBatch] * 2)
+        nlps, members = _group_batched_greybox_nlps(gbnlps)
+        self.assertIsInstance(nlps[0], _ExternalGreyBoxBatchAsNLP)
+        with self.assertRaisesRegex(
+            ValueError,
+            r'BadShapeBatch.evaluate_outputs_batch returned an array with '
+            r'shape \(2, 3\); expected \(2, 2\)',
+        ):
+            nlps[0].evaluate_constraints()
+
+    @unittest.skipUnless(AmplInterface.available(), "ASL interface not available")
+    def test_pyomo_nlp_with_greybox_blocks(self):
+        Batch = ex_models.PressureDropTwoEqualitiesTwoOutputsBatch
+        Unbatched = ex_models.PressureDropTwoEqualitiesTwoOutputsWithHessian
+        nlps = []
+        for cls in (Batch, Unbatched):
+            m = create_model([cls] * 3)
+            m.obj = pyo.Objective(
+                expr=sum((m.egb[i].outputs['Pout'] - 20) ** 2 for i in m.egb)
+            )
+            nlps.append(PyomoNLPWithGreyBoxBlocks(m))
+        batch_nlp, nlp = nlps
+
+        self.assertEqual(sorted(batch_nlp.primals_names()), sorted(nlp.primals_names()))
+        self.assertEqual(
+            sorted(batch_nlp.constraint_names()), sorted(nlp.constraint_names())
+        )
+        batch_nlp.set_primals(batch_nlp.init_primals())
+        nlp.set_primals(nlp.init_primals())
+        self.assertEqual(batch_nlp.evaluate_objective(), nlp.evaluate_objective())
+        self.assertAlmostEqual(
+            np.linalg.norm(batch_nlp.evaluate_constraints()),
+            np.linalg.norm(nlp.evaluate_constraints()),
+        )
+        self.assertAlmostEqual(
+            scipy.sparse.linalg.norm(batch_nlp.evaluate_jacobian()),
+            scipy.sparse.linalg.norm(nlp.evaluate_jacobian()),
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
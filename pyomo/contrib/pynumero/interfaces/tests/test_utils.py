@@ -86,5 +86,49 @@ class TestCondensedSparseSummation(unittest.TestCase):
         self.assertTrue(np.array_equal(expected_col, C.col))
 
 
+class TestSubmatrixExtractor(unittest.TestCase):
+    def _matrix(self):
+        row = [0, 0, 1, 2, 2, 2, 3]
+        col = [0, 2, 1, 0, 1, 3, 3]
+        data = [1.0, 2.0, 0.0, 4.0, 5.0, 6.0, 7.0]
+        return scipy.sparse.coo_matrix((data, (row, col)), shape=(4, 4))
+
+    def test_extract(self):
+        A = self._matrix()
+        extractor = utils.SubmatrixExtractor(A.row, A.col, A.shape, [2, 0], [3, 0, 1])
+        self.assertEqual(extractor.shape, (2, 3))
+        self.assertEqual(extractor.nnz, 4)
+
+        expected = A.toarray()[np.ix_([2, 0], [3, 0, 1])]
+        B = extractor.extract(A)
+        self.assertIsInstance(B, scipy.sparse.coo_matrix)
+        self.assertEqual(B.nnz, 4)
+        self.assertTrue(np.array_equal(B.toarray(), expected))
+        # Structural nonzeros are preserved
+        C = extractor.extract(A.data * 0)
+        self.assertEqual(C.nnz, 4)
+        self.assertTrue(np.array_equal(C.row, B.row))
+        self.assertTrue(np.array_equal(C.col, B.col))
+
+        # Update the values in place
+        A.data *= 2
+        out = extractor.extract(A, out=B)
+        self.assertIs(out, B)
+        self.assertTrue(np.array_equal(B.toarray(), 2 * expected))
+
+        # Rows/columns with no nonzeros in the submatrix
+        extractor = utils.SubmatrixExtractor(A.row, A.col, A.shape, [1, 3], [0, 2])
+        self.assertEqual(extractor.nnz, 0)
+        self.assertEqual(extractor.extract(A).shape, (2, 2))
+
+    def test_errors(self):
+        A = self._matrix()
+        extractor = utils.SubmatrixExtractor(A.row, A.col, A.shape, [2, 0], [3, 0])
+        with self.assertRaisesRegex(RuntimeError, "Expected nnz=7"):
+            extractor.extract(np.ones(3))
+        with self.assertRaisesRegex(RuntimeError, r"shape=\(2,2\) and nnz=3"):
+            extractor.extract(A, out=scipy.sparse.coo_matrix((2, 2)))
+
+
 if __name__ == '__main__':
     TestCondensedSparseSummation().test_condensed_sparse_summation()
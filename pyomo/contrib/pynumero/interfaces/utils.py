@@ -198,3 +198,103 @@ class CondensedSparseSummation(object):
             (data, (np.copy(self._row), np.copy(self._col))), shape=self._shape
         )
         return ret
+
+
+class SubmatrixExtractor(object):
+    def __init__(self, row, col, shape, row_indices, col_indices):
+        """
+        This class is used to repeatedly extract the same submatrix
+        from sparse (COO) matrices that share a fixed nonzero structure
+        (e.g., the Jacobian or Hessian of an NLP). Create the class with
+        the structure of the full matrix and the (ordered) indices of
+        the rows and columns that make up the submatrix, and the
+        extract method remains valid as long as the structure of the
+        full matrix does not change
+
+        Parameters
+        ----------
+        row: array_like
+            Row coordinates of the nonzeros of the full matrix
+        col: array_like
+            Column coordinates of the nonzeros of the full matrix
+        shape: tuple
+            Shape of the full matrix
+        row_indices: array_like
+            Indices of the full matrix rows, in the order they appear in
+            the submatrix
+        col_indices: array_like
+            Indices of the full matrix columns, in the order they appear
+            in the submatrix
+        """
+        self._full_nnz = len(row)
+        self._nz = None
+        self._row = None
+        self._col = None
+        self._shape = (len(row_indices), len(col_indices))
+        self._build_maps(row, col, shape, row_indices, col_indices)
+
+    def _build_maps(self, row, col, shape, row_indices, col_indices):
+        """
+        This method creates the gather map (the positions of the
+        submatrix nonzeros in the full matrix data array) and the
+        coordinates of those nonzeros in the submatrix
+        """
+        row = np.asarray(row)
+        col = np.asarray(col)
+        # Maps from full matrix rows/columns to submatrix rows/columns
+        # (-1 for rows/columns that are not part of the submatrix)
+        row_map = np.full(shape[0], -1, dtype=np.int64)
+        row_map[np.asarray(row_indices, dtype=np.int64)] = np.arange(self._shape[0])
+        col_map = np.full(shape[1], -1, dtype=np.int64)
+        col_map[np.asarray(col_indices, dtype=np.int64)] = np.arange(self._shape[1])
+
+        sub_row = row_map[row]
+        sub_col = col_map[col]
+        self._nz = np.nonzero((sub_row >= 0) & (sub_col >= 0))[0]
+        self._row = sub_row[self._nz]
+        self._col = sub_col[self._nz]
+
+    @property
+    def shape(self):
+        return self._shape
+
+    @property
+    def nnz(self):
+        return len(self._nz)
+
+    def extract(self, matrix, out=None):
+        """
+        Return the submatrix of matrix (a coo_matrix with the structure
+        used to create this object, or the array of its nonzero values)
+
+        If out is provided, it must be a coo_matrix returned by a previous
+        call to this method. Its nonzero values are updated in place.
+        """
+        if isinstance(matrix, coo_matrix):
+            data = matrix.data
+        else:
+            data = np.asarray(matrix)
+        if len(data) != self._full_nnz:
+            raise RuntimeError(
+                'SubmatrixExtractor.extract called with a matrix that has '
+                '{} nonzeros. Expected nnz={}'.format(len(data), self._full_nnz)
+            )
+        if out is not None:
+            if (
+                not isinstance(out, coo_matrix)
+                or out.shape != self._shape
+                or out.nnz != len(self._nz)
+            ):
+                raise RuntimeError(
+                    'SubmatrixExtractor.extract called with an "out" argument'
+                    ' that is invalid. This should be a coo_matrix with'
+                    ' shape=({},{}) and nnz={}'.format(
+                        self._shape[0], self._shape[1], len(self._nz)
+                    )
+                )
+            np.take(data, self._nz, out=out.data)
+            return out
+        return coo_matrix(
+            (data[self._nz], (np.copy(self._row), np.copy(self._col))),
+            shape=self._shape,
+        )
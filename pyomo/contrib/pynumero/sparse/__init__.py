@@ -12,5 +12,9 @@
 from ..dependencies import numpy_available, scipy_available
 
 if numpy_available and scipy_available:
-    from .block_vector import BlockVector, NotFullyDefinedBlockVectorError
+    from .block_vector import (
+        BlockVector,
+        ContiguousBlockVector,
+        NotFullyDefinedBlockVectorError,
+    )
     from .block_matrix import BlockMatrix, NotFullyDefinedBlockMatrixError
@@ -22,7 +22,10 @@ where m_{i,j} are sparse matrices
 
 """
 
-from pyomo.contrib.pynumero.sparse.block_vector import BlockVector
+from pyomo.contrib.pynumero.sparse.block_vector import (
+    BlockVector,
+    ContiguousBlockVector,
+)
 from scipy.sparse import coo_matrix, csr_matrix, csc_matrix
 from scipy.sparse import isspmatrix
 from .base_block import BaseBlockMatrix
@@ -939,6 +942,21 @@ class BlockMatrix(BaseBlockMatrix):
             assert not other.has_none, 'Block vector must not have none entries'
             assert_block_structure(self)
 
+            if isinstance(other, ContiguousBlockVector):
+                # Accumulate the products directly into the blocks of a
+                # contiguous result
+                result = ContiguousBlockVector(
+                    self._brow_lengths,
+                    dtype=np.result_type(self.dtype, other.ravel().dtype),
+                )
+                for i, j in zip(*np.nonzero(self._block_mask)):
+                    _tmp = self._blocks[i, j] * other.get_block(j)
+                    if isinstance(_tmp, BlockVector):
+                        _tmp = _tmp.flatten()
+                    blk = result.get_block(i)
+                    blk += _tmp
+                return result
+
             nblocks = self.bshape[0]
             result = BlockVector(nblocks)
             for i in range(bm):
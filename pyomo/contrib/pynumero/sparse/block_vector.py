@@ -177,6 +177,7 @@ For example,
    BlockVector.nblocks
    BlockVector.bshape
    BlockVector.has_none
+   ContiguousBlockVector
 
 """
 
@@ -1668,3 +1669,487 @@ class BlockVector(BaseBlockVector, np.ndarray):
             mpi_bv.set_block(bid, self.get_block(bid))
 
         return mpi_bv
+
+
+class ContiguousBlockVector(BlockVector):
+    """
+    BlockVector whose blocks are views into a single contiguous
+    numpy array. The full BlockVector API is supported, but
+    elementwise operations, ufuncs, and reductions are performed once
+    on the underlying array (instead of block-by-block), and
+    :py:meth:`ravel` returns the underlying array without copying.
+
+    Note that, unlike in BlockVector, :py:meth:`set_block` copies the
+    values of the new block into the existing block (so the blocks
+    always remain views into the underlying array). For the same
+    reason, blocks cannot be nested BlockVectors.
+
+    >>> import numpy as np
+    >>> from pyomo.contrib.pynumero.sparse import ContiguousBlockVector
+    >>> bv = ContiguousBlockVector([3, 2])
+    >>> bv.set_block(0, np.ones(3))
+    >>> bv.ravel()
+    array([1., 1., 1., 0., 0.])
+
+    Parameters
+    ----------
+    block_sizes: array_like
+        The size of each block
+    dtype: numpy.dtype, optional
+        The type of the underlying array (ignored if buffer is provided)
+    buffer: numpy.ndarray, optional
+        A 1D array to use as the underlying array (the blocks are
+        views into this array). If not provided, the vector is
+        initialized to zeros.
+
+    """
+
+    def __new__(cls, block_sizes, dtype=np.float64, buffer=None):
+        block_sizes = np.asarray(block_sizes, dtype=np.int64)
+        assert block_sizes.ndim == 1, 'block_sizes must be 1D'
+        nblocks = block_sizes.size
+        obj = super(ContiguousBlockVector, cls).__new__(cls, nblocks)
+        offsets = np.zeros(nblocks + 1, dtype=np.int64)
+        np.cumsum(block_sizes, out=offsets[1:])
+        if buffer is None:
+            buffer = np.zeros(offsets[-1], dtype=dtype)
+        else:
+            assert type(buffer) == np.ndarray, 'buffer must be a numpy array'
+            assert buffer.ndim == 1, 'buffer must be 1D'
+            assert buffer.size == offsets[-1], 'Dimension mismatch {} != {}'.format(
+                buffer.size, offsets[-1]
+            )
+        obj._buffer = buffer
+        obj._offsets = offsets
+        for i in range(nblocks):
+            BlockVector.set_block(obj, i, buffer[offsets[i] : offsets[i + 1]])
+        return obj
+
+    def __init__(self, block_sizes, dtype=np.float64, buffer=None):
+        pass
+
+    def __array_finalize__(self, obj):
+        """This method is required to subclass from numpy array"""
+        super(ContiguousBlockVector, self).__array_finalize__(obj)
+        if obj is None:
+            return
+        self._buffer = getattr(obj, '_buffer', None)
+        self._offsets = getattr(obj, '_offsets', None)
+
+    @classmethod
+    def from_blocks(cls, blocks, dtype=None):
+        """
+        Create a ContiguousBlockVector with a copy of the values in blocks
+
+        Parameters
+        ----------
+        blocks: list or BlockVector
+            The blocks (1D numpy arrays or BlockVectors, which are
+            flattened into a single block)
+        dtype: numpy.dtype, optional
+            The type of the underlying array. Defaults to the type that
+            results from combining all the blocks.
+
+        Returns
+        -------
+        ContiguousBlockVector
+        """
+        if isinstance(blocks, BlockVector):
+            assert_block_structure(blocks)
+        blocks = list(blocks)
+        if dtype is None:
+            dtype = np.result_type(*blocks) if blocks else np.float64
+        result = cls([blk.size for blk in blocks], dtype=dtype)
+        for i, blk in enumerate(blocks):
+            result.set_block(i, blk)
+        return result
+
+    def _new_like(self, buffer):
+        """Return a new ContiguousBlockVector with this structure over buffer"""
+        result = super(ContiguousBlockVector, self.__class__).__new__(
+            self.__class__, self._nblocks
+        )
+        offsets = self._offsets
+        result._buffer = buffer
+        result._offsets = offsets
+        # The structure is known to be valid, so we can bypass the
+        # checks in set_block
+        result._brow_lengths = self._brow_lengths.copy()
+        result._undefined_brows = set()
+        _setitem = super(BlockVector, result).__setitem__
+        for i in range(self._nblocks):
+            _setitem(i, buffer[offsets[i] : offsets[i + 1]])
+        return result
+
+    def _flat_operand(self, other):
+        """Return other as something that can be combined with the
+        underlying array (or None if this is not possible)"""
+        if isinstance(other, ContiguousBlockVector):
+            if other._offsets is self._offsets or np.array_equal(
+                other._offsets, self._offsets
+            ):
+                return other._buffer
+            return None
+        elif type(other) == np.ndarray:
+            if other.ndim == 1 and other.size == self._buffer.size:
+                return other
+            return None
+        elif np.isscalar(other):
+            return other
+        return None
+
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        """Runs ufuncs on the underlying array when possible"""
+        if kwargs.get('out', None) is None:
+            if method == 'reduce' and ufunc in vec_associative_reductions:
+                (arg,) = inputs
+                if isinstance(arg, ContiguousBlockVector):
+                    return getattr(ufunc, method)(arg._buffer, **kwargs)
+            elif method == '__call__' and (
+                ufunc in vec_unary_ufuncs or ufunc in vec_binary_ufuncs
+            ):
+                ref = next(
+                    arg for arg in inputs if isinstance(arg, ContiguousBlockVector)
+                )
+                args = [ref._flat_operand(arg) for arg in inputs]
+                if all(arg is not None for arg in args):
+                    return ref._new_like(ufunc(*args, **kwargs))
+        return super(ContiguousBlockVector, self).__array_ufunc__(
+            ufunc, method, *inputs, **kwargs
+        )
+
+    def _as_block_vector(self):
+        """Return a (regular) BlockVector that shares the blocks of this vector"""
+        result = BlockVector(self._nblocks)
+        for i in range(self._nblocks):
+            result.set_block(i, self.get_block(i))
+        return result
+
+    def _binary_operation_helper(self, other, operation, fallback):
+        _other = self._flat_operand(other)
+        if _other is None:
+            # Operands that do not share our structure are handled
+            # block-by-block by the BlockVector implementation
+            return fallback(self._as_block_vector(), other)
+        return self._new_like(operation(self._buffer, _other))
+
+    def _inplace_operation_helper(self, other, operation, fallback):
+        _other = self._flat_operand(other)
+        if _other is None:
+            fallback(self._as_block_vector(), other)
+        else:
+            operation(self._buffer, _other)
+        return self
+
+    def _comparison_helper(self, other, operation):
+        return self._binary_operation_helper(
+            other,
+            operation,
+            lambda x, y: BlockVector._comparison_helper(x, y, operation),
+        )
+
+    def set_block(self, key, value):
+        """
+        Set the values of a block. The value can be a NumPy array or a
+        BlockVector (which is flattened). The values are copied into the
+        existing block.
+
+        Parameters
+        ----------
+        key: int
+            This is the block index
+        value:
+            This is the block. It can be a NumPy array or another BlockVector.
+        """
+        assert -self.nblocks < key < self.nblocks, 'out of range'
+        assert isinstance(value, np.ndarray) or isinstance(
+            value, BaseBlockVector
+        ), 'Blocks need to be numpy arrays or BlockVectors'
+        assert value.ndim == 1, 'Blocks need to be 1D'
+        if isinstance(value, BaseBlockVector):
+            assert_block_structure(value)
+            value = value.flatten()
+        self._set_block_size(key, value.size)
+        np.copyto(self.get_block(key), value)
+
+    def dot(self, other, out=None):
+        """
+        Returns dot product
+
+        Parameters
+        ----------
+        other : ndarray or BlockVector
+
+        Returns
+        -------
+        float
+
+        """
+        assert out is None, 'Operation not supported with out keyword'
+        _other = self._flat_operand(other)
+        if _other is None or np.isscalar(_other):
+            return super(ContiguousBlockVector, self).dot(other)
+        return self._buffer.dot(_other)
+
+    def sum(self, axis=None, dtype=None, out=None, keepdims=False):
+        """
+        Returns the sum of all entries in this BlockVector
+        """
+        return self._buffer.sum(axis=axis, dtype=dtype, out=out, keepdims=keepdims)
+
+    def all(self, axis=None, out=None, keepdims=False):
+        """
+        Returns True if all elements evaluate to True.
+        """
+        return self._buffer.all(axis=axis, out=out, keepdims=keepdims)
+
+    def any(self, axis=None, out=None, keepdims=False):
+        """
+        Returns True if any element evaluate to True.
+        """
+        return self._buffer.any(axis=axis, out=out, keepdims=keepdims)
+
+    def max(self, axis=None, out=None, keepdims=False):
+        """
+        Returns the largest value stored in this BlockVector
+        """
+        return self._buffer.max(axis=axis, out=out, keepdims=keepdims)
+
+    def min(self, axis=None, out=None, keepdims=False):
+        """
+        Returns the smallest value stored in the vector
+        """
+        return self._buffer.min(axis=axis, out=out, keepdims=keepdims)
+
+    def prod(self, axis=None, dtype=None, out=None, keepdims=False):
+        """
+        Returns the product of all entries in this BlockVector
+        """
+        return self._buffer.prod(axis=axis, dtype=dtype, out=out, keepdims=keepdims)
+
+    def astype(self, dtype, order='K', casting='unsafe', subok=True, copy=True):
+        """Copy of the array, cast to a specified type"""
+        if copy:
+            return self._new_like(self._buffer.astype(dtype, casting=casting))
+        raise NotImplementedError("astype not implemented for copy=False")
+
+    def clip(self, min=None, max=None, out=None):
+        """
+        Return BlockVector whose values are limited to [min, max].
+        One of max or min must be given.
+        """
+        assert out is None, 'Out keyword not supported'
+        return self._new_like(self._buffer.clip(min=min, max=max))
+
+    def round(self, decimals=0, out=None):
+        """
+        Return BlockVector with each element rounded to the given number of decimals
+        """
+        assert out is None, 'Out keyword not supported'
+        return self._new_like(self._buffer.round(decimals=decimals))
+
+    def fill(self, value):
+        """
+        Fills the BlockVector with a scalar value.
+        """
+        self._buffer.fill(value)
+
+    def flatten(self, order='C'):
+        """
+        Returns a copy of the underlying array
+
+        Parameters
+        ----------
+        order: str: {C, F, A, K}, optional
+            See NumPy array documentation.
+
+        Returns
+        -------
+        flat_array: numpy.ndarray
+        """
+        return self._buffer.copy(order=order)
+
+    def ravel(self, order='C'):
+        """
+        Returns the underlying array (without copying). Changes to the
+        returned array are reflected in the blocks of this vector.
+
+        Returns
+        -------
+        res: numpy.ndarray
+        """
+        return self._buffer
+
+    def tolist(self):
+        """
+        Return the BlockVector flattened as a list.
+        """
+        return self._buffer.tolist()
+
+    def clone(self, value=None, copy=True):
+        """
+        Returns a copy of this BlockVector
+
+        Parameters
+        ----------
+        value: scalar (optional)
+            all entries of the cloned vector are set to this value
+        copy: bool (optional)
+            if True makes a copy of the underlying array. default True
+
+        Returns
+        -------
+        ContiguousBlockVector
+
+        """
+        result = self._new_like(self._buffer.copy() if copy else self._buffer)
+        if value is not None:
+            result.fill(value)
+        return result
+
+    def copy(self, order='C'):
+        """
+        Returns a copy of the BlockVector
+        """
+        return self._new_like(self._buffer.copy(order=order))
+
+    def copy_structure(self):
+        """
+        Returns a copy of the BlockVector structure filled with zeros
+        """
+        return self._new_like(np.zeros_like(self._buffer))
+
+    def __copy__(self):
+        # numpy would copy the array of blocks, and the blocks of the
+        # copy would still be views into our underlying array
+        return self._new_like(self._buffer.copy())
+
+    def __deepcopy__(self, memo):
+        result = memo[id(self)] = self._new_like(self._buffer.copy())
+        return result
+
+    def copyfrom(self, other):
+        """
+        Copy entries of other vector into this vector
+
+        Parameters
+        ----------
+        other: BlockVector or numpy.ndarray
+            vector to be copied to this BlockVector
+
+        Returns
+        -------
+        None
+
+        """
+        if isinstance(other, BlockVector):
+            assert_block_structure(other)
+            assert self.shape == other.shape, 'Dimension mismatch {} != {}'.format(
+                self.shape, other.shape
+            )
+            assert (
+                self.nblocks == other.nblocks
+            ), 'Number of blocks mismatch {} != {}'.format(self.nblocks, other.nblocks)
+            if isinstance(other, ContiguousBlockVector):
+                np.copyto(self._buffer, other._buffer)
+            else:
+                for idx in range(other.nblocks):
+                    self.set_block(idx, other.get_block(idx))
+        elif isinstance(other, np.ndarray):
+            assert self.shape == other.shape, 'Dimension mismatch {} != {}'.format(
+                self.shape, other.shape
+            )
+            np.copyto(self._buffer, other)
+        else:
+            raise NotImplementedError('Operation not supported by BlockVector')
+
+    def copyto(self, other):
+        """
+        Copy entries of this BlockVector into other
+
+        Parameters
+        ----------
+        other: BlockVector or numpy.ndarray
+
+        Returns
+        -------
+        None
+
+        """
+        if isinstance(other, ContiguousBlockVector):
+            assert (
+                self.nblocks == other.nblocks
+            ), 'Number of blocks mismatch {} != {}'.format(self.nblocks, other.nblocks)
+            np.copyto(other._buffer, self._buffer)
+        elif type(other) == np.ndarray:
+            np.copyto(other, self._buffer)
+        else:
+            super(ContiguousBlockVector, self).copyto(other)
+
+    def __add__(self, other):
+        return self._binary_operation_helper(other, operator.add, BlockVector.__add__)
+
+    def __radd__(self, other):  # other + self
+        return self.__add__(other)
+
+    def __sub__(self, other):
+        return self._binary_operation_helper(other, operator.sub, BlockVector.__sub__)
+
+    def __rsub__(self, other):  # other - self
+        return self._binary_operation_helper(
+            other, lambda x, y: y - x, BlockVector.__rsub__
+        )
+
+    def __mul__(self, other):
+        return self._binary_operation_helper(other, operator.mul, BlockVector.__mul__)
+
+    def __rmul__(self, other):  # other * self
+        return self.__mul__(other)
+
+    def __truediv__(self, other):
+        return self._binary_operation_helper(
+            other, operator.truediv, BlockVector.__truediv__
+        )
+
+    def __rtruediv__(self, other):
+        return self._binary_operation_helper(
+            other, lambda x, y: y / x, BlockVector.__rtruediv__
+        )
+
+    def __floordiv__(self, other):
+        return self._binary_operation_helper(
+            other, operator.floordiv, BlockVector.__floordiv__
+        )
+
+    def __rfloordiv__(self, other):
+        return self._binary_operation_helper(
+            other, lambda x, y: y // x, BlockVector.__rfloordiv__
+        )
+
+    def __iadd__(self, other):
+        return self._inplace_operation_helper(
+            other, operator.iadd, BlockVector.__iadd__
+        )
+
+    def __isub__(self, other):
+        return self._inplace_operation_helper(
+            other, operator.isub, BlockVector.__isub__
+        )
+
+    def __imul__(self, other):
+        return self._inplace_operation_helper(
+            other, operator.imul, BlockVector.__imul__
+        )
+
+    def __itruediv__(self, other):
+        return self._inplace_operation_helper(
+            other, operator.itruediv, BlockVector.__itruediv__
+        )
+
+    def __neg__(self):
+        return self._new_like(-self._buffer)
+
+    def __contains__(self, item):
+        if np.isscalar(item):
+            return item in self._buffer
+        raise NotImplementedError()
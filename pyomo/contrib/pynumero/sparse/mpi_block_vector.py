@@ -23,6 +23,19 @@ import numpy as np
 import operator
 
 
+def _mpi_op(comm, name):
+    """Return the reduction operation (e.g., 'SUM') for the communicator
+
+    Communicators that are not from mpi4py (e.g.,
+    :py:class:`~pyomo.contrib.pynumero.sparse.shared_memory_comm.SharedMemoryComm`)
+    provide their own reduction operations through an ``ops`` attribute.
+    """
+    ops = getattr(comm, 'ops', None)
+    if ops is None:
+        ops = mpi4py.MPI
+    return getattr(ops, name)
+
+
 def assert_block_structure(vec):
     if vec.has_none:
         msg = 'Call MPIBlockVector.broadcast_block_sizes() first.'
@@ -480,7 +493,7 @@ class MPIBlockVector(BaseBlockVector, np.ndarray):
         for i in self._owned_blocks:
             local *= self._block_vector.get_block(i).all()
 
-        return bool(self._mpiw.allreduce(local, op=mpi4py.MPI.PROD))
+        return bool(self._mpiw.allreduce(local, op=_mpi_op(self._mpiw, 'PROD')))
 
     def any(self, axis=None, out=None, keepdims=False):
         """
@@ -492,7 +505,7 @@ class MPIBlockVector(BaseBlockVector, np.ndarray):
         for i in self._owned_blocks:
             local += self._block_vector.get_block(i).any()
 
-        return bool(self._mpiw.allreduce(local, op=mpi4py.MPI.SUM))
+        return bool(self._mpiw.allreduce(local, op=_mpi_op(self._mpiw, 'SUM')))
 
     def min(self, axis=None, out=None, keepdims=False):
         """
@@ -507,7 +520,7 @@ class MPIBlockVector(BaseBlockVector, np.ndarray):
                 lmin = block.min()
                 if lmin <= local_min:
                     local_min = lmin
-        res = self._mpiw.allreduce(local_min, op=mpi4py.MPI.MIN)
+        res = self._mpiw.allreduce(local_min, op=_mpi_op(self._mpiw, 'MIN'))
         if res == np.inf:
             if self.size == 0:
                 raise ValueError('cannot get the min of a size 0 array')
@@ -526,7 +539,7 @@ class MPIBlockVector(BaseBlockVector, np.ndarray):
                 lmax = block.max()
                 if lmax >= local_max:
                     local_max = lmax
-        res = self._mpiw.allreduce(local_max, op=mpi4py.MPI.MAX)
+        res = self._mpiw.allreduce(local_max, op=_mpi_op(self._mpiw, 'MAX'))
         if res == -np.inf:
             if self.size == 0:
                 raise ValueError('cannot get the max of a size 0 array')
@@ -545,7 +558,7 @@ class MPIBlockVector(BaseBlockVector, np.ndarray):
         for i in indices:
             local_sum += self._block_vector.get_block(i).sum(axis=axis, dtype=dtype)
 
-        return self._mpiw.allreduce(local_sum, op=mpi4py.MPI.SUM)
+        return self._mpiw.allreduce(local_sum, op=_mpi_op(self._mpiw, 'SUM'))
 
     def prod(self, axis=None, dtype=None, out=None, keepdims=False):
         """
@@ -559,7 +572,7 @@ class MPIBlockVector(BaseBlockVector, np.ndarray):
         local_prod = 1.0
         for i in indices:
             local_prod *= self._block_vector.get_block(i).prod(axis=axis, dtype=dtype)
-        return self._mpiw.allreduce(local_prod, op=mpi4py.MPI.PROD)
+        return self._mpiw.allreduce(local_prod, op=_mpi_op(self._mpiw, 'PROD'))
 
     def mean(self, axis=None, dtype=None, out=None, keepdims=False):
         """
@@ -872,7 +885,7 @@ class MPIBlockVector(BaseBlockVector, np.ndarray):
                     other.get_block(i)
                 )
 
-            return self._mpiw.allreduce(local_dot_prod, op=mpi4py.MPI.SUM)
+            return self._mpiw.allreduce(local_dot_prod, op=_mpi_op(self._mpiw, 'SUM'))
         elif isinstance(other, BlockVector):
             assert (
                 self.nblocks == other.nblocks
@@ -1248,7 +1261,7 @@ class MPIBlockVector(BaseBlockVector, np.ndarray):
             for i in self._owned_blocks:
                 if other in self.get_block(i):
                     contains = True
-            return bool(self._mpiw.allreduce(contains, op=mpi4py.MPI.SUM))
+            return bool(self._mpiw.allreduce(contains, op=_mpi_op(self._mpiw, 'SUM')))
         else:
             raise NotImplementedError('Operation not supported by MPIBlockVector')
 
@@ -0,0 +1,424 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright (c) 2008-2025
+#  National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+"""
+A shared-memory communicator for running PyNumero's parallel block
+structures (:py:class:`MPIBlockVector` and :py:class:`MPIBlockMatrix`)
+on a pool of local processes without MPI.
+
+:py:class:`SharedMemoryComm` implements the subset of the mpi4py
+communicator interface used by the parallel block structures.  Each
+rank owns a :py:mod:`multiprocessing.shared_memory` segment that it
+writes its contribution to a collective operation into; the other ranks
+read that data directly from shared memory.  Block ownership,
+``broadcast_block_sizes()``, ``dot()``, and all reductions therefore
+behave exactly as they do under MPI.
+
+:py:func:`run_parallel` starts the processes and calls a function with
+the communicator in each of them, e.g.
+
+.. code-block:: python
+
+   def main(comm):
+       rank = comm.Get_rank()
+       x = MPIBlockVector(3, [0, 1, 2], comm)
+       x.set_block(rank, np.ones(4) * rank)
+       x.broadcast_block_sizes()
+       return x.dot(x)
+
+   results = run_parallel(main, 3)
+
+.. rubric:: Contents
+
+"""
+
+import functools
+import multiprocessing
+import operator
+import pickle
+import sys
+import traceback
+from multiprocessing import shared_memory
+from multiprocessing.connection import wait
+from threading import BrokenBarrierError
+from types import SimpleNamespace
+
+import numpy as np
+
+# The minimum size (in bytes) of the segment each rank uses to send data
+_MIN_SEGMENT_SIZE = 4096
+
+
+class _ReductionOp(object):
+    """A reduction operation for :py:class:`SharedMemoryComm`
+
+    Parameters
+    ----------
+    name: str
+        The name of the corresponding mpi4py operation
+    reduce_obj: callable
+        Binary function used to reduce Python objects (``allreduce``)
+    reduce_array: numpy.ufunc
+        Binary ufunc used to reduce buffers (``Allreduce``)
+    """
+
+    __slots__ = ('name', 'reduce_obj', 'reduce_array')
+
+    def __init__(self, name, reduce_obj, reduce_array):
+        self.name = name
+        self.reduce_obj = reduce_obj
+        self.reduce_array = reduce_array
+
+    def __repr__(self):
+        return 'SharedMemoryComm.ops.' + self.name
+
+
+SUM = _ReductionOp('SUM', operator.add, np.add)
+PROD = _ReductionOp('PROD', operator.mul, np.multiply)
+MIN = _ReductionOp('MIN', min, np.minimum)
+MAX = _ReductionOp('MAX', max, np.maximum)
+LAND = _ReductionOp('LAND', lambda a, b: bool(a and b), np.logical_and)
+LOR = _ReductionOp('LOR', lambda a, b: bool(a or b), np.logical_or)
+
+
+def _attach(name):
+    # Attaching to a segment created by another process must not
+    # register it with the resource tracker a second time (the creating
+    # process is responsible for unlinking it)
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=name, track=False)
+    return shared_memory.SharedMemory(name=name)
+
+
+def _as_bytes(buf):
+    return np.ascontiguousarray(buf).reshape(-1).view(np.uint8)
+
+
+def _pickle(obj):
+    return np.frombuffer(pickle.dumps(obj, pickle.HIGHEST_PROTOCOL), dtype=np.uint8)
+
+
+class SharedMemoryComm(object):
+    """
+    Communicator for a group of local processes that exchange data
+    through shared memory.
+
+    This implements the part of the mpi4py ``Comm`` interface that is
+    used by :py:class:`MPIBlockVector` and :py:class:`MPIBlockMatrix`
+    (``Get_rank``, ``Get_size``, ``Barrier``, ``allreduce``,
+    ``allgather``, ``gather``, ``bcast``, ``Allreduce``, ``Allgather``,
+    ``Gather``, and ``Bcast``).  As with MPI, every rank has to call
+    the collective operations in the same order.  The reduction
+    operations are available as ``SharedMemoryComm.ops.SUM``,
+    ``PROD``, ``MIN``, ``MAX``, ``LAND``, and ``LOR``.
+
+    Communicators are not created directly; use :py:func:`run_parallel`.
+
+    Parameters
+    ----------
+    rank: int
+        Rank of this process
+    size: int
+        Number of processes in the communicator
+    directory: str
+        Name of the shared memory segment with the (generation, number
+        of bytes) of the data each rank has sent
+    barrier: multiprocessing.Barrier
+        Barrier shared by all ranks
+    """
+
+    ops = SimpleNamespace(SUM=SUM, PROD=PROD, MIN=MIN, MAX=MAX, LAND=LAND, LOR=LOR)
+
+    def __init__(self, rank, size, directory, barrier):
+        self._rank = rank
+        self._size = size
+        self._barrier = barrier
+        self._prefix = directory
+        self._directory_shm = _attach(directory)
+        self._directory = np.ndarray(
+            (size, 2), dtype=np.int64, buffer=self._directory_shm.buf
+        )
+        # The segment this rank sends data through.  It is replaced
+        # (and the generation incremented) when it is too small.
+        self._segment = None
+        self._generation = 0
+        # rank -> (generation, segment) for the other ranks' segments
+        self._attached = {}
+
+    @property
+    def rank(self):
+        return self._rank
+
+    @property
+    def size(self):
+        return self._size
+
+    def Get_rank(self):
+        return self._rank
+
+    def Get_size(self):
+        return self._size
+
+    def Barrier(self):
+        self._barrier.wait()
+
+    barrier = Barrier
+
+    def free(self):
+        """Release the shared memory used by this rank"""
+        for gen, seg in self._attached.values():
+            seg.close()
+        self._attached = {}
+        if self._segment is not None:
+            self._segment.close()
+            self._segment.unlink()
+            self._segment = None
+        if self._directory_shm is not None:
+            self._directory = None
+            self._directory_shm.close()
+            self._directory_shm = None
+
+    def _segment_name(self, rank, generation):
+        return '%s_%s_%s' % (self._prefix, rank, generation)
+
+    def _send_buffer(self, nbytes):
+        seg = self._segment
+        if seg is None or seg.size < nbytes:
+            capacity = _MIN_SEGMENT_SIZE
+            if seg is not None:
+                capacity = 2 * seg.size
+                seg.close()
+                seg.unlink()
+            self._generation += 1
+            seg = self._segment = shared_memory.SharedMemory(
+                name=self._segment_name(self._rank, self._generation),
+                create=True,
+                size=max(nbytes, capacity),
+            )
+        return seg
+
+    def _recv_buffer(self, rank):
+        gen, nbytes = (int(i) for i in self._directory[rank])
+        if not nbytes:
+            return np.empty(0, dtype=np.uint8)
+        if rank == self._rank:
+            seg = self._segment
+        else:
+            cached = self._attached.get(rank)
+            if cached is not None and cached[0] == gen:
+                seg = cached[1]
+            else:
+                if cached is not None:
+                    cached[1].close()
+                seg = _attach(self._segment_name(rank, gen))
+                self._attached[rank] = (gen, seg)
+        return np.ndarray(nbytes, dtype=np.uint8, buffer=seg.buf)
+
+    def _exchange(self, payload, reader):
+        """Send payload (a uint8 array or None) to all ranks
+
+        ``reader`` is called with the list of payloads sent by each
+        rank.  The payloads are views into shared memory that are only
+        valid until ``reader`` returns, so the reader must copy any
+        data it needs to keep.
+        """
+        nbytes = 0 if payload is None else payload.nbytes
+        if nbytes:
+            seg = self._send_buffer(nbytes)
+            np.ndarray(nbytes, dtype=np.uint8, buffer=seg.buf)[:] = payload
+        self._directory[self._rank] = (self._generation, nbytes)
+        self._barrier.wait()
+        try:
+            return reader([self._recv_buffer(r) for r in range(self._size)])
+        finally:
+            # Nobody may overwrite their segment until everyone is done
+            # reading it
+            self._barrier.wait()
+
+    #
+    # Collective operations on (picklable) Python objects
+    #
+
+    def allgather(self, sendobj):
+        return self._exchange(
+            _pickle(sendobj), lambda bufs: [pickle.loads(buf) for buf in bufs]
+        )
+
+    def allreduce(self, sendobj, op=SUM):
+        return functools.reduce(op.reduce_obj, self.allgather(sendobj))
+
+    def gather(self, sendobj, root=0):
+        if self._rank == root:
+            reader = lambda bufs: [pickle.loads(buf) for buf in bufs]
+        else:
+            reader = lambda bufs: None
+        return self._exchange(_pickle(sendobj), reader)
+
+    def bcast(self, obj, root=0):
+        return self._exchange(
+            _pickle(obj) if self._rank == root else None,
+            lambda bufs: pickle.loads(bufs[root]),
+        )
+
+    #
+    # Collective operations on numpy arrays
+    #
+
+    def Allreduce(self, sendbuf, recvbuf, op=SUM):
+        dtype = np.asarray(sendbuf).dtype
+
+        def reader(bufs):
+            result = functools.reduce(
+                op.reduce_array, (buf.view(dtype) for buf in bufs)
+            )
+            recvbuf[...] = result.reshape(recvbuf.shape)
+
+        self._exchange(_as_bytes(sendbuf), reader)
+
+    def Allgather(self, sendbuf, recvbuf):
+        def reader(bufs):
+            data = np.concatenate(bufs).view(recvbuf.dtype)
+            recvbuf[...] = data.reshape(recvbuf.shape)
+
+        self._exchange(_as_bytes(sendbuf), reader)
+
+    def Gather(self, sendbuf, recvbuf, root=0):
+        if self._rank == root:
+
+            def reader(bufs):
+                data = np.concatenate(bufs).view(recvbuf.dtype)
+                recvbuf[...] = data.reshape(recvbuf.shape)
+
+        else:
+            reader = lambda bufs: None
+        self._exchange(_as_bytes(sendbuf), reader)
+
+    def Bcast(self, buf, root=0):
+        if self._rank == root:
+            self._exchange(_as_bytes(buf), lambda bufs: None)
+        else:
+
+            def reader(bufs):
+                buf[...] = bufs[root].view(buf.dtype).reshape(buf.shape)
+
+            self._exchange(None, reader)
+
+
+def _run_rank(target, rank, size, directory, barrier, conn, args, kwargs):
+    comm = SharedMemoryComm(rank, size, directory, barrier)
+    try:
+        result = (True, target(comm, *args, **kwargs))
+    except BaseException as e:
+        # Release any ranks waiting on this one in a collective
+        barrier.abort()
+        result = (False, isinstance(e, BrokenBarrierError), traceback.format_exc())
+    finally:
+        comm.free()
+    try:
+        conn.send(result)
+    except Exception:
+        conn.send((False, False, traceback.format_exc()))
+    conn.close()
+
+
+def run_parallel(target, nprocs, args=(), kwargs=None, mp_context=None):
+    """Call ``target(comm, *args, **kwargs)`` in ``nprocs`` local processes
+
+    Each process is passed a :py:class:`SharedMemoryComm` connecting
+    it to the other processes, so ``target`` can be written exactly as
+    an MPI program that uses the communicator (e.g., to build
+    :py:class:`MPIBlockVector` and :py:class:`MPIBlockMatrix` objects).
+
+    Parameters
+    ----------
+    target: callable
+        The function to run.  This (and the arguments) must be picklable
+        if the processes are not started by forking.
+    nprocs: int
+        The number of processes (ranks) to run
+    args: tuple
+        Additional positional arguments to pass to ``target``
+    kwargs: dict
+        Keyword arguments to pass to ``target``
+    mp_context: str
+        The :py:mod:`multiprocessing` start method (by default, the
+        platform default is used)
+
+    Returns
+    -------
+    list
+        The value returned by ``target`` on each rank (indexed by rank)
+    """
+    if nprocs < 1:
+        raise ValueError(
+            "run_parallel requires at least one process (got nprocs=%s)" % (nprocs,)
+        )
+    if kwargs is None:
+        kwargs = {}
+    ctx = multiprocessing.get_context(mp_context)
+    barrier = ctx.Barrier(nprocs)
+    directory = shared_memory.SharedMemory(create=True, size=16 * nprocs)
+    try:
+        np.ndarray((nprocs, 2), dtype=np.int64, buffer=directory.buf)[...] = 0
+        procs = []
+        conns = []
+        for rank in range(nprocs):
+            recv_conn, send_conn = ctx.Pipe(duplex=False)
+            proc = ctx.Process(
+                target=_run_rank,
+                args=(
+                    target,
+                    rank,
+                    nprocs,
+                    directory.name,
+                    barrier,
+                    send_conn,
+                    args,
+                    kwargs,
+                ),
+            )
+            proc.start()
+            send_conn.close()
+            procs.append(proc)
+            conns.append(recv_conn)
+
+        outcome = [None] * nprocs
+        pending = {conn: rank for rank, conn in enumerate(conns)}
+        while pending:
+            for conn in wait(list(pending)):
+                rank = pending.pop(conn)
+                try:
+                    outcome[rank] = conn.recv()
+                except EOFError:
+                    # The process died without reporting back
+                    barrier.abort()
+                    procs[rank].join()
+                    outcome[rank] = (
+                        False,
+                        False,
+                        "Process exited with code %s" % (procs[rank].exitcode,),
+                    )
+                conn.close()
+        for proc in procs:
+            proc.join()
+    finally:
+        directory.close()
+        directory.unlink()
+
+    failed = [rank for rank, res in enumerate(outcome) if not res[0]]
+    if failed:
+        # Report the original error (and not the ranks that failed
+        # because the barrier was aborted)
+        rank = next((r for r in failed if not outcome[r][1]), failed[0])
+        raise RuntimeError(
+            "run_parallel: rank %s of %s raised an exception:\n%s"
+            % (rank, nprocs, outcome[rank][2])
+        )
+    return [res[1] for res in outcome]
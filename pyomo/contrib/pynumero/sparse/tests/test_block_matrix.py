@@ -26,6 +26,7 @@ from scipy.sparse import coo_matrix, bmat
 from pyomo.contrib.pynumero.sparse import (
     BlockMatrix,
     BlockVector,
+    ContiguousBlockVector,
     NotFullyDefinedBlockMatrixError,
 )
 import warnings
@@ -157,6 +158,24 @@ class TestBlockMatrix(unittest.TestCase):
         self.basic_m *= 5.0
         self.assertTrue(np.allclose(dense_mat, self.basic_m.toarray()))
 
+    def test_multiply_contiguous(self):
+        block = self.block_m
+        scipy_mat = bmat([[block, block], [None, block]], format='coo')
+        x = ContiguousBlockVector.from_blocks([np.arange(4.0), np.ones(4)])
+        res = self.basic_m * x
+        self.assertIsInstance(res, ContiguousBlockVector)
+        self.assertEqual(res.block_sizes().tolist(), [4, 4])
+        self.assertTrue(np.allclose(res.flatten(), scipy_mat.dot(x.flatten())))
+
+        # nested blocks
+        x = ContiguousBlockVector.from_blocks([np.arange(4.0), np.arange(8.0)])
+        res = self.composed_m * x
+        self.assertIsInstance(res, ContiguousBlockVector)
+        self.assertEqual(res.block_sizes().tolist(), [4, 8])
+        self.assertTrue(
+            np.allclose(res.flatten(), self.composed_m.tocoo().dot(x.flatten()))
+        )
+
     def test_mul_sparse_matrix(self):
         m = self.basic_m
 
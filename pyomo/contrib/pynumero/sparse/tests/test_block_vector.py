@@ -10,6 +10,8 @@
 #  ___________________________________________________________________________
 
 
+import copy
+
 import pyomo.common.unittest as unittest
 
 from pyomo.contrib.pynumero.dependencies import (
@@ -23,6 +25,7 @@ if not (numpy_available and scipy_available):
 
 from pyomo.contrib.pynumero.sparse.block_vector import (
     BlockVector,
+    ContiguousBlockVector,
     NotFullyDefinedBlockVectorError,
     vec_associative_reductions,
     vec_unary_ufuncs,
@@ -1160,5 +1163,179 @@ class TestBlockVector(unittest.TestCase):
         self.assertEqual(b.max(), 0)
 
 
+class TestContiguousBlockVector(unittest.TestCase):
+    def setUp(self):
+        self.blocks = [np.arange(2.0), np.arange(4.0) - 2, np.ones(3)]
+        self.v = ContiguousBlockVector.from_blocks(self.blocks)
+        self.flat = np.concatenate(self.blocks)
+
+    def assertContiguous(self, v, expected):
+        self.assertIs(type(v), ContiguousBlockVector)
+        self.assertEqual(v.block_sizes().tolist(), [2, 4, 3])
+        buffer = v.ravel()
+        offset = 0
+        for blk in v:
+            self.assertTrue(np.shares_memory(blk, buffer))
+            self.assertTrue(np.array_equal(blk, expected[offset : offset + blk.size]))
+            offset += blk.size
+        self.assertTrue(np.array_equal(buffer, expected))
+
+    def test_constructor(self):
+        v = ContiguousBlockVector([2, 0, 3])
+        self.assertEqual(v.nblocks, 3)
+        self.assertEqual(v.size, 5)
+        self.assertFalse(v.has_none)
+        self.assertTrue(np.array_equal(v.ravel(), np.zeros(5)))
+        self.assertTrue(np.array_equal(v.get_block(1), np.zeros(0)))
+
+        buffer = np.arange(5.0)
+        v = ContiguousBlockVector([2, 3], buffer=buffer)
+        self.assertIs(v.ravel(), buffer)
+        self.assertTrue(np.array_equal(v.get_block(1), [2, 3, 4]))
+        with self.assertRaisesRegex(AssertionError, "Dimension mismatch 5 != 4"):
+            ContiguousBlockVector([2, 2], buffer=buffer)
+
+        self.assertContiguous(self.v, self.flat)
+        v = ContiguousBlockVector([2, 2], dtype=int)
+        self.assertEqual(v.ravel().dtype, int)
+
+    def test_from_blocks(self):
+        bv = BlockVector(2)
+        bv.set_block(0, np.ones(2))
+        nested = BlockVector(2)
+        nested.set_block(0, np.zeros(1))
+        nested.set_block(1, np.arange(2.0))
+        bv.set_block(1, nested)
+        v = ContiguousBlockVector.from_blocks(bv)
+        self.assertEqual(v.block_sizes().tolist(), [2, 3])
+        self.assertTrue(np.array_equal(v.ravel(), [1, 1, 0, 0, 1]))
+        v = ContiguousBlockVector.from_blocks([np.arange(2), np.ones(1)])
+        self.assertEqual(v.ravel().dtype, np.float64)
+
+    def test_set_block(self):
+        v = self.v
+        buffer = v.ravel()
+        blk = np.array([5.0, 6.0])
+        v.set_block(0, blk)
+        self.assertIsNot(v.get_block(0), blk)
+        self.assertTrue(np.array_equal(buffer[:2], blk))
+        self.assertContiguous(v, np.concatenate([blk] + self.blocks[1:]))
+        with self.assertRaisesRegex(ValueError, "Incompatible dimensions"):
+            v.set_block(0, np.ones(3))
+        with self.assertRaises(AssertionError):
+            v.set_block(0, None)
+
+    def test_flatten(self):
+        flat = self.v.flatten()
+        self.assertTrue(np.array_equal(flat, self.flat))
+        self.assertFalse(np.shares_memory(flat, self.v.ravel()))
+        self.v.ravel()[0] = 10
+        self.assertEqual(self.v.get_block(0)[0], 10)
+        self.assertEqual(self.v.tolist()[0], 10)
+
+    def test_reductions(self):
+        v = self.v
+        self.assertEqual(v.sum(), self.flat.sum())
+        self.assertEqual(np.sum(v), self.flat.sum())
+        self.assertEqual(v.max(), self.flat.max())
+        self.assertEqual(v.min(), self.flat.min())
+        self.assertEqual(v.prod(), self.flat.prod())
+        self.assertAlmostEqual(v.mean(), self.flat.mean())
+        self.assertEqual(v.dot(v), self.flat.dot(self.flat))
+        self.assertEqual(v.dot(self.flat), self.flat.dot(self.flat))
+        self.assertFalse(v.all())
+        self.assertTrue(v.any())
+        for fun in (np.add, np.multiply, np.maximum, np.minimum):
+            self.assertEqual(fun.reduce(v), fun.reduce(self.flat))
+
+    def test_ufuncs(self):
+        v = self.v
+        flat = self.flat
+        for fun in (np.exp, np.abs, np.negative, np.isnan, np.sign):
+            self.assertContiguous(fun(v), fun(flat))
+        for fun in (np.add, np.multiply, np.maximum, np.greater):
+            self.assertContiguous(fun(v, v), fun(flat, flat))
+            self.assertContiguous(fun(v, flat), fun(flat, flat))
+            self.assertContiguous(fun(2.0, v), fun(2.0, flat))
+
+    def test_arithmetic(self):
+        v = self.v
+        flat = self.flat
+        w = v.copy()
+        self.assertFalse(np.shares_memory(w.ravel(), v.ravel()))
+        self.assertContiguous(v + w, flat + flat)
+        self.assertContiguous(v - 1, flat - 1)
+        self.assertContiguous(1 - v, 1 - flat)
+        self.assertContiguous(v * flat, flat * flat)
+        self.assertContiguous(v / 2, flat / 2)
+        self.assertContiguous(2 / (v + 5), 2 / (flat + 5))
+        self.assertContiguous(v // 2, flat // 2)
+        self.assertContiguous(-v, -flat)
+        self.assertContiguous(v <= 0, flat <= 0)
+        self.assertContiguous(v == w, flat == flat)
+
+        buffer = w.ravel()
+        w += v
+        w *= 2
+        w -= 1
+        w /= 4
+        self.assertIs(w.ravel(), buffer)
+        self.assertContiguous(w, (4 * flat - 1) / 4)
+
+        # Operands with a different structure are handled block-by-block
+        bv = BlockVector(3)
+        for i, blk in enumerate(self.blocks):
+            bv.set_block(i, blk.copy())
+        res = v + bv
+        self.assertIs(type(res), BlockVector)
+        self.assertTrue(np.array_equal(res.flatten(), flat + flat))
+        res = v < bv
+        self.assertIs(type(res), BlockVector)
+        self.assertEqual(res.get_block(0).dtype, bool)
+        w = v.copy()
+        w += bv
+        self.assertContiguous(w, flat + flat)
+
+    def test_copy(self):
+        v = self.v
+        self.assertContiguous(v.clone(2), np.full(9, 2.0))
+        self.assertContiguous(v.copy_structure(), np.zeros(9))
+        self.assertContiguous(v.astype(int), self.flat.astype(int))
+        self.assertEqual(v.astype(int).ravel().dtype, self.flat.astype(int).dtype)
+        self.assertContiguous(v.clip(min=0), self.flat.clip(min=0))
+
+        w = v.copy_structure()
+        w.copyfrom(v)
+        self.assertContiguous(w, self.flat)
+        w.copyfrom(2 * self.flat)
+        self.assertContiguous(w, 2 * self.flat)
+        bv = BlockVector(3)
+        for i, blk in enumerate(self.blocks):
+            bv.set_block(i, blk)
+        w.copyfrom(bv)
+        self.assertContiguous(w, self.flat)
+
+        bv = bv.copy_structure()
+        v.copyto(bv)
+        self.assertTrue(np.array_equal(bv.flatten(), self.flat))
+        w.fill(0)
+        v.copyto(w)
+        self.assertContiguous(w, self.flat)
+        flat = np.zeros(9)
+        v.copyto(flat)
+        self.assertTrue(np.array_equal(flat, self.flat))
+
+    def test_copy_module(self):
+        v = self.v
+        for w in (copy.copy(v), copy.deepcopy(v)):
+            self.assertContiguous(w, self.flat)
+            self.assertFalse(np.shares_memory(w.ravel(), v.ravel()))
+            w.fill(1)
+            self.assertContiguous(v, self.flat)
+        # Shared references are preserved by deepcopy
+        a, b = copy.deepcopy([v, v])
+        self.assertIs(a, b)
+
+
 if __name__ == '__main__':
     unittest.main()
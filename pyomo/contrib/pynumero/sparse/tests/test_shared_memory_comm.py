@@ -0,0 +1,193 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright (c) 2008-2025
+#  National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+import pyomo.common.unittest as unittest
+
+from pyomo.contrib.pynumero.dependencies import (
+    numpy_available,
+    scipy_available,
+    numpy as np,
+)
+
+if not (numpy_available and scipy_available):
+    raise unittest.SkipTest("Pynumero needs scipy and numpy to run shared memory tests")
+
+from scipy.sparse import coo_matrix
+
+from pyomo.contrib.pynumero.sparse.mpi_block_vector import MPIBlockVector
+from pyomo.contrib.pynumero.sparse.mpi_block_matrix import MPIBlockMatrix
+from pyomo.contrib.pynumero.sparse.shared_memory_comm import (
+    SharedMemoryComm,
+    run_parallel,
+)
+from pyomo.contrib.pynumero.examples import parallel_vector_ops, parallel_matvec
+
+
+def _collectives(comm):
+    rank = comm.Get_rank()
+    size = comm.Get_size()
+    ops = SharedMemoryComm.ops
+    res = {}
+    res['allgather'] = comm.allgather(('r', rank))
+    res['gather'] = comm.gather(rank * 10, root=1)
+    res['bcast'] = comm.bcast({'from': rank}, root=2)
+    res['sum'] = comm.allreduce(rank + 1)
+    res['prod'] = comm.allreduce(rank + 1, op=ops.PROD)
+    res['min'] = comm.allreduce(rank - 5, op=ops.MIN)
+    res['max'] = comm.allreduce(rank - 5, op=ops.MAX)
+    res['land'] = comm.allreduce(rank > 0, op=ops.LAND)
+    res['lor'] = comm.allreduce(rank > 0, op=ops.LOR)
+
+    recv = np.zeros(3)
+    comm.Allreduce(np.arange(3, dtype=float) * rank, recv)
+    res['Allreduce'] = recv.tolist()
+    recv = np.zeros(3, dtype=np.int64)
+    comm.Allreduce(np.arange(3) - rank, recv, op=ops.MAX)
+    res['Allreduce_max'] = recv.tolist()
+
+    recv = np.zeros(2 * size, dtype=np.int64)
+    comm.Allgather(np.array([rank, -rank]), recv)
+    res['Allgather'] = recv.tolist()
+
+    recv = np.zeros(size) if rank == 0 else None
+    comm.Gather(np.array([rank + 0.5]), recv, root=0)
+    res['Gather'] = None if recv is None else recv.tolist()
+
+    # Large enough that every rank has to grow its send segment
+    data = np.full(10000, float(rank))
+    comm.Bcast(data, 1)
+    res['Bcast'] = (data.size, float(data.min()), float(data.max()))
+    comm.Barrier()
+    return res
+
+
+def _vector_ops(comm):
+    rank = comm.Get_rank()
+    v = MPIBlockVector(4, [0, 1, 2, -1], comm)
+    v.set_block(rank, np.arange(rank + 1, dtype=float))
+    v.set_block(3, np.array([1.0, -2.0]))
+    v.broadcast_block_sizes()
+
+    w = v * 2
+    return {
+        'owned': v.owned_blocks.tolist(),
+        'sizes': v.block_sizes().tolist(),
+        'size': v.size,
+        'dot': v.dot(w),
+        'sum': v.sum(),
+        'max': v.max(),
+        'min': v.min(),
+        'norm': float(np.abs(v).max()),
+        'any': v.any(),
+        'all': v.all(),
+        'local': v.make_local_copy().flatten().tolist(),
+    }
+
+
+def _matvec(comm):
+    rank = comm.Get_rank()
+    x = MPIBlockVector(3, [0, 1, -1], comm)
+    x.set_block(rank, np.ones(2) * (rank + 1))
+    x.set_block(2, np.array([1.0, 2.0]))
+    x.broadcast_block_sizes()
+
+    owners = np.array([[0, -1, 0], [-1, 1, 1]])
+    A = MPIBlockMatrix(2, 3, rank_ownership=owners, mpi_comm=comm)
+    row = np.array([0, 1, 1])
+    col = np.array([0, 0, 1])
+    A.set_block(rank, rank, coo_matrix(([1.0, 2.0, 3.0], (row, col)), shape=(2, 2)))
+    A.set_block(rank, 2, coo_matrix(np.eye(2) * (rank + 1)))
+    A.broadcast_block_sizes()
+
+    b = A * x
+    return (
+        A.to_local_array().dot(x.make_local_copy().flatten()).tolist(),
+        b.make_local_copy().flatten().tolist(),
+        A.nnz,
+    )
+
+
+def _vector_ops_example(comm):
+    z1, z2, z3 = parallel_vector_ops.main(comm)
+    # BlockVectors do not support pickling, so return the flattened array
+    return z1.flatten(), z2, z3
+
+
+def _fail_on_rank_1(comm):
+    if comm.Get_rank() == 1:
+        raise ValueError("rank 1 failed")
+    return comm.allreduce(1)
+
+
+class TestSharedMemoryComm(unittest.TestCase):
+    def test_collectives(self):
+        results = run_parallel(_collectives, 3)
+        self.assertEqual(len(results), 3)
+        for rank, res in enumerate(results):
+            self.assertEqual(res['allgather'], [('r', 0), ('r', 1), ('r', 2)])
+            self.assertEqual(res['gather'], [0, 10, 20] if rank == 1 else None)
+            self.assertEqual(res['bcast'], {'from': 2})
+            self.assertEqual(res['sum'], 6)
+            self.assertEqual(res['prod'], 6)
+            self.assertEqual(res['min'], -5)
+            self.assertEqual(res['max'], -3)
+            self.assertIs(res['land'], False)
+            self.assertIs(res['lor'], True)
+            self.assertEqual(res['Allreduce'], [0, 3, 6])
+            self.assertEqual(res['Allreduce_max'], [0, 1, 2])
+            self.assertEqual(res['Allgather'], [0, 0, 1, -1, 2, -2])
+            self.assertEqual(res['Gather'], [0.5, 1.5, 2.5] if rank == 0 else None)
+            self.assertEqual(res['Bcast'], (10000, 1.0, 1.0))
+
+    def test_single_process(self):
+        self.assertEqual(run_parallel(_fail_on_rank_1, 1), [1])
+
+    def test_mpi_block_vector(self):
+        results = run_parallel(_vector_ops, 3)
+        v = np.array([0, 0, 1, 0, 1, 2, 1, -2], dtype=float)
+        for rank, res in enumerate(results):
+            self.assertEqual(res['owned'], [rank, 3])
+            self.assertEqual(res['sizes'], [1, 2, 3, 2])
+            self.assertEqual(res['size'], 8)
+            self.assertAlmostEqual(res['dot'], 2 * v.dot(v))
+            self.assertAlmostEqual(res['sum'], v.sum())
+            self.assertEqual(res['max'], 2)
+            self.assertEqual(res['min'], -2)
+            self.assertEqual(res['norm'], 2)
+            self.assertTrue(res['any'])
+            self.assertFalse(res['all'])
+            self.assertEqual(res['local'], v.tolist())
+
+    def test_mpi_block_matrix(self):
+        results = run_parallel(_matvec, 2)
+        for expected, b, nnz in results:
+            self.assertStructuredAlmostEqual(b, expected)
+            self.assertEqual(nnz, 10)
+
+    def test_examples(self):
+        z1, z2, z3 = run_parallel(_vector_ops_example, 3)[0]
+        self.assertTrue(np.allclose(z1, [6, 6, 6, 2, 2, 2, 4, 4, 4, 2, 4, 6]))
+        self.assertAlmostEqual(z2, 56)
+        self.assertEqual(z3, 3)
+
+        for err in run_parallel(parallel_matvec.main, 3):
+            self.assertAlmostEqual(err, 0)
+
+    def test_error(self):
+        with self.assertRaisesRegex(
+            RuntimeError, "rank 1 of 3 raised an exception:(.|\n)*rank 1 failed"
+        ):
+            run_parallel(_fail_on_rank_1, 3)
+        with self.assertRaisesRegex(ValueError, "at least one process"):
+            run_parallel(_fail_on_rank_1, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -109,4 +109,4 @@ class SolverFactoryClass(Factory):
 
 
 #: Global registry/factory for "v2" solver interfaces.
-SolverFactory: SolverFactoryClass = SolverFactoryClass()
+SolverFactory: SolverFactoryClass = SolverFactoryClass(group='pyomo.contrib.solvers')
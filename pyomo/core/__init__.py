@@ -122,7 +122,7 @@ from pyomo.core.base.component import name, Component, ModelComponentFactory
 from pyomo.core.base.componentuid import ComponentUID
 from pyomo.core.base.action import BuildAction
 from pyomo.core.base.check import BuildCheck
-from pyomo.core.base.set import Set, SetOf, simple_set_rule, RangeSet
+from pyomo.core.base.set import Set, SetOf, ColumnarSet, simple_set_rule, RangeSet
 from pyomo.core.base.param import Param
 from pyomo.core.base.var import Var, ScalarVar, VarList
 from pyomo.core.base.boolean_var import BooleanVar, BooleanVarList, ScalarBooleanVar
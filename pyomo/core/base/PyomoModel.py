@@ -24,15 +24,17 @@ from pyomo.common.log import is_debug_set
 from pyomo.common.numeric_types import value
 from pyomo.core.staleflag import StaleFlagManager
 from pyomo.core.expr.symbol_map import SymbolMap
-from pyomo.core.base.component import ModelComponentFactory
+from pyomo.core.base.component import ComponentBase, ModelComponentFactory
 from pyomo.core.base.var import Var
 from pyomo.core.base.constraint import Constraint
+from pyomo.core.base.expression import Expression
 from pyomo.core.base.objective import Objective
 from pyomo.core.base.suffix import active_import_suffix_generator
 from pyomo.core.base.block import ScalarBlock
 from pyomo.core.base.set import Set
 from pyomo.core.base.componentuid import ComponentUID
 from pyomo.core.base.label import CNameLabeler, CuidLabeler
+from pyomo.core.base.parallel_construction import ParallelConstruction
 from pyomo.dataportal.DataPortal import DataPortal
 
 from pyomo.opt.results import Solution, SolverStatus, UndefinedData
@@ -572,6 +574,121 @@ class ModelSolutions(object):
         StaleFlagManager.mark_all_as_stale(delayed=True)
 
 
+#
+# Lazy construction
+#
+# Model.create_instance(lazy=True) defers the construction of indexed
+# components of the following types.  Sets, Params, and all other
+# components (which the deferred components may depend on) are still
+# constructed eagerly and in declaration order.
+#
+_lazy_ctypes = (Var, Expression, Constraint, Objective)
+
+_lazy_classes = {}
+
+
+def _lazy_class(cls):
+    """Return the "lazy" version of the component class `cls`
+
+    Deferred components are assigned the lazy version of their class.
+    Any access to the component data (through the `_data` attribute or
+    the indexing methods) constructs the component and restores the
+    original class, so that there is no overhead once the component has
+    been constructed.  This is analogous to the "Abstract" scalar classes
+    created by :py:func:`disable_methods`.
+
+    """
+    try:
+        return _lazy_classes[cls]
+    except KeyError:
+        pass
+
+    def _data(self):
+        self._construct_pending()
+        return self._data
+
+    def _set_data(self, val):
+        self.__dict__['_data'] = val
+
+    def construct(self, data=None):
+        self._construct_pending(data)
+
+    def _construct_pending(self, data=None):
+        pending = self.__dict__.pop('_lazy_data', None)
+        if data is None:
+            data = pending
+        self.__class__ = cls
+        active = getattr(self, '_active', True)
+        if is_debug_set(logger):
+            logger.debug("Constructing deferred component '%s'", self.name)
+        self.construct(data)
+        if not active:
+            # propagate a deactivate() call made before construction
+            self.deactivate()
+
+    def is_constructed(self):
+        # The component is constructed as soon as it is used
+        return True
+
+    def is_reference(self):
+        return False
+
+    def _create_objects_for_deepcopy(self, memo, component_list):
+        # There is no component data to clone (the copy is also deferred)
+        return ComponentBase._create_objects_for_deepcopy(self, memo, component_list)
+
+    def __reduce_ex__(self, protocol):
+        self._construct_pending()
+        return self.__reduce_ex__(protocol)
+
+    def _construct_on_call(name):
+        def fcn(self, *args, **kwds):
+            # Note: this may be called through a bound method that was
+            # retrieved before the component was constructed
+            if self.__class__ is not cls:
+                self._construct_pending()
+            return getattr(cls, name)(self, *args, **kwds)
+
+        fcn.__name__ = name
+        return fcn
+
+    ns = {
+        '_data': property(_data, _set_data),
+        'construct': construct,
+        '_construct_pending': _construct_pending,
+        'is_constructed': is_constructed,
+        'is_reference': is_reference,
+        '_create_objects_for_deepcopy': _create_objects_for_deepcopy,
+        '__reduce_ex__': __reduce_ex__,
+        '__module__': cls.__module__,
+        '__qualname__': cls.__qualname__,
+        '__doc__': cls.__doc__,
+    }
+    # These methods check _constructed before accessing _data
+    for name in ('__getitem__', '__setitem__', '__delitem__', 'getitems'):
+        ns[name] = _construct_on_call(name)
+    if hasattr(cls, 'deactivate'):
+        # (de)activating a deferred component does not construct it
+
+        def activate(self):
+            self._active = True
+
+        def deactivate(self):
+            self._active = False
+
+        ns['activate'] = activate
+        ns['deactivate'] = deactivate
+
+    ans = _lazy_classes[cls] = type(cls.__name__, (cls,), ns)
+    return ans
+
+
+def _defer_construction(component, data):
+    """Defer the construction of `component` until it is first used"""
+    component.__dict__['_lazy_data'] = data
+    component.__class__ = _lazy_class(component.__class__)
+
+
 @ModelComponentFactory.register(
     'Model objects can be used as a component of other models.'
 )
@@ -643,6 +760,8 @@ class Model(ScalarBlock):
         namespaces=None,
         profile_memory=0,
         report_timing=False,
+        lazy=False,
+        parallel=False,
         **kwds,
     ):
         """
@@ -667,6 +786,20 @@ class Model(ScalarBlock):
             A number that indicates the profiling level.
         report_timing: `bool`, optional
             Report timing statistics during construction.
+        lazy: `bool`, optional
+            Defer the construction of indexed Var, Expression,
+            Constraint, and Objective components until they are first
+            used (e.g., when they are indexed, iterated over, or
+            collected by a writer).  Components that are deactivated
+            before they are used are never constructed.
+        parallel: `bool` or `int`, optional
+            Call the rules of indexed Constraint, Objective, and
+            Expression components in worker processes (see
+            :py:mod:`pyomo.core.base.parallel_construction`).  If
+            `True`, one worker process is started per CPU; if an `int`,
+            the number of worker processes.
+            This only helps for rules that are expensive compared to
+            the expressions they generate.
 
         """
         #
@@ -692,6 +825,12 @@ arguments (which have been ignored):"""
         if self.is_constructed():
             return self.clone()
 
+        if lazy and parallel:
+            raise ValueError(
+                "Model.create_instance() passed both 'lazy' and 'parallel' "
+                "keyword arguments.  These options cannot be used together"
+            )
+
         if name is None:
             # Preserve only the local name (not the FQ name, as that may
             # have been quoted or otherwise escaped)
@@ -731,7 +870,13 @@ arguments (which have been ignored):"""
             if None not in _namespaces:
                 _namespaces.append(None)
 
-            instance.load(data, namespaces=_namespaces, profile_memory=profile_memory)
+            instance.load(
+                data,
+                namespaces=_namespaces,
+                profile_memory=profile_memory,
+                lazy=lazy,
+                parallel=parallel,
+            )
 
             #
             # Indicate that the model is concrete/constructed
@@ -755,7 +900,9 @@ arguments (which have been ignored):"""
     def preprocess(self, preprocessor=None):
         return
 
-    def load(self, arg, namespaces=[None], profile_memory=0):
+    def load(
+        self, arg, namespaces=[None], profile_memory=0, lazy=False, parallel=False
+    ):
         """
         Load the model with data from a file, dictionary or DataPortal object.
         """
@@ -768,7 +915,9 @@ arguments (which have been ignored):"""
         else:
             msg = "Cannot load model model data from with object of type '%s'"
             raise ValueError(msg % str(type(arg)))
-        self._load_model_data(dp, namespaces, profile_memory=profile_memory)
+        self._load_model_data(
+            dp, namespaces, profile_memory=profile_memory, lazy=lazy, parallel=parallel
+        )
 
     def _load_model_data(self, modeldata, namespaces, **kwds):
         """
@@ -787,6 +936,8 @@ arguments (which have been ignored):"""
             # out the limit.
             #
             profile_memory = kwds.get('profile_memory', 0)
+            lazy = kwds.get('lazy', False)
+            parallel = kwds.get('parallel', False)
 
             if profile_memory >= 2 and pympler_available:
                 mem_used = pympler.muppy.get_size(pympler.muppy.get_objects())
@@ -815,15 +966,33 @@ arguments (which have been ignored):"""
             #
             # Initialize each component in order.
             #
+            scheduler = None
+            if parallel:
+                scheduler = ParallelConstruction(
+                    self, None if parallel is True else parallel
+                )
 
             for component_name, component in self.component_map().items():
                 if component.ctype is Model:
                     continue
 
+                if scheduler is not None:
+                    data = self._component_data(modeldata, namespaces, component_name)
+                    if scheduler.add(component, data):
+                        continue
+                    # This component may use the components that are
+                    # waiting to be constructed
+                    self._run_scheduler(
+                        scheduler, modeldata, namespaces, profile_memory
+                    )
+
                 self._initialize_component(
-                    modeldata, namespaces, component_name, profile_memory
+                    modeldata, namespaces, component_name, profile_memory, lazy
                 )
 
+            if scheduler is not None:
+                self._run_scheduler(scheduler, modeldata, namespaces, profile_memory)
+
             # Note: As is, connectors are expanded when using command-line pyomo but not calling model.create(...) in a Python script.
             # John says this has to do with extension points which are called from commandline but not when writing scripts.
             # Uncommenting the next two lines switches this (command-line fails because it tries to expand connectors twice)
@@ -839,8 +1008,25 @@ arguments (which have been ignored):"""
                 pympler.summary.print_(post_construction_summary, limit=100)
                 print("")
 
+    def _run_scheduler(self, scheduler, modeldata, namespaces, profile_memory):
+        # Construct the components that could not be constructed in
+        # parallel
+        for component in scheduler.run():
+            self._initialize_component(
+                modeldata, namespaces, component.local_name, profile_memory
+            )
+
+    def _component_data(self, modeldata, namespaces, component_name):
+        if component_name in modeldata._default:
+            return modeldata._default[component_name]
+        for namespace in namespaces:
+            data = modeldata._data.get(namespace, {}).get(component_name, None)
+            if data is not None:
+                return data
+        return None
+
     def _initialize_component(
-        self, modeldata, namespaces, component_name, profile_memory
+        self, modeldata, namespaces, component_name, profile_memory, lazy=False
     ):
         declaration = self.component(component_name)
 
@@ -855,6 +1041,16 @@ arguments (which have been ignored):"""
             if data is not None:
                 break
 
+        if (
+            lazy
+            and declaration.ctype in _lazy_ctypes
+            and declaration.is_indexed()
+            and not declaration.is_reference()
+            and not declaration._constructed
+        ):
+            _defer_construction(declaration, data)
+            return
+
         generate_debug_messages = is_debug_set(logger)
         if generate_debug_messages:
             _blockName = (
@@ -918,6 +1114,24 @@ class ConcreteModel(Model):
         kwds['concrete'] = True
         Model.__init__(self, *args, **kwds)
 
+    @classmethod
+    def from_bytes(cls, data):
+        """Create a model from data generated by :py:meth:`BlockData.to_bytes`"""
+        from pyomo.core.base.serialization import from_bytes
+
+        return from_bytes(data, cls)
+
+    @classmethod
+    def from_file(cls, filename, use_mmap=True):
+        """Create a model from a file generated by :py:meth:`BlockData.to_file`
+
+        If `use_mmap` is True, the file is memory-mapped and decoded in
+        place rather than read into memory.
+        """
+        from pyomo.core.base.serialization import from_file
+
+        return from_file(filename, cls, use_mmap)
+
 
 @ModelComponentFactory.register(
     'An abstract optimization model that defers construction of components.'
@@ -115,6 +115,7 @@ from pyomo.core.base.set import (
     Set,
     SetData,
     SetOf,
+    ColumnarSet,
     RangeSet,
     Reals,
     PositiveReals,
@@ -137,6 +138,7 @@ from pyomo.core.base.set import (
     IntegerInterval,
     simple_set_rule,
 )
+from pyomo.core.base.matrix_constraint import MatrixConstraint
 from pyomo.core.base.sos import SOSConstraint, SOSConstraintData
 from pyomo.core.base.suffix import (
     active_export_suffix_generator,
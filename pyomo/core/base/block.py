@@ -12,6 +12,7 @@
 from __future__ import annotations
 import copy
 import functools
+import itertools
 import logging
 import sys
 import weakref
@@ -56,6 +57,14 @@ from pyomo.opt import WriterFactory
 
 logger = logging.getLogger('pyomo.core')
 
+# Source of the structure versions of blocks (see _structure_changed).
+# Versions are unique across all blocks, so a block that is moved to a
+# different model can never match a stale version.
+_structure_versions = itertools.count(1)
+# Structure changes are only tracked once a _StructureCache has been
+# created (so that building models does not pay for the tracking)
+_track_structure = False
+
 
 class _generic_component_decorator(object):
     """A generic decorator that wraps Block.__setattr__()
@@ -253,6 +262,69 @@ class _BlockConstruction(object):
     data = {}
 
 
+def _structure_changed(block):
+    """Record that a component was added to, removed from, or
+    reclassified on ``block``
+
+    This changes the structure version of the block and of every block
+    that contains it, invalidating their :py:class:`_StructureCache`
+    objects.  Caches on other blocks (including other models) are not
+    affected.
+
+    """
+    if not _track_structure:
+        return
+    version = next(_structure_versions)
+    while block is not None:
+        block.__dict__['_structure_version'] = version
+        try:
+            block = block.parent_block()
+        except AttributeError:
+            # Components can be added to scalar blocks while the
+            # block itself is still being initialized (before the
+            # parent is set)
+            break
+
+
+class _StructureCache(dict):
+    """A dict holding information derived from the structure of a block
+
+    Caches are stored as private attributes on the block that they
+    describe (see :py:func:`_get_structure_cache`) and are discarded
+    when any component is added to, removed from, or reclassified on
+    the block or any of its sub-blocks.  As the cached information
+    refers to the block it was generated from, the cache is not carried
+    along when the block is cloned or pickled: copies always start with
+    an empty cache.
+
+    """
+
+    __slots__ = ('version',)
+
+    def __init__(self, version=None):
+        super().__init__()
+        self.version = version
+
+    def __deepcopy__(self, memo):
+        return _StructureCache()
+
+    def __reduce__(self):
+        return _StructureCache, ()
+
+
+def _get_structure_cache(block, name):
+    """Return the (current) :py:class:`_StructureCache` stored on
+    ``block`` under the attribute ``name``, creating it if necessary"""
+    global _track_structure
+    _track_structure = True
+    version = block.__dict__.get('_structure_version', 0)
+    cache = block.__dict__.get(name, None)
+    if cache is None or cache.version != version:
+        cache = _StructureCache(version)
+        setattr(block, name, cache)
+    return cache
+
+
 class PseudoMap(AutoSlots.Mixin):
     """
     This class presents a "mock" dict interface to the internal
@@ -838,6 +910,9 @@ class BlockData(ActiveComponentData):
                 # set the value)
             ):
                 setattr(self, k, v)
+        # The attributes may include the structure version (and caches)
+        # of src: make sure that they do not appear current on this block
+        _structure_changed(self)
 
     def collect_ctypes(self, active=None, descend_into=True):
         """
@@ -1040,6 +1115,7 @@ component, use the block del_component() and add_component() methods.
             idx_info[2] += 1
         else:
             self._ctypes[_type] = [_new_idx, _new_idx, 1]
+        _structure_changed(self)
         #
         # Error, for disabled support implicit rule names
         #
@@ -1189,6 +1265,7 @@ component, use the block del_component() and add_component() methods.
         # correct way to add the attribute is to delegate the work to
         # the next class up the MRO.
         super(BlockData, self).__delattr__(name)
+        _structure_changed(self)
 
     def reclassify_component_type(
         self, name_or_object, new_ctype, preserve_declaration_order=True
@@ -1204,6 +1281,8 @@ component, use the block del_component() and add_component() methods.
         if obj.ctype is new_ctype:
             return
 
+        _structure_changed(self)
+
         name = obj.local_name
         if not preserve_declaration_order:
             # if we don't have to preserve the decl order, then the
@@ -1947,6 +2026,26 @@ component, use the block del_component() and add_component() methods.
     # models to a solver.
     #
 
+    def to_bytes(self):
+        """Serialize this block (and all components in it) to bytes.
+
+        This uses the compact binary format implemented in
+        :py:mod:`pyomo.core.base.serialization`.  The result can be
+        restored with :py:meth:`ConcreteModel.from_bytes`.
+        """
+        from pyomo.core.base.serialization import to_bytes
+
+        return to_bytes(self)
+
+    def to_file(self, filename):
+        """Serialize this block (and all components in it) to a file.
+
+        The file can be restored with :py:meth:`ConcreteModel.from_file`.
+        """
+        from pyomo.core.base.serialization import to_file
+
+        to_file(self, filename)
+
     def valid_problem_types(self):
         """This method allows the pyomo.opt convert function to work with a
         Model object."""
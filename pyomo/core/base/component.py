@@ -53,7 +53,9 @@ class ModelComponentFactoryClass(Factory):
         return fn
 
 
-ModelComponentFactory = ModelComponentFactoryClass('model component')
+ModelComponentFactory = ModelComponentFactoryClass(
+    'model component', 'pyomo.components'
+)
 
 
 def name(component, index=NOTSET, fully_qualified=False, relative_to=None):
@@ -27,6 +27,7 @@ from pyomo.core.pyomoobject import PyomoObject
 from pyomo.common import DeveloperError
 from pyomo.common.autoslots import fast_deepcopy
 from pyomo.common.collections import ComponentSet
+from pyomo.common.dependencies import numpy, numpy_available
 from pyomo.common.deprecation import deprecated, deprecation_warning
 from pyomo.common.errors import TemplateExpressionError
 from pyomo.common.modeling import NOTSET
@@ -301,6 +302,17 @@ class IndexedComponent(Component):
     #
     _DEFAULT_INDEX_CHECKING_ENABLED = True
 
+    #
+    # Map of (non-normalized) indices that were successfully resolved
+    # by __getitem__ to the corresponding normalized index.  This is
+    # created on demand (the vast majority of components never see a
+    # non-normalized index).  The cache never holds more entries than
+    # the component (or _INDEX_CACHE_MIN_SIZE, if that is larger): the
+    # oldest entries are discarded first.
+    #
+    _index_cache = None
+    _INDEX_CACHE_MIN_SIZE = 1024
+
     def __init__(self, *args, **kwds):
         #
         kwds.pop('noruleinit', None)
@@ -379,6 +391,7 @@ class IndexedComponent(Component):
         """Clear the data in this component"""
         if self.is_indexed():
             self._data = {}
+            self._index_cache = None
         else:
             raise DeveloperError(
                 "Derived scalar component %s failed to define clear()."
@@ -621,6 +634,16 @@ You can silence this warning by one of three ways:
             return self._data[index]
         except KeyError:
             obj = _NotFound
+            # Indices that were previously looked up in a non-normalized
+            # form (e.g., nested tuples) are remembered so that we can
+            # skip the (expensive) validation / normalization
+            _cache = self._index_cache
+            if _cache is not None:
+                _cached = _cache.get(index, _NotFound)
+                if _cached is not _NotFound:
+                    obj = self._data.get(_cached, _NotFound)
+                    if obj is not _NotFound:
+                        return obj
         except TypeError:
             try:
                 index = self._processUnhashableIndex(index)
@@ -647,13 +670,15 @@ You can silence this warning by one of three ways:
                 return index
             validated_index = self._validate_index(index)
             if validated_index is not index:
-                index = validated_index
                 # _processUnhashableIndex could have found a slice, or
                 # _validate could have found an Ellipsis and returned a
                 # slicer
-                if index.__class__ is IndexedComponent_slice:
-                    return index
-                obj = self._data.get(index, _NotFound)
+                if validated_index.__class__ is IndexedComponent_slice:
+                    return validated_index
+                obj = self._data.get(validated_index, _NotFound)
+                if obj is not _NotFound:
+                    self._cache_index(index, validated_index)
+                index = validated_index
             #
             # Call the _getitem_when_not_present helper to retrieve/return
             # the default value
@@ -663,6 +688,73 @@ You can silence this warning by one of three ways:
 
         return obj
 
+    def getitems(self, keys):
+        """Return a list of the component data objects for several indices
+
+        This is equivalent to ``[self[k] for k in keys]``, but resolves
+        indices that are already present in the component in bulk.
+        Indices that are not present (or are not normalized) are
+        resolved through :py:meth:`__getitem__` (so default values,
+        rules, and errors behave exactly as they do for individual
+        lookups).
+
+        Parameters
+        ----------
+        keys: iterable or numpy.ndarray
+            The indices to retrieve.  Rows of two-dimensional arrays
+            are interpreted as tuple indices.
+
+        """
+        if self._constructed is False:
+            self._not_constructed_error(None)
+
+        if numpy_available and isinstance(keys, numpy.ndarray):
+            if keys.ndim == 2:
+                keys = list(map(tuple, keys.tolist()))
+            elif keys.ndim == 1:
+                keys = keys.tolist()
+            else:
+                raise ValueError(
+                    "Error retrieving items from component %s: index "
+                    "arrays must be one- or two-dimensional (got %s)"
+                    % (self.name, keys.ndim)
+                )
+        elif keys.__class__ is not list:
+            keys = list(keys)
+
+        try:
+            ans = list(map(self._data.get, keys, [_NotFound] * len(keys)))
+        except TypeError:
+            # At least one of the keys is unhashable (slices,
+            # expressions, etc.)
+            return [self[k] for k in keys]
+        # Note: we cannot use "_NotFound in ans" here, as that would
+        # fall back on (overloaded) equality tests for ComponentData
+        for i in [i for i, obj in enumerate(ans) if obj is _NotFound]:
+            ans[i] = self[keys[i]]
+        return ans
+
+    def _cache_index(self, index, validated_index):
+        """Record that `index` resolves to `validated_index`"""
+        if index.__class__ is not tuple:
+            return
+        # Only remember indices built entirely from native types (so the
+        # cache never holds references to other modeling components)
+        _stack = list(index)
+        while _stack:
+            _val = _stack.pop()
+            if _val.__class__ is tuple:
+                _stack.extend(_val)
+            elif _val.__class__ not in native_types:
+                return
+        _cache = self._index_cache
+        if _cache is None:
+            _cache = self._index_cache = {}
+        elif len(_cache) >= max(len(self._data), self._INDEX_CACHE_MIN_SIZE):
+            # Discard the oldest entry (dicts preserve insertion order)
+            del _cache[next(iter(_cache))]
+        _cache[index] = validated_index
+
     def __setitem__(self, index, val):
         #
         # Set the value: This relies on _setitem_when_not_present() to
@@ -13,22 +13,28 @@
 import logging
 import weakref
 
+from pyomo.common.dependencies import numpy as np, scipy
 from pyomo.common.gc_manager import PauseGC
 from pyomo.common.log import is_debug_set
 from pyomo.common.modeling import NOTSET
+from pyomo.common.numeric_types import native_numeric_types
 from pyomo.core.base.set_types import Any
 from pyomo.core.expr.expr_common import _type_check_exception_arg
 from pyomo.core.expr.numvalue import value
 from pyomo.core.expr.numeric_expr import LinearExpression
+from pyomo.core.expr.relational_expr import (
+    EqualityExpression,
+    InequalityExpression,
+    RangedExpression,
+)
 from pyomo.core.base.component import ModelComponentFactory
 from pyomo.core.base.constraint import IndexedConstraint, ConstraintData
-from pyomo.repn.standard_repn import StandardRepn
-
-from collections.abc import Mapping
 
 
 logger = logging.getLogger('pyomo.core')
 
+_inf = float('inf')
+
 
 class _MatrixConstraintData(ConstraintData):
     """
@@ -72,36 +78,50 @@ class _MatrixConstraintData(ConstraintData):
     def canonical_form(self, compute_values=True):
         """Build a canonical representation of the body of
         this constraints"""
-        comp = self.parent_component()
-        index = self._index
-        data = comp._A_data
-        indices = comp._A_indices
-        indptr = comp._A_indptr
-        x = comp._x
+        from pyomo.repn.standard_repn import StandardRepn
 
-        variables = []
-        coefficients = []
+        variables, coefficients = self._row()
         constant = 0
-        for p in range(indptr[index], indptr[index + 1]):
-            v = x[indices[p]]
-            c = data[p]
-            if not v.fixed:
-                variables.append(v)
-                if compute_values:
-                    coefficients.append(value(c))
-                else:
-                    coefficients.append(c)
-            else:
-                if compute_values:
+        if any(v.fixed for v in variables):
+            free_vars = []
+            free_coefs = []
+            for v, c in zip(variables, coefficients):
+                if not v.fixed:
+                    free_vars.append(v)
+                    free_coefs.append(c)
+                elif compute_values:
                     constant += value(c) * v.value
                 else:
                     constant += c * v
+            variables = free_vars
+            coefficients = free_coefs
+        if compute_values and any(
+            c.__class__ not in native_numeric_types for c in coefficients
+        ):
+            coefficients = [value(c) for c in coefficients]
         repn = StandardRepn()
         repn.linear_vars = tuple(variables)
         repn.linear_coefs = tuple(coefficients)
         repn.constant = constant
         return repn
 
+    def _row(self):
+        """Return the lists of variables and coefficients in this row"""
+        comp = self.parent_component()
+        index = self._index
+        indptr = comp._A_indptr
+        start = indptr[index]
+        stop = indptr[index + 1]
+        indices = comp._A_indices[start:stop]
+        data = comp._A_data[start:stop]
+        if hasattr(data, 'tolist'):
+            # Convert array slices (e.g., from from_sparse) to lists of
+            # Python numbers
+            indices = indices.tolist()
+            data = data.tolist()
+        x = comp._x
+        return [x[j] for j in indices], data
+
     def __init__(self, index, component_ref):
         #
         # These lines represent in-lining of the
@@ -135,15 +155,8 @@ class _MatrixConstraintData(ConstraintData):
     def __call__(self, exception=NOTSET):
         """Compute the value of the body of this constraint."""
         exception = _type_check_exception_arg(self, exception)
-        comp = self.parent_component()
-        index = self._index
-        data = comp._A_data
-        indices = comp._A_indices
-        indptr = comp._A_indptr
-        x = comp._x
-        ptrs = range(indptr[index], indptr[index + 1])
         try:
-            return sum(x[indices[p]].value * data[p] for p in ptrs)
+            return sum(v.value * c for v, c in zip(*self._row()))
         except (ValueError, TypeError):
             if exception:
                 raise
@@ -215,47 +228,67 @@ class _MatrixConstraintData(ConstraintData):
     # Abstract Interface (ConstraintData)
     #
 
+    def to_bounded_expression(self, evaluate_bounds=False):
+        """Convert this constraint to a tuple of 3 expressions (lb, body, ub)
+
+        The bounds of a MatrixConstraint row are always numeric
+        constants (or None), so ``evaluate_bounds`` has no effect.
+
+        """
+        return self.lower, self.body, self.upper
+
     @property
     def body(self):
         """Access the body of a constraint expression."""
-        comp = self.parent_component()
-        index = self._index
-        data = comp._A_data
-        indices = comp._A_indices
-        indptr = comp._A_indptr
-        x = comp._x
-        ptrs = range(indptr[index], indptr[index + 1])
+        variables, coefficients = self._row()
         return LinearExpression(
-            linear_vars=[x[indices[p]] for p in ptrs],
-            linear_coefs=[data[p] for p in ptrs],
-            constant=0,
+            linear_vars=variables, linear_coefs=coefficients, constant=0
         )
 
+    @property
+    def expr(self):
+        """Return the (relational) expression for this constraint."""
+        lb, body, ub = self.to_bounded_expression()
+        if lb is None:
+            if ub is None:
+                return None
+            return InequalityExpression((body, ub), False)
+        elif ub is None:
+            return InequalityExpression((lb, body), False)
+        elif lb == ub:
+            return EqualityExpression((body, ub))
+        return RangedExpression((lb, body, ub), False)
+
     @property
     def lower(self):
         """Access the lower bound of a constraint
         expression."""
-        comp = self.parent_component()
-        index = self._index
-        return comp._lower[index]
+        lb = self.parent_component()._lower[self._index]
+        if lb is None or lb != lb or lb == -_inf:
+            return None
+        return lb
 
     @property
     def upper(self):
         """Access the upper bound of a constraint
         expression."""
-        comp = self.parent_component()
-        index = self._index
-        return comp._upper[index]
+        ub = self.parent_component()._upper[self._index]
+        if ub is None or ub != ub or ub == _inf:
+            return None
+        return ub
+
+    # The bounds are always numeric constants
+    lb = lower
+    ub = upper
 
     @property
     def equality(self):
         """A boolean indicating whether this is an equality
         constraint."""
-        comp = self.parent_component()
-        index = self._index
-        if (comp._lower[index] is None) or (comp._upper[index] is None):
+        lb = self.lower
+        if lb is None:
             return False
-        return comp._lower[index] == comp._upper[index]
+        return lb == self.upper
 
     @property
     def strict_lower(self):
@@ -275,7 +308,7 @@ class _MatrixConstraintData(ConstraintData):
 
 
 @ModelComponentFactory.register("A set of constraint expressions in Ax=b form.")
-class MatrixConstraint(Mapping, IndexedConstraint):
+class MatrixConstraint(IndexedConstraint):
     """
     Defines a set of linear constraints of the form:
 
@@ -287,7 +320,14 @@ class MatrixConstraint(Mapping, IndexedConstraint):
     in the associated coefficient matrix. This modeling
     component allows for fast construction of large linear
     constraint sets as it bypasses Pyomo's expression
-    system.
+    system.  The LP, NL, and linear standard form writers (and
+    the direct / persistent solver interfaces) process the rows
+    of a MatrixConstraint directly from the sparse matrix,
+    without building the constraint expressions.
+
+    The constraint rows are indexed by the integers 0 to m-1.
+    Use :py:meth:`from_sparse` to declare a MatrixConstraint
+    from a SciPy sparse matrix and NumPy bound arrays.
 
     Parameters
     ----------
@@ -337,6 +377,94 @@ class MatrixConstraint(Mapping, IndexedConstraint):
         self._upper = ub
         self._x = tuple(x)
 
+    @classmethod
+    def from_sparse(cls, A, lb, ub, x):
+        """Declare a MatrixConstraint from a sparse coefficient matrix
+
+        Parameters
+        ----------
+        A : scipy.sparse matrix or array
+            The (m x n) coefficient matrix.  Any SciPy sparse format
+            (or dense array) is accepted; it is converted to CSR
+            format without copying the data when possible.
+        lb : numpy.ndarray, float, or None
+            The constraint lower bounds.  ``None``, NaN, and ``-inf``
+            entries indicate that a row has no lower bound.
+        ub : numpy.ndarray, float, or None
+            The constraint upper bounds.  ``None``, NaN, and ``inf``
+            entries indicate that a row has no upper bound.
+        x : list of VarData or IndexedVar
+            The n variables corresponding to the columns of ``A``
+
+        Example
+        -------
+        >>> import numpy as np, scipy.sparse
+        >>> from pyomo.environ import ConcreteModel, Var
+        >>> from pyomo.core.base.matrix_constraint import MatrixConstraint
+        >>> model = ConcreteModel()
+        >>> model.v = Var(range(3))
+        >>> A = scipy.sparse.csr_array([[1.0, -1.0, 0], [0, 1.0, -1.0]])
+        >>> model.c = MatrixConstraint.from_sparse(A, None, np.zeros(2), model.v)
+        >>> print(model.c[1].expr)
+        v[1] - v[2]  <=  0.0
+
+        """
+        if getattr(x, 'ctype', None) is not None:
+            # Accept (indexed) Var components
+            x = list(x.values())
+        else:
+            x = list(x)
+        A = scipy.sparse.csr_array(A)
+        if not A.has_canonical_format:
+            # Do not modify the caller's matrix when summing duplicates
+            A = A.copy()
+            A.sum_duplicates()
+        m, n = A.shape
+        if len(x) != n:
+            raise ValueError(
+                f"The coefficient matrix has {n} columns, but {len(x)} "
+                "variables were provided"
+            )
+        return cls(
+            A.data,
+            A.indices,
+            A.indptr,
+            _bound_array(lb, m, -_inf, 'lb'),
+            _bound_array(ub, m, _inf, 'ub'),
+            x,
+        )
+
+    def to_sparse(self):
+        """Return the data defining this MatrixConstraint
+
+        Returns
+        -------
+        A : scipy.sparse.csr_array
+            The (m x n) coefficient matrix
+        lb : numpy.ndarray
+            The constraint lower bounds (``-inf`` if unbounded)
+        ub : numpy.ndarray
+            The constraint upper bounds (``inf`` if unbounded)
+        x : tuple of VarData
+            The variables corresponding to the columns of ``A``
+
+        """
+        m = len(self._lower)
+        A = scipy.sparse.csr_array(
+            (
+                np.asarray(self._A_data, dtype=float),
+                np.asarray(self._A_indices),
+                np.asarray(self._A_indptr),
+            ),
+            shape=(m, len(self._x)),
+        )
+        return (
+            A,
+            _bound_array(self._lower, m, -_inf, 'lb'),
+            _bound_array(self._upper, m, _inf, 'ub'),
+            self._x,
+        )
+
     def construct(self, data=None):
         """Construct the expression(s) for this constraint."""
         if is_debug_set(logger):
@@ -362,7 +490,29 @@ class MatrixConstraint(Mapping, IndexedConstraint):
         return self._data.__len__()
 
     def __iter__(self):
-        return iter(i for i in range(len(self)))
+        return iter(range(len(self)))
+
+    def __contains__(self, key):
+        return key in range(len(self._data))
+
+    #
+    # Pyomo components support an extended dict API
+    #
+
+    def keys(self, sort=None):
+        # The 0..n-1 indices are always ordered and sorted; we can
+        # ignore the `sort` argument
+        return iter(range(len(self._data)))
+
+    def values(self, sort=None):
+        # The 0..n-1 indices are always ordered and sorted; we can
+        # ignore the `sort` argument
+        return iter(self._data)
+
+    def items(self, sort=None):
+        # The 0..n-1 indices are always ordered and sorted; we can
+        # ignore the `sort` argument
+        return enumerate(self._data)
 
     #
     # Remove methods that allow modifying this constraint
@@ -376,3 +526,20 @@ class MatrixConstraint(Mapping, IndexedConstraint):
 
     def __setitem__(self, key, value):  # pragma:nocover
         raise NotImplementedError
+
+
+def _bound_array(bound, m, default, name):
+    """Return a float array of m constraint bounds, mapping None and NaN
+    entries to the (infinite) default"""
+    if bound is None:
+        return np.full(m, default)
+    bound = np.array(bound, dtype=float)
+    if bound.ndim == 0:
+        bound = np.full(m, bound)
+    elif bound.shape != (m,):
+        raise ValueError(
+            f"Expected {m} values for '{name}' (one per row), but got an "
+            f"array with shape {bound.shape}"
+        )
+    bound[np.isnan(bound)] = default
+    return bound
@@ -0,0 +1,479 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright (c) 2008-2025
+#  National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+
+"""Construct model components in worker processes.
+
+:py:meth:`Model.create_instance` constructs components one at a time,
+in declaration order.  For indexed :py:class:`Constraint`,
+:py:class:`Objective`, and :py:class:`Expression` components, nearly
+all of that time is spent calling the component rule once per index
+to generate the expressions.  The :py:class:`ParallelConstruction`
+scheduler collects runs of consecutively declared components of these
+types and calls their rules in forked worker processes:
+
+- Every component is split into tasks over contiguous ranges of its
+  index set.  Workers call the rule for each index in the task and
+  return the pickled results: references to existing model
+  components and component data are recorded as (component number,
+  index) pairs, so only the new expression nodes are serialized (as
+  calls to their constructors, which is much faster to unpickle than
+  the generic slot-by-slot state).
+- The main process unpickles the results (resolving the references
+  against its own copy of the model) and attaches them to the
+  component in index order, exactly as ``construct()`` would.
+- Rules may use components that are being constructed in the same
+  run (e.g., a Constraint that uses a named Expression).  In the
+  workers, any access to the data of a component that has not been
+  constructed yet raises :py:class:`_PendingComponentError`; the
+  component is then retried in the next round, after the round's
+  results have been attached.  Components that cannot be constructed
+  in parallel (because of an error in the rule or a cyclic
+  dependency) are constructed serially, so that errors are reported
+  as they would be without the scheduler.
+
+Unpickling the results is done serially by the main process and
+bounds the achievable speedup: for rules that simply index data to
+build short expressions, it takes about a quarter of the time of
+constructing the component serially, and the (parallel) cost of
+calling the rules and pickling the results is higher than serial
+construction.  The scheduler therefore only pays off for rules that
+do much more work than building the expression they return (e.g.,
+scanning a large set to build a short constraint); see
+``scripts/performance/parallel_construction.py``.
+
+Rules are evaluated in the worker processes, so any side effects of a
+rule (other than the returned expression) are lost.  Worker processes
+are created with ``fork()``; on platforms where that is not available,
+all components are constructed serially.
+
+"""
+
+import logging
+import math
+import os
+import pickle
+from io import BytesIO
+
+from pyomo.common.collections import ComponentSet
+from pyomo.common.gc_manager import PauseGC
+from pyomo.common.log import is_debug_set
+from pyomo.common.timing import ConstructionTimer, default_timer
+from pyomo.core.base.component import Component, ComponentData
+from pyomo.core.base import constraint as _constraint_module
+from pyomo.core.base import objective as _objective_module
+from pyomo.core.base.constraint import Constraint
+from pyomo.core.base.expression import Expression
+from pyomo.core.base.objective import Objective
+from pyomo.core.expr.numeric_expr import (
+    LinearExpression,
+    NumericExpression,
+    SumExpression,
+)
+from pyomo.core.expr.relational_expr import (
+    InequalityExpression,
+    RangedExpression,
+    RelationalExpression,
+)
+
+logger = logging.getLogger('pyomo.core')
+
+# Status of a task
+_DONE = 0
+_PENDING = 1
+_FAILED = 2
+
+# The number of tasks generated for each component (per worker)
+_TASKS_PER_WORKER = 4
+
+# State shared with the (forked) worker processes
+_worker_state = None
+
+# The components referenced by the results being unpickled (see _load)
+_ref_table = None
+
+
+class _PendingComponentError(Exception):
+    """Raised (in a worker process) when a rule accesses a component
+    that has not been constructed yet"""
+
+
+class _PendingData(dict):
+    """Stand-in for the ``_data`` dict of the components that have not
+    been constructed (used in the worker processes)"""
+
+    __slots__ = ()
+
+    def _pending(self, *args, **kwds):
+        raise _PendingComponentError()
+
+    __getitem__ = __len__ = __iter__ = __contains__ = _pending
+    get = keys = values = items = _pending
+
+
+def _slots(cls):
+    slots = set()
+    for base in cls.__mro__:
+        if base is not object and '__slots__' not in base.__dict__:
+            # The class has a __dict__
+            return None
+        slots.update(base.__dict__.get('__slots__', ()))
+    return slots
+
+
+def _default_reducer(obj):
+    return obj.__reduce_ex__(pickle.HIGHEST_PROTOCOL)
+
+
+def _sum_reducer(obj):
+    return obj.__class__, (obj._args_[: obj._nargs],)
+
+
+def _args_reducer(obj):
+    return obj.__class__, (obj._args_,)
+
+
+def _strict_reducer(obj):
+    return obj.__class__, (obj._args_, obj._strict)
+
+
+_args_init = {
+    NumericExpression.__init__,
+    SumExpression.__init__,
+    LinearExpression.__init__,
+    RelationalExpression.__init__,
+}
+_strict_init = {InequalityExpression.__init__, RangedExpression.__init__}
+
+
+def _expression_reducer(cls):
+    # Expression nodes are (by default) pickled through the generic
+    # AutoSlots __getstate__ / __setstate__, which dominates the time
+    # to unpickle the results.  Nodes whose state is completely
+    # determined by the constructor arguments are instead pickled as
+    # a call to the constructor.
+    if not issubclass(cls, (NumericExpression, RelationalExpression)):
+        return _default_reducer
+    slots = _slots(cls)
+    if cls.__init__ in _args_init:
+        if issubclass(cls, SumExpression):
+            if slots == {'_args_', '_nargs'}:
+                return _sum_reducer
+        elif slots == {'_args_'}:
+            return _args_reducer
+    elif cls.__init__ in _strict_init and slots == {'_args_', '_strict'}:
+        return _strict_reducer
+    return _default_reducer
+
+
+class _DispatchTable(dict):
+    """Reducers for the classes pickled by a :py:class:`_ComponentPickler`
+
+    The pickler only looks up classes that it cannot pickle natively
+    (i.e., not numbers, strings, lists, tuples, or dicts), so this
+    adds no overhead for the bulk of the pickled objects.
+
+    """
+
+    __slots__ = ('pickler',)
+
+    def __init__(self, pickler):
+        self.pickler = pickler
+
+    def __missing__(self, cls):
+        if issubclass(cls, (Component, ComponentData)):
+            reducer = self.pickler.reduce_component
+        else:
+            reducer = _expression_reducer(cls)
+        self[cls] = reducer
+        return reducer
+
+
+class _ComponentPickler(pickle.Pickler):
+    """Pickler that records references to model components
+
+    References to the model components (and component data) are
+    pickled as calls to :py:func:`_ref` with the position of the
+    reference in :py:attr:`refs`, the list of (component number, index)
+    pairs referenced by the pickle.  As the pickler memoizes the
+    result, every component is only recorded once.
+
+    """
+
+    def __init__(self, file, ids):
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self.dispatch_table = _DispatchTable(self)
+        self.refs = []
+        self._ids = ids
+
+    def reduce_component(self, obj):
+        comp = obj.parent_component()
+        n = self._ids.get(id(comp))
+        if n is None:
+            return _default_reducer(obj)
+        self.refs.append((n,) if comp is obj else (n, obj.index()))
+        return _ref, (len(self.refs) - 1,)
+
+
+def _ref(i):
+    return _ref_table[i]
+
+
+def _load(payload, refs, components):
+    """Unpickle a payload generated by :py:class:`_ComponentPickler`,
+    resolving the references against ``components``"""
+    global _ref_table
+    table = []
+    for ref in refs:
+        comp = components[ref[0]]
+        if len(ref) == 1:
+            table.append(comp)
+            continue
+        try:
+            table.append(comp._data[ref[1]])
+        except KeyError:
+            # e.g., sparse (dense=False) Var data that was created by
+            # the rule in the worker process
+            table.append(comp[ref[1]])
+    _ref_table = table
+    try:
+        return pickle.loads(payload)
+    finally:
+        _ref_table = None
+
+
+class _WorkerState(object):
+    __slots__ = ('components', 'ids', 'indices', 'pending')
+
+    def __init__(self, components, indices, pending):
+        self.components = components
+        self.ids = {id(comp): n for n, comp in enumerate(components)}
+        self.indices = indices
+        self.pending = pending
+
+
+def _init_worker():
+    # Make any use of the components that are not constructed yet
+    # generate a _PendingComponentError (instead of returning empty
+    # results or raising a "not constructed" error)
+    for comp in _worker_state.pending:
+        comp._data = _PendingData()
+        comp._constructed = True
+
+
+def _run_task(task):
+    n, start, stop = task
+    state = _worker_state
+    comp = state.components[n]
+    rule = comp._rule
+    block = comp.parent_block()
+    timer = -default_timer()
+    try:
+        values = [rule(block, index) for index in state.indices[n][start:stop]]
+        buf = BytesIO()
+        pickler = _ComponentPickler(buf, state.ids)
+        pickler.dump(values)
+    except _PendingComponentError:
+        return n, start, _PENDING, None, 0
+    except Exception:
+        # Report the failure: the component will be constructed
+        # serially (and the error reported) by the main process
+        return n, start, _FAILED, None, 0
+    timer += default_timer()
+    return n, start, _DONE, (buf.getvalue(), pickler.refs), timer
+
+
+def _fork_context():
+    # Note: multiprocessing is imported here (and not when the module is
+    # imported) to avoid slowing down "import pyomo.environ"
+    import multiprocessing
+
+    if 'fork' not in multiprocessing.get_all_start_methods():
+        return None
+    return multiprocessing.get_context('fork')
+
+
+class ParallelConstruction(object):
+    """Construct independent components of a model in worker processes
+
+    Components are registered with :py:meth:`add` in declaration order.
+    :py:meth:`run` constructs all registered components and must be
+    called before constructing any component that was not registered
+    (as that component may depend on the registered components).
+
+    Parameters
+    ----------
+    model: BlockData
+        The model (block) that is being constructed
+
+    workers: int
+        The number of worker processes (defaults to the number of CPUs)
+
+    """
+
+    def __init__(self, model, workers=None):
+        if workers is None or workers is True:
+            workers = os.cpu_count() or 1
+        self.model = model
+        self.workers = int(workers)
+        self.pending = []
+        self._context = _fork_context() if self.workers > 1 else None
+
+    def add(self, component, data=None):
+        """Register a component for parallel construction.
+
+        Returns False (and does not register the component) if the
+        component cannot be constructed in parallel.
+
+        """
+        if not self._can_construct(component, data):
+            return False
+        if component._anonymous_sets is not None:
+            for _set in component._anonymous_sets:
+                _set.construct()
+        self.pending.append(component)
+        return True
+
+    def _can_construct(self, component, data):
+        if self._context is None or data is not None:
+            return False
+        if component.ctype is Constraint:
+            if _constraint_module.TEMPLATIZE_CONSTRAINTS:
+                return False
+        elif component.ctype is Objective:
+            if _objective_module.TEMPLATIZE_OBJECTIVES:
+                return False
+        elif component.ctype is not Expression:
+            return False
+        if component._constructed or not component.is_indexed():
+            return False
+        if component.is_reference():
+            return False
+        rule = component._rule
+        if rule is None or rule.constant() or rule.contains_indices():
+            return False
+        return True
+
+    def run(self):
+        """Construct the registered components.
+
+        Returns the list of registered components (in declaration
+        order) that could not be constructed in parallel and must be
+        constructed serially.
+
+        """
+        pending, self.pending = self.pending, []
+        failed = ComponentSet()
+        # As with Model.create_instance(), we are only creating
+        # (acyclic) objects, so there is no need to run the GC
+        with PauseGC():
+            pending = self._run(pending, failed)
+        if pending and is_debug_set(logger):
+            logger.debug(
+                "Constructing %s serially: the components could not be "
+                "constructed in parallel",
+                ", ".join(comp.name for comp in pending),
+            )
+        return pending
+
+    def _run(self, pending, failed):
+        while pending:
+            todo = [comp for comp in pending if comp not in failed]
+            if not todo:
+                break
+            done = self._run_round(todo, pending, failed)
+            if not done:
+                break
+            pending = [comp for comp in pending if comp not in done]
+        return pending
+
+    def _run_round(self, todo, pending, failed):
+        global _worker_state
+
+        # Note that components are added to the model as the model
+        # is constructed (e.g., on Blocks), so this is regenerated for
+        # every round
+        components = list(self.model.component_objects(descend_into=True))
+        state = _WorkerState(components, {}, pending)
+        tasks = []
+        timers = {}
+        for comp in todo:
+            n = state.ids[id(comp)]
+            indices = state.indices[n] = list(comp.index_set())
+            size = max(1, math.ceil(len(indices) / (self.workers * _TASKS_PER_WORKER)))
+            tasks.extend((n, i, i + size) for i in range(0, len(indices), size))
+            timers[n] = ConstructionTimer(comp)
+
+        results = {n: [] for n in timers}
+        worker_time = dict.fromkeys(timers, 0)
+        _worker_state = state
+        try:
+            for n, start, status, payload, seconds in self._evaluate(tasks):
+                if results[n] is None:
+                    continue
+                if status != _DONE:
+                    results[n] = None
+                    if status == _FAILED:
+                        failed.add(components[n])
+                    continue
+                results[n].append((start, payload))
+                worker_time[n] += seconds
+        finally:
+            _worker_state = None
+
+        done = ComponentSet()
+        for n, chunks in results.items():
+            if chunks is None:
+                continue
+            comp = components[n]
+            chunks.sort(key=lambda x: x[0])
+            timer = timers[n]
+            timer.mode = "in parallel: %s tasks, %.2f seconds in workers" % (
+                len(chunks),
+                worker_time[n],
+            )
+            try:
+                self._attach(comp, state, n, chunks)
+            except Exception:
+                # Discard the partial results and construct the
+                # component serially (which will report the error)
+                comp.clear()
+                comp._constructed = False
+                failed.add(comp)
+                continue
+            timer.report()
+            done.add(comp)
+        return done
+
+    def _evaluate(self, tasks):
+        if not tasks:
+            return
+        with self._context.Pool(
+            min(self.workers, len(tasks)), initializer=_init_worker
+        ) as pool:
+            yield from pool.imap_unordered(_run_task, tasks)
+
+    def _attach(self, comp, state, n, chunks):
+        comp._constructed = True
+        block = comp.parent_block()
+        setitem = comp._setitem_when_not_present
+        indices = state.indices[n]
+        for start, (payload, refs) in chunks:
+            values = _load(payload, refs, state.components)
+            index_iter = iter(indices[start : start + len(values)])
+            if comp.ctype is Objective:
+                sense = comp._init_sense
+                for index, val in zip(index_iter, values):
+                    ans = setitem(index, val)
+                    if ans is not None:
+                        ans.set_sense(sense(block, index))
+            else:
+                for index, val in zip(index_iter, values):
+                    setitem(index, val)
@@ -0,0 +1,1469 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright (c) 2008-2025
+#  National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+
+"""A compact, versioned binary serialization format for concrete models.
+
+Pickling a model goes through ``__getstate__`` / ``__setstate__`` for
+every component and component data object.  This module implements an
+alternative format that records the model as a set of flat, typed
+columns (tables):
+
+- a shared string table (component names, set names, function names),
+- a shared index table (every distinct index / set member is stored once),
+- one table per modeling component type (Var, Param, Constraint, ...),
+- a single postfix "tape" holding every expression in the model.
+
+Each table is stored as a contiguous, 8-byte aligned section of native
+machine types, so reading a file through :py:mod:`mmap` decodes the
+columns in place without copying them into intermediate Python objects.
+
+Supported components are :py:class:`Block`, :py:class:`Set`,
+:py:class:`RangeSet`, :py:class:`Var`, :py:class:`Param`,
+:py:class:`Expression`, :py:class:`Constraint`, :py:class:`Objective`,
+and :py:class:`Suffix` (including References to these components).
+Block subclasses are restored as plain blocks, Set operators other than
+products are restored as materialized (finite) Sets, and References are
+restored as references over explicit mappings.  Models containing
+components with units, external functions, or other component types are
+rejected with a :py:class:`ValueError`.
+
+"""
+
+import math
+import mmap
+import struct
+import sys
+from array import array
+from bisect import bisect_right
+from io import BytesIO
+
+from pyomo.common.numeric_types import native_integer_types, native_numeric_types
+from pyomo.core.staleflag import StaleFlagManager
+from pyomo.core.expr.base import ExpressionBase
+from pyomo.core.expr import numeric_expr, relational_expr
+from pyomo.core.expr.numvalue import NumericConstant
+from pyomo.core.base.block import Block
+from pyomo.core.base.constraint import Constraint
+from pyomo.core.base.expression import Expression
+from pyomo.core.base.global_set import GlobalSetBase, GlobalSets
+from pyomo.core.base.objective import Objective
+from pyomo.core.base.param import Param, ParamData, _ImplicitAny
+from pyomo.core.base.range import NumericRange
+from pyomo.core.base.reference import Reference
+from pyomo.core.base.set import (
+    Set,
+    RangeSet,
+    SetProduct,
+    SortedSetData,
+    UnknownSetDimen,
+)
+from pyomo.core.base.suffix import Suffix
+from pyomo.core.base.var import Var
+
+#: The current version of the binary format.  Readers reject files
+#: written with a newer (unknown) format version.
+FORMAT_VERSION = 1
+
+_MAGIC = b'PYOMOSER'
+_HEADER = struct.Struct('<8sHHI')
+_ENTRY = struct.Struct('<16sQQ')
+_BIG_ENDIAN = 1
+_ALIGN = 8
+
+# The ordered list of sections (column name, array typecode)
+_SECTIONS = (
+    ('meta', 'q'),
+    # Shared string table
+    ('str.off', 'q'),
+    ('str.dat', 'B'),
+    # Shared float table (payload for float constants / values)
+    ('flt', 'd'),
+    # Shared index (key) table
+    ('key.off', 'q'),
+    ('key.kind', 'b'),
+    ('key.val', 'q'),
+    # Component table
+    ('cmp.name', 'i'),
+    ('cmp.doc', 'i'),
+    ('cmp.parent', 'i'),
+    ('cmp.ctype', 'b'),
+    ('cmp.flags', 'B'),
+    ('cmp.iset', 'i'),
+    ('cmp.dom', 'i'),
+    ('cmp.start', 'i'),
+    ('cmp.count', 'i'),
+    ('cmp.auxk', 'b'),
+    ('cmp.aux', 'q'),
+    # Block data
+    ('blk.key', 'i'),
+    ('blk.flags', 'B'),
+    # Set references / definitions
+    ('set.kind', 'b'),
+    ('set.a', 'i'),
+    ('set.b', 'i'),
+    ('set.c', 'i'),
+    ('set.list', 'i'),
+    # Set data (for Set components)
+    ('sd.key', 'i'),
+    ('sd.def', 'i'),
+    # Var data
+    ('var.key', 'i'),
+    ('var.val', 'd'),
+    ('var.lb', 'd'),
+    ('var.ub', 'd'),
+    ('var.flags', 'H'),
+    ('var.dom', 'i'),
+    ('var.bx', 'i'),
+    # Param data
+    ('par.key', 'i'),
+    ('par.kind', 'b'),
+    ('par.val', 'q'),
+    # Expression data
+    ('exp.key', 'i'),
+    ('exp.expr', 'i'),
+    # Constraint data
+    ('con.key', 'i'),
+    ('con.expr', 'i'),
+    ('con.flags', 'B'),
+    # Objective data
+    ('obj.key', 'i'),
+    ('obj.expr', 'i'),
+    ('obj.flags', 'B'),
+    # Reference data
+    ('ref.key', 'i'),
+    ('ref.cmp', 'i'),
+    ('ref.tkey', 'i'),
+    # Suffix data
+    ('suf.cmp', 'i'),
+    ('suf.key', 'i'),
+    ('suf.kind', 'b'),
+    ('suf.val', 'q'),
+    # Expression tape
+    ('ex.off', 'q'),
+    ('ex.op', 'b'),
+    ('ex.a', 'i'),
+    ('ex.b', 'i'),
+    ('ex.cls', 'i'),
+)
+
+# Scalar value kinds (used for index elements and generic values)
+_K_INT = 0
+_K_FLOAT = 1
+_K_STR = 2
+_K_BOOL = 3
+_K_NONE = 4
+_K_BIGINT = 5
+_K_NOVALUE = 6
+
+# Component types
+_C_BLOCK = 0
+_C_SET = 1
+_C_RANGESET = 2
+_C_VAR = 3
+_C_PARAM = 4
+_C_EXPRESSION = 5
+_C_CONSTRAINT = 6
+_C_OBJECTIVE = 7
+_C_SUFFIX = 8
+
+_CTYPES = (Block, Set, RangeSet, Var, Param, Expression, Constraint, Objective, Suffix)
+_CTYPE_CODE = {ctype: i for i, ctype in enumerate(_CTYPES)}
+# The data table holding the rows for each component type
+_CTYPE_TABLE = {
+    _C_BLOCK: 'blk',
+    _C_SET: 'sd',
+    _C_VAR: 'var',
+    _C_PARAM: 'par',
+    _C_EXPRESSION: 'exp',
+    _C_CONSTRAINT: 'con',
+    _C_OBJECTIVE: 'obj',
+    _C_SUFFIX: 'suf',
+}
+
+# Component flags
+_F_ACTIVE = 1
+_F_INDEXED = 2
+_F_REFERENCE = 4
+_F_MUTABLE = 8
+
+# Set reference kinds
+_S_GLOBAL = 0
+_S_COMPONENT = 1
+_S_PRODUCT = 2
+_S_FINITE = 3
+_S_RANGE = 4
+
+# Set ordering modes
+_ORDER_NONE = 0
+_ORDER_INSERTION = 1
+_ORDER_SORTED = 2
+
+# Var flags
+_V_FIXED = 1
+_V_VALUE_NONE = 2
+_V_VALUE_INT = 4
+_V_LB_NONE = 8
+_V_LB_INT = 16
+_V_LB_EXPR = 32
+_V_UB_NONE = 64
+_V_UB_INT = 128
+_V_UB_EXPR = 256
+_V_STALE = 512
+
+# Data flags (Block, Constraint, Objective)
+_D_ACTIVE = 1
+_D_MAXIMIZE = 2
+
+# Component-relative key markers
+_KEY_NONE = -1
+_KEY_COMPONENT = -2
+
+# Expression tape opcodes
+_E_INT = 0
+_E_FLOAT = 1
+_E_SCALAR = 2
+_E_VAR = 3
+_E_PARAM = 4
+_E_EXPR = 5
+_E_OBJ = 6
+_E_NODE = 7
+_E_FUNC = 8
+_E_REL = 9
+
+
+def _build_node_registry():
+    registry = {}
+    for mod in (numeric_expr, relational_expr):
+        for name, obj in vars(mod).items():
+            if (
+                isinstance(obj, type)
+                and issubclass(obj, ExpressionBase)
+                and obj.__module__ == mod.__name__
+            ):
+                registry[name] = obj
+    for name in (
+        'NumericExpression',
+        'RelationalExpression',
+        'ExternalFunctionExpression',
+        'NPV_ExternalFunctionExpression',
+        'TrivialRelationalExpression',
+        '_MutableSumExpression',
+        '_MutableLinearExpression',
+        '_MutableNPVSumExpression',
+    ):
+        registry.pop(name, None)
+    return registry
+
+
+_NODE_TYPES = _build_node_registry()
+_NODE_CLASSES = set(_NODE_TYPES.values())
+_IMMUTABLE_NODE = {
+    numeric_expr._MutableSumExpression: numeric_expr.SumExpression,
+    numeric_expr._MutableLinearExpression: numeric_expr.LinearExpression,
+    numeric_expr._MutableNPVSumExpression: numeric_expr.NPV_SumExpression,
+}
+_FUNC_NODES = {
+    numeric_expr.UnaryFunctionExpression,
+    numeric_expr.NPV_UnaryFunctionExpression,
+}
+_REL_NODES = {relational_expr.InequalityExpression, relational_expr.RangedExpression}
+
+
+def _type_signature(idx):
+    if idx.__class__ is tuple:
+        return tuple(i.__class__ for i in idx)
+    return idx.__class__
+
+
+class _ModelWriter(object):
+    def __init__(self):
+        self.tables = {name: array(typecode) for name, typecode in _SECTIONS}
+        self.strings = {}
+        self.str_data = []
+        self.floats = {}
+        self.keys = {}
+        self.key_obj = []
+        self.typed_keys = {}
+        self.cmp_row = {}
+        self.set_refs = {}
+        self.var_row = {}
+        self.par_row = {}
+        self.exp_row = {}
+        self.obj_row = {}
+        self.node_cls = {}
+        self.pending = []
+        t = self.tables
+        t['str.off'].append(0)
+        t['key.off'].append(0)
+        t['ex.off'].append(0)
+
+    #
+    # Shared tables
+    #
+
+    def _str(self, val):
+        ans = self.strings.get(val)
+        if ans is None:
+            ans = self.strings[val] = len(self.strings)
+            data = val.encode('utf-8')
+            self.str_data.append(data)
+            t = self.tables['str.off']
+            t.append(t[-1] + len(data))
+        return ans
+
+    def _scalar(self, val):
+        """Return the (kind, payload) encoding of a scalar value"""
+        cls = val.__class__
+        if cls is int:
+            if -(2**63) <= val < 2**63:
+                return _K_INT, val
+            return _K_BIGINT, self._str(str(val))
+        if cls is float:
+            ans = self.floats.get(val)
+            if ans is None:
+                flt = self.tables['flt']
+                ans = len(flt)
+                flt.append(val)
+                if val:
+                    # do not cache 0.0 / -0.0 (they compare equal)
+                    self.floats[val] = ans
+            return _K_FLOAT, ans
+        if cls is str:
+            return _K_STR, self._str(val)
+        if cls is bool:
+            return _K_BOOL, int(val)
+        if val is None:
+            return _K_NONE, 0
+        if val is Param.NoValue:
+            return _K_NOVALUE, 0
+        if cls in native_numeric_types:
+            # e.g., numpy scalars
+            if cls in native_integer_types:
+                return self._scalar(int(val))
+            return self._scalar(float(val))
+        raise ValueError(
+            "Cannot serialize value '%s' of type '%s': only int, float, "
+            "str, bool, and None values are supported" % (val, cls.__name__)
+        )
+
+    def _key(self, idx):
+        if idx is None:
+            return _KEY_NONE
+        ans = self.keys.get(idx)
+        if ans is not None:
+            # Equal keys may still differ in type (e.g., 1 and 1.0):
+            # only reuse the key if the element types match.
+            orig = self.key_obj[ans]
+            if orig.__class__ is not tuple:
+                if orig.__class__ is idx.__class__:
+                    return ans
+            elif all(a.__class__ is b.__class__ for a, b in zip(orig, idx)):
+                return ans
+            typed = (_type_signature(idx), idx)
+            ans = self.typed_keys.get(typed)
+            if ans is not None:
+                return ans
+            ans = self.typed_keys[typed] = self._new_key(idx)
+            return ans
+        ans = self.keys[idx] = self._new_key(idx)
+        return ans
+
+    def _new_key(self, idx):
+        t = self.tables
+        kind, val = t['key.kind'], t['key.val']
+        if idx.__class__ is tuple:
+            for i in idx:
+                k, v = self._scalar(i)
+                kind.append(k)
+                val.append(v)
+        else:
+            k, v = self._scalar(idx)
+            kind.append(k)
+            val.append(v)
+        t['key.off'].append(len(kind))
+        self.key_obj.append(idx)
+        return len(self.key_obj) - 1
+
+    def _set_row(self, kind, a=0, b=0, c=0):
+        t = self.tables
+        t['set.kind'].append(kind)
+        t['set.a'].append(a)
+        t['set.b'].append(b)
+        t['set.c'].append(c)
+        return len(t['set.kind']) - 1
+
+    def _set_ref(self, s):
+        ans = self.set_refs.get(id(s))
+        if ans is not None:
+            return ans
+        if isinstance(s, GlobalSetBase):
+            ans = self._set_row(_S_GLOBAL, self._str(s.local_name))
+        else:
+            comp = s.parent_component()
+            row = self.cmp_row.get(id(comp))
+            if row is not None:
+                ans = self._set_row(
+                    _S_COMPONENT,
+                    row,
+                    self._key(s.index()) if comp.is_indexed() else _KEY_NONE,
+                )
+            elif (
+                comp.parent_block() is not None
+                and comp.parent_block().component(comp.local_name) is comp
+            ):
+                raise ValueError(
+                    "Cannot serialize reference to Set '%s': the Set is not "
+                    "within the scope of the serialized block" % (s.name,)
+                )
+            else:
+                # Anonymous (unnamed) set
+                ans = self._set_def(s)
+        self.set_refs[id(s)] = ans
+        return ans
+
+    def _set_def(self, s):
+        set_list = self.tables['set.list']
+        if isinstance(s, SetProduct):
+            subsets = [
+                self._set_ref(sub) for sub in s.subsets(expand_all_set_operators=False)
+            ]
+            ans = self._set_row(_S_PRODUCT, len(set_list), len(subsets))
+            set_list.extend(subsets)
+            return ans
+        if s.ctype is RangeSet:
+            ranges = list(s.ranges())
+            if all(r.__class__ is NumericRange for r in ranges):
+                ans = self._set_row(_S_RANGE, len(set_list), len(ranges))
+                for r in ranges:
+                    set_list.append(self._key(r.start))
+                    set_list.append(self._key(r.end))
+                    set_list.append(self._key(r.step))
+                    set_list.append(r.closed[0] + 2 * r.closed[1])
+                return ans
+        if not s.isfinite():
+            raise ValueError(
+                "Cannot serialize the non-finite Set '%s'" % (s.name or str(s),)
+            )
+        if isinstance(s, SortedSetData):
+            order = _ORDER_SORTED
+        elif s.isordered():
+            order = _ORDER_INSERTION
+        else:
+            order = _ORDER_NONE
+        dimen = s.dimen
+        if dimen is None:
+            dimen = -1
+        elif dimen is UnknownSetDimen:
+            dimen = -2
+        members = [self._key(i) for i in s]
+        ans = self._set_row(_S_FINITE, len(set_list), len(members), order + 4 * dimen)
+        set_list.extend(members)
+        return ans
+
+    #
+    # Model structure
+    #
+
+    def write(self, block):
+        t = self.tables
+        t['meta'].append(self._str(block.name))
+        self.blk_row = {id(block): 0}
+        # Pass 1: assign rows to all components and block data so that
+        # component / data references can be resolved in any order
+        components = []
+        blocks = [block]
+        t['blk.key'].append(_KEY_NONE)
+        t['blk.flags'].append(_D_ACTIVE if block.active else 0)
+        for bdata in blocks:
+            parent = self.blk_row[id(bdata)]
+            for comp in bdata.component_objects(descend_into=False):
+                self.cmp_row[id(comp)] = len(components)
+                components.append((comp, parent))
+                if comp.ctype is Block and not comp.is_reference():
+                    for idx, sub in comp._data.items():
+                        self.blk_row[id(sub)] = len(t['blk.key'])
+                        t['blk.key'].append(self._key(idx))
+                        t['blk.flags'].append(_D_ACTIVE if sub.active else 0)
+                        blocks.append(sub)
+        # Pass 2: record the component and data tables
+        blk_start = 1
+        for comp, parent in components:
+            ctype = _CTYPE_CODE.get(comp.ctype)
+            if ctype is None:
+                raise ValueError(
+                    "Cannot serialize component '%s': components of type "
+                    "'%s' are not supported" % (comp.name, comp.ctype.__name__)
+                )
+            if getattr(comp, '_units', None) is not None:
+                raise ValueError(
+                    "Cannot serialize component '%s': components with "
+                    "units are not supported" % (comp.name,)
+                )
+            flags = 0
+            if getattr(comp, 'active', True):
+                flags |= _F_ACTIVE
+            if comp.is_indexed():
+                flags |= _F_INDEXED
+            t['cmp.name'].append(self._str(comp.local_name))
+            doc = comp.doc
+            t['cmp.doc'].append(-1 if doc is None else self._str(doc))
+            t['cmp.parent'].append(parent)
+            t['cmp.ctype'].append(ctype)
+            t['cmp.iset'].append(
+                self._set_ref(comp.index_set())
+                if comp.is_indexed() and not comp.is_reference()
+                else -1
+            )
+            dom, auxk, aux = -1, _K_NONE, 0
+            if comp.is_reference():
+                flags |= _F_REFERENCE
+                start, count = self._write_reference(comp)
+            elif ctype == _C_BLOCK:
+                start, count = blk_start, len(comp._data)
+                blk_start += count
+            elif ctype == _C_SET:
+                start, count = self._write_set(comp)
+                for sdata in comp._data.values():
+                    if not isinstance(sdata, SetProduct):
+                        dom = self._set_ref(sdata.domain)
+                    break
+            elif ctype == _C_RANGESET:
+                start, count = 0, 0
+                auxk, aux = _K_INT, self._set_def(comp)
+            elif ctype == _C_VAR:
+                start, count = self._write_var(comp)
+            elif ctype == _C_PARAM:
+                if comp.mutable:
+                    flags |= _F_MUTABLE
+                if not isinstance(comp.domain, _ImplicitAny):
+                    dom = self._set_ref(comp.domain)
+                default = comp.default()
+                if default is not Param.NoValue and callable(default):
+                    raise ValueError(
+                        "Cannot serialize Param '%s': rule-based default "
+                        "values are not supported" % (comp.name,)
+                    )
+                auxk, aux = self._scalar(default)
+                start, count = self._write_param(comp)
+            elif ctype == _C_EXPRESSION:
+                start, count = self._write_expression(comp)
+            elif ctype == _C_CONSTRAINT:
+                start, count = self._write_constraint(comp)
+            elif ctype == _C_OBJECTIVE:
+                start, count = self._write_objective(comp)
+            elif ctype == _C_SUFFIX:
+                datatype = comp.datatype
+                auxk = _K_INT
+                aux = comp.direction + 16 * (-1 if datatype is None else datatype)
+                start, count = self._write_suffix(comp)
+            t['cmp.flags'].append(flags)
+            t['cmp.dom'].append(dom)
+            t['cmp.start'].append(start)
+            t['cmp.count'].append(count)
+            t['cmp.auxk'].append(auxk)
+            t['cmp.aux'].append(aux)
+        # Pass 3: record all expressions (now that all leaves have rows)
+        for table, row, expr in self.pending:
+            table[row] = self._expr(expr)
+        return self
+
+    def _data_ref(self, obj):
+        comp = obj.parent_component()
+        row = self.cmp_row.get(id(comp))
+        if row is None:
+            raise ValueError(
+                "Cannot serialize reference to '%s': the component is not "
+                "within the scope of the serialized block" % (obj.name,)
+            )
+        if obj is comp and comp.is_indexed():
+            return row, _KEY_COMPONENT
+        return row, self._key(obj.index())
+
+    def _write_reference(self, comp):
+        t = self.tables
+        key, cmp, tkey = t['ref.key'], t['ref.cmp'], t['ref.tkey']
+        start = len(key)
+        for idx, obj in comp._data.items():
+            row, tgt = self._data_ref(obj)
+            key.append(self._key(idx))
+            cmp.append(row)
+            tkey.append(tgt)
+        return start, len(key) - start
+
+    def _write_set(self, comp):
+        t = self.tables
+        key, sdef = t['sd.key'], t['sd.def']
+        start = len(key)
+        for idx, sdata in comp._data.items():
+            key.append(self._key(idx))
+            sdef.append(self._set_def(sdata))
+        return start, len(key) - start
+
+    def _write_var(self, comp):
+        t = self.tables
+        key, val, lb, ub = t['var.key'], t['var.val'], t['var.lb'], t['var.ub']
+        flags, dom, bx = t['var.flags'], t['var.dom'], t['var.bx']
+        var_row = self.var_row
+        _key, _set_ref = self._key, self._set_ref
+        start = len(key)
+        for idx, vdata in comp._data.items():
+            row = var_row[id(vdata)] = len(key)
+            key.append(_key(idx))
+            f = _V_FIXED if vdata._fixed else 0
+            if vdata.stale:
+                f |= _V_STALE
+            v = vdata._value
+            if v is None:
+                f |= _V_VALUE_NONE
+                v = 0.0
+            elif v.__class__ is int:
+                f |= _V_VALUE_INT
+            val.append(v)
+            for bound, table, NONE, INT, EXPR, which in (
+                (vdata._lb, lb, _V_LB_NONE, _V_LB_INT, _V_LB_EXPR, 0),
+                (vdata._ub, ub, _V_UB_NONE, _V_UB_INT, _V_UB_EXPR, 1),
+            ):
+                if bound is None:
+                    f |= NONE
+                    bound = 0.0
+                elif bound.__class__ is int:
+                    f |= INT
+                elif bound.__class__ not in native_numeric_types:
+                    f |= EXPR
+                    bx.extend((row, which, -1))
+                    self.pending.append((bx, len(bx) - 1, bound))
+                    bound = 0.0
+                table.append(bound)
+            flags.append(f)
+            dom.append(_set_ref(vdata._domain))
+        return start, len(key) - start
+
+    def _write_param(self, comp):
+        t = self.tables
+        key, kind, val = t['par.key'], t['par.kind'], t['par.val']
+        start = len(key)
+        for idx, pdata in comp.sparse_iteritems():
+            if isinstance(pdata, ParamData):
+                self.par_row[id(pdata)] = len(key)
+                pdata = pdata._value
+            key.append(self._key(idx))
+            k, v = self._scalar(pdata)
+            kind.append(k)
+            val.append(v)
+        return start, len(key) - start
+
+    def _write_expression(self, comp):
+        t = self.tables
+        key, expr = t['exp.key'], t['exp.expr']
+        start = len(key)
+        for idx, edata in comp._data.items():
+            self.exp_row[id(edata)] = len(key)
+            key.append(self._key(idx))
+            expr.append(-1)
+            self.pending.append((expr, len(expr) - 1, edata.expr))
+        return start, len(key) - start
+
+    def _write_constraint(self, comp):
+        t = self.tables
+        key, expr, flags = t['con.key'], t['con.expr'], t['con.flags']
+        start = len(key)
+        for idx, cdata in comp._data.items():
+            key.append(self._key(idx))
+            flags.append(_D_ACTIVE if cdata.active else 0)
+            expr.append(-1)
+            self.pending.append((expr, len(expr) - 1, cdata.expr))
+        return start, len(key) - start
+
+    def _write_objective(self, comp):
+        t = self.tables
+        key, expr, flags = t['obj.key'], t['obj.expr'], t['obj.flags']
+        start = len(key)
+        for idx, odata in comp._data.items():
+            self.obj_row[id(odata)] = len(key)
+            key.append(self._key(idx))
+            f = _D_ACTIVE if odata.active else 0
+            if odata.sense < 0:
+                f |= _D_MAXIMIZE
+            flags.append(f)
+            expr.append(-1)
+            self.pending.append((expr, len(expr) - 1, odata.expr))
+        return start, len(key) - start
+
+    def _write_suffix(self, comp):
+        t = self.tables
+        cmp, key, kind, val = t['suf.cmp'], t['suf.key'], t['suf.kind'], t['suf.val']
+        start = len(key)
+        for obj, v in comp.items():
+            row, k = self._data_ref(obj)
+            cmp.append(row)
+            key.append(k)
+            k, v = self._scalar(v)
+            kind.append(k)
+            val.append(v)
+        return start, len(key) - start
+
+    #
+    # Expressions
+    #
+
+    def _expr(self, expr):
+        if expr is None:
+            return -1
+        t = self.tables
+        op, a, b = t['ex.op'], t['ex.a'], t['ex.b']
+        stack = [(expr, False)]
+        while stack:
+            node, visited = stack.pop()
+            cls = node.__class__
+            if visited:
+                cls = _IMMUTABLE_NODE.get(cls, cls)
+                cls_id = self.node_cls.get(cls)
+                if cls_id is None:
+                    if cls not in _NODE_CLASSES:
+                        raise ValueError(
+                            "Cannot serialize expression node of type '%s'"
+                            % (cls.__name__,)
+                        )
+                    cls_id = self.node_cls[cls] = len(t['ex.cls'])
+                    t['ex.cls'].append(self._str(cls.__name__))
+                if cls in _FUNC_NODES:
+                    if getattr(math, node._name, None) is not node._fcn:
+                        raise ValueError(
+                            "Cannot serialize unary function '%s'" % (node._name,)
+                        )
+                    op.append(_E_FUNC)
+                    a.append(cls_id)
+                    b.append(self._str(node._name))
+                elif cls in _REL_NODES:
+                    strict = node._strict
+                    if strict.__class__ is tuple:
+                        strict = strict[0] + 2 * strict[1]
+                    op.append(_E_REL)
+                    a.append(cls_id)
+                    b.append(int(strict))
+                else:
+                    op.append(_E_NODE)
+                    a.append(cls_id)
+                    b.append(node.nargs())
+            elif cls in native_numeric_types or cls in (str, bool) or node is None:
+                k, v = self._scalar(node)
+                if k == _K_INT and not -(2**31) <= v < 2**31:
+                    k, v = _K_BIGINT, self._str(str(v))
+                if k == _K_INT:
+                    op.append(_E_INT)
+                    a.append(v)
+                    b.append(0)
+                elif k == _K_FLOAT:
+                    op.append(_E_FLOAT)
+                    a.append(v)
+                    b.append(0)
+                else:
+                    op.append(_E_SCALAR)
+                    a.append(k)
+                    b.append(v)
+            elif node.is_expression_type():
+                if node.is_named_expression_type():
+                    if id(node) in self.exp_row:
+                        op.append(_E_EXPR)
+                        a.append(self.exp_row[id(node)])
+                    elif id(node) in self.obj_row:
+                        op.append(_E_OBJ)
+                        a.append(self.obj_row[id(node)])
+                    else:
+                        raise ValueError(
+                            "Cannot serialize reference to '%s': the component "
+                            "is not within the scope of the serialized block"
+                            % (node.name,)
+                        )
+                    b.append(0)
+                    continue
+                stack.append((node, True))
+                stack.extend((arg, False) for arg in reversed(node.args))
+            elif cls is NumericConstant:
+                stack.append((node.value, False))
+            elif node.is_variable_type():
+                row = self.var_row.get(id(node))
+                if row is None:
+                    raise ValueError(
+                        "Cannot serialize reference to '%s': the component "
+                        "is not within the scope of the serialized block" % (node.name,)
+                    )
+                op.append(_E_VAR)
+                a.append(row)
+                b.append(0)
+            elif node.is_parameter_type() and id(node) in self.par_row:
+                op.append(_E_PARAM)
+                a.append(self.par_row[id(node)])
+                b.append(0)
+            else:
+                raise ValueError(
+                    "Cannot serialize expression leaf '%s' of type '%s'"
+                    % (node, cls.__name__)
+                )
+        t['ex.off'].append(len(op))
+        return len(t['ex.off']) - 2
+
+    #
+    # Output
+    #
+
+    def dump(self, ostream):
+        t = self.tables
+        t['str.dat'] = array('B', b''.join(self.str_data))
+        offset = _HEADER.size + len(_SECTIONS) * _ENTRY.size
+        offset += -offset % _ALIGN
+        directory = []
+        for name, typecode in _SECTIONS:
+            nbytes = len(t[name]) * t[name].itemsize
+            directory.append(_ENTRY.pack(name.encode('ascii'), offset, nbytes))
+            offset += nbytes + (-nbytes % _ALIGN)
+        flags = _BIG_ENDIAN if sys.byteorder == 'big' else 0
+        header = _HEADER.pack(_MAGIC, FORMAT_VERSION, flags, len(_SECTIONS))
+        header += b''.join(directory)
+        ostream.write(header + bytes(-len(header) % _ALIGN))
+        for name, typecode in _SECTIONS:
+            data = memoryview(t[name]).cast('B')
+            ostream.write(data)
+            ostream.write(bytes(-len(data) % _ALIGN))
+
+
+class _ModelReader(object):
+    def __init__(self, buf):
+        self.views = []
+        mv = self._view(memoryview(buf))
+        if len(mv) < _HEADER.size:
+            raise ValueError("Invalid serialized model: data is truncated")
+        magic, version, flags, nsections = _HEADER.unpack_from(mv)
+        if magic != _MAGIC:
+            raise ValueError("Invalid serialized model: unrecognized file header")
+        if version > FORMAT_VERSION:
+            raise ValueError(
+                "Cannot read serialized model: format version %s is newer "
+                "than the supported version (%s)" % (version, FORMAT_VERSION)
+            )
+        swap = bool(flags & _BIG_ENDIAN) != (sys.byteorder == 'big')
+        typecodes = dict(_SECTIONS)
+        self.t = t = {}
+        for i in range(nsections):
+            name, offset, nbytes = _ENTRY.unpack_from(
+                mv, _HEADER.size + i * _ENTRY.size
+            )
+            name = name.rstrip(b'\0').decode('ascii')
+            if name not in typecodes:
+                # Sections from a newer minor revision of the format
+                continue
+            data = self._view(mv[offset : offset + nbytes])
+            if swap:
+                data = array(typecodes[name], data)
+                data.byteswap()
+            else:
+                data = self._view(data.cast(typecodes[name]))
+            t[name] = data
+        for name, typecode in _SECTIONS:
+            if name not in t:
+                t[name] = array(typecode)
+
+        self.str_cache = [None] * (len(t['str.off']) - 1)
+        self.key_cache = [None] * (len(t['key.off']) - 1)
+        self.set_cache = {}
+        ncmp = len(t['cmp.name'])
+        self.cmp_obj = [None] * ncmp
+        self.filled = [False] * ncmp
+        self.blk_obj = [None] * len(t['blk.key'])
+        self.var_obj = [None] * len(t['var.key'])
+        self.par_obj = [None] * len(t['par.key'])
+        self.exp_obj = [None] * len(t['exp.key'])
+        self.obj_obj = [None] * len(t['obj.key'])
+        # Map data table rows back to their owning components
+        self.owners = {}
+        for row in range(ncmp):
+            if t['cmp.flags'][row] & _F_REFERENCE:
+                continue
+            table = _CTYPE_TABLE.get(t['cmp.ctype'][row])
+            if table is not None:
+                starts, rows = self.owners.setdefault(table, ([], []))
+                starts.append(t['cmp.start'][row])
+                rows.append(row)
+        self.node_cls = [_NODE_TYPES[self._str(i)] for i in t['ex.cls']]
+        self.node_sum = [
+            issubclass(cls, numeric_expr.SumExpression) for cls in self.node_cls
+        ]
+
+    def _view(self, view):
+        self.views.append(view)
+        return view
+
+    def release(self):
+        for view in reversed(self.views):
+            view.release()
+        self.views = []
+
+    #
+    # Shared tables
+    #
+
+    def _str(self, i):
+        ans = self.str_cache[i]
+        if ans is None:
+            off = self.t['str.off']
+            ans = self.str_cache[i] = bytes(
+                self.t['str.dat'][off[i] : off[i + 1]]
+            ).decode('utf-8')
+        return ans
+
+    def _scalar(self, kind, val):
+        if kind == _K_INT:
+            return val
+        if kind == _K_FLOAT:
+            return self.t['flt'][val]
+        if kind == _K_STR:
+            return self._str(val)
+        if kind == _K_BOOL:
+            return bool(val)
+        if kind == _K_NONE:
+            return None
+        if kind == _K_BIGINT:
+            return int(self._str(val))
+        if kind == _K_NOVALUE:
+            return Param.NoValue
+        raise ValueError("Invalid serialized model: unknown value kind %s" % (kind,))
+
+    def _key(self, i):
+        if i < 0:
+            return None
+        ans = self.key_cache[i]
+        if ans is None:
+            t = self.t
+            off, kind, val = t['key.off'], t['key.kind'], t['key.val']
+            start, end = off[i], off[i + 1]
+            if end - start == 1:
+                ans = self._scalar(kind[start], val[start])
+            else:
+                ans = tuple(self._scalar(kind[j], val[j]) for j in range(start, end))
+            self.key_cache[i] = ans
+        return ans
+
+    def _set(self, row):
+        ans = self.set_cache.get(row)
+        if ans is not None:
+            return ans
+        t = self.t
+        kind, a, b = t['set.kind'][row], t['set.a'][row], t['set.b'][row]
+        set_list = t['set.list']
+        if kind == _S_GLOBAL:
+            ans = GlobalSets[self._str(a)]
+        elif kind == _S_COMPONENT:
+            comp = self._component(a)
+            ans = comp if b == _KEY_NONE else comp[self._key(b)]
+        elif kind == _S_PRODUCT:
+            ans = SetProduct(*(self._set(set_list[i]) for i in range(a, a + b)))
+        elif kind == _S_RANGE:
+            ans = RangeSet(ranges=self._ranges(row))
+        elif kind == _S_FINITE:
+            ans = Set(initialize=self._members(row), **self._set_options(row))
+        else:
+            raise ValueError("Invalid serialized model: unknown set kind %s" % (kind,))
+        self.set_cache[row] = ans
+        return ans
+
+    def _ranges(self, row):
+        t = self.t
+        a, b = t['set.a'][row], t['set.b'][row]
+        set_list = t['set.list']
+        ranges = []
+        for i in range(a, a + 4 * b, 4):
+            closed = set_list[i + 3]
+            ranges.append(
+                NumericRange(
+                    self._key(set_list[i]),
+                    self._key(set_list[i + 1]),
+                    self._key(set_list[i + 2]),
+                    (bool(closed & 1), bool(closed & 2)),
+                )
+            )
+        return tuple(ranges)
+
+    def _members(self, row):
+        t = self.t
+        a, b = t['set.a'][row], t['set.b'][row]
+        _key, set_list = self._key, t['set.list']
+        return [_key(set_list[i]) for i in range(a, a + b)]
+
+    def _set_options(self, row):
+        c = self.t['set.c'][row]
+        order = c % 4
+        dimen = c // 4
+        ans = {}
+        if order == _ORDER_SORTED:
+            ans['ordered'] = Set.SortedOrder
+        elif order == _ORDER_INSERTION:
+            ans['ordered'] = Set.InsertionOrder
+        else:
+            ans['ordered'] = False
+        if dimen >= 0:
+            ans['dimen'] = dimen
+        elif dimen == -1:
+            ans['dimen'] = None
+        else:
+            ans['dimen'] = UnknownSetDimen
+        return ans
+
+    #
+    # Model structure
+    #
+
+    def read(self, cls):
+        t = self.t
+        model = self.blk_obj[0] = cls(name=self._str(t['meta'][0]))
+        if not t['blk.flags'][0] & _D_ACTIVE:
+            model.deactivate()
+        ncmp = len(t['cmp.name'])
+        for row in range(ncmp):
+            self._component(row)
+        for row in range(ncmp):
+            self._fill(row)
+        for row in range(ncmp):
+            if t['cmp.ctype'][row] == _C_SUFFIX:
+                self._fill_suffix(row)
+        return model
+
+    def _owner(self, table, row):
+        starts, rows = self.owners[table]
+        return rows[bisect_right(starts, row) - 1]
+
+    def _block(self, row):
+        ans = self.blk_obj[row]
+        if ans is None:
+            self._component(self._owner('blk', row))
+            ans = self.blk_obj[row]
+        return ans
+
+    def _component(self, row):
+        comp = self.cmp_obj[row]
+        if comp is not None:
+            return comp
+        t = self.t
+        ctype = t['cmp.ctype'][row]
+        flags = t['cmp.flags'][row]
+        parent = self._block(t['cmp.parent'][row])
+        # Building the parent block may have (recursively) built this
+        # component
+        if self.cmp_obj[row] is not None:
+            return self.cmp_obj[row]
+        doc = t['cmp.doc'][row]
+        kwds = {'doc': None if doc < 0 else self._str(doc)}
+        if flags & _F_INDEXED and not flags & _F_REFERENCE:
+            args = (self._set(t['cmp.iset'][row]),)
+        else:
+            args = ()
+        start, count = t['cmp.start'][row], t['cmp.count'][row]
+        if flags & _F_REFERENCE:
+            comp = self._build_reference(row, start, count)
+        elif ctype == _C_BLOCK:
+            comp = Block(*args, dense=False, **kwds)
+        elif ctype == _C_SET:
+            comp = self._build_set(row, args, start, count, kwds)
+        elif ctype == _C_RANGESET:
+            comp = RangeSet(ranges=self._ranges(t['cmp.aux'][row]), **kwds)
+        elif ctype == _C_VAR:
+            comp = Var(*args, dense=not args, **kwds)
+        elif ctype == _C_PARAM:
+            comp = self._build_param(row, args, start, count, kwds)
+        elif ctype == _C_EXPRESSION:
+            if args:
+                kwds['initialize'] = {
+                    self._key(t['exp.key'][i]): None
+                    for i in range(start, start + count)
+                }
+            comp = Expression(*args, **kwds)
+        elif ctype == _C_CONSTRAINT:
+            comp = Constraint(*args, **kwds)
+        elif ctype == _C_OBJECTIVE:
+            comp = Objective(*args, **kwds)
+        elif ctype == _C_SUFFIX:
+            aux = t['cmp.aux'][row]
+            datatype = aux // 16
+            comp = Suffix(
+                direction=aux % 16, datatype=None if datatype < 0 else datatype, **kwds
+            )
+        else:
+            raise ValueError(
+                "Invalid serialized model: unknown component type %s" % (ctype,)
+            )
+        parent.add_component(self._str(t['cmp.name'][row]), comp)
+        self.cmp_obj[row] = comp
+        if flags & _F_REFERENCE:
+            pass
+        elif ctype == _C_BLOCK:
+            self._populate_block(comp, start, count)
+        elif ctype == _C_VAR:
+            self._populate_var(comp, start, count)
+        elif ctype == _C_PARAM:
+            if comp.is_indexed():
+                self._populate_param(comp, start, count)
+            elif count and flags & _F_MUTABLE:
+                self.par_obj[start] = comp
+        elif ctype == _C_EXPRESSION:
+            for i in range(start, start + count):
+                self.exp_obj[i] = self._data(comp, t['exp.key'][i])
+        if not flags & _F_ACTIVE and ctype not in (_C_CONSTRAINT, _C_OBJECTIVE):
+            comp.deactivate()
+        return comp
+
+    def _data(self, comp, key):
+        return comp[self._key(key)] if comp.is_indexed() else comp
+
+    def _build_reference(self, row, start, count):
+        t = self.t
+        data = {}
+        for i in range(start, start + count):
+            tgt = self._component(t['ref.cmp'][i])
+            self._fill(t['ref.cmp'][i])
+            tkey = t['ref.tkey'][i]
+            if tkey != _KEY_COMPONENT and tgt.is_indexed():
+                tgt = tgt[self._key(tkey)]
+            data[self._key(t['ref.key'][i])] = tgt
+        return Reference(data, ctype=_CTYPES[t['cmp.ctype'][row]])
+
+    def _build_set(self, row, args, start, count, kwds):
+        t = self.t
+        sdef = t['sd.def']
+        if not args:
+            if count and t['set.kind'][sdef[start]] == _S_PRODUCT:
+                # Named SetProduct: rebuild the product from the subsets
+                ans = self._set(sdef[start])
+                del self.set_cache[sdef[start]]
+                ans.doc = kwds['doc']
+                return ans
+            members = self._members(sdef[start]) if count else []
+            options = self._set_options(sdef[start]) if count else {}
+        else:
+            members = {}
+            dimen = {}
+            for i in range(start, start + count):
+                key = self._key(t['sd.key'][i])
+                members[key] = self._members(sdef[i])
+                dimen[key] = self._set_options(sdef[i])['dimen']
+            options = self._set_options(sdef[start]) if count else {}
+            options['dimen'] = dimen
+        dom = t['cmp.dom'][row]
+        if dom >= 0:
+            options['domain'] = self._set(dom)
+        return Set(*args, initialize=members, **options, **kwds)
+
+    def _build_param(self, row, args, start, count, kwds):
+        t = self.t
+        if not args and count:
+            # Indexed Params are populated after construction (see
+            # _populate_param)
+            value = self._scalar(t['par.kind'][start], t['par.val'][start])
+            if value is not Param.NoValue:
+                kwds['initialize'] = value
+        dom = t['cmp.dom'][row]
+        if dom >= 0:
+            kwds['domain'] = self._set(dom)
+        return Param(
+            *args,
+            mutable=bool(t['cmp.flags'][row] & _F_MUTABLE),
+            default=self._scalar(t['cmp.auxk'][row], t['cmp.aux'][row]),
+            **kwds,
+        )
+
+    def _populate_param(self, comp, start, count):
+        t = self.t
+        key, kind, val = t['par.key'], t['par.kind'], t['par.val']
+        _key, _scalar = self._key, self._scalar
+        data = comp._data
+        if comp.mutable:
+            par_obj, data_cls = self.par_obj, comp._ComponentDataClass
+            for i in range(start, start + count):
+                idx = _key(key[i])
+                pdata = par_obj[i] = data[idx] = data_cls(comp)
+                pdata._index = idx
+                pdata._value = _scalar(kind[i], val[i])
+        else:
+            for i in range(start, start + count):
+                data[_key(key[i])] = _scalar(kind[i], val[i])
+
+    def _populate_block(self, comp, start, count):
+        t = self.t
+        key, flags = t['blk.key'], t['blk.flags']
+        for i in range(start, start + count):
+            k = key[i]
+            bdata = comp[self._key(k)] if comp.is_indexed() else comp
+            self.blk_obj[i] = bdata
+            if not flags[i] & _D_ACTIVE:
+                bdata.deactivate()
+
+    def _populate_var(self, comp, start, count):
+        t = self.t
+        key, val, lb, ub = t['var.key'], t['var.val'], t['var.lb'], t['var.ub']
+        flags, dom = t['var.flags'], t['var.dom']
+        var_obj, _key, _set = self.var_obj, self._key, self._set
+        indexed = comp.is_indexed()
+        data, data_cls = comp._data, comp._ComponentDataClass
+        for i in range(start, start + count):
+            if indexed:
+                # Keys were validated when the model was serialized:
+                # create the VarData directly (bypassing the domain and
+                # bounds rules, which are overwritten below)
+                idx = _key(key[i])
+                vdata = data[idx] = data_cls(component=comp)
+                vdata._index = idx
+            else:
+                vdata = comp
+            var_obj[i] = vdata
+            f = flags[i]
+            if not f & _V_VALUE_NONE:
+                vdata._value = int(val[i]) if f & _V_VALUE_INT else val[i]
+            if not f & (_V_LB_NONE | _V_LB_EXPR):
+                vdata._lb = int(lb[i]) if f & _V_LB_INT else lb[i]
+            if not f & (_V_UB_NONE | _V_UB_EXPR):
+                vdata._ub = int(ub[i]) if f & _V_UB_INT else ub[i]
+            vdata._fixed = bool(f & _V_FIXED)
+            if not f & _V_STALE:
+                vdata._stale = StaleFlagManager.get_flag(0)
+            vdata._domain = _set(dom[i])
+
+    def _fill(self, row):
+        if self.filled[row]:
+            return
+        self.filled[row] = True
+        t = self.t
+        ctype = t['cmp.ctype'][row]
+        flags = t['cmp.flags'][row]
+        if flags & _F_REFERENCE:
+            return
+        comp = self._component(row)
+        start, count = t['cmp.start'][row], t['cmp.count'][row]
+        _expr, _key = self._expr, self._key
+        if ctype == _C_VAR:
+            # bound expressions are recorded in var row order
+            bx = t['var.bx']
+            lo = _bisect_triples(bx, start)
+            for i in range(lo, len(bx), 3):
+                if bx[i] >= start + count:
+                    break
+                vdata = self.var_obj[bx[i]]
+                if bx[i + 1]:
+                    vdata._ub = _expr(bx[i + 2])
+                else:
+                    vdata._lb = _expr(bx[i + 2])
+        elif ctype == _C_EXPRESSION:
+            expr = t['exp.expr']
+            for i in range(start, start + count):
+                self.exp_obj[i].set_value(_expr(expr[i]))
+        elif ctype == _C_CONSTRAINT:
+            key, expr, dflags = t['con.key'], t['con.expr'], t['con.flags']
+            for i in range(start, start + count):
+                cdata = comp._setitem_when_not_present(_key(key[i]), _expr(expr[i]))
+                if not dflags[i] & _D_ACTIVE:
+                    cdata.deactivate()
+            if not flags & _F_ACTIVE:
+                comp.deactivate()
+        elif ctype == _C_OBJECTIVE:
+            key, expr, dflags = t['obj.key'], t['obj.expr'], t['obj.flags']
+            for i in range(start, start + count):
+                odata = comp._setitem_when_not_present(_key(key[i]), _expr(expr[i]))
+                self.obj_obj[i] = odata
+                odata.sense = -1 if dflags[i] & _D_MAXIMIZE else 1
+                if not dflags[i] & _D_ACTIVE:
+                    odata.deactivate()
+            if not flags & _F_ACTIVE:
+                comp.deactivate()
+
+    def _fill_suffix(self, row):
+        t = self.t
+        comp = self._component(row)
+        start, count = t['cmp.start'][row], t['cmp.count'][row]
+        cmp, key, kind, val = t['suf.cmp'], t['suf.key'], t['suf.kind'], t['suf.val']
+        for i in range(start, start + count):
+            obj = self._component(cmp[i])
+            k = key[i]
+            if k != _KEY_COMPONENT and obj.is_indexed():
+                obj = obj[self._key(k)]
+            comp[obj] = self._scalar(kind[i], val[i])
+
+    #
+    # Expressions
+    #
+
+    def _var(self, row):
+        ans = self.var_obj[row]
+        if ans is None:
+            self._component(self._owner('var', row))
+            ans = self.var_obj[row]
+        return ans
+
+    def _param(self, row):
+        ans = self.par_obj[row]
+        if ans is None:
+            comp = self._component(self._owner('par', row))
+            ans = self.par_obj[row] = self._data(comp, self.t['par.key'][row])
+        return ans
+
+    def _named_expr(self, row):
+        ans = self.exp_obj[row]
+        if ans is None:
+            self._component(self._owner('exp', row))
+            ans = self.exp_obj[row]
+        return ans
+
+    def _objective(self, row):
+        ans = self.obj_obj[row]
+        if ans is None:
+            self._fill(self._owner('obj', row))
+            ans = self.obj_obj[row]
+        return ans
+
+    def _expr(self, eid):
+        if eid < 0:
+            return None
+        t = self.t
+        op, a, b, off = t['ex.op'], t['ex.a'], t['ex.b'], t['ex.off']
+        flt, node_cls, node_sum = t['flt'], self.node_cls, self.node_sum
+        var_obj = self.var_obj
+        stack = []
+        for i in range(off[eid], off[eid + 1]):
+            code = op[i]
+            if code == _E_VAR:
+                v = var_obj[a[i]]
+                stack.append(self._var(a[i]) if v is None else v)
+            elif code == _E_INT:
+                stack.append(a[i])
+            elif code == _E_FLOAT:
+                stack.append(flt[a[i]])
+            elif code == _E_NODE:
+                n = b[i]
+                if n:
+                    args = stack[-n:]
+                    del stack[-n:]
+                else:
+                    args = []
+                if node_sum[a[i]]:
+                    stack.append(node_cls[a[i]](args))
+                else:
+                    stack.append(node_cls[a[i]](tuple(args)))
+            elif code == _E_PARAM:
+                stack.append(self._param(a[i]))
+            elif code == _E_EXPR:
+                stack.append(self._named_expr(a[i]))
+            elif code == _E_OBJ:
+                stack.append(self._objective(a[i]))
+            elif code == _E_FUNC:
+                name = self._str(b[i])
+                stack[-1] = node_cls[a[i]]((stack[-1],), name, getattr(math, name))
+            elif code == _E_REL:
+                cls = node_cls[a[i]]
+                if cls is relational_expr.RangedExpression:
+                    args = tuple(stack[-3:])
+                    del stack[-3:]
+                    strict = (bool(b[i] & 1), bool(b[i] & 2))
+                else:
+                    args = tuple(stack[-2:])
+                    del stack[-2:]
+                    strict = bool(b[i])
+                stack.append(cls(args, strict))
+            elif code == _E_SCALAR:
+                stack.append(self._scalar(a[i], b[i]))
+            else:
+                raise ValueError(
+                    "Invalid serialized model: unknown expression opcode %s" % (code,)
+                )
+        return stack[0]
+
+
+def _bisect_triples(data, row):
+    """Return the offset of the first (row, *, *) triple with row >= row"""
+    lo, hi = 0, len(data) // 3
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if data[3 * mid] < row:
+            lo = mid + 1
+        else:
+            hi = mid
+    return 3 * lo
+
+
+def _load(buf, cls):
+    if cls is None:
+        from pyomo.core.base.PyomoModel import ConcreteModel as cls
+    reader = _ModelReader(buf)
+    try:
+        return reader.read(cls)
+    finally:
+        reader.release()
+
+
+def to_bytes(block):
+    """Serialize a block (and all components within it) to bytes
+
+    Parameters
+    ----------
+    block: BlockData
+        The (constructed) block to serialize
+
+    Returns
+    -------
+    bytes
+
+    """
+    ostream = BytesIO()
+    _ModelWriter().write(block).dump(ostream)
+    return ostream.getvalue()
+
+
+def from_bytes(data, cls=None):
+    """Create a new model from data generated by :py:func:`to_bytes`
+
+    Parameters
+    ----------
+    data: bytes-like
+        The serialized model (any object supporting the buffer protocol)
+
+    cls: type
+        The model class to create (defaults to :py:class:`ConcreteModel`)
+
+    """
+    return _load(data, cls)
+
+
+def to_file(block, filename):
+    """Serialize a block (and all components within it) to a file"""
+    writer = _ModelWriter().write(block)
+    with open(filename, 'wb') as FILE:
+        writer.dump(FILE)
+
+
+def from_file(filename, cls=None, use_mmap=True):
+    """Create a new model from a file generated by :py:func:`to_file`
+
+    Parameters
+    ----------
+    filename: str
+        The file to read
+
+    cls: type
+        The model class to create (defaults to :py:class:`ConcreteModel`)
+
+    use_mmap: bool
+        If True (the default), the file is memory-mapped and the tables
+        are decoded in place instead of reading the file into memory.
+
+    """
+    with open(filename, 'rb') as FILE:
+        if not use_mmap:
+            return _load(FILE.read(), cls)
+        buf = mmap.mmap(FILE.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            return _load(buf, cls)
+        finally:
+            buf.close()
@@ -23,6 +23,7 @@ from typing import Union, Type, Any as typingAny
 
 from pyomo.common.autoslots import AutoSlots
 from pyomo.common.collections import ComponentSet
+from pyomo.common.dependencies import numpy as np
 from pyomo.common.deprecation import deprecated, deprecation_warning, RenamedClass
 from pyomo.common.errors import DeveloperError, PyomoException
 from pyomo.common.log import is_debug_set
@@ -2720,6 +2721,213 @@ class OrderedSetOf(_ScalarOrderedSetMixin, _OrderedSetMixin, FiniteSetOf):
 ############################################################################
 
 
+@ModelComponentFactory.register(
+    "A sparse set of index tuples stored as columns of index values."
+)
+class ColumnarSet(
+    _ScalarOrderedSetMixin, _OrderedSetMixin, _FiniteSetMixin, SetData, Component
+):
+    """A sparse, ordered set of index tuples stored as columns
+
+    This set is intended for indexing components over a sparse subset
+    of a (large) product set, for example the ``(origin, destination,
+    time)`` tuples that actually appear in a data set.  The members are
+    provided as columns of index values (one array per position in the
+    index tuple), so the set is declared without ever generating the
+    dense product of the underlying sets::
+
+        m.ODT = ColumnarSet(columns=(origin, dest, time), within=m.O * m.D * m.T)
+        m.flow = Var(m.ODT)
+
+    The members are ordered by their position in the columns.
+    Membership tests and :py:meth:`ord` are hash lookups, and iteration
+    returns the same (cached) tuple objects every time.
+
+    Parameters
+    ----------
+    columns: sequence of array_like, numpy.ndarray, or pandas.DataFrame
+        The member index values.  This may be a sequence of 1-D arrays
+        (one per tuple position), a 2-D array with one row per member
+        (e.g., the result of :py:func:`numpy.argwhere`), a 1-D array
+        (for a set of scalars), a :py:class:`pandas.DataFrame`, or a
+        :py:class:`pandas.MultiIndex`.
+
+    within: Set, optional
+        The domain that all members are required to be in.  Members are
+        checked column by column when `within` is the product of
+        one-dimensional sets.
+
+    """
+
+    def __init__(self, columns, within=None, **kwds):
+        SetData.__init__(self, component=self)
+        kwds.setdefault('ctype', ColumnarSet)
+        Component.__init__(self, **kwds)
+        self._columns = _columnar_set_columns(columns)
+        self._domain = Any if within is None else process_setarg(within)[0]
+        self._values = None
+        self._positions = None
+        self.construct()
+
+    def construct(self, data=None):
+        if self._constructed:
+            return
+        self._constructed = True
+
+        timer = ConstructionTimer(self)
+        if is_debug_set(logger):
+            logger.debug("Constructing ColumnarSet, name=%s" % (self,))
+        columns = [col.tolist() for col in self._columns]
+        if len(columns) == 1:
+            self._values = columns[0]
+        else:
+            self._values = list(zip(*columns))
+        self._positions = {val: i for i, val in enumerate(self._values)}
+        if len(self._positions) != len(self._values):
+            for val in self._values:
+                if self._positions.pop(val, None) is None:
+                    raise ValueError(
+                        f"The ColumnarSet columns contain the value {val} "
+                        "more than once"
+                    )
+        if self._domain is not Any:
+            self._verify_domain(columns)
+        timer.report()
+
+    def _verify_domain(self, columns):
+        domain = self._domain
+        subsets = list(domain.subsets(expand_all_set_operators=False))
+        if (
+            len(subsets) == len(columns)
+            and all(s.dimen == 1 for s in subsets)
+            and all(val in s for s, col in zip(subsets, columns) for val in set(col))
+        ):
+            # Each unique value in each column is in the corresponding
+            # factor set (verified without forming tuples)
+            return
+        for val in self._values:
+            if val not in domain:
+                raise ValueError(
+                    f"The ColumnarSet value {val} is not in the domain {domain}"
+                )
+
+    @property
+    def columns(self):
+        """The (read-only) arrays of index values, one per tuple position"""
+        return self._columns
+
+    @property
+    def dimen(self):
+        return len(self._columns)
+
+    @property
+    def domain(self):
+        return self._domain
+
+    def get(self, value, default=None):
+        try:
+            if value in self._positions:
+                return value
+        except TypeError:
+            # unhashable values are not members of the set
+            return default
+        # The bulk of single-value set members are stored as scalars.
+        if value.__class__ is tuple and len(value) == 1:
+            if value[0] in self._positions:
+                return value[0]
+        return default
+
+    def __len__(self):
+        return len(self._values)
+
+    def _iter_impl(self):
+        return iter(self._values)
+
+    def __reversed__(self):
+        return reversed(self._values)
+
+    def data(self):
+        return tuple(self._values)
+
+    def at(self, index):
+        i = self._to_0_based_index(index)
+        try:
+            return self._values[i]
+        except IndexError:
+            raise IndexError(f"{self.name} index out of range") from None
+
+    def ord(self, item):
+        """
+        Return the position index of the input value.
+
+        Note that Pyomo Set objects have positions starting at 1 (not 0).
+
+        If the search item is not in the Set, then a ValueError is raised.
+        """
+        ans = self._positions.get(item, None)
+        if ans is None and item.__class__ is tuple and len(item) == 1:
+            ans = self._positions.get(item[0], None)
+        if ans is None:
+            raise ValueError("%s.ord(x): x not in %s" % (self.name, self.name))
+        return ans + 1
+
+    def _pprint(self):
+        """
+        Return data that will be printed for this component.
+        """
+        return (
+            [("Dimen", self.dimen), ("Size", len(self))],
+            {None: self}.items(),
+            ("Domain", "Ordered", "Members"),
+            lambda k, v: [v._domain, "Insertion", Set._pprint_members(v)],
+        )
+
+
+def _columnar_set_columns(columns):
+    """Convert the ColumnarSet columns argument into read-only 1-D arrays"""
+    for cls in columns.__class__.__mro__:
+        if cls.__name__ == 'DataFrame' and cls.__module__.startswith('pandas'):
+            columns = [columns[c].to_numpy() for c in columns.columns]
+            break
+        if cls.__name__ == 'MultiIndex' and cls.__module__.startswith('pandas'):
+            columns = [
+                columns.get_level_values(i).to_numpy() for i in range(columns.nlevels)
+            ]
+            break
+        if cls.__name__ == 'ndarray' and cls.__module__ == 'numpy':
+            if columns.ndim == 1:
+                columns = [columns]
+            elif columns.ndim == 2:
+                columns = list(columns.T)
+            else:
+                raise ValueError(
+                    "ColumnarSet expects a 1-D or 2-D array of index values "
+                    f"(received an array with shape {columns.shape})"
+                )
+            break
+    ans = []
+    for col in columns:
+        col = np.array(col)
+        if col.ndim != 1:
+            raise ValueError(
+                "ColumnarSet columns must be one-dimensional arrays "
+                f"(received an array with shape {col.shape})"
+            )
+        col.flags.writeable = False
+        ans.append(col)
+    if not ans:
+        raise ValueError("ColumnarSet requires at least one column of index values")
+    if any(len(col) != len(ans[0]) for col in ans):
+        raise ValueError(
+            "ColumnarSet columns must all have the same length (received "
+            f"columns of lengths {[len(col) for col in ans]})"
+        )
+    return tuple(ans)
+
+
+############################################################################
+
+
 class InfiniteRangeSetData(SetData):
     """Data class for a infinite set.
 
@@ -4054,6 +4262,18 @@ class SetProduct_InfiniteSet(SetProduct):
     __slots__ = tuple()
 
     def get(self, val, default=None):
+        if val.__class__ is tuple and len(val) == len(self._sets):
+            # Fast path for the common case of a flat tuple with one
+            # (scalar) entry per subset: query each subset directly.
+            # Anything else falls through to the general search below.
+            try:
+                for s, v in zip(self._sets, val):
+                    if v.__class__ is tuple or s.get(v, _NotFound) is _NotFound:
+                        break
+                else:
+                    return val
+            except TypeError:
+                pass
         # return self._find_val(val) is not None
         v = self._find_val(val)
         if v is None:
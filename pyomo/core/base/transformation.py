@@ -166,7 +166,7 @@ class ReverseTransformationToken(object):
         # the transformation to sort out
 
 
-TransformationFactory = Factory('transformation type')
+TransformationFactory = Factory('transformation type', 'pyomo.transformations')
 
 
 @deprecated(version='4.3.11323')
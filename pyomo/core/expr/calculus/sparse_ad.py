@@ -0,0 +1,868 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright (c) 2008-2025
+#  National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+
+"""
+Sparse first and second derivatives of many expressions at once.
+
+Unlike :py:func:`reverse_ad`, which walks one expression at a time and
+returns a ComponentMap, the :py:class:`DerivativeTape` records a list
+of expressions (e.g., all the constraint bodies in a model) onto a
+single shared tape.  The tape is a level-scheduled sequence of
+operations over NumPy arrays: evaluating the expressions, their
+(sparse) Jacobian and the (sparse) Hessian of a weighted sum of the
+expressions (e.g., the Hessian of the Lagrangian) only replays the tape
+and never walks the expression trees again.  The sparsity structure of
+the Jacobian and Hessian is computed once and reused for every
+evaluation.
+
+This is a pure Python / NumPy implementation (it does not require the
+compiled PyNumero ASL interface).  Derivatives are computed in reverse
+mode: the Jacobian from the adjoints of every tape node, and the
+Hessian by combining those adjoints with the (forward mode) gradients
+of the arguments of every nonlinear operation.
+
+The tape compiler (:py:class:`_TapeBuilder`) is also used to evaluate
+many expressions at once without derivatives (see
+:py:class:`pyomo.util.residuals.ConstraintResidualEvaluator`).
+"""
+
+import math
+
+from pyomo.common.dependencies import numpy as np, scipy
+from pyomo.common.numeric_types import native_numeric_types, native_types, value
+import pyomo.core.expr as _expr
+from pyomo.core.expr.calculus.diff_with_pyomo import DifferentiationException
+
+_binary_map = {
+    _expr.ProductExpression: 'mul',
+    _expr.NPV_ProductExpression: 'mul',
+    _expr.MonomialTermExpression: 'mul',
+    _expr.DivisionExpression: 'div',
+    _expr.NPV_DivisionExpression: 'div',
+    _expr.PowExpression: 'pow',
+    _expr.NPV_PowExpression: 'pow',
+}
+
+_sum_types = {_expr.SumExpression, _expr.NPV_SumExpression, _expr.LinearExpression}
+
+_negation_types = {_expr.NegationExpression, _expr.NPV_NegationExpression}
+
+_unary_types = {
+    _expr.UnaryFunctionExpression,
+    _expr.NPV_UnaryFunctionExpression,
+    _expr.AbsExpression,
+    _expr.NPV_AbsExpression,
+}
+
+
+_LN10 = math.log(10)
+
+# name: (value, first derivative, second derivative)
+#
+# Functions without derivatives (ceil, floor) can only be recorded on
+# tapes that are not differentiated.
+_unary_map = {
+    'exp': (lambda a: np.exp(a), lambda a: np.exp(a), lambda a: np.exp(a)),
+    'log': (lambda a: np.log(a), lambda a: 1 / a, lambda a: -1 / a**2),
+    'log10': (
+        lambda a: np.log10(a),
+        lambda a: 1 / (a * _LN10),
+        lambda a: -1 / (a**2 * _LN10),
+    ),
+    'sqrt': (
+        lambda a: np.sqrt(a),
+        lambda a: 0.5 / np.sqrt(a),
+        lambda a: -0.25 * a**-1.5,
+    ),
+    'sin': (lambda a: np.sin(a), lambda a: np.cos(a), lambda a: -np.sin(a)),
+    'cos': (lambda a: np.cos(a), lambda a: -np.sin(a), lambda a: -np.cos(a)),
+    'tan': (
+        lambda a: np.tan(a),
+        lambda a: 1 / np.cos(a) ** 2,
+        lambda a: 2 * np.tan(a) / np.cos(a) ** 2,
+    ),
+    'asin': (
+        lambda a: np.arcsin(a),
+        lambda a: (1 - a**2) ** -0.5,
+        lambda a: a * (1 - a**2) ** -1.5,
+    ),
+    'acos': (
+        lambda a: np.arccos(a),
+        lambda a: -((1 - a**2) ** -0.5),
+        lambda a: -a * (1 - a**2) ** -1.5,
+    ),
+    'atan': (
+        lambda a: np.arctan(a),
+        lambda a: 1 / (1 + a**2),
+        lambda a: -2 * a / (1 + a**2) ** 2,
+    ),
+    'sinh': (lambda a: np.sinh(a), lambda a: np.cosh(a), lambda a: np.sinh(a)),
+    'cosh': (lambda a: np.cosh(a), lambda a: np.sinh(a), lambda a: np.cosh(a)),
+    'tanh': (
+        lambda a: np.tanh(a),
+        lambda a: 1 - np.tanh(a) ** 2,
+        lambda a: -2 * np.tanh(a) * (1 - np.tanh(a) ** 2),
+    ),
+    'asinh': (
+        lambda a: np.arcsinh(a),
+        lambda a: (a**2 + 1) ** -0.5,
+        lambda a: -a * (a**2 + 1) ** -1.5,
+    ),
+    'acosh': (
+        lambda a: np.arccosh(a),
+        lambda a: (a**2 - 1) ** -0.5,
+        lambda a: -a * (a**2 - 1) ** -1.5,
+    ),
+    'atanh': (
+        lambda a: np.arctanh(a),
+        lambda a: 1 / (1 - a**2),
+        lambda a: 2 * a / (1 - a**2) ** 2,
+    ),
+    # Note: abs() is not differentiable at 0 (return NaN there)
+    'abs': (
+        lambda a: np.abs(a),
+        lambda a: np.where(a == 0, np.nan, np.sign(a)),
+        lambda a: np.where(a == 0, np.nan, 0.0),
+    ),
+    'ceil': (lambda a: np.ceil(a), None, None),
+    'floor': (lambda a: np.floor(a), None, None),
+}
+
+# The (argument, argument) pairs with (potentially) nonzero second
+# derivatives for each binary operation
+_binary_hessian_pairs = {
+    'mul': ((0, 1),),
+    'div': ((0, 1), (1, 1)),
+    'pow': ((0, 0), (0, 1), (1, 1)),
+}
+
+
+def _binary_second_derivatives(kind, a, b):
+    if kind == 'mul':
+        return {(0, 1): np.ones(len(a))}
+    if kind == 'div':
+        return {(0, 1): -1 / b**2, (1, 1): 2 * a / b**3}
+    # pow
+    log_a = np.log(a)
+    return {
+        (0, 0): b * (b - 1) * a ** (b - 2),
+        (0, 1): a ** (b - 1) * (1 + b * log_a),
+        (1, 1): a**b * log_a**2,
+    }
+
+
+def _to_float(val):
+    if val is None:
+        return np.nan
+    try:
+        return float(val)
+    except (TypeError, ValueError):
+        # e.g., complex values from fractional powers of negative numbers
+        return np.nan
+
+
+def _classify(node):
+    """Return the operation kind used to record nodes of this class"""
+    cls = node.__class__
+    if cls in native_types:
+        return 'native' if cls in native_numeric_types else None
+    if not node.is_expression_type():
+        return 'var' if node.is_variable_type() else 'leaf'
+    if cls in _sum_types:
+        return 'sum'
+    if cls in _binary_map:
+        return _binary_map[cls]
+    if cls in _negation_types:
+        return 'neg'
+    if cls in _unary_types:
+        return 'unary'
+    if node.is_named_expression_type():
+        return 'named'
+    return None
+
+
+def _csr_pattern(rows, cols, shape):
+    """Return the CSR structure for the (row, col) entries.
+
+    Returns the CSR ``indices`` and ``indptr`` arrays along with the
+    position of each entry in the CSR ``data`` array (duplicate
+    entries map to the same position).
+    """
+    keys = rows.astype(np.int64) * shape[1] + cols
+    keys, position = np.unique(keys, return_inverse=True)
+    indices = keys % shape[1]
+    indptr = np.zeros(shape[0] + 1, dtype=np.intp)
+    np.cumsum(np.bincount(keys // shape[1], minlength=shape[0]), out=indptr[1:])
+    return indices.astype(np.intp), indptr, position.reshape(-1)
+
+
+class _TapeBuilder(object):
+    """Record expression trees onto a single tape.
+
+    Every distinct leaf is assigned a slot in a value array.  Leaves
+    are split into variables (the columns, loaded from the point being
+    evaluated), constants (loaded once) and "dynamic" leaves (mutable
+    Params and other objects whose value is looked up on every
+    evaluation).  Operators are grouped by their depth in the DAG and
+    their kind so that each group can be evaluated with a single NumPy
+    call.
+
+    When the tape will be differentiated, every operator node is
+    recorded separately (named expressions are expanded inline), so
+    the recorded operators form a forest with one tree per expression.
+    This makes each operator node's adjoint depend on a single
+    expression (row).  Otherwise, named expressions are only recorded
+    once and shared by every expression that uses them.
+
+    """
+
+    def __init__(self, variables=None, include_fixed=False, differentiate=True):
+        self.levels = []
+        self.active = []
+        self.leaf_memo = {}
+        self.variables = []
+        self.var_slots = []
+        self.const_slots = []
+        self.const_values = []
+        self.dynamic_slots = []
+        self.dynamic_objs = []
+        self.kinds = {}
+        # (level, kind) -> list of (slot, arg slots, row)
+        self.ops = {}
+        # (named expression, expression it held when it was recorded)
+        self.named = []
+        self.differentiate = differentiate
+        self.include_fixed = include_fixed
+        self.fixed_columns = variables is not None
+        if self.fixed_columns:
+            for v in variables:
+                if id(v) in self.leaf_memo:
+                    raise ValueError(f"Variable '{v.name}' appears more than once")
+                self._add_column(v)
+
+    def _new_slot(self, level, active):
+        self.levels.append(level)
+        self.active.append(active)
+        return len(self.levels) - 1
+
+    def _add_column(self, var):
+        slot = self.leaf_memo[id(var)] = self._new_slot(0, True)
+        self.variables.append(var)
+        self.var_slots.append(slot)
+        return slot
+
+    def _constant(self, val):
+        key = (val.__class__, val)
+        slot = self.leaf_memo.get(key, None)
+        if slot is None:
+            slot = self.leaf_memo[key] = self._new_slot(0, False)
+            self.const_slots.append(slot)
+            self.const_values.append(val)
+        return slot
+
+    def _leaf(self, node, kind):
+        slot = self.leaf_memo.get(id(node), None)
+        if slot is not None:
+            return slot
+        if (
+            kind == 'var'
+            and not self.fixed_columns
+            and (self.include_fixed or not node.fixed)
+        ):
+            return self._add_column(node)
+        slot = self.leaf_memo[id(node)] = self._new_slot(0, False)
+        if kind != 'var' and node.is_constant():
+            self.const_slots.append(slot)
+            self.const_values.append(value(node))
+        else:
+            # Mutable params and variables that are not columns of the
+            # Jacobian are treated as (variable) constants
+            self.dynamic_slots.append(slot)
+            self.dynamic_objs.append(node)
+        return slot
+
+    def record(self, expr, row):
+        """Record ``expr`` and return the slot holding its value"""
+        kinds = self.kinds
+        # Iterative post-order traversal: each stack entry is (node,
+        # kind, args, slots of the already recorded args).  The
+        # sentinel entry collects the slot of the root.
+        stack = [(None, None, (expr,), [])]
+        while 1:
+            node, kind, args, slots = stack[-1]
+            if len(slots) < len(args):
+                child = args[len(slots)]
+                cls = child.__class__
+                try:
+                    child_kind = kinds[cls]
+                except KeyError:
+                    child_kind = kinds[cls] = _classify(child)
+                if child_kind is None:
+                    raise DifferentiationException(
+                        f'Unsupported expression type for differentiation: {cls}'
+                    )
+                if child_kind == 'native':
+                    slots.append(self._constant(child))
+                elif child_kind == 'var' or child_kind == 'leaf':
+                    slots.append(self._leaf(child, child_kind))
+                elif child_kind == 'named' and id(child) in self.leaf_memo:
+                    # Shared named expression (only without derivatives)
+                    slots.append(self.leaf_memo[id(child)])
+                else:
+                    stack.append((child, child_kind, child.args, []))
+                continue
+            stack.pop()
+            if not stack:
+                return slots[0]
+            stack[-1][3].append(self._operator(node, kind, slots, row))
+
+    def _operator(self, node, kind, slots, row):
+        if kind == 'named':
+            # Named expressions (Expression, Objective) simply forward
+            # the value of their argument
+            self.named.append((node, node.expr))
+            if not self.differentiate:
+                self.leaf_memo[id(node)] = slots[0]
+            return slots[0]
+        if kind == 'sum':
+            if len(slots) < 2:
+                return slots[0] if slots else self._constant(0)
+        elif kind == 'unary':
+            kind = node.getname()
+            if kind not in _unary_map or (
+                self.differentiate and _unary_map[kind][1] is None
+            ):
+                raise DifferentiationException(
+                    f'Unsupported expression type for differentiation: {kind}'
+                )
+        levels = self.levels
+        level = max([levels[s] for s in slots]) + 1
+        slot = self._new_slot(level, True)
+        try:
+            self.ops[level, kind].append((slot, slots, row))
+        except KeyError:
+            self.ops[level, kind] = [(slot, slots, row)]
+        return slot
+
+    def program(self):
+        """Convert the recorded operations into NumPy index arrays
+
+        Returns the forward program (one step per (level, kind) group),
+        the list of edges (parent op, argument) in the same order, and
+        the row of every slot (-1 for leaves).
+
+        """
+        intp = np.intp
+        slot_row = np.full(len(self.levels), -1, dtype=intp)
+        steps = []
+        edge_parent = []
+        edge_child = []
+        nedges = 0
+        for level, kind in sorted(self.ops):
+            ops = self.ops[level, kind]
+            n = len(ops)
+            targets = np.fromiter((op[0] for op in ops), dtype=intp, count=n)
+            slot_row[targets] = np.fromiter((op[2] for op in ops), dtype=intp, count=n)
+            if kind == 'sum':
+                nargs = np.fromiter((len(op[1]) for op in ops), dtype=intp, count=n)
+                args = np.fromiter(
+                    (s for op in ops for s in op[1]), dtype=intp, count=nargs.sum()
+                )
+                owner = np.repeat(np.arange(n, dtype=intp), nargs)
+                steps.append((kind, targets, owner, args, nedges))
+                edge_parent.append(targets[owner])
+                edge_child.append(args)
+                nedges += len(args)
+            elif kind in _binary_hessian_pairs:
+                a = np.fromiter((op[1][0] for op in ops), dtype=intp, count=n)
+                b = np.fromiter((op[1][1] for op in ops), dtype=intp, count=n)
+                steps.append((kind, targets, a, b, nedges))
+                edge_parent.extend((targets, targets))
+                edge_child.extend((a, b))
+                nedges += 2 * n
+            else:
+                a = np.fromiter((op[1][0] for op in ops), dtype=intp, count=n)
+                steps.append((kind, targets, a, None, nedges))
+                edge_parent.append(targets)
+                edge_child.append(a)
+                nedges += n
+        edge_parent = np.concatenate(edge_parent) if steps else np.zeros(0, intp)
+        edge_child = np.concatenate(edge_child) if steps else np.zeros(0, intp)
+        return steps, edge_parent, edge_child, slot_row
+
+
+class _Tape(object):
+    """Base class for objects that evaluate a recorded tape
+
+    :py:meth:`_load_tape` copies the (NumPy) program out of a
+    :py:class:`_TapeBuilder`; :py:meth:`_forward` then evaluates every
+    slot on the tape at a point.
+
+    """
+
+    def _load_tape(self, builder, roots):
+        intp = np.intp
+        self._variables = builder.variables
+        self._nslots = len(builder.levels)
+        self._var_slots = np.array(builder.var_slots, dtype=intp)
+        self._const_slots = np.array(builder.const_slots, dtype=intp)
+        self._const_values = np.array(builder.const_values, dtype=float)
+        self._dynamic_slots = np.array(builder.dynamic_slots, dtype=intp)
+        self._dynamic_objs = builder.dynamic_objs
+        self._roots = np.array(roots, dtype=intp)
+        (self._steps, self._edge_parent, self._edge_child, self._slot_row) = (
+            builder.program()
+        )
+
+    @property
+    def variables(self):
+        """The list of variables (the order of the point arrays)"""
+        return self._variables
+
+    def get_variable_values(self):
+        """Return the current variable values as an array
+
+        Variables without a value are returned as ``nan``.
+        """
+        return np.fromiter(
+            (np.nan if v.value is None else v.value for v in self._variables),
+            dtype=float,
+            count=len(self._variables),
+        )
+
+    def _point(self, x):
+        if x is None:
+            return self.get_variable_values()
+        x = np.asarray(x, dtype=float)
+        if x.shape != (len(self._variables),):
+            raise ValueError(
+                "Expected an array of %s variable values (found shape %s)"
+                % (len(self._variables), x.shape)
+            )
+        return x
+
+    def _forward(self, x):
+        """Return the value of every slot on the tape at the point x"""
+        vals = np.empty(self._nslots)
+        vals[self._const_slots] = self._const_values
+        vals[self._var_slots] = self._point(x)
+        if self._dynamic_objs:
+            vals[self._dynamic_slots] = [
+                _to_float(value(obj, exception=False)) for obj in self._dynamic_objs
+            ]
+        for kind, targets, a, b, e0 in self._steps:
+            if kind == 'sum':
+                vals[targets] = np.bincount(a, weights=vals[b], minlength=len(targets))
+            elif kind == 'mul':
+                vals[targets] = vals[a] * vals[b]
+            elif kind == 'div':
+                vals[targets] = vals[a] / vals[b]
+            elif kind == 'pow':
+                vals[targets] = np.power(vals[a], vals[b])
+            elif kind == 'neg':
+                vals[targets] = -vals[a]
+            else:
+                vals[targets] = _unary_map[kind][0](vals[a])
+        return vals
+
+
+class DerivativeTape(_Tape):
+    """Sparse derivatives of a list of expressions.
+
+    The expressions are recorded onto a shared tape when the tape is
+    created.  The tape captures the *structure* of the expressions:
+    variable values and mutable parameter values are read each time
+    the tape is evaluated, but changes to the expressions themselves
+    require recording a new tape.
+
+    Parameters
+    ----------
+    exprs: iterable
+        The expressions to differentiate.  Constraints are replaced
+        by their bodies (objectives and named expressions can be
+        passed directly).
+
+    variables: iterable of VarData
+        The variables defining the columns of the Jacobian (and the
+        rows and columns of the Hessian).  Any other variable is
+        treated as a constant.  If not provided, the columns are all
+        variables appearing in the expressions (in order of first
+        appearance).
+
+    include_fixed: bool
+        If True (and ``variables`` is not provided), include fixed
+        variables in the columns.  Otherwise, fixed variables are
+        treated as constants.
+
+    Examples
+    --------
+
+    >>> import pyomo.environ as pyo
+    >>> from pyomo.core.expr.calculus.sparse_ad import DerivativeTape
+    >>> m = pyo.ConcreteModel()
+    >>> m.x = pyo.Var([1, 2], initialize=2)
+    >>> m.c1 = pyo.Constraint(expr=m.x[1] * m.x[2] == 1)
+    >>> m.c2 = pyo.Constraint(expr=m.x[1] + pyo.exp(m.x[2]) <= 5)
+    >>> tape = DerivativeTape([m.c1, m.c2])
+    >>> tape.jacobian().toarray()
+    array([[2.       , 2.       ],
+           [1.       , 7.3890561]])
+    >>> tape.hessian([1, 1]).toarray()
+    array([[0.       , 1.       ],
+           [1.       , 7.3890561]])
+
+    """
+
+    def __init__(self, exprs, variables=None, include_fixed=False):
+        self._exprs = list(exprs)
+        builder = _TapeBuilder(variables, include_fixed)
+        roots = []
+        for row, expr in enumerate(self._exprs):
+            body = getattr(expr, 'body', expr)
+            roots.append(builder.record(body, row))
+
+        self._load_tape(builder, roots)
+        intp = np.intp
+        nslots = self._nslots
+        levels = np.array(builder.levels, dtype=intp)
+        active = np.array(builder.active, dtype=bool)
+        slot_column = np.full(nslots, -1, dtype=intp)
+        slot_column[self._var_slots] = np.arange(len(self._variables))
+        steps = self._steps
+        edge_parent = self._edge_parent
+        edge_child = self._edge_child
+        slot_row = self._slot_row
+        nedges = len(edge_parent)
+        self._levels = levels
+        self._active = active
+
+        # Partial derivatives that do not depend on the point
+        self._partials = np.zeros(nedges)
+        for kind, targets, a, b, e0 in steps:
+            if kind == 'sum':
+                self._partials[e0 : e0 + len(b)] = 1
+            elif kind == 'neg':
+                self._partials[e0 : e0 + len(targets)] = -1
+
+        # The reverse sweep: process the edges (with active arguments)
+        # from the highest level to the lowest
+        e_active = np.flatnonzero(active[edge_child])
+        e_level = levels[edge_parent[e_active]]
+        order = np.argsort(-e_level, kind='stable')
+        e_active = e_active[order]
+        e_level = e_level[order]
+        bounds = np.flatnonzero(np.diff(e_level)) + 1
+        self._reverse = []
+        for es in np.split(e_active, bounds):
+            if not len(es):
+                continue
+            es_op = es[levels[edge_child[es]] > 0]
+            self._reverse.append((es, es_op))
+        self._op_roots = self._roots[levels[self._roots] > 0]
+
+        # The Jacobian structure
+        ncols = len(self._variables)
+        var_edges = e_active[levels[edge_child[e_active]] == 0]
+        root_rows = np.flatnonzero(slot_column[self._roots] >= 0)
+        rows = np.concatenate((slot_row[edge_parent[var_edges]], root_rows))
+        cols = np.concatenate(
+            (slot_column[edge_child[var_edges]], slot_column[self._roots[root_rows]])
+        )
+        shape = (len(self._exprs), ncols)
+        self._jac_indices, self._jac_indptr, position = _csr_pattern(rows, cols, shape)
+        self._jac_var_edges = var_edges
+        self._jac_edge_pos = position[: len(var_edges)]
+        self._jac_root_pos = position[len(var_edges) :]
+        self._slot_column = slot_column
+        self._hessian_structure = None
+
+    @property
+    def expressions(self):
+        """The list of recorded expressions (the rows of the Jacobian)"""
+        return self._exprs
+
+    def _first_derivatives(self, vals):
+        """Return the partial derivative of every edge on the tape"""
+        P = self._partials.copy()
+        for kind, targets, a, b, e0 in self._steps:
+            if kind == 'sum' or kind == 'neg':
+                continue
+            n = len(targets)
+            if kind == 'mul':
+                P[e0 : e0 + n] = vals[b]
+                P[e0 + n : e0 + 2 * n] = vals[a]
+            elif kind == 'div':
+                P[e0 : e0 + n] = 1 / vals[b]
+                P[e0 + n : e0 + 2 * n] = -vals[a] / vals[b] ** 2
+            elif kind == 'pow':
+                va = vals[a]
+                vb = vals[b]
+                P[e0 : e0 + n] = vb * va ** (vb - 1)
+                P[e0 + n : e0 + 2 * n] = vals[targets] * np.log(va)
+            else:
+                P[e0 : e0 + n] = _unary_map[kind][1](vals[a])
+        return P
+
+    def _adjoints(self, P):
+        """Reverse sweep: return the adjoint of every slot and edge"""
+        adj = np.zeros(self._nslots)
+        adj[self._op_roots] = 1
+        W = np.zeros(len(P))
+        parent = self._edge_parent
+        child = self._edge_child
+        for es, es_op in self._reverse:
+            W[es] = adj[parent[es]] * P[es]
+            adj[child[es_op]] = W[es_op]
+        return adj, W
+
+    def evaluate(self, x=None):
+        """Evaluate the expressions
+
+        Parameters
+        ----------
+        x: numpy.ndarray
+            The variable values (ordered as in :py:attr:`variables`).
+            If None, the current variable values are used.
+
+        Returns
+        -------
+        numpy.ndarray
+
+        """
+        with np.errstate(all='ignore'):
+            return self._forward(x)[self._roots]
+
+    def jacobian(self, x=None):
+        """Evaluate the Jacobian of the expressions
+
+        The sparsity structure is fixed when the tape is recorded:
+        every call returns a matrix with the same ``indices`` and
+        ``indptr`` (entries that evaluate to 0 are stored explicitly).
+
+        Parameters
+        ----------
+        x: numpy.ndarray
+            The variable values (ordered as in :py:attr:`variables`).
+            If None, the current variable values are used.
+
+        Returns
+        -------
+        scipy.sparse.csr_matrix
+
+        """
+        with np.errstate(all='ignore'):
+            adj, W = self._adjoints(self._first_derivatives(self._forward(x)))
+        data = np.bincount(
+            self._jac_edge_pos,
+            weights=W[self._jac_var_edges],
+            minlength=len(self._jac_indices),
+        )
+        data[self._jac_root_pos] += 1
+        return scipy.sparse.csr_matrix(
+            (data, self._jac_indices, self._jac_indptr),
+            shape=(len(self._exprs), len(self._variables)),
+        )
+
+    def hessian(self, multipliers=None, x=None):
+        """Evaluate the Hessian of a weighted sum of the expressions
+
+        For constraint bodies and a vector of constraint multipliers,
+        this is the Hessian of the Lagrangian (the objective can be
+        included by recording it as one of the expressions).
+
+        The sparsity structure is computed the first time this is
+        called and then reused.
+
+        Parameters
+        ----------
+        multipliers: numpy.ndarray
+            The weight for each expression.  If None, all expressions
+            are weighted by 1.
+        x: numpy.ndarray
+            The variable values (ordered as in :py:attr:`variables`).
+            If None, the current variable values are used.
+
+        Returns
+        -------
+        scipy.sparse.csr_matrix
+            The (full, symmetric) Hessian matrix
+
+        """
+        if self._hessian_structure is None:
+            self._hessian_structure = self._record_hessian()
+        (
+            terms,
+            G_program,
+            var_entries,
+            nentries,
+            h_term,
+            h_i,
+            h_j,
+            h_pos,
+            indices,
+            indptr,
+        ) = self._hessian_structure
+        if multipliers is None:
+            multipliers = np.ones(len(self._exprs))
+        else:
+            multipliers = np.asarray(multipliers, dtype=float)
+            if multipliers.shape != (len(self._exprs),):
+                raise ValueError(
+                    "Expected an array of %s multipliers (found shape %s)"
+                    % (len(self._exprs), multipliers.shape)
+                )
+        n = len(self._variables)
+        with np.errstate(all='ignore'):
+            vals = self._forward(x)
+            P = self._first_derivatives(vals)
+            adj, W = self._adjoints(P)
+            # Forward-mode gradients of the nonlinear operation arguments
+            G = np.zeros(nentries)
+            G[var_entries] = 1
+            for tgt, src, edge in G_program:
+                G += np.bincount(tgt, weights=P[edge] * G[src], minlength=nentries)
+            # Second derivatives of each nonlinear operation, scaled by
+            # its adjoint and the multiplier of the expression it
+            # belongs to
+            coef = np.empty(sum(len(t[2]) for t in terms))
+            for step, pair, sel, t0 in terms:
+                kind, targets, a, b, e0 = self._steps[step]
+                if b is None:
+                    S = _unary_map[kind][2](vals[a[sel]])
+                else:
+                    S = _binary_second_derivatives(kind, vals[a[sel]], vals[b[sel]])[
+                        pair
+                    ]
+                parent = targets[sel]
+                coef[t0 : t0 + len(sel)] = (
+                    S * adj[parent] * multipliers[self._slot_row[parent]]
+                )
+            data = np.bincount(
+                h_pos, weights=coef[h_term] * G[h_i] * G[h_j], minlength=len(indices)
+            )
+        return scipy.sparse.csr_matrix((data, indices, indptr), shape=(n, n))
+
+    def _record_hessian(self):
+        levels = self._levels
+        active = self._active
+        steps = self._steps
+        parent = self._edge_parent
+        child = self._edge_child
+        column = self._slot_column
+
+        # Collect the nonlinear terms: (step, arg pair, selected ops)
+        terms = []
+        term_args = []
+        nterms = 0
+        for step, (kind, targets, a, b, e0) in enumerate(steps):
+            if kind == 'sum' or kind == 'neg':
+                continue
+            if b is None:
+                pairs = (((0, 0), a, a),)
+            else:
+                pairs = tuple(
+                    (pair, (a, b)[pair[0]], (a, b)[pair[1]])
+                    for pair in _binary_hessian_pairs[kind]
+                )
+            for pair, k, l in pairs:
+                sel = np.flatnonzero(active[k] & active[l])
+                if not len(sel):
+                    continue
+                terms.append((step, pair, sel, nterms))
+                diag = pair[0] == pair[1]
+                term_args.extend(
+                    (sk, sl, diag) for sk, sl in zip(k[sel].tolist(), l[sel].tolist())
+                )
+                nterms += len(sel)
+
+        # Operator arguments: slot -> [(arg slot, edge)]
+        op_args = {}
+        e_active = np.flatnonzero(active[child])
+        for e, p, c in zip(
+            e_active.tolist(), parent[e_active].tolist(), child[e_active].tolist()
+        ):
+            op_args.setdefault(p, []).append((c, e))
+
+        # Forward gradient sparsity patterns (col -> entry) for every
+        # slot whose gradient is needed
+        patterns = {}
+        var_entries = []
+        needed = set()
+        pending = [s for sk, sl, diag in term_args for s in (sk, sl)]
+        while pending:
+            s = pending.pop()
+            if s in needed:
+                continue
+            needed.add(s)
+            pending.extend(c for c, e in op_args.get(s, ()))
+        program = {}
+        nentries = 0
+        for s in sorted(needed, key=levels.__getitem__):
+            if levels[s] == 0:
+                patterns[s] = {int(column[s]): nentries}
+                var_entries.append(nentries)
+                nentries += 1
+                continue
+            pattern = patterns[s] = {}
+            contrib = program.setdefault(int(levels[s]), ([], [], []))
+            for c, e in op_args[s]:
+                for col, src in patterns[c].items():
+                    tgt = pattern.get(col, None)
+                    if tgt is None:
+                        tgt = pattern[col] = nentries
+                        nentries += 1
+                    contrib[0].append(tgt)
+                    contrib[1].append(src)
+                    contrib[2].append(e)
+        intp = np.intp
+        G_program = [
+            tuple(np.array(x, dtype=intp) for x in program[level])
+            for level in sorted(program)
+        ]
+
+        # The Hessian entries
+        h_rows = []
+        h_cols = []
+        h_term = []
+        h_i = []
+        h_j = []
+        for t, (sk, sl, diag) in enumerate(term_args):
+            Gk = patterns[sk].items()
+            Gl = patterns[sl].items()
+            for ci, ei in Gk:
+                for cj, ej in Gl:
+                    h_rows.append(ci)
+                    h_cols.append(cj)
+                    h_term.append(t)
+                    h_i.append(ei)
+                    h_j.append(ej)
+                    if not diag:
+                        h_rows.append(cj)
+                        h_cols.append(ci)
+                        h_term.append(t)
+                        h_i.append(ei)
+                        h_j.append(ej)
+        n = len(self._variables)
+        indices, indptr, h_pos = _csr_pattern(
+            np.array(h_rows, dtype=intp), np.array(h_cols, dtype=intp), (n, n)
+        )
+        return (
+            terms,
+            G_program,
+            np.array(var_entries, dtype=intp),
+            nentries,
+            np.array(h_term, dtype=intp),
+            np.array(h_i, dtype=intp),
+            np.array(h_j, dtype=intp),
+            h_pos,
+            indices,
+            indptr,
+        )
@@ -9,7 +9,17 @@
 #  This software is distributed under the 3-clause BSD License.
 #  ___________________________________________________________________________
 
-from pyomo.common.dependencies import numpy as np, numpy_available
+import math
+
+from pyomo.common.dependencies import (
+    numpy as np,
+    numpy_available,
+    scipy,
+    scipy_available,
+)
+from pyomo.common.numeric_types import native_numeric_types
+from pyomo.core.pyomoobject import PyomoObject
+from pyomo.core.expr.numeric_expr import LinearExpression, MonomialTermExpression
 
 
 #
@@ -37,3 +47,465 @@ class NumericNDArray(np.ndarray if numpy_available else object):
             return ans.view(NumericNDArray)
         else:
             return ans
+
+
+class LinearNDArray(object):
+    """An array of linear expressions stored as a sparse coefficient matrix
+
+    Each element of the array is the linear expression ``C[i, :] @ x +
+    c[i]``, where ``C`` is a :py:class:`scipy.sparse.csr_array` with one
+    row per element (in C order), ``c`` is a vector of constants, and
+    ``x`` is a list of Pyomo variables.  Arithmetic that preserves
+    linearity (addition and subtraction, scaling by numeric arrays,
+    ``@`` with numeric matrices, and :py:meth:`sum`) is performed
+    directly on the coefficient data, so no intermediate Pyomo
+    expression objects are created.  Any other operation (including
+    relational operators) converts the array to a
+    :py:class:`NumericNDArray` of Pyomo expressions (generating each
+    :py:class:`LinearExpression` directly from its row of ``C``) and
+    continues elementwise.
+
+    This is opt-in: NumPy operations on indexed Pyomo :py:class:`Var`
+    components return :py:class:`NumericNDArray` objects (which are
+    NumPy arrays), while::
+
+        x = LinearNDArray.from_variables(m.x)
+        m.c = Constraint(range(len(b)), expr=A @ x + b <= ub)
+
+    builds the constraint bodies without creating intermediate sums.
+    LinearNDArray is not an ndarray subclass; attributes and methods
+    that it does not implement (e.g., :py:meth:`tolist` or
+    :py:meth:`flatten`) are taken from the equivalent
+    :py:class:`NumericNDArray`.
+
+    """
+
+    def __init__(self, coef, constant, variables, shape):
+        self._coef = coef
+        self._const = constant
+        self._vars = variables
+        self.shape = tuple(shape)
+
+    @classmethod
+    def from_variables(cls, variables):
+        """Create a LinearNDArray from an array of variables
+
+        Parameters
+        ----------
+        variables: IndexedVar or array_like
+            The variables (either an indexed Var that can be converted
+            to a NumPy array, or an array of :py:class:`VarData`)
+
+        """
+        ans = _linear_from_array(np.asarray(variables, dtype=object))
+        if ans is None:
+            raise ValueError(
+                "LinearNDArray.from_variables() requires an array containing "
+                "only Pyomo variables"
+            )
+        return ans
+
+    @property
+    def ndim(self):
+        return len(self.shape)
+
+    @property
+    def size(self):
+        return self._const.size
+
+    @property
+    def T(self):
+        return self._take(np.arange(self.size).reshape(self.shape).T)
+
+    @property
+    def variables(self):
+        """The list of variables corresponding to the coefficient columns"""
+        return self._vars
+
+    def to_sparse(self):
+        """Return the (coefficient matrix, constants, variables) triple
+
+        Rows of the coefficient matrix correspond to the array elements
+        in C (row-major) order.
+
+        """
+        return self._coef.copy(), self._const.copy(), list(self._vars)
+
+    def reshape(self, *shape):
+        if len(shape) == 1 and not isinstance(shape[0], int):
+            shape = shape[0]
+        return self._take(np.arange(self.size).reshape(shape))
+
+    def sum(self, axis=None, dtype=None, out=None, keepdims=False, **kwds):
+        if out is not None or kwds or dtype not in (None, object):
+            return np.asarray(self).sum(
+                axis=axis, dtype=dtype, out=out, keepdims=keepdims, **kwds
+            )
+        ndim = self.ndim
+        if axis is None:
+            axis = tuple(range(ndim))
+        elif not isinstance(axis, tuple):
+            axis = (axis,)
+        axis = {a + ndim if a < 0 else a for a in axis}
+        if any(a < 0 or a >= ndim for a in axis):
+            raise ValueError(
+                f"Invalid axis for summing a LinearNDArray with {ndim} dimensions"
+            )
+        # Map each element to the (flattened) index of the element it
+        # is summed into and form the summation matrix
+        shape = tuple(1 if i in axis else n for i, n in enumerate(self.shape))
+        rows = np.arange(math.prod(shape)).reshape(shape)
+        rows = np.broadcast_to(rows, self.shape).ravel()
+        S = scipy.sparse.csr_array(
+            (np.ones(self.size, dtype=np.int64), (rows, np.arange(self.size))),
+            shape=(math.prod(shape), self.size),
+        )
+        if not keepdims:
+            shape = tuple(n for i, n in enumerate(self.shape) if i not in axis)
+        return _linear_result(S @ self._coef, S @ self._const, self._vars, shape)
+
+    def __len__(self):
+        if not self.shape:
+            raise TypeError("len() of unsized object")
+        return self.shape[0]
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def __getitem__(self, key):
+        idx = np.arange(self.size).reshape(self.shape)[key]
+        if idx.__class__ is not np.ndarray:
+            return self._expression(int(idx))
+        return self._take(idx)
+
+    def __array__(self, dtype=None, copy=None):
+        if dtype not in (None, object):
+            raise ValueError(
+                "LinearNDArray can only be converted to NumPy arrays "
+                f"with dtype=object (received {dtype=})"
+            )
+        if copy is not None and not copy:
+            raise ValueError(
+                "LinearNDArray does not support conversion to NumPy "
+                "arrays without generating a new array"
+            )
+        ans = NumericNDArray(shape=(self.size,), dtype=object)
+        ans[:] = self._expressions()
+        return ans.reshape(self.shape)
+
+    def __str__(self):
+        return str(np.asarray(self))
+
+    def __getattr__(self, name):
+        # Fall back on the NumericNDArray for anything that is not
+        # implemented here.  Note that private / special attributes
+        # are not delegated (NumPy looks up attributes like
+        # __array_interface__ while converting this object to an
+        # array).
+        if name.startswith('_'):
+            raise AttributeError(
+                f"'{self.__class__.__name__}' object has no attribute '{name}'"
+            )
+        return getattr(self.__array__(), name)
+
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        handler = _linear_ufunc_handlers.get(ufunc.__name__)
+        if (
+            handler is not None
+            and method == '__call__'
+            and not kwargs
+            and scipy_available
+        ):
+            operands = [_linear_operand(arg) for arg in inputs]
+            if all(arg is not None for arg in operands) and any(
+                arg.__class__ is LinearNDArray for arg in operands
+            ):
+                ans = handler(*operands)
+                if ans is not NotImplemented:
+                    return ans
+        return NumericNDArray.__array_ufunc__(None, ufunc, method, *inputs, **kwargs)
+
+    def __neg__(self):
+        return np.negative(self)
+
+    def __pos__(self):
+        return self
+
+    def __abs__(self):
+        return np.absolute(self)
+
+    def __add__(self, other):
+        return np.add(self, other)
+
+    def __radd__(self, other):
+        return np.add(other, self)
+
+    def __sub__(self, other):
+        return np.subtract(self, other)
+
+    def __rsub__(self, other):
+        return np.subtract(other, self)
+
+    def __mul__(self, other):
+        return np.multiply(self, other)
+
+    def __rmul__(self, other):
+        return np.multiply(other, self)
+
+    def __truediv__(self, other):
+        return np.true_divide(self, other)
+
+    def __rtruediv__(self, other):
+        return np.true_divide(other, self)
+
+    def __pow__(self, other):
+        return np.power(self, other)
+
+    def __rpow__(self, other):
+        return np.power(other, self)
+
+    def __matmul__(self, other):
+        return np.matmul(self, other)
+
+    def __rmatmul__(self, other):
+        return np.matmul(other, self)
+
+    def __le__(self, other):
+        return np.less_equal(self, other)
+
+    def __lt__(self, other):
+        return np.less(self, other)
+
+    def __ge__(self, other):
+        return np.greater_equal(self, other)
+
+    def __gt__(self, other):
+        return np.greater(self, other)
+
+    def __eq__(self, other):
+        return np.equal(self, other)
+
+    __hash__ = None
+
+    def _take(self, idx):
+        rows = idx.ravel()
+        return LinearNDArray(self._coef[rows], self._const[rows], self._vars, idx.shape)
+
+    def _broadcast(self, shape):
+        """Return the (coef, const) for this array broadcast to `shape`"""
+        if self.shape == shape:
+            return self._coef, self._const
+        rows = np.arange(self.size).reshape(self.shape)
+        rows = np.broadcast_to(rows, shape).ravel()
+        return self._coef[rows], self._const[rows]
+
+    def _canonical_coef(self):
+        C = self._coef
+        if not C.has_canonical_format:
+            C.sum_duplicates()
+        C.eliminate_zeros()
+        return C
+
+    def _expression(self, i):
+        C = self._canonical_coef()
+        start, end = C.indptr[i : i + 2]
+        _vars = self._vars
+        return _linear_expr(
+            C.data[start:end].tolist(),
+            [_vars[j] for j in C.indices[start:end].tolist()],
+            self._const[i].item(),
+        )
+
+    def _expressions(self):
+        C = self._canonical_coef()
+        data = C.data.tolist()
+        _vars = self._vars
+        terms = [_vars[j] for j in C.indices.tolist()]
+        indptr = C.indptr.tolist()
+        return [
+            _linear_expr(data[start:end], terms[start:end], const)
+            for start, end, const in zip(indptr, indptr[1:], self._const.tolist())
+        ]
+
+
+def _linear_expr(coefs, variables, const):
+    args = [
+        v if c == 1 else MonomialTermExpression((c, v))
+        for c, v in zip(coefs, variables)
+    ]
+    # Follow the operator overloading system and only generate a
+    # LinearExpression for sums of more than one term
+    if not args:
+        return const
+    if const:
+        args.append(const)
+    elif len(args) == 1:
+        return args[0]
+    return LinearExpression(args)
+
+
+def _linear_result(coef, const, variables, shape):
+    if not shape:
+        return LinearNDArray(coef, const, variables, shape)._expression(0)
+    return LinearNDArray(coef, const, variables, shape)
+
+
+def _linear_from_array(arr):
+    """Convert an object array of variables into a LinearNDArray
+
+    Returns None if any element of the array is not a variable.
+
+    """
+    index = {}
+    variables = []
+    cols = []
+    for v in arr.flat:
+        if not (isinstance(v, PyomoObject) and v.is_variable_type()):
+            return None
+        _id = id(v)
+        if _id not in index:
+            index[_id] = len(variables)
+            variables.append(v)
+        cols.append(index[_id])
+    coef = scipy.sparse.csr_array(
+        (np.ones(arr.size, dtype=np.int64), cols, np.arange(arr.size + 1)),
+        shape=(arr.size, len(variables)),
+    )
+    return LinearNDArray(coef, np.zeros(arr.size, dtype=np.int64), variables, arr.shape)
+
+
+def _linear_operand(arg):
+    """Classify a ufunc operand
+
+    Returns a LinearNDArray (for linear operands), a numeric ndarray
+    (for constant operands), or None.
+
+    """
+    if arg.__class__ is LinearNDArray:
+        return arg
+    if arg.__class__ in native_numeric_types:
+        return np.asarray(arg)
+    if arg.__class__ is str or scipy.sparse.issparse(arg):
+        return None
+    arr = np.asarray(arg)
+    if arr.dtype.kind in 'biuf':
+        return arr
+    if arr.dtype.kind == 'O' and arr.size:
+        return _linear_from_array(arr)
+    return None
+
+
+def _merge_variables(a, b):
+    """Express the coefficients of `a` and `b` over a common variable list"""
+    if a._vars is b._vars:
+        return a._vars, a._coef, b._coef
+    index = {id(v): i for i, v in enumerate(a._vars)}
+    variables = list(a._vars)
+    cols = np.empty(len(b._vars), dtype=np.int64)
+    for j, v in enumerate(b._vars):
+        i = index.get(id(v), None)
+        if i is None:
+            i = index[id(v)] = len(variables)
+            variables.append(v)
+        cols[j] = i
+    n = len(variables)
+    A = a._coef
+    A = scipy.sparse.csr_array((A.data, A.indices, A.indptr), shape=(A.shape[0], n))
+    B = b._coef
+    B = scipy.sparse.csr_array(
+        (B.data, cols[B.indices], B.indptr), shape=(B.shape[0], n)
+    )
+    return variables, A, B
+
+
+def _linear_add(a, b):
+    shape = np.broadcast_shapes(a.shape, b.shape)
+    if a.__class__ is not LinearNDArray:
+        a, b = b, a
+    coef, const = a._broadcast(shape)
+    if b.__class__ is not LinearNDArray:
+        const = const + np.broadcast_to(b, shape).ravel()
+        return _linear_result(coef, const, a._vars, shape)
+    variables, A, B = _merge_variables(a, b)
+    a = LinearNDArray(A, a._const, variables, a.shape)
+    b = LinearNDArray(B, b._const, variables, b.shape)
+    coef_a, const_a = a._broadcast(shape)
+    coef_b, const_b = b._broadcast(shape)
+    return _linear_result(coef_a + coef_b, const_a + const_b, variables, shape)
+
+
+def _linear_negative(a):
+    return LinearNDArray(-a._coef, -a._const, a._vars, a.shape)
+
+
+def _linear_subtract(a, b):
+    if b.__class__ is LinearNDArray:
+        return _linear_add(a, _linear_negative(b))
+    return _linear_add(a, -b)
+
+
+def _linear_multiply(a, b):
+    if a.__class__ is LinearNDArray:
+        if b.__class__ is LinearNDArray:
+            # Nonlinear: fall back on elementwise expression generation
+            return NotImplemented
+        a, b = b, a
+    shape = np.broadcast_shapes(a.shape, b.shape)
+    coef, const = b._broadcast(shape)
+    a = np.broadcast_to(a, shape).ravel()
+    return _linear_result(
+        scipy.sparse.diags_array(a, dtype=a.dtype) @ coef, a * const, b._vars, shape
+    )
+
+
+def _linear_true_divide(a, b):
+    if b.__class__ is LinearNDArray:
+        return NotImplemented
+    return _linear_multiply(a, 1 / b)
+
+
+def _linear_matmul(a, b):
+    if a.__class__ is b.__class__:
+        return NotImplemented
+    if not (1 <= a.ndim <= 2 and 1 <= b.ndim <= 2):
+        return NotImplemented
+    if a.shape[-1] != b.shape[0]:
+        raise ValueError(
+            f"matmul: operands with shapes {a.shape} and {b.shape} are not aligned"
+        )
+    # Treat both operands as matrices, and then drop the extra
+    # dimensions following the NumPy rules for 1-D operands
+    m = a.shape[0] if a.ndim == 2 else 1
+    p = b.shape[1] if b.ndim == 2 else 1
+    shape = (m,) * (a.ndim - 1) + (p,) * (b.ndim - 1)
+    if b.__class__ is LinearNDArray:
+        # Element (i, k) is sum_j a[i, j] * b[j, k]
+        M = scipy.sparse.csr_array(a.reshape(m, -1))
+        if p > 1:
+            M = scipy.sparse.kron(
+                M, scipy.sparse.eye_array(p, dtype=M.dtype), format='csr'
+            )
+        variables = b._vars
+        b = b._coef, b._const
+    else:
+        M = scipy.sparse.csr_array(b.reshape(-1, p).T)
+        if m > 1:
+            M = scipy.sparse.kron(
+                scipy.sparse.eye_array(m, dtype=M.dtype), M, format='csr'
+            )
+        variables = a._vars
+        b = a._coef, a._const
+    return _linear_result(M @ b[0], M @ b[1], variables, shape)
+
+
+_linear_ufunc_handlers = {
+    'add': _linear_add,
+    'subtract': _linear_subtract,
+    'multiply': _linear_multiply,
+    'true_divide': _linear_true_divide,
+    'divide': _linear_true_divide,
+    'negative': _linear_negative,
+    'positive': lambda a: a,
+    'matmul': _linear_matmul,
+}
@@ -59,6 +59,7 @@ from pyomo.core.base.block import (
     SubclassOf,
     BlockData,
     declare_custom_block,
+    _get_structure_cache,
 )
 import pyomo.core.expr as EXPR
 from pyomo.opt import check_available_solvers
@@ -3592,6 +3593,42 @@ class TestBlock(unittest.TestCase):
             ],
         )
 
+    def test_structure_cache(self):
+        m = ConcreteModel()
+        m.b = Block()
+        m.b.c = Block()
+        other = ConcreteModel()
+
+        def cache(blk):
+            return _get_structure_cache(blk, '_test_cache')
+
+        caches = [cache(blk) for blk in (m, m.b, m.b.c)]
+        self.assertEqual(
+            [cache(blk) is c for blk, c in zip((m, m.b, m.b.c), caches)], [True] * 3
+        )
+        # Changes to other models do not invalidate the caches
+        other.x = Var()
+        self.assertTrue(all(cache(blk) is c for blk, c in zip((m, m.b, m.b.c), caches)))
+        # Changes to a block invalidate the caches on the block and
+        # the blocks that contain it, but not on its sub-blocks
+        m.b.x = Var()
+        self.assertIsNot(cache(m), caches[0])
+        self.assertIsNot(cache(m.b), caches[1])
+        self.assertIs(cache(m.b.c), caches[2])
+        caches = [cache(blk) for blk in (m, m.b, m.b.c)]
+        m.b.del_component(m.b.x)
+        self.assertIsNot(cache(m), caches[0])
+        self.assertIs(cache(m.b.c), caches[2])
+        caches[0] = cache(m)
+        m.b.c.reclassify_component_type(m.b.c, Block)
+        m.y = Var()
+        m.reclassify_component_type(m.y, Param)
+        self.assertIsNot(cache(m), caches[0])
+        self.assertIs(cache(m.b.c), caches[2])
+        # Caches are not carried along by clone()
+        caches[2]['data'] = 1
+        self.assertNotIn('data', cache(m.clone().b.c))
+
     def test_private_data(self):
         m = ConcreteModel()
         m.b = Block()
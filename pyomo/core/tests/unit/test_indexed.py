@@ -21,6 +21,7 @@ from pyomo.common import DeveloperError
 import pyomo.common.unittest as unittest
 from pyomo.common.log import LoggingIntercept
 
+from pyomo.common.dependencies import numpy as np, numpy_available
 from pyomo.environ import ConcreteModel, Var, Param, Set, value, Integers
 from pyomo.core.base.set import FiniteSetOf, OrderedSetOf
 from pyomo.core.base.indexed_component import normalize_index
@@ -422,6 +423,112 @@ class TestIndexedComponent(unittest.TestCase):
         ):
             m.x[3].index()
 
+    def test_getitems(self):
+        m = ConcreteModel()
+        m.I = Set(initialize=[1, 2, 3])
+        m.x = Var(m.I, m.I)
+        m.p = Param(m.I, m.I, initialize={(1, 1): 5}, default=0)
+        m.y = Var(Integers, dense=False)
+
+        keys = [(3, 1), (1, 2), (2, 2)]
+        self.assertEqual(m.x.getitems(keys), [m.x[k] for k in keys])
+        self.assertEqual(m.x.getitems(iter(keys)), [m.x[k] for k in keys])
+        self.assertEqual(m.x.getitems([]), [])
+        # Non-normalized and unhashable indices
+        self.assertEqual(m.x.getitems([((1,), 2), [2, 3]]), [m.x[1, 2], m.x[2, 3]])
+        # Default values
+        self.assertEqual(m.p.getitems([(1, 1), (2, 3), (1, 1)]), [5, 0, 5])
+        # Sparse components
+        self.assertEqual(len(m.y), 0)
+        self.assertEqual(m.y.getitems([5, 1]), [m.y[5], m.y[1]])
+        self.assertEqual(len(m.y), 2)
+        # Slices
+        (ans,) = m.x.getitems([(1, slice(None))])
+        self.assertEqual(list(ans), [m.x[1, 1], m.x[1, 2], m.x[1, 3]])
+
+        with self.assertRaisesRegex(
+            KeyError, r"Index '\(1, 4\)' is not valid for indexed component 'x'"
+        ):
+            m.x.getitems([(1, 1), (1, 4)])
+
+        m.z = Var(m.I, m.I)
+        m.z._constructed = False
+        with self.assertRaisesRegex(
+            ValueError, "The component has not been constructed"
+        ):
+            m.z.getitems([(1, 1)])
+
+    @unittest.skipUnless(numpy_available, "requires numpy")
+    def test_getitems_ndarray(self):
+        m = ConcreteModel()
+        m.I = Set(initialize=[1, 2, 3])
+        m.x = Var(m.I, m.I)
+        m.y = Var(m.I)
+
+        keys = np.array([[3, 1], [1, 2]])
+        self.assertEqual(m.x.getitems(keys), [m.x[3, 1], m.x[1, 2]])
+        self.assertEqual(m.y.getitems(np.array([2, 1])), [m.y[2], m.y[1]])
+        with self.assertRaisesRegex(ValueError, "one- or two-dimensional"):
+            m.x.getitems(np.zeros((1, 1, 1)))
+
+    def test_nested_index_cache(self):
+        m = ConcreteModel()
+        m.I = Set(initialize=[1, 2, 3])
+        m.J = Set(initialize=[(1, 2), (3, 4)])
+        m.x = Var(m.I, m.J)
+        m.p = Param(m.I, m.I, initialize={(1, 1): 5}, default=0)
+        self.assertIsNone(m.x._index_cache)
+
+        # Normalized indices are never cached
+        self.assertIs(m.x[1, 1, 2], m.x._data[1, 1, 2])
+        self.assertIsNone(m.x._index_cache)
+
+        self.assertIs(m.x[1, (1, 2)], m.x._data[1, 1, 2])
+        self.assertEqual(m.x._index_cache, {(1, (1, 2)): (1, 1, 2)})
+        self.assertIs(m.x[1, (1, 2)], m.x._data[1, 1, 2])
+        self.assertIs(m.x[((1,), (1, 2))], m.x._data[1, 1, 2])
+        self.assertEqual(len(m.x._index_cache), 2)
+
+        # Indices containing components are not cached
+        m.q = Param(initialize=1)
+        self.assertIs(m.x[m.q, (1, 2)], m.x._data[1, 1, 2])
+        self.assertEqual(len(m.x._index_cache), 2)
+
+        # Cached entries are only used if the data is still present
+        old = m.x[1, 1, 2]
+        del m.x[1, 1, 2]
+        new = m.x[1, (1, 2)]
+        self.assertIsNot(new, old)
+        self.assertIs(new, m.x._data[1, 1, 2])
+
+        # Default values are not cached
+        self.assertEqual(m.p[(2,), 3], 0)
+        self.assertIsNone(m.p._index_cache)
+
+        # Clearing the component clears the cache
+        m.x.clear()
+        self.assertIsNone(m.x._index_cache)
+
+    def test_index_cache_size(self):
+        m = ConcreteModel()
+        m.J = Set(initialize=[(i, i) for i in range(10)])
+        m.x = Var([1], m.J)
+        m.x._INDEX_CACHE_MIN_SIZE = 5
+        for i in range(10):
+            self.assertIs(m.x[1, (i, i)], m.x._data[1, i, i])
+        # The cache is bounded by the number of component entries...
+        self.assertEqual(len(m.x._index_cache), 10)
+        for i in range(10):
+            self.assertIs(m.x[(1,), (i, i)], m.x._data[1, i, i])
+        self.assertEqual(len(m.x._index_cache), 10)
+        # ... and keeps the most recent entries
+        self.assertEqual(list(m.x._index_cache), [((1,), (i, i)) for i in range(10)])
+        # ... unless _INDEX_CACHE_MIN_SIZE is larger
+        m.x._INDEX_CACHE_MIN_SIZE = 15
+        for i in range(10):
+            self.assertIs(m.x[(1, i), i], m.x._data[1, i, i])
+        self.assertEqual(len(m.x._index_cache), 15)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -9,10 +9,28 @@
 #  This software is distributed under the 3-clause BSD License.
 #  ___________________________________________________________________________
 
+import io
+from unittest import mock
+
 import pyomo.common.unittest as unittest
 import pyomo.environ as pyo
 
-from pyomo.core.base.matrix_constraint import MatrixConstraint
+from pyomo.common.dependencies import (
+    numpy as np,
+    numpy_available,
+    scipy,
+    scipy_available,
+)
+from pyomo.core.base.matrix_constraint import MatrixConstraint, _MatrixConstraintData
+from pyomo.core.expr.numeric_expr import LinearExpression
+from pyomo.core.expr.relational_expr import (
+    EqualityExpression,
+    InequalityExpression,
+    RangedExpression,
+)
+from pyomo.repn.plugins.lp_writer import LPWriter
+from pyomo.repn.plugins.nl_writer import NLWriter
+from pyomo.repn.plugins.standard_form import LinearStandardFormCompiler
 
 
 def _create_variable_list(size, **kwds):
@@ -94,5 +112,139 @@ class TestMatrixConstraint(unittest.TestCase):
             self.assertEqual(c.equality, True)
 
 
+def _sparse_models():
+    # The same LP written with a MatrixConstraint and with Constraints
+    A = [[1.0, -1.0, 0, 2.0], [0, 3.0, 0, -1.0], [1.0, 0, 1.0, 0], [0, 0, 0, 1.5]]
+    lb = [None, 1.0, -2.0, -1.0]
+    ub = [0.0, 1.0, 5.0, None]
+    models = []
+    for matrix in (True, False):
+        m = pyo.ConcreteModel()
+        m.x = pyo.Var(range(4), bounds=(-10, 10))
+        m.o = pyo.Objective(expr=m.x[0] + 2 * m.x[1] - m.x[3])
+        if matrix:
+            m.c = MatrixConstraint.from_sparse(
+                scipy.sparse.coo_array(A), np.array(lb, dtype=float), ub, m.x
+            )
+        else:
+            m.c = pyo.Constraint(
+                range(4),
+                rule=lambda m, i: (
+                    lb[i],
+                    LinearExpression(
+                        linear_coefs=[a for a in A[i] if a],
+                        linear_vars=[m.x[j] for j, a in enumerate(A[i]) if a],
+                    ),
+                    ub[i],
+                ),
+            )
+        models.append(m)
+    return models
+
+
+@unittest.skipUnless(numpy_available and scipy_available, "requires numpy, scipy")
+class TestMatrixConstraintFromSparse(unittest.TestCase):
+    def test_from_sparse(self):
+        m, ref = _sparse_models()
+        self.assertEqual(len(m.c), 4)
+        self.assertEqual(list(m.c), [0, 1, 2, 3])
+        self.assertIn(2, m.c)
+        self.assertNotIn(4, m.c)
+        self.assertEqual(
+            [c.name for c in m.component_data_objects(pyo.Constraint)],
+            ['c[0]', 'c[1]', 'c[2]', 'c[3]'],
+        )
+        for c, c_ref in zip(m.c.values(), ref.c.values()):
+            self.assertEqual(c.lb, c_ref.lb)
+            self.assertEqual(c.ub, c_ref.ub)
+            self.assertEqual(c.equality, c_ref.equality)
+            self.assertEqual(str(c.body), str(c_ref.body))
+        self.assertIs(m.c[0].lower, None)
+        self.assertIs(m.c[3].upper, None)
+
+        self.assertIs(m.c[0].expr.__class__, InequalityExpression)
+        self.assertIs(m.c[1].expr.__class__, EqualityExpression)
+        self.assertIs(m.c[2].expr.__class__, RangedExpression)
+        self.assertEqual(str(m.c[2].expr), "-2.0  <=  x[0] + x[2]  <=  5.0")
+
+        m.x.set_values({0: 1, 1: 2, 2: 3, 3: 4})
+        self.assertEqual([c() for c in m.c.values()], [7, 2, 4, 6])
+
+        repn = m.c[0].canonical_form()
+        self.assertEqual(repn.linear_vars, (m.x[0], m.x[1], m.x[3]))
+        self.assertEqual(repn.linear_coefs, (1, -1, 2))
+        m.x[1].fix(2)
+        repn = m.c[0].canonical_form()
+        self.assertEqual(repn.linear_vars, (m.x[0], m.x[3]))
+        self.assertEqual(repn.constant, -2)
+
+    def test_to_sparse(self):
+        m = _sparse_models()[0]
+        A, lb, ub, x = m.c.to_sparse()
+        self.assertEqual(A.shape, (4, 4))
+        self.assertEqual(A.nnz, 8)
+        self.assertEqual(x, tuple(m.x.values()))
+        self.assertEqual(lb.tolist(), [-float('inf'), 1, -2, -1])
+        self.assertEqual(ub.tolist(), [0, 1, 5, float('inf')])
+
+        # Duplicate entries are summed (without changing the argument)
+        A = scipy.sparse.coo_array(([1.0, 2.0, 3.0], ([0, 0, 1], [1, 1, 0])))
+        m.d = MatrixConstraint.from_sparse(A, 0, None, [m.x[0], m.x[1]])
+        self.assertEqual(str(m.d[0].body), "3.0*x[1]")
+        self.assertEqual(A.nnz, 3)
+        self.assertEqual(m.d[1].lb, 0)
+        self.assertIsNone(m.d[1].ub)
+
+        # Empty rows
+        m.e = MatrixConstraint.from_sparse(
+            scipy.sparse.csr_array((2, 2)), [None, 1], 2, [m.x[0], m.x[1]]
+        )
+        self.assertEqual(m.e[0].body(), 0)
+        self.assertEqual(m.e[1].canonical_form().linear_vars, ())
+
+    def test_from_sparse_errors(self):
+        m = pyo.ConcreteModel()
+        m.x = pyo.Var(range(2))
+        A = scipy.sparse.eye(3)
+        with self.assertRaisesRegex(ValueError, "has 3 columns, but 2 variables"):
+            MatrixConstraint.from_sparse(A, None, None, m.x)
+        with self.assertRaisesRegex(ValueError, "Expected 3 values for 'ub'"):
+            MatrixConstraint.from_sparse(A, None, [1, 2], [m.x[0], m.x[1], m.x[0]])
+
+    def test_writers(self):
+        m, ref = _sparse_models()
+        for model in m, ref:
+            model.x[2].fix(1)
+        for writer in (
+            lambda m, buf: LPWriter().write(m, buf),
+            lambda m, buf: NLWriter().write(m, buf, io.StringIO(), io.StringIO()),
+        ):
+            buf = io.StringIO()
+            writer(m, buf)
+            ref_buf = io.StringIO()
+            writer(ref, ref_buf)
+            self.assertEqual(buf.getvalue(), ref_buf.getvalue())
+
+        for options in ({}, {'mixed_form': True}, {'slack_form': True}):
+            repn = LinearStandardFormCompiler().write(m, **options)
+            ref_repn = LinearStandardFormCompiler().write(ref, **options)
+            self.assertEqual(repn.A.toarray().tolist(), ref_repn.A.toarray().tolist())
+            self.assertEqual(list(repn.rhs), list(ref_repn.rhs))
+            self.assertEqual(
+                [v.name for v in repn.columns], [v.name for v in ref_repn.columns]
+            )
+
+    def test_writers_do_not_build_expressions(self):
+        m = _sparse_models()[0]
+
+        def _fail(self):
+            raise AssertionError("body should not be generated")
+
+        with mock.patch.object(_MatrixConstraintData, 'body', property(_fail)):
+            LPWriter().write(m, io.StringIO())
+            NLWriter().write(m, io.StringIO(), io.StringIO(), io.StringIO())
+            LinearStandardFormCompiler().write(m)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -44,7 +44,9 @@ from pyomo.environ import (
     ObjectiveList,
     ConstraintList,
     Model,
+    Expression,
 )
+from pyomo.core.base.constraint import IndexedConstraint
 from pyomo.opt import check_available_solvers
 from pyomo.opt.parallel.local import SolverManager_Serial
 
@@ -985,5 +987,135 @@ class Test(unittest.TestCase):
             m = Model()
 
 
+def _lazy_model():
+    # Note: rules are module-level functions so that instances can be
+    # pickled
+    m = AbstractModel()
+    m.I = Set()
+    m.p = Param(m.I)
+    m.x = Var(m.I, bounds=(0, 10))
+    m.e = Expression(m.I, rule=_lazy_e_rule)
+    m.c = Constraint(m.I, rule=_lazy_c_rule)
+    m.d = Constraint(m.I, rule=_lazy_d_rule)
+    m.o = Objective(m.I, rule=_lazy_o_rule)
+    return m
+
+
+def _lazy_e_rule(m, i):
+    return m.p[i] * m.x[i]
+
+
+def _lazy_c_rule(m, i):
+    return m.e[i] <= 3
+
+
+def _lazy_d_rule(m, i):
+    return m.x[i] >= 1
+
+
+def _lazy_o_rule(m, i):
+    return sum(m.x[j] for j in m.I if j != i)
+
+
+_lazy_data = {None: {'I': {None: [1, 2, 3]}, 'p': {1: 1, 2: 2, 3: 3}}}
+
+
+class TestLazyConstruction(unittest.TestCase):
+    def test_deferred(self):
+        m = _lazy_model()
+        inst = m.create_instance(data=_lazy_data, lazy=True)
+        self.assertTrue(inst.I._constructed)
+        self.assertTrue(inst.p._constructed)
+        for comp in (inst.x, inst.e, inst.c, inst.d, inst.o):
+            self.assertFalse(comp._constructed)
+            self.assertTrue(comp.is_constructed())
+        self.assertTrue(inst.is_constructed())
+
+        # Accessing a component constructs it (and its dependencies)
+        self.assertEqual(str(inst.c[2].body), 'e[2]')
+        self.assertIs(type(inst.c), IndexedConstraint)
+        for comp in (inst.x, inst.e, inst.c):
+            self.assertTrue(comp._constructed)
+        self.assertEqual(str(inst.e[2].expr), '2*x[2]')
+        self.assertEqual(len(inst.x), 3)
+        for comp in (inst.d, inst.o):
+            self.assertFalse(comp._constructed)
+
+        # Iteration and explicit construction
+        self.assertEqual(list(inst.d), [1, 2, 3])
+        self.assertTrue(inst.d._constructed)
+        inst.o.construct()
+        self.assertTrue(inst.o._constructed)
+        self.assertEqual(str(inst.o[1].expr), 'x[2] + x[3]')
+
+    def test_scalar_components_are_not_deferred(self):
+        m = AbstractModel()
+        m.I = Set(initialize=[1, 2])
+        m.x = Var(m.I)
+        m.y = Var()
+        m.o = Objective(rule=lambda m: m.y + sum(m.x[i] for i in m.I))
+        inst = m.create_instance(lazy=True)
+        self.assertTrue(inst.y._constructed)
+        self.assertTrue(inst.o._constructed)
+        # x was constructed when the objective rule used it
+        self.assertTrue(inst.x._constructed)
+
+    def test_deactivate(self):
+        m = _lazy_model()
+        inst = m.create_instance(data=_lazy_data, lazy=True)
+        inst.d.deactivate()
+        inst.o[2].deactivate()
+        inst.o[3].deactivate()
+        self.assertFalse(inst.d._constructed)
+        self.assertFalse(inst.d.active)
+
+        ref = m.create_instance(data=_lazy_data)
+        ref.d.deactivate()
+        ref.o[2].deactivate()
+        ref.o[3].deactivate()
+
+        TempfileManager.push()
+        try:
+            fname = TempfileManager.create_tempfile(suffix='.lp')
+            inst.write(fname, io_options={'symbolic_solver_labels': True})
+            with open(fname) as FILE:
+                lazy_lp = FILE.read()
+            ref.write(fname, io_options={'symbolic_solver_labels': True})
+            with open(fname) as FILE:
+                ref_lp = FILE.read()
+        finally:
+            TempfileManager.pop()
+        self.assertEqual(lazy_lp, ref_lp)
+        # The deactivated constraint was not needed by the writer
+        self.assertFalse(inst.d._constructed)
+
+        # Components deactivated before construction have inactive data
+        self.assertEqual(len(inst.d), 3)
+        self.assertFalse(inst.d.active)
+        self.assertFalse(any(cdata.active for cdata in inst.d.values()))
+        inst.d.activate()
+        self.assertTrue(all(cdata.active for cdata in inst.d.values()))
+
+    def test_clone_and_pickle(self):
+        m = _lazy_model()
+        inst = m.create_instance(data=_lazy_data, lazy=True)
+        inst.d.deactivate()
+
+        # Clones remain lazy
+        new = inst.clone()
+        self.assertFalse(new.c._constructed)
+        self.assertFalse(new.d.active)
+        self.assertEqual(str(new.c[1].body), 'e[1]')
+        self.assertIs(new.c[1].body.parent_component(), new.e)
+        self.assertFalse(inst.c._constructed)
+
+        # Pickling constructs the deferred components
+        new = pickle.loads(pickle.dumps(inst))
+        self.assertIs(type(new.c), IndexedConstraint)
+        self.assertEqual(str(new.c[1].body), 'e[1]')
+        self.assertFalse(new.d.active)
+        self.assertFalse(new.d[1].active)
+
+
 if __name__ == "__main__":
     unittest.main()
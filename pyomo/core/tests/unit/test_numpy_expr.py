@@ -16,6 +16,7 @@ from pyomo.common.dependencies import (
     numpy_available,
     pandas as pd,
     pandas_available,
+    scipy_available,
 )
 
 from pyomo.environ import (
@@ -29,12 +30,14 @@ from pyomo.environ import (
     Reals,
 )
 from pyomo.core.expr import MonomialTermExpression
-from pyomo.core.expr.ndarray import NumericNDArray
+from pyomo.core.expr.ndarray import LinearNDArray, NumericNDArray
+from pyomo.core.expr.numeric_expr import LinearExpression, ProductExpression
 from pyomo.core.expr.numvalue import as_numeric
 from pyomo.core.expr.compare import compare_expressions
 from pyomo.core.expr.relational_expr import InequalityExpression
 
 from pyomo.repn import generate_standard_repn
+from pyomo.common.collections import ComponentMap
 
 
 @unittest.skipUnless(numpy_available, 'numpy is not available')
@@ -313,5 +316,175 @@ class TestNumPy(unittest.TestCase):
         self.assertEqual(str(expr), "v[2]  <  5")
 
 
+@unittest.skipUnless(numpy_available and scipy_available, 'requires numpy, scipy')
+class TestLinearNDArray(unittest.TestCase):
+    def _reference(self, ufunc, *args):
+        # Generate the expressions one term at a time (the
+        # NumericNDArray implementation)
+        args = [np.asarray(a) if hasattr(a, 'is_indexed') else a for a in args]
+        return NumericNDArray.__array_ufunc__(None, ufunc, '__call__', *args)
+
+    def _repn(self, expr):
+        repn = generate_standard_repn(expr, compute_values=False)
+        self.assertTrue(repn.is_linear())
+        coefs = ComponentMap()
+        for c, v in zip(repn.linear_coefs, repn.linear_vars):
+            if c:
+                coefs[v] = coefs.get(v, 0) + c
+        return repn.constant, coefs
+
+    def _check(self, lin, ref):
+        self.assertIs(type(lin), LinearNDArray)
+        self.assertEqual(lin.shape, ref.shape)
+        for a, b in zip(np.asarray(lin).flat, ref.flat):
+            const_a, coef_a = self._repn(a)
+            const_b, coef_b = self._repn(b)
+            self.assertAlmostEqual(const_a, const_b)
+            self.assertEqual(set(map(id, coef_a)), set(map(id, coef_b)))
+            for v, c in coef_a.items():
+                self.assertAlmostEqual(c, coef_b[v])
+
+    def test_matmul(self):
+        m = ConcreteModel()
+        m.x = Var(range(4))
+        m.X = Var(range(4), range(3))
+        A = np.array([[1, 2, 0, 4], [5, -1, 7, 8.5]])
+        x = LinearNDArray.from_variables(m.x)
+        X = LinearNDArray.from_variables(m.X)
+        e = A @ x
+        self.assertIs(type(e), LinearNDArray)
+        self.assertExpressionsEqual(
+            e[0], LinearExpression([m.x[0], 2.0 * m.x[1], 4.0 * m.x[3]])
+        )
+        self.assertExpressionsEqual(
+            e[1],
+            LinearExpression([5.0 * m.x[0], -1.0 * m.x[1], 7.0 * m.x[2], 8.5 * m.x[3]]),
+        )
+        self._check(A @ X, self._reference(np.matmul, A, m.X))
+        self._check(A[0] @ X, self._reference(np.matmul, A[0], m.X))
+        self._check(X.T @ A.T, self._reference(np.matmul, np.asarray(m.X).T, A.T))
+        self._check(X.T @ A[1], self._reference(np.matmul, np.asarray(m.X).T, A[1]))
+        # vector-vector products are scalar expressions
+        self.assertExpressionsEqual(
+            A[0] @ x, LinearExpression([m.x[0], 2.0 * m.x[1], 4.0 * m.x[3]])
+        )
+        with self.assertRaisesRegex(ValueError, "not aligned"):
+            A.T @ x
+
+    def test_opt_in(self):
+        m = ConcreteModel()
+        m.x = Var(range(3))
+        A = np.array([[1, 2, 0], [0, 3, -1]])
+        # Operations on indexed components still return NumPy arrays
+        e = A @ m.x
+        self.assertIs(type(e), NumericNDArray)
+        self.assertIsInstance(e, np.ndarray)
+        e = A @ LinearNDArray.from_variables(m.x) + 1
+        self.assertIs(type(e), LinearNDArray)
+        # ndarray methods that LinearNDArray does not implement are
+        # evaluated on the equivalent NumericNDArray
+        self.assertEqual(len(e.tolist()), 2)
+        self.assertIs(type(e.flatten()), NumericNDArray)
+        self.assertIs(e.astype(object).dtype, np.dtype(object))
+        self.assertExpressionsEqual(
+            abs(e)[1], abs(LinearExpression([3 * m.x[1], -1 * m.x[2], 1]))
+        )
+        with self.assertRaisesRegex(AttributeError, "no attribute '_missing'"):
+            e._missing
+
+    def test_elementwise(self):
+        m = ConcreteModel()
+        m.x = Var(range(3))
+        m.y = Var(range(2), range(3))
+        m.z = Var()
+        a = np.array([2, 0, -3.5])
+        b = np.array([[1], [2]])
+        x = LinearNDArray.from_variables(m.x)
+        y = LinearNDArray.from_variables(m.y)
+        X = np.asarray(m.x)
+        Y = np.asarray(m.y)
+        self._check(a * x, self._reference(np.multiply, a, X))
+        self._check(x / 4, self._reference(np.true_divide, X, 4))
+        self._check(x - a, self._reference(np.subtract, X, a))
+        self._check(1 - x, self._reference(np.subtract, 1, X))
+        self._check(-x, self._reference(np.negative, X))
+        self._check(+x, X)
+        # broadcasting, and merging the variable lists
+        self._check(a * x + y, a * X + Y)
+        self._check(y - (b * x + m.z), Y - (b * X + m.z))
+        self.assertEqual(len((y - x).variables), 9)
+        # x - x cancels
+        self.assertEqual(list(np.asarray(x - x)), [0, 0, 0])
+        # Elements follow the operator overloading conventions
+        self.assertExpressionsEqual(
+            list(np.asarray(a * x)), [2.0 * m.x[0], 0.0, -3.5 * m.x[2]]
+        )
+        self.assertExpressionsEqual(
+            list(np.asarray(x + 1)), [LinearExpression([m.x[i], 1]) for i in range(3)]
+        )
+
+    def test_nonlinear(self):
+        m = ConcreteModel()
+        m.x = Var(range(2))
+        x = LinearNDArray.from_variables(m.x)
+        e = x * (x + 1)
+        self.assertIs(type(e), NumericNDArray)
+        self.assertIs(type(e[0]), ProductExpression)
+        self.assertExpressionsEqual(e[1], m.x[1] * (m.x[1] + 1))
+        e = x**2
+        self.assertIs(type(e), NumericNDArray)
+        self.assertExpressionsEqual(e[0], m.x[0] ** 2)
+
+    def test_sum(self):
+        m = ConcreteModel()
+        m.y = Var(range(2), range(3))
+        y = 2 * LinearNDArray.from_variables(m.y) + 1
+        Y = 2 * np.asarray(m.y) + 1
+        self._check(y.sum(axis=0), Y.sum(axis=0))
+        self._check(y.sum(axis=-1), Y.sum(axis=1))
+        self._check(np.sum(y, axis=1, keepdims=True), Y.sum(axis=1, keepdims=True))
+        const, coefs = self._repn(np.sum(y))
+        self.assertEqual(const, 6)
+        self.assertEqual(list(coefs.values()), [2] * 6)
+        with self.assertRaisesRegex(ValueError, "Invalid axis"):
+            y.sum(axis=2)
+
+    def test_indexing(self):
+        m = ConcreteModel()
+        m.y = Var(range(2), range(3))
+        y = LinearNDArray.from_variables(m.y) - 1
+        self.assertEqual(y.shape, (2, 3))
+        self.assertEqual(y.ndim, 2)
+        self.assertEqual(y.size, 6)
+        self.assertEqual(len(y), 2)
+        self.assertExpressionsEqual(y[1, 2], LinearExpression([m.y[1, 2], -1]))
+        self._check(y[:, 1], np.asarray(m.y)[:, 1] - 1)
+        self._check(y.T, np.asarray(m.y).T - 1)
+        self._check(y.reshape(3, 2), np.asarray(m.y).reshape(3, 2) - 1)
+        self.assertEqual([r.shape for r in y], [(3,), (3,)])
+
+        A, c, v = y.to_sparse()
+        self.assertEqual(A.toarray().tolist(), np.eye(6).tolist())
+        self.assertEqual(c.tolist(), [-1] * 6)
+        self.assertEqual(v, list(m.y.values()))
+
+        with self.assertRaisesRegex(ValueError, "only Pyomo variables"):
+            LinearNDArray.from_variables([m.y[0, 0], 5])
+
+    def test_constraint(self):
+        m = ConcreteModel()
+        m.x = Var(range(3))
+        A = np.array([[1, 2, 0], [0, 3, -1]])
+        b = np.array([1, 2])
+        x = LinearNDArray.from_variables(m.x)
+        m.c = Constraint(range(2), expr=A @ x - b <= np.array([5, 6]))
+        self.assertExpressionsEqual(
+            m.c[0].expr, LinearExpression([m.x[0], 2 * m.x[1], -1]) <= 5
+        )
+        self.assertExpressionsEqual(
+            m.c[1].expr, LinearExpression([3 * m.x[1], -1 * m.x[2], -2]) <= 6
+        )
+
+
 if __name__ == '__main__':
     unittest.main()
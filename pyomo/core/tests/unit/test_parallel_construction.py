@@ -0,0 +1,217 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright (c) 2008-2025
+#  National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+#
+# Unit Tests for constructing components in worker processes
+#
+
+from io import BytesIO, StringIO
+import logging
+
+import pyomo.common.unittest as unittest
+
+from pyomo.common.collections import ComponentSet
+from pyomo.common.log import LoggingIntercept
+from pyomo.common.timing import report_timing
+from pyomo.core.base.parallel_construction import (
+    ParallelConstruction,
+    _ComponentPickler,
+    _fork_context,
+    _load,
+)
+from pyomo.core.expr.visitor import identify_variables
+from pyomo.environ import (
+    AbstractModel,
+    Block,
+    ConcreteModel,
+    Constraint,
+    Expression,
+    Objective,
+    Param,
+    RangeSet,
+    Var,
+    inequality,
+    maximize,
+    minimize,
+    sin,
+)
+
+# Rules are module-level functions (so that they behave the same way
+# in the worker processes as in the main process)
+
+
+def e_rule(m, i):
+    return m.x[i] ** 2
+
+
+def c_rule(m, i):
+    return m.e[i] + m.x[i] <= m.p[i]
+
+
+def o_rule(m, i):
+    return sum(m.x[j] for j in m.I if j <= i)
+
+
+def o_sense(m, i):
+    return maximize if i % 2 else minimize
+
+
+def bad_rule(m, i):
+    if i == 3:
+        raise RuntimeError("bad index %s" % (i,))
+    return m.x[i] >= 0
+
+
+def skip_rule(m, i):
+    if i % 2:
+        return Constraint.Skip
+    return m.x[i] >= 0
+
+
+def build_model(N=20):
+    m = AbstractModel()
+    m.I = RangeSet(N)
+    m.p = Param(m.I, initialize=lambda m, i: i)
+    m.x = Var(m.I)
+    m.e = Expression(m.I, rule=e_rule)
+    m.c = Constraint(m.I, rule=c_rule)
+    m.s = Constraint(m.I, rule=skip_rule)
+    m.o = Objective(RangeSet(3), rule=o_rule, sense=o_sense)
+    return m
+
+
+class TestComponentPickler(unittest.TestCase):
+    def test_round_trip(self):
+        m = ConcreteModel()
+        m.x = Var([1, 2, 3])
+        m.y = Var()
+        m.p = Param(mutable=True, initialize=2)
+        e = m.x[1] + m.x[2]
+        # Sums share their argument list (e.g., e1 and e2)
+        e1 = e + m.y
+        e2 = e + m.x[3]
+        values = [
+            e1,
+            e2,
+            m.p * sin(m.x[1]) <= m.y,
+            inequality(0, m.y, m.p, strict=True),
+            m.x[2] ** 2 == e1,
+        ]
+        comps = list(m.component_objects())
+        buf = BytesIO()
+        pickler = _ComponentPickler(buf, {id(c): n for n, c in enumerate(comps)})
+        pickler.dump(values)
+        # Every referenced component is only recorded once
+        self.assertEqual(pickler.refs, [(0, 1), (0, 2), (1,), (0, 3), (2,)])
+        ans = _load(buf.getvalue(), pickler.refs, comps)
+        self.assertEqual([str(v) for v in ans], [str(v) for v in values])
+        for v, ref in zip(ans, values):
+            self.assertIs(type(v), type(ref))
+            self.assertEqual(v.nargs(), ref.nargs())
+        self.assertIs(ans[2].args[1], m.y)
+        self.assertIs(ans[2].args[0].args[0], m.p)
+        self.assertTrue(ans[3].strict)
+        self.assertIs(ans[4].args[1], ans[0])
+
+
+@unittest.skipIf(_fork_context() is None, "fork() is not available")
+class TestParallelConstruction(unittest.TestCase):
+    def assertSameComponent(self, a, b):
+        self.assertEqual(list(a.keys()), list(b.keys()))
+        for i in a:
+            self.assertEqual(str(a[i].expr), str(b[i].expr))
+
+    def test_create_instance(self):
+        m = build_model()
+        serial = m.create_instance()
+        inst = m.create_instance(parallel=2)
+        self.assertTrue(inst.is_constructed())
+        for name in ('e', 'c', 's', 'o'):
+            self.assertTrue(inst.component(name).is_constructed())
+            self.assertSameComponent(serial.component(name), inst.component(name))
+        # The expressions reference the instance components (and not
+        # copies of them)
+        self.assertIs(inst.c[5].body.args[0], inst.e[5])
+        self.assertIs(inst.c[5].body.args[1], inst.x[5])
+        self.assertEqual(inst.o[1].sense, maximize)
+        self.assertEqual(inst.o[2].sense, minimize)
+
+    def test_lazy_and_parallel(self):
+        m = build_model()
+        with self.assertRaisesRegex(ValueError, "'lazy' and 'parallel'"):
+            m.create_instance(lazy=True, parallel=2)
+
+    def test_rule_error(self):
+        m = build_model()
+        m.bad = Constraint(m.I, rule=bad_rule)
+        # The component is constructed serially, which reports the error
+        OUT = StringIO()
+        with LoggingIntercept(OUT, 'pyomo.core'):
+            with self.assertRaisesRegex(RuntimeError, "bad index 3"):
+                m.create_instance(parallel=2)
+        self.assertIn(
+            "Rule failed when generating expression for Constraint bad", OUT.getvalue()
+        )
+
+    def test_dependency_on_block(self):
+        m = build_model()
+        m.b = Block()
+        m.b.y = Var(m.I)
+        m.d = Constraint(m.I, rule=lambda m, i: m.b.y[i] + m.c[i].body <= 1)
+        serial = m.create_instance()
+        inst = m.create_instance(parallel=2)
+        self.assertSameComponent(serial.d, inst.d)
+        self.assertEqual(
+            ComponentSet(identify_variables(inst.d[1].body)),
+            ComponentSet([inst.b.y[1], inst.x[1]]),
+        )
+
+    def test_scheduler(self):
+        m = build_model()
+        for comp in (m.I, m.p, m.x, m.o):
+            comp.construct()
+        m.c2 = Constraint(rule=lambda m: m.x[1] >= 0)
+        scheduler = ParallelConstruction(m, 2)
+        # Only unconstructed indexed Constraint, Objective, and
+        # Expression components are accepted
+        self.assertFalse(scheduler.add(m.p))
+        self.assertFalse(scheduler.add(m.o))
+        self.assertFalse(scheduler.add(m.c2))
+        self.assertFalse(scheduler.add(m.e, {1: 1}))
+        # Components are constructed after the components they use
+        self.assertTrue(scheduler.add(m.c))
+        self.assertTrue(scheduler.add(m.e))
+        self.assertFalse(m.c.is_constructed())
+        self.assertEqual(scheduler.run(), [])
+        self.assertTrue(m.e.is_constructed())
+        self.assertTrue(m.c.is_constructed())
+        self.assertEqual(len(m.c), 20)
+        self.assertIs(m.c[2].body.args[0], m.e[2])
+
+    def test_single_worker(self):
+        m = build_model()
+        # Nothing is run in parallel with only one worker
+        scheduler = ParallelConstruction(m, 1)
+        self.assertFalse(scheduler.add(m.c))
+
+    def test_report_timing(self):
+        m = build_model()
+        OUT = StringIO()
+        with report_timing(OUT, level=logging.INFO):
+            m.create_instance(parallel=2)
+        self.assertRegex(
+            OUT.getvalue(),
+            r"seconds to construct Constraint c; 20 indices total "
+            r"\(in parallel: \d+ tasks, [0-9.]+ seconds in workers\)",
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,222 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright (c) 2008-2025
+#  National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+
+from io import StringIO
+
+import pyomo.common.unittest as unittest
+from pyomo.common.dependencies import pint_available
+from pyomo.common.tempfiles import TempfileManager
+from pyomo.core.base import serialization
+from pyomo.environ import (
+    Any,
+    Binary,
+    Block,
+    BooleanVar,
+    ConcreteModel,
+    Constraint,
+    ConstraintList,
+    Expression,
+    Expr_if,
+    NonNegativeIntegers,
+    Objective,
+    Param,
+    RangeSet,
+    Reference,
+    Set,
+    Suffix,
+    Var,
+    exp,
+    inequality,
+    maximize,
+    sqrt,
+    units,
+    value,
+)
+
+
+def _pprint(m):
+    OUT = StringIO()
+    m.pprint(ostream=OUT)
+    return OUT.getvalue()
+
+
+def _make_model():
+    m = ConcreteModel(name='test model')
+    m.I = Set(initialize=['a', 'b', 'c'])
+    m.J = RangeSet(3)
+    m.S = Set(initialize=[3, 1, 2], ordered=Set.SortedOrder)
+    m.U = Set(initialize=[(1, 'a'), (2, 'b')], dimen=2)
+    m.E = Set(dimen=2)
+    m.R = RangeSet(0, 1, 0.25)
+    m.IS = Set(m.S, initialize={1: [1, 2], 2: [3], 3: []})
+    m.SU = m.S * m.U
+    m.p = Param(m.I, initialize={'a': 1, 'b': 2.5, 'c': 3}, mutable=True)
+    m.q = Param(initialize=5)
+    m.big = Param(initialize=2**70)
+    m.s = Param(m.S, initialize={1: 'x'}, default='d', within=Any)
+    m.pm = Param(m.S, mutable=True, default=1.5)
+    m.x = Var(m.I, m.J, bounds=(0, 10), initialize=1)
+    m.y = Var(domain=Binary)
+    m.y.fix(1)
+    m.z = Var([1, 2], bounds=(m.p['a'], None))
+    m.v = Var(m.SU, within=NonNegativeIntegers)
+    m.w = Var(m.R, bounds=(-1, 1))
+    m.e = Expression(expr=sum(m.x[i, j] * m.p[i] for i in m.I for j in m.J))
+    m.ee = Expression(
+        m.S,
+        rule=lambda m, i: Expr_if(m.w[0] >= 0, m.w[0], -m.w[0])
+        + abs(m.w[1])
+        + sqrt(m.pm[i]),
+    )
+    m.c = Constraint(m.I, rule=lambda m, i: sum(m.x[i, j] for j in m.J) <= m.p[i])
+    m.r = Constraint(expr=inequality(0, exp(m.z[1]) + m.z[2] ** 2, 4))
+    m.cl = ConstraintList()
+    m.cl.add(m.w[0] == 3)
+    m.cl.add(m.w[0] + m.w[1] >= 3)
+    m.cl[2].deactivate()
+    m.o = Objective(expr=m.e + m.q * m.y, sense=maximize)
+    m.oi = Objective(m.S, rule=lambda m, i: m.pm[i] * m.w[0] ** i)
+    m.oi.deactivate()
+    m.co = Constraint(expr=m.oi[1] + m.ee[1] + 2 * m.pm[2] <= 5)
+    m.b = Block([1, 2])
+    m.b[1].v = Var()
+    m.b[1].c = Constraint(expr=m.b[1].v + m.y == 1)
+    m.b[1].sub = Block(m.S)
+    m.b[1].sub[1].z = Var(m.IS[1])
+    m.b[2].deactivate()
+    m.dual = Suffix(direction=Suffix.IMPORT)
+    m.dual[m.c['a']] = 3.5
+    m.dual[m.b[1].sub[2]] = 1
+    m.dual[m.v] = 4
+    m.ref = Reference(m.x[:, 1])
+    return m
+
+
+class TestSerialization(unittest.TestCase):
+    def test_round_trip_bytes(self):
+        m = _make_model()
+        data = m.to_bytes()
+        self.assertIsInstance(data, bytes)
+        self.assertEqual(data[:8], b'PYOMOSER')
+        m2 = ConcreteModel.from_bytes(data)
+        self.assertIs(type(m2), ConcreteModel)
+        self.assertEqual(m2.name, 'test model')
+        # The Reference is restored over an explicit mapping (and so
+        # its index set prints differently)
+        ref = m.ref
+        m.del_component(ref)
+        ref2 = m2.ref
+        m2.del_component(ref2)
+        self.assertEqual(_pprint(m), _pprint(m2))
+
+        self.assertEqual(list(ref2.keys()), ['a', 'b', 'c'])
+        self.assertIs(ref2['b'], m2.x['b', 1])
+        self.assertIs(m2.z[1].lower, m2.p['a'])
+        self.assertIs(type(m2.big.value), int)
+        self.assertEqual(m2.big.value, 2**70)
+        self.assertEqual(m2.s[2], 'd')
+        self.assertEqual(m2.dual[m2.c['a']], 3.5)
+        self.assertEqual(m2.dual[m2.b[1].sub[2]], 1)
+        self.assertEqual(m2.dual[m2.v], 4)
+        self.assertFalse(m2.oi.active)
+        self.assertFalse(m2.b[2].active)
+        self.assertTrue(m2.cl[1].active)
+        self.assertFalse(m2.cl[2].active)
+        self.assertFalse(m2.y.stale)
+        self.assertTrue(m2.z[1].stale)
+
+        # The restored model is independent of the original
+        m2.p['a'] = 10
+        self.assertEqual(value(m2.z[1].lb), 10)
+        self.assertEqual(value(m.z[1].lb), 1)
+
+    def test_round_trip_file(self):
+        m = _make_model()
+        m.del_component(m.ref)
+        ref = _pprint(m)
+        with TempfileManager.new_context() as TMP:
+            fname = TMP.create_tempfile(suffix='.pyomo')
+            m.to_file(fname)
+            self.assertEqual(_pprint(ConcreteModel.from_file(fname)), ref)
+            self.assertEqual(
+                _pprint(ConcreteModel.from_file(fname, use_mmap=False)), ref
+            )
+
+    def test_subblock(self):
+        m = ConcreteModel()
+        m.x = Var()
+        m.b = Block()
+        m.b.y = Var([1, 2], initialize=3)
+        m.b.c = Constraint(expr=m.b.y[1] + m.b.y[2] <= 4)
+        m2 = ConcreteModel.from_bytes(m.b.to_bytes())
+        self.assertEqual(m2.name, 'b')
+        self.assertEqual(str(m2.c.expr), 'y[1] + y[2]  <=  4')
+        self.assertEqual(m2.y[2].value, 3)
+
+        m.b.d = Constraint(expr=m.b.y[1] >= m.x)
+        with self.assertRaisesRegex(
+            ValueError,
+            "Cannot serialize reference to 'x': the component is not "
+            "within the scope of the serialized block",
+        ):
+            m.b.to_bytes()
+
+    def test_unsupported(self):
+        m = ConcreteModel()
+        m.x = BooleanVar()
+        with self.assertRaisesRegex(
+            ValueError,
+            "Cannot serialize component 'x': components of type "
+            "'BooleanVar' are not supported",
+        ):
+            m.to_bytes()
+
+        m = ConcreteModel()
+        m.p = Param(initialize=object(), within=Any)
+        with self.assertRaisesRegex(ValueError, "Cannot serialize value"):
+            m.to_bytes()
+
+    @unittest.skipUnless(pint_available, "units require pint")
+    def test_units(self):
+        m = ConcreteModel()
+        m.x = Var(units=units.m)
+        with self.assertRaisesRegex(
+            ValueError,
+            "Cannot serialize component 'x': components with units "
+            "are not supported",
+        ):
+            m.to_bytes()
+
+    def test_invalid_data(self):
+        with self.assertRaisesRegex(ValueError, "data is truncated"):
+            ConcreteModel.from_bytes(b'PYOMO')
+        with self.assertRaisesRegex(ValueError, "unrecognized file header"):
+            ConcreteModel.from_bytes(b'NOTPYOMO' + bytes(8))
+
+        data = bytearray(ConcreteModel().to_bytes())
+        data[8] = serialization.FORMAT_VERSION + 1
+        with self.assertRaisesRegex(ValueError, "format version 2 is newer"):
+            ConcreteModel.from_bytes(data)
+
+    def test_shared_tables(self):
+        m = ConcreteModel()
+        m.I = Set(initialize=range(100))
+        m.x = Var(m.I, initialize=1.5)
+        m.y = Var(m.I, initialize=1.5)
+        writer = serialization._ModelWriter().write(m)
+        # Every index and every distinct float is only stored once
+        self.assertEqual(len(writer.tables['key.off']), 101)
+        self.assertEqual(len(writer.tables['flt']), 0)
+        self.assertEqual(len(writer.tables['var.val']), 200)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -60,6 +60,7 @@ from pyomo.core.base.set import (
     OrderedSetOf,
     FiniteSetOf,
     InfiniteSetOf,
+    ColumnarSet,
     RangeSet,
     FiniteRangeSetData,
     InfiniteRangeSetData,
@@ -5881,6 +5882,131 @@ class TestAbstractSetAPI(unittest.TestCase):
             s.ord(0)
 
 
+@unittest.skipUnless(numpy_available, "ColumnarSet requires numpy")
+class TestColumnarSet(unittest.TestCase):
+    def test_api(self):
+        m = ConcreteModel()
+        m.I = Set(initialize=[1, 2, 3])
+        m.J = Set(initialize=['a', 'b'])
+        m.S = ColumnarSet(columns=([3, 1, 2], ['b', 'a', 'b']), within=m.I * m.J)
+        self.assertIs(m.S.ctype, ColumnarSet)
+        self.assertTrue(m.S.is_constructed())
+        self.assertTrue(m.S.isfinite())
+        self.assertTrue(m.S.isordered())
+        self.assertEqual(m.S.dimen, 2)
+        self.assertEqual(len(m.S), 3)
+        self.assertEqual(list(m.S), [(3, 'b'), (1, 'a'), (2, 'b')])
+        self.assertEqual(list(reversed(m.S)), [(2, 'b'), (1, 'a'), (3, 'b')])
+        self.assertEqual(m.S.data(), ((3, 'b'), (1, 'a'), (2, 'b')))
+        self.assertEqual(m.S.ordered_data(), ((3, 'b'), (1, 'a'), (2, 'b')))
+        self.assertEqual(m.S.sorted_data(), ((1, 'a'), (2, 'b'), (3, 'b')))
+        # Iteration returns the same (cached) tuples
+        for a, b in zip(m.S, m.S):
+            self.assertIs(a, b)
+
+        self.assertIn((1, 'a'), m.S)
+        self.assertNotIn((1, 'b'), m.S)
+        self.assertNotIn([1, 'b'], m.S)
+        self.assertEqual(m.S.at(1), (3, 'b'))
+        self.assertEqual(m.S.at(-1), (2, 'b'))
+        self.assertEqual(m.S.first(), (3, 'b'))
+        self.assertEqual(m.S.last(), (2, 'b'))
+        self.assertEqual(m.S.next((1, 'a')), (2, 'b'))
+        self.assertEqual(m.S.ord((2, 'b')), 3)
+        self.assertEqual(m.S.ord((1, 'a')), 2)
+        with self.assertRaisesRegex(ValueError, r"S.ord\(x\): x not in S"):
+            m.S.ord((1, 'b'))
+        with self.assertRaisesRegex(IndexError, "S index out of range"):
+            m.S.at(4)
+
+        cols = m.S.columns
+        self.assertEqual(len(cols), 2)
+        self.assertEqual(cols[0].tolist(), [3, 1, 2])
+        with self.assertRaises(ValueError):
+            cols[0][0] = 5
+
+    def test_scalar_members(self):
+        m = ConcreteModel()
+        m.S = ColumnarSet(columns=np.array([5, 2, 7]))
+        self.assertEqual(m.S.dimen, 1)
+        self.assertEqual(list(m.S), [5, 2, 7])
+        self.assertIs(type(m.S.at(1)), int)
+        self.assertIn(2, m.S)
+        self.assertIn((2,), m.S)
+        self.assertEqual(m.S.ord((7,)), 3)
+        self.assertIs(m.S.domain, Any)
+
+    def test_input_formats(self):
+        ref = [(0, 1), (2, 0), (2, 1)]
+        mask = np.array([[False, True], [False, False], [True, True]])
+        s = ColumnarSet(columns=np.argwhere(mask))
+        self.assertEqual(list(s), ref)
+        s = ColumnarSet(columns=[np.array([0, 2, 2]), np.array([1, 0, 1])])
+        self.assertEqual(list(s), ref)
+        if pandas_available:
+            df = pd.DataFrame({'i': [0, 2, 2], 'j': [1, 0, 1]})
+            self.assertEqual(list(ColumnarSet(columns=df)), ref)
+            index = pd.MultiIndex.from_frame(df)
+            self.assertEqual(list(ColumnarSet(columns=index)), ref)
+
+    def test_errors(self):
+        m = ConcreteModel()
+        m.I = Set(initialize=[1, 2])
+        with self.assertRaisesRegex(ValueError, "must all have the same length"):
+            ColumnarSet(columns=([1, 2], [1]))
+        with self.assertRaisesRegex(ValueError, "1-D or 2-D array"):
+            ColumnarSet(columns=np.zeros((2, 2, 2)))
+        with self.assertRaisesRegex(ValueError, "must be one-dimensional"):
+            ColumnarSet(columns=[[[1, 2]]])
+        with self.assertRaisesRegex(ValueError, "at least one column"):
+            ColumnarSet(columns=[])
+        with self.assertRaisesRegex(
+            ValueError, "columns contain the value \\(1, 2\\) more"
+        ):
+            ColumnarSet(columns=([1, 2, 1], [2, 1, 2]))
+        with self.assertRaisesRegex(
+            ValueError, "value \\(3, 1\\) is not in the domain I\\*I"
+        ):
+            m.S = ColumnarSet(columns=([1, 3], [2, 1]), within=m.I * m.I)
+        # Domains that are not products of 1-D sets are checked by tuple
+        m.J = Set(initialize=[(1, 2), (2, 1)])
+        m.T = ColumnarSet(columns=([1, 2], [2, 1]), within=m.J)
+        self.assertEqual(len(m.T), 2)
+        with self.assertRaisesRegex(
+            ValueError, "value \\(2, 2\\) is not in the domain J"
+        ):
+            m.U = ColumnarSet(columns=([1, 2], [2, 2]), within=m.J)
+
+    def test_indexing(self):
+        m = ConcreteModel()
+        m.I = Set(initialize=range(100))
+        cols = (np.array([0, 5, 99]), np.array([3, 3, 0]), np.array([7, 1, 2]))
+        m.S = ColumnarSet(columns=cols, within=m.I * m.I * m.I)
+        m.x = Var(m.S, initialize=lambda m, i, j, k: i + j + k)
+        m.c = Constraint(m.S, rule=lambda m, i, j, k: m.x[i, j, k] >= 0)
+        self.assertEqual(len(m.x), 3)
+        self.assertEqual(list(m.x.keys()), [(0, 3, 7), (5, 3, 1), (99, 0, 2)])
+        self.assertEqual(m.x[5, 3, 1].value, 9)
+        self.assertEqual(len(m.c), 3)
+        with self.assertRaisesRegex(KeyError, r"Index '\(1, 1, 1\)' is not valid"):
+            m.x[1, 1, 1]
+
+        OUT = StringIO()
+        m.S.pprint(ostream=OUT)
+        self.assertEqual(
+            OUT.getvalue(),
+            """S : Dimen=3, Size=3
+    Key  : Domain : Ordered   : Members
+    None :  I*I*I : Insertion : {(0, 3, 7), (5, 3, 1), (99, 0, 2)}
+""",
+        )
+
+        i = m.clone()
+        self.assertEqual(list(i.S), list(m.S))
+        self.assertIs(i.x.index_set(), i.S)
+        self.assertIs(next(i.S.domain.subsets()), i.I)
+
+
 class TestSetUtils(unittest.TestCase):
     def test_get_continuous_interval(self):
         self.assertEqual(Reals.get_interval(), (None, None, 0))
@@ -0,0 +1,195 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright (c) 2008-2025
+#  National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+
+import pyomo.common.unittest as unittest
+import pyomo.environ as pyo
+from pyomo.common.dependencies import numpy as np, numpy_available, scipy_available
+from pyomo.core.expr.calculus.diff_with_pyomo import (
+    DifferentiationException,
+    reverse_ad,
+)
+from pyomo.core.expr.calculus.sparse_ad import DerivativeTape
+
+
+def _model():
+    m = pyo.ConcreteModel()
+    m.x = pyo.Var([1, 2, 3], initialize={1: 1.5, 2: 0.7, 3: 2.2})
+    m.p = pyo.Param(mutable=True, initialize=1.3)
+    m.e = pyo.Expression(expr=m.x[1] * m.x[2] + m.p)
+    m.c = pyo.ConstraintList()
+    m.c.add(m.x[1] * m.x[2] * m.x[3] + m.x[1] ** 2 == 1)
+    m.c.add(pyo.exp(m.x[2]) / m.x[3] - pyo.log(m.x[1]) <= 4)
+    m.c.add(m.e ** m.x[3] + pyo.sin(m.e) * pyo.cos(m.x[3]) >= 0)
+    m.c.add(pyo.sqrt(m.x[1] + m.x[3]) - pyo.atan(m.x[2]) / m.p <= 2)
+    m.c.add(m.x[2] == 0.3)
+    m.c.add(5 * m.x[1] - (m.x[2] + 2 * m.x[3]) <= 0)
+    m.c.add(2 ** m.x[1] + abs(m.x[2] - 5) + m.x[3] ** 3 / 7 >= 0)
+    m.c.add(pyo.tanh(m.x[1] * m.x[3]) + pyo.asinh(m.x[2]) * pyo.log10(m.x[3]) <= 0)
+    return m
+
+
+@unittest.skipUnless(numpy_available and scipy_available, "requires numpy, scipy")
+class TestDerivativeTape(unittest.TestCase):
+    def _fd_jacobian(self, tape, x, h=1e-6):
+        return np.array(
+            [
+                (tape.evaluate(x + h * e) - tape.evaluate(x - h * e)) / (2 * h)
+                for e in np.eye(len(x))
+            ]
+        ).T
+
+    def test_evaluate(self):
+        m = _model()
+        tape = DerivativeTape(m.c.values())
+        self.assertEqual(tape.expressions, list(m.c.values()))
+        self.assertEqual(tape.variables, [m.x[1], m.x[2], m.x[3]])
+        self.assertStructuredAlmostEqual(
+            list(tape.evaluate()), [pyo.value(c.body) for c in m.c.values()]
+        )
+        m.p = 2
+        self.assertStructuredAlmostEqual(
+            list(tape.evaluate()), [pyo.value(c.body) for c in m.c.values()]
+        )
+
+    def test_jacobian(self):
+        m = _model()
+        tape = DerivativeTape(m.c.values())
+        J = tape.jacobian()
+        self.assertEqual(J.shape, (8, 3))
+        # Compare against reverse_ad (for the constraints it supports)
+        for i, c in enumerate(m.c.values()):
+            if i == 7:
+                continue
+            ref = reverse_ad(c.body)
+            for j, v in enumerate(tape.variables):
+                self.assertAlmostEqual(J[i, j], ref.get(v, 0), places=10)
+        x = tape.get_variable_values()
+        self.assertTrue(np.allclose(J.toarray(), self._fd_jacobian(tape, x)))
+
+        # The structure is fixed (even if entries evaluate to 0)
+        x2 = np.array([2.0, 0, 1.5])
+        J2 = tape.jacobian(x2)
+        self.assertEqual(J.nnz, J2.nnz)
+        self.assertTrue(np.array_equal(J.indices, J2.indices))
+        self.assertTrue(np.array_equal(J.indptr, J2.indptr))
+        self.assertTrue(np.allclose(J2.toarray(), self._fd_jacobian(tape, x2)))
+        # Passing a point does not change the model
+        self.assertEqual(m.x[2].value, 0.7)
+        self.assertEqual(
+            [list(J.indices[J.indptr[i] : J.indptr[i + 1]]) for i in range(8)],
+            [
+                [0, 1, 2],
+                [0, 1, 2],
+                [0, 1, 2],
+                [0, 1, 2],
+                [1],
+                [0, 1, 2],
+                [0, 1, 2],
+                [0, 1, 2],
+            ],
+        )
+
+    def test_hessian(self):
+        m = _model()
+        tape = DerivativeTape(m.c.values())
+        lam = np.arange(1, 9, dtype=float)
+        for x in (tape.get_variable_values(), np.array([1.1, 0.2, 1.7])):
+            H = tape.hessian(lam, x).toarray()
+            h = 1e-6
+            H_fd = np.array(
+                [
+                    (
+                        tape.jacobian(x + h * e).T @ lam
+                        - tape.jacobian(x - h * e).T @ lam
+                    )
+                    / (2 * h)
+                    for e in np.eye(3)
+                ]
+            )
+            self.assertTrue(np.allclose(H, H_fd, rtol=1e-6, atol=1e-6))
+            self.assertTrue(np.array_equal(H, H.T))
+
+        # Linear expressions do not contribute to the Hessian
+        lam = np.zeros(8)
+        lam[4] = lam[5] = 1
+        self.assertEqual(tape.hessian(lam).count_nonzero(), 0)
+
+    def test_hessian_product(self):
+        m = pyo.ConcreteModel()
+        m.x = pyo.Var(initialize=3)
+        m.y = pyo.Var(initialize=2)
+        tape = DerivativeTape([m.x * m.x, m.x * m.y, m.y**3 / m.x])
+        self.assertStructuredAlmostEqual(
+            tape.hessian([1, 0, 0]).toarray().tolist(), [[2, 0], [0, 0]]
+        )
+        self.assertStructuredAlmostEqual(
+            tape.hessian([0, 2, 0]).toarray().tolist(), [[0, 2], [2, 0]]
+        )
+        # d2/dx2 = 2 y^3 / x^3; d2/dxdy = -3 y^2 / x^2; d2/dy2 = 6 y / x
+        self.assertStructuredAlmostEqual(
+            tape.hessian([0, 0, 1]).toarray().tolist(),
+            [[16 / 27, -12 / 9], [-12 / 9, 4]],
+        )
+        self.assertEqual(tape.hessian().nnz, 4)
+
+    def test_variables(self):
+        m = pyo.ConcreteModel()
+        m.x = pyo.Var([1, 2, 3], initialize=2)
+        m.x[3].fix()
+        exprs = [m.x[1] * m.x[3], m.x[2] + m.x[1] ** 2]
+        tape = DerivativeTape(exprs)
+        self.assertEqual(tape.variables, [m.x[1], m.x[2]])
+        self.assertEqual(tape.jacobian().toarray().tolist(), [[2, 0], [4, 1]])
+        # Fixed variables are treated as constants
+        m.x[3].value = 5
+        self.assertEqual(tape.jacobian().toarray().tolist(), [[5, 0], [4, 1]])
+
+        tape = DerivativeTape(exprs, include_fixed=True)
+        self.assertEqual(tape.variables, [m.x[1], m.x[3], m.x[2]])
+        self.assertEqual(tape.jacobian().toarray().tolist(), [[5, 2, 0], [4, 0, 1]])
+
+        tape = DerivativeTape(exprs, variables=[m.x[2], m.x[3]])
+        self.assertEqual(tape.variables, [m.x[2], m.x[3]])
+        self.assertEqual(tape.jacobian().toarray().tolist(), [[0, 2], [1, 0]])
+        self.assertEqual(tape.jacobian([1, 1]).toarray().tolist(), [[0, 2], [1, 0]])
+
+        with self.assertRaisesRegex(ValueError, "Variable 'x\\[2\\]' appears more"):
+            DerivativeTape(exprs, variables=[m.x[2], m.x[2]])
+        with self.assertRaisesRegex(ValueError, "Expected an array of 2 variable"):
+            tape.jacobian([1, 2, 3])
+        with self.assertRaisesRegex(ValueError, "Expected an array of 2 multipliers"):
+            tape.hessian([1])
+
+    def test_trivial_expressions(self):
+        m = pyo.ConcreteModel()
+        m.x = pyo.Var(initialize=2)
+        m.p = pyo.Param(initialize=3, mutable=True)
+        m.o = pyo.Objective(expr=m.x**2)
+        tape = DerivativeTape([m.x, 5, m.p, m.o, -m.x])
+        self.assertEqual(list(tape.evaluate()), [2, 5, 3, 4, -2])
+        self.assertEqual(tape.jacobian().toarray().tolist(), [[1], [0], [0], [4], [-1]])
+        self.assertEqual(tape.hessian().toarray().tolist(), [[2]])
+
+    def test_unsupported(self):
+        m = pyo.ConcreteModel()
+        m.x = pyo.Var()
+        with self.assertRaisesRegex(
+            DifferentiationException, "Unsupported expression type for differentiation"
+        ):
+            DerivativeTape([pyo.Expr_if(m.x >= 0, m.x, 0)])
+        with self.assertRaisesRegex(
+            DifferentiationException, "Unsupported expression type for differentiation"
+        ):
+            DerivativeTape([pyo.floor(m.x)])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -164,20 +164,20 @@ class ContinuousSet(SortedScalarSet):
         -------
         float
         """
-        if point in self._fe:
+        fe = self._fe
+        # The list _fe is always sorted
+        i = bisect.bisect_left(fe, point)
+        if i < len(fe) and fe[i] == point:
             return point
-        elif point > max(self._fe):
+        elif i == len(fe):
             logger.warning(
                 "The point '%s' exceeds the upper bound "
                 "of the ContinuousSet '%s'. Returning the upper bound"
                 % (str(point), self.name)
             )
-            return max(self._fe)
+            return fe[-1]
         else:
-            for i in self._fe:
-                # This works because the list _fe is always sorted
-                if i > point:
-                    return i
+            return fe[i]
 
     def get_lower_element_boundary(self, point):
         """Returns the first finite element point that is less than or
@@ -191,29 +191,38 @@ class ContinuousSet(SortedScalarSet):
         -------
         float
         """
-        if point in self._fe:
+        fe = self._fe
+        # The list _fe is always sorted
+        i = bisect.bisect_left(fe, point)
+        if i < len(fe) and fe[i] == point:
             if 'scheme' in self._discretization_info:
                 if self._discretization_info['scheme'] == 'LAGRANGE-RADAU':
                     # Because Radau Collocation has a collocation point on the
                     # upper finite element bound this if statement ensures that
                     # the desired finite element bound is returned
-                    tmp = self._fe.index(point)
-                    if tmp != 0:
-                        return self._fe[tmp - 1]
+                    if i != 0:
+                        return fe[i - 1]
             return point
-        elif point < min(self._fe):
+        elif i == 0:
             logger.warning(
                 "The point '%s' is less than the lower bound "
                 "of the ContinuousSet '%s'. Returning the lower bound "
                 % (str(point), self.name)
             )
-            return min(self._fe)
+            return fe[0]
         else:
-            rev_fe = list(self._fe)
-            rev_fe.reverse()
-            for i in rev_fe:
-                if i < point:
-                    return i
+            return fe[i - 1]
+
+    def _get_point_list(self):
+        """Returns the sorted list of points in the set
+
+        This returns the list the set maintains internally (which is
+        rebuilt whenever points are added or removed) and avoids copying
+        the set. Callers must not modify the returned list.
+        """
+        if self._ordered_values is None:
+            self._rebuild_ordered_values()
+        return self._ordered_values
 
     def construct(self, values=None):
         """Constructs a :py:class:`ContinuousSet` component"""
@@ -277,7 +286,7 @@ class ContinuousSet(SortedScalarSet):
         """
         lo = 0
         hi = len(self)
-        arr = list(self)
+        arr = self._get_point_list()
         i = bisect.bisect_right(arr, target, lo=lo, hi=hi)
         # i is the index at which target should be inserted if it is to be
         # right of any equal components.
@@ -15,7 +15,7 @@ with respect to common indexing sets
 
 from pyomo.core.base import Block, Reference
 from pyomo.common.collections import ComponentSet, ComponentMap
-from pyomo.core.base.block import SubclassOf
+from pyomo.core.base.block import SubclassOf, _get_structure_cache
 from pyomo.core.base.set import SetProduct
 from pyomo.core.base.indexed_component import UnindexedComponent_set, normalize_index
 from pyomo.core.base.component import ActiveComponent
@@ -539,7 +539,23 @@ def flatten_components_along_sets(m, sets, ctype, indices=None, active=None):
     return sets_list, comps_list
 
 
-def flatten_dae_components(model, time, ctype, indices=None, active=None):
+def clear_flatten_cache(model):
+    """Discard the results of :py:func:`flatten_dae_components` cached
+    on a block
+
+    The cache is invalidated automatically when components are added to,
+    removed from, or reclassified on the block or any of its sub-blocks.
+    This function must be called after any other change that alters how
+    the model is partitioned, e.g., adding members to a (non-time) set
+    that indexes time-indexed components.
+
+    """
+    model.__dict__.pop('_dae_flatten_cache', None)
+
+
+def flatten_dae_components(
+    model, time, ctype, indices=None, active=None, use_cache=False
+):
     """Partitions components into ComponentData and Components indexed only
     by the provided set.
 
@@ -565,6 +581,14 @@ def flatten_dae_components(model, time, ctype, indices=None, active=None):
         specified active flag. A reference-to-slice is returned if any
         data object defined by the slice matches this flag.
 
+    use_cache: Bool
+        If True, the partition is stored on ``model`` and reused by
+        later calls with the same ``time`` and ``ctype`` until a component
+        is added to, removed from, or reclassified on ``model`` or any of
+        its sub-blocks (see :py:func:`clear_flatten_cache` for changes
+        that are not detected).
+        May not be combined with ``indices`` or ``active``.
+
     Returns
     -------
     List of ComponentData, list of Component
@@ -573,6 +597,22 @@ def flatten_dae_components(model, time, ctype, indices=None, active=None):
         -slices for all components indexed by the provided set.
 
     """
+    if use_cache:
+        if indices is not None or active is not None:
+            raise ValueError(
+                "flatten_dae_components does not support use_cache=True "
+                "in combination with the indices or active arguments"
+            )
+        cache = _get_structure_cache(model, '_dae_flatten_cache')
+        key = (ctype, id(time))
+        if key not in cache:
+            scalar_comps, dae_comps = flatten_dae_components(model, time, ctype)
+            # Store the time set so that its id() cannot be reused
+            cache[key] = (time, scalar_comps, dae_comps, None)
+        _, scalar_comps, dae_comps, _ = cache[key]
+        # Return copies so that callers cannot corrupt the cache
+        return list(scalar_comps), list(dae_comps)
+
     target = ComponentSet((time,))
     sets_list, comps_list = flatten_components_along_sets(
         model, target, ctype, indices=indices, active=active
@@ -593,3 +633,51 @@ def flatten_dae_components(model, time, ctype, indices=None, active=None):
                 "indexed by time (explicitly or implicitly) multiple times."
             )
     return scalar_comps, dae_comps
+
+
+def flatten_dae_component_data(model, time, ctype, use_cache=False):
+    """Partitions the data objects of components into those not indexed
+    by the provided set and a matrix of data objects at each point in
+    the provided set
+
+    Parameters
+    ----------
+
+    model: BlockData
+        Block whose components are partitioned
+
+    time: Set
+        Set whose points index the rows of the returned matrix
+
+    ctype: Subclass of Component
+        Type of component to identify, partition, and return
+
+    use_cache: Bool
+        If True, both the partition (see :py:func:`flatten_dae_components`)
+        and the matrix are cached on ``model``. The matrix is regenerated
+        if the points in ``time`` change.
+
+    Returns
+    -------
+    List of ComponentData, list of time points, tuple of tuples of ComponentData
+        The first list contains ComponentData for all components not
+        indexed by the provided set. The third is an immutable row-major
+        matrix whose row ``i`` contains, for each time-indexed component
+        in the order returned by :py:func:`flatten_dae_components`, the
+        data object at the ``i``-th point of the second list. This matrix
+        may be passed directly to ``numpy.array(..., dtype=object)``.
+
+    """
+    scalar_comps, dae_comps = flatten_dae_components(
+        model, time, ctype, use_cache=use_cache
+    )
+    time_points = list(time)
+    if use_cache:
+        entry = model._dae_flatten_cache[ctype, id(time)]
+        if entry[3] is not None and entry[3][0] == time_points:
+            return scalar_comps, time_points, entry[3][1]
+    matrix = tuple(tuple(comp[t] for comp in dae_comps) for t in time_points)
+    if use_cache:
+        model._dae_flatten_cache[ctype, id(time)] = entry[:3] + ((time_points, matrix),)
+        time_points = list(time_points)
+    return scalar_comps, time_points, matrix
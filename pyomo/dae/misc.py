@@ -42,9 +42,11 @@ def generate_finite_elements(ds, nfe):
         # If only bounds have been specified on the differentialset we
         # generate the desired number of finite elements by
         # spreading them evenly over the interval
-        step = (max(ds) - min(ds)) / float(nfe)
-        tmp = min(ds) + step
-        while round(tmp, 6) <= round((max(ds) - step), 6):
+        lb = min(ds)
+        ub = max(ds)
+        step = (ub - lb) / float(nfe)
+        tmp = lb + step
+        while round(tmp, 6) <= round((ub - step), 6):
             ds.add(round(tmp, 6))
             tmp += step
         ds.set_changed(True)
@@ -223,6 +225,10 @@ def update_contset_indexed_component(comp, expansion_map):
     temp = comp.index_set()
     indexset = list(comp.index_set().subsets())
 
+    # Every index that is missing is added in a single pass, so the
+    # component only needs to be expanded once (even if it is indexed
+    # by several ContinuousSets that have changed).  Indices that are
+    # already present are never rebuilt.
     for s in indexset:
         if s.ctype == ContinuousSet and s.get_changed():
             if isinstance(comp, Var):  # Don't use the type() method here
@@ -252,6 +258,7 @@ def update_contset_indexed_component(comp, expansion_map):
                     "after discretizing. Alert the pyomo developers "
                     "for more assistance." % (str(comp), comp.ctype)
                 )
+            break
 
 
 def _update_var(v):
@@ -264,9 +271,14 @@ def _update_var(v):
     #       Var (which is now a IndexedComponent). However, it
     #       would be much slower to rely on that method to generate new
     #       VarData for a large number of new indices.
-    new_indices = set(v.index_set()) - set(v._data.keys())
+    #
+    # The new indices come from the index set, so we can create the
+    # VarData directly (in index set order) without validating every
+    # index (as v.add() / v[index] would).
+    _data = v._data
+    new_indices = [index for index in v.index_set() if index not in _data]
     for index in new_indices:
-        v.add(index)
+        v._getitem_when_not_present(index)
 
 
 def _update_constraint(con):
@@ -402,7 +414,7 @@ def add_continuity_equations(block, d, i, loc):
         afinal = s.get_discretization_info()['afinal']
 
         def _fun(i):
-            tmp = list(s)
+            tmp = s._get_point_list()
             idx = s.ord(i) - 1
             low = s.get_lower_element_boundary(i)
             if i != low or idx == 0:
@@ -497,7 +509,7 @@ def _get_idx(l, ds, n, i, k):
     points and is not separated into finite elements and collocation
     points.
     """
-    t = list(ds)
+    t = ds._get_point_list()
     tmp = ds.ord(ds._fe[i]) - 1
     tik = t[tmp + k]
     if n is None:
@@ -44,7 +44,7 @@ def _lagrange_radau_transform(v, s):
     adot = s.get_discretization_info()['adot']
 
     def _fun(i):
-        tmp = list(s)
+        tmp = s._get_point_list()
         idx = s.ord(i) - 1
         if idx == 0:  # Don't apply this equation at initial point
             raise IndexError("list index out of range")
@@ -65,7 +65,7 @@ def _lagrange_radau_transform_order2(v, s):
     adotdot = s.get_discretization_info()['adotdot']
 
     def _fun(i):
-        tmp = list(s)
+        tmp = s._get_point_list()
         idx = s.ord(i) - 1
         if idx == 0:
             # Don't apply this equation at initial point
@@ -87,16 +87,16 @@ def _lagrange_legendre_transform(v, s):
     adot = s.get_discretization_info()['adot']
 
     def _fun(i):
-        tmp = list(s)
+        tmp = s._get_point_list()
         idx = s.ord(i) - 1
         if idx == 0:
             # Don't apply this equation at initial point
             raise IndexError("list index out of range")
-        elif i in s.get_finite_elements():
-            # Don't apply at finite element points continuity equations
-            # added later
-            raise IndexError("list index out of range")
         low = s.get_lower_element_boundary(i)
+        if low == i:
+            # i is a finite element point. Don't apply at finite element
+            # points continuity equations added later
+            raise IndexError("list index out of range")
         lowidx = s.ord(low) - 1
         return sum(
             v(tmp[lowidx + j])
@@ -113,16 +113,16 @@ def _lagrange_legendre_transform_order2(v, s):
     adotdot = s.get_discretization_info()['adotdot']
 
     def _fun(i):
-        tmp = list(s)
+        tmp = s._get_point_list()
         idx = s.ord(i) - 1
         if idx == 0:
             # Don't apply this equation at initial point
             raise IndexError("list index out of range")
-        elif i in s.get_finite_elements():
-            # Don't apply at finite element points continuity equations
-            # added later
-            raise IndexError("list index out of range")
         low = s.get_lower_element_boundary(i)
+        if low == i:
+            # i is a finite element point. Don't apply at finite element
+            # points continuity equations added later
+            raise IndexError("list index out of range")
         lowidx = s.ord(low) - 1
         return sum(
             v(tmp[lowidx + j])
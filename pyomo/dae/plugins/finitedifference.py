@@ -35,7 +35,7 @@ def _central_transform(v, s):
     """
 
     def _ctr_fun(i):
-        tmp = list(s)
+        tmp = s._get_point_list()
         idx = s.ord(i) - 1
         if idx == 0:  # Needed since '-1' is considered a valid index in Python
             raise IndexError("list index out of range")
@@ -51,7 +51,7 @@ def _central_transform_order2(v, s):
     """
 
     def _ctr_fun2(i):
-        tmp = list(s)
+        tmp = s._get_point_list()
         idx = s.ord(i) - 1
         if idx == 0:  # Needed since '-1' is considered a valid index in Python
             raise IndexError("list index out of range")
@@ -70,7 +70,7 @@ def _forward_transform(v, s):
     """
 
     def _fwd_fun(i):
-        tmp = list(s)
+        tmp = s._get_point_list()
         idx = s.ord(i) - 1
         return 1 / (tmp[idx + 1] - tmp[idx]) * (v(tmp[idx + 1]) - v(tmp[idx]))
 
@@ -83,7 +83,7 @@ def _forward_transform_order2(v, s):
     """
 
     def _fwd_fun(i):
-        tmp = list(s)
+        tmp = s._get_point_list()
         idx = s.ord(i) - 1
         return (
             1
@@ -100,7 +100,7 @@ def _backward_transform(v, s):
     """
 
     def _bwd_fun(i):
-        tmp = list(s)
+        tmp = s._get_point_list()
         idx = s.ord(i) - 1
         if idx == 0:  # Needed since '-1' is considered a valid index in Python
             raise IndexError("list index out of range")
@@ -116,7 +116,7 @@ def _backward_transform_order2(v, s):
     """
 
     def _bwd_fun(i):
-        tmp = list(s)
+        tmp = s._get_point_list()
         idx = s.ord(i) - 1
 
         # This check is needed since '-1' is considered a valid index in Python
@@ -185,6 +185,20 @@ class TestContinuousSet(unittest.TestCase):
             temp = m.t.get_lower_element_boundary(0.5)
         self.assertIn('Returning the lower bound', log_out.getvalue())
 
+        # Radau collocation points on an element boundary belong to the
+        # element on the left
+        m.t.get_discretization_info()['scheme'] = 'LAGRANGE-RADAU'
+        self.assertEqual(m.t.get_lower_element_boundary(1), 1)
+        self.assertEqual(m.t.get_lower_element_boundary(2), 1)
+        self.assertEqual(m.t.get_lower_element_boundary(3.5), 3)
+
+    def test_get_point_list(self):
+        m = ConcreteModel()
+        m.t = ContinuousSet(initialize=[1, 3, 2])
+        self.assertEqual(m.t._get_point_list(), [1, 2, 3])
+        m.t.add(2.5)
+        self.assertEqual(m.t._get_point_list(), [1, 2, 2.5, 3])
+
     def test_duplicate_construct(self):
         m = ConcreteModel()
         m.t = ContinuousSet(initialize=[1, 2, 3])
@@ -23,6 +23,8 @@ from pyomo.dae import ContinuousSet
 from pyomo.common.collections import ComponentSet, ComponentMap
 from pyomo.core.base.indexed_component import UnindexedComponent_set, normalize_index
 from pyomo.dae.flatten import (
+    clear_flatten_cache,
+    flatten_dae_component_data,
     flatten_dae_components,
     flatten_components_along_sets,
     slice_component_along_sets,
@@ -1653,6 +1655,111 @@ class TestFlatten(_TestFlattenBase, unittest.TestCase):
         self.assertEqual(len(comps_list), 0)
 
 
+class TestFlattenCache(unittest.TestCase):
+    def _make_model(self):
+        m = ConcreteModel()
+        m.time = Set(initialize=[0, 1, 2])
+        m.comp = Set(initialize=["A", "B"])
+        m.v = Var()
+        m.x = Var(m.time, m.comp)
+        m.b = Block(m.time)
+        for t in m.time:
+            m.b[t].y = Var()
+        return m
+
+    def test_cache_reused(self):
+        m = self._make_model()
+        scalar, dae = flatten_dae_components(m, m.time, Var, use_cache=True)
+        self.assertEqual([v.name for v in scalar], ["v"])
+        self.assertEqual(len(dae), 3)
+        scalar2, dae2 = flatten_dae_components(m, m.time, Var, use_cache=True)
+        self.assertEqual(scalar2, scalar)
+        self.assertEqual(len(dae2), 3)
+        for ref, ref2 in zip(dae, dae2):
+            self.assertIs(ref, ref2)
+        # The returned lists are copies
+        dae2.pop()
+        _, dae3 = flatten_dae_components(m, m.time, Var, use_cache=True)
+        self.assertEqual(len(dae3), 3)
+        # Different ctypes are cached separately
+        scalar, dae = flatten_dae_components(m, m.time, Constraint, use_cache=True)
+        self.assertEqual(scalar, [])
+        self.assertEqual(dae, [])
+
+    def test_cache_invalidated(self):
+        m = self._make_model()
+        _, dae = flatten_dae_components(m, m.time, Var, use_cache=True)
+        self.assertEqual(len(dae), 3)
+
+        m.z = Var(m.time)
+        _, dae = flatten_dae_components(m, m.time, Var, use_cache=True)
+        self.assertEqual(len(dae), 4)
+        self.assertIn(m.z[1], ComponentSet(ref[1] for ref in dae))
+
+        m.del_component(m.x)
+        _, dae = flatten_dae_components(m, m.time, Var, use_cache=True)
+        self.assertEqual(len(dae), 2)
+
+        # Changes on sub-blocks are detected as well
+        for t in m.time:
+            m.b[t].w = Var()
+        _, dae = flatten_dae_components(m, m.time, Var, use_cache=True)
+        self.assertEqual(len(dae), 3)
+
+        # New members of non-time sets are only picked up after
+        # clearing the cache
+        m.comp.add("C")
+        m.del_component(m.z)
+        m.z = Var(m.time, m.comp)
+        _, dae = flatten_dae_components(m, m.time, Var, use_cache=True)
+        self.assertEqual(len(dae), 5)
+        m.comp.add("D")
+        for t in m.time:
+            m.z[t, "D"].set_value(1)
+        _, dae = flatten_dae_components(m, m.time, Var, use_cache=True)
+        self.assertEqual(len(dae), 5)
+        clear_flatten_cache(m)
+        _, dae = flatten_dae_components(m, m.time, Var, use_cache=True)
+        self.assertEqual(len(dae), 6)
+
+    def test_cache_not_copied(self):
+        m = self._make_model()
+        flatten_dae_components(m, m.time, Var, use_cache=True)
+        m2 = m.clone()
+        _, dae = flatten_dae_components(m2, m2.time, Var, use_cache=True)
+        self.assertEqual(len(dae), 3)
+        for ref in dae:
+            for v in ref.values():
+                self.assertIs(v.model(), m2)
+
+    def test_cache_bad_arguments(self):
+        m = self._make_model()
+        with self.assertRaisesRegex(ValueError, "does not support use_cache"):
+            flatten_dae_components(m, m.time, Var, active=True, use_cache=True)
+        with self.assertRaisesRegex(ValueError, "does not support use_cache"):
+            flatten_dae_components(m, m.time, Var, indices=(1,), use_cache=True)
+
+    def test_component_data(self):
+        m = self._make_model()
+        for use_cache in (False, True, True):
+            scalar, time, matrix = flatten_dae_component_data(
+                m, m.time, Var, use_cache=use_cache
+            )
+            self.assertEqual(scalar, [m.v])
+            self.assertEqual(time, [0, 1, 2])
+            self.assertEqual(
+                matrix, tuple((m.x[t, "A"], m.x[t, "B"], m.b[t].y) for t in m.time)
+            )
+
+        m.time.add(3)
+        m.x[3, :] = 1
+        m.b[3].y = Var()
+        _, time, matrix = flatten_dae_component_data(m, m.time, Var, use_cache=True)
+        self.assertEqual(time, [0, 1, 2, 3])
+        self.assertEqual(len(matrix), 4)
+        self.assertEqual(matrix[3], (m.x[3, "A"], m.x[3, "B"], m.b[3].y))
+
+
 class TestCUID(unittest.TestCase):
     """
     When returning indexed components, the flattener returns references.
@@ -388,6 +388,44 @@ class TestDaeMisc(unittest.TestCase):
         self.assertTrue(value(m.con3[2, 0, 2, 1, 1].lower) is None)
         self.assertTrue(value(m.con3[3, 2, 3, 2, 2].upper) == 20)
 
+    def test_update_contset_indexed_component_single_pass(self):
+        m = ConcreteModel()
+        m.t = ContinuousSet(bounds=(0, 10))
+        m.t2 = ContinuousSet(bounds=(0, 1))
+        m.v = Var(m.t, m.t2, initialize=1)
+        calls = []
+
+        def _con(m, t, t2):
+            calls.append((t, t2))
+            return m.v[t, t2] >= 0
+
+        m.con = Constraint(m.t, m.t2, rule=_con)
+        old = {idx: m.v[idx] for idx in m.v}
+        old_con = {idx: m.con[idx] for idx in m.con}
+        del calls[:]
+
+        generate_finite_elements(m.t, 5)
+        generate_finite_elements(m.t2, 2)
+        expansion_map = ComponentMap()
+        update_contset_indexed_component(m.v, expansion_map)
+        update_contset_indexed_component(m.con, expansion_map)
+
+        self.assertEqual(len(m.v), 18)
+        self.assertEqual(len(m.con), 18)
+        # The new VarData are created in index set order...
+        self.assertEqual(
+            list(m.v._data)[len(old) :],
+            [idx for idx in m.v.index_set() if idx not in old],
+        )
+        # ... and the existing data (and constraints) are not rebuilt
+        for idx, obj in old.items():
+            self.assertIs(m.v[idx], obj)
+        for idx, obj in old_con.items():
+            self.assertIs(m.con[idx], obj)
+        # The rule is called once for each new index (although the
+        # constraint is indexed by two ContinuousSets that changed)
+        self.assertEqual(sorted(calls), sorted(set(m.con) - set(old_con)))
+
     # test update_contset_indexed_component method for Expression with
     # single index of the ContinuouSet
     def test_update_contset_indexed_component_expressions_single(self):
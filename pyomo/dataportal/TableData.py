@@ -24,6 +24,7 @@ class TableData(object):
         Constructor
         """
         self._info = None
+        self._bulk_info = None
         self._data = None
         self.options = Bunch()
         self.options.ncolumns = 1
@@ -85,6 +86,14 @@ class TableData(object):
             model = self.options.model
         if not self.options.namespace in data:
             data[self.options.namespace] = {}
+        if self._bulk_info is not None:
+            _data = data[self.options.namespace]
+            for name, values in self._bulk_info.items():
+                if type(values) is list:
+                    _data[name] = {None: values}
+                else:
+                    _data.setdefault(name, {}).update(values)
+            return True
         return _process_data(
             self._info,
             model,
@@ -102,8 +111,14 @@ class TableData(object):
         Clear the data that was extracted from this table
         """
         self._info = None
+        self._bulk_info = None
 
-    def _set_data(self, headers, rows):
+    def _process_options(self, headers):
+        """
+        Normalize the set, param, index and format options for a table
+        with the given column headers, and return the positions of the
+        selected columns.
+        """
         from pyomo.core.base.set import Set
         from pyomo.core.base.param import Param
 
@@ -164,6 +179,11 @@ class TableData(object):
             msg = "Must specify the set or parameter option for data"
             raise IOError(msg)
 
+        return header_index
+
+    def _set_data(self, headers, rows):
+        header_index = self._process_options(headers)
+
         if self.options.format == 'set':
             if not self.options.index is None:
                 msg = "Cannot specify index for data with the 'set' format: %s"
@@ -217,6 +237,78 @@ class TableData(object):
             msg = "Unknown parameter format: '%s'"
             raise ValueError(msg % self.options.format)
 
+    def _set_columns(self, headers, chunks):
+        """
+        Set the table data from whole columns.
+
+        This is the bulk counterpart of :meth:`_set_data` for columnar
+        data sources.  ``chunks`` is an iterable of lists of columns
+        (one Python list per header, all with the same length), where
+        missing values are represented by :const:`None`.  Each chunk is
+        processed as soon as it is read, so data sources can bound
+        their memory use by returning the table in pieces.
+
+        Data with the 'set' and 'table' formats is collected directly
+        into the set and parameter dictionaries, bypassing the token
+        processing in :func:`_process_data`.  Missing values are
+        skipped: set members with a missing value are not loaded, and
+        neither are missing parameter values.  Other formats are
+        converted to rows and processed by :meth:`_set_data`.
+        """
+        header_index = self._process_options(headers)
+        fmt = self.options.format
+        nparams = 0 if self.options.param is None else len(self.options.param)
+        if fmt == 'table':
+            nindex = len(header_index) - nparams
+        if fmt not in ('set', 'table') or (fmt == 'table' and nindex < 1):
+            rows = []
+            for columns in chunks:
+                for row in zip(*columns):
+                    rows.append(['.' if val is None else val for val in row])
+            self._set_data(headers, rows)
+            return
+
+        if fmt == 'set':
+            if not self.options.index is None:
+                msg = "Cannot specify index for data with the 'set' format: %s"
+                raise IOError(msg % str(self.options.index))
+            values = []
+            for columns in chunks:
+                if len(columns) > 1:
+                    rows = zip(*columns)
+                    if any(None in col for col in columns):
+                        rows = (row for row in rows if None not in row)
+                    values.extend(rows)
+                elif None in columns[0]:
+                    values.extend(val for val in columns[0] if val is not None)
+                else:
+                    values.extend(columns[0])
+            self._bulk_info = {self.options.set: values}
+            return
+
+        self.options.ncolumns = len(header_index)
+        index_cols = header_index[:nindex]
+        param_cols = header_index[nindex:]
+        index_values = []
+        param_values = {param: {} for param in self.options.param}
+        for columns in chunks:
+            if nindex > 1:
+                keys = list(zip(*(columns[i] for i in index_cols)))
+            else:
+                keys = columns[index_cols[0]]
+            index_values.extend(keys)
+            for param, i in zip(self.options.param, param_cols):
+                vals = columns[i]
+                if None in vals:
+                    param_values[param].update(
+                        (k, v) for k, v in zip(keys, vals) if v is not None
+                    )
+                else:
+                    param_values[param].update(zip(keys, vals))
+        self._bulk_info = param_values
+        if self.options.index is not None:
+            self._bulk_info[self.options.index] = index_values
+
     def _get_table(self):
         from pyomo.core.expr import value
 
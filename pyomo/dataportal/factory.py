@@ -47,4 +47,4 @@ class DataManagerFactoryClass(Factory):
         return dm
 
 
-DataManagerFactory = DataManagerFactoryClass('data file')
+DataManagerFactory = DataManagerFactoryClass('data file', 'pyomo.data_managers')
@@ -12,6 +12,7 @@
 
 def load():
     from pyomo.dataportal.plugins import (
+        columnar,
         csv_table,
         datacommands,
         db_table,
@@ -0,0 +1,240 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright (c) 2008-2025
+#  National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+
+import os.path
+
+from pyomo.common.dependencies import (
+    attempt_import,
+    numpy as np,
+    numpy_available,
+    pandas as pd,
+    pandas_available,
+)
+from pyomo.dataportal import TableData
+from pyomo.dataportal.factory import DataManagerFactory
+
+pyarrow, pyarrow_available = attempt_import('pyarrow')
+pq, pq_available = attempt_import('pyarrow.parquet')
+
+# format=
+# chunksize=
+# frame=
+# select=
+
+
+def _column_to_list(col):
+    """Convert a column to a list of Python objects, with missing values
+    (NaN, None, pandas.NA, or Arrow nulls) mapped to None"""
+    if pyarrow_available and isinstance(col, (pyarrow.Array, pyarrow.ChunkedArray)):
+        return col.to_pylist()
+    if pandas_available and isinstance(col, pd.Series):
+        missing = col.isna().to_numpy()
+        col = col.to_numpy()
+    else:
+        col = np.asarray(col)
+        if col.dtype.kind == 'f':
+            missing = np.isnan(col)
+        elif col.dtype.kind == 'O':
+            missing = np.fromiter((val is None for val in col), bool, len(col))
+        else:
+            missing = None
+    values = col.tolist()
+    if missing is not None and missing.any():
+        for i in np.flatnonzero(missing).tolist():
+            values[i] = None
+    return values
+
+
+def _is_table(obj):
+    if isinstance(obj, (dict, np.ndarray)):
+        return True
+    if pandas_available and isinstance(obj, pd.DataFrame):
+        return True
+    return pyarrow_available and isinstance(obj, (pyarrow.Table, pyarrow.RecordBatch))
+
+
+def _split_table(table, chunksize):
+    """Return the headers of a table and a generator over lists of columns
+    with at most chunksize rows"""
+    if pandas_available and isinstance(table, pd.DataFrame):
+        headers = [str(col) for col in table.columns]
+        nrows = len(table)
+
+        def _columns(start, stop):
+            chunk = table.iloc[start:stop]
+            return [chunk.iloc[:, i] for i in range(len(headers))]
+
+    elif pyarrow_available and isinstance(table, (pyarrow.Table, pyarrow.RecordBatch)):
+        headers = [str(col) for col in table.column_names]
+        nrows = table.num_rows
+
+        def _columns(start, stop):
+            chunk = table.slice(start, stop - start)
+            return [chunk.column(i) for i in range(len(headers))]
+
+    elif isinstance(table, np.ndarray):
+        if table.dtype.names is None:
+            raise ValueError(
+                "NumPy arrays must be structured (record) arrays to be "
+                "loaded as a table"
+            )
+        headers = list(table.dtype.names)
+        nrows = len(table)
+
+        def _columns(start, stop):
+            return [table[name][start:stop] for name in headers]
+
+    elif isinstance(table, dict):
+        headers = [str(col) for col in table]
+        cols = list(table.values())
+        nrows = len(cols[0]) if cols else 0
+
+        def _columns(start, stop):
+            return [col[start:stop] for col in cols]
+
+    else:
+        raise ValueError(
+            "Cannot load data from an object of type '%s'" % type(table).__name__
+        )
+
+    if not chunksize:
+        chunksize = max(nrows, 1)
+
+    def _chunks():
+        for start in range(0, nrows, chunksize):
+            yield [
+                _column_to_list(col)
+                for col in _columns(start, min(start + chunksize, nrows))
+            ]
+
+    return headers, _chunks()
+
+
+def _chain_tables(tables, chunksize):
+    """Return the headers and the chunks of columns for a sequence of
+    tables that all have the same columns"""
+    tables = iter(tables)
+    try:
+        first = next(tables)
+    except StopIteration:
+        raise IOError("Empty table")
+    headers, chunks = _split_table(first, chunksize)
+
+    def _chunks():
+        yield from chunks
+        for table in tables:
+            _headers, more = _split_table(table, chunksize)
+            if _headers != headers:
+                raise ValueError(
+                    "Inconsistent table columns: expected %s but found %s"
+                    % (headers, _headers)
+                )
+            yield from more
+
+    return headers, _chunks()
+
+
+@DataManagerFactory.register(
+    "dataframe",
+    "In-memory table (pandas DataFrame, Arrow table, or NumPy record array)",
+)
+class DataFrameTable(TableData):
+    """
+    Load data from an in-memory table.
+
+    The table is passed with the ``frame`` option and may be a pandas
+    DataFrame, a pyarrow Table or RecordBatch, a NumPy structured
+    (record) array, a dict mapping column names to columns, or an
+    iterable of these (e.g., the reader returned by
+    ``pandas.read_csv(..., chunksize=n)``).  The column names play
+    the role of the header row of a CSV file.
+
+    Set and parameter data with the 'set' and 'table' formats is
+    built from whole columns, and the table is processed in chunks of
+    ``chunksize`` rows so that only one chunk is converted to Python
+    objects at a time.
+    """
+
+    def __init__(self):
+        TableData.__init__(self)
+
+    def available(self):
+        return numpy_available
+
+    def requirements(self):
+        return 'numpy'
+
+    def initialize(self, **kwds):
+        self.filename = kwds.pop('filename', None)
+        self._data = kwds.pop('frame', None)
+        self.add_options(**kwds)
+
+    def add_options(self, **kwds):
+        if 'frame' in kwds:
+            self._data = kwds.pop('frame')
+        TableData.add_options(self, **kwds)
+
+    def open(self):
+        if self._data is None:
+            raise IOError("No data frame specified")
+
+    def read(self):
+        if self.options.chunksize is not None and self.options.chunksize < 1:
+            raise ValueError(
+                "The chunksize must be a positive integer (received %s)"
+                % (self.options.chunksize,)
+            )
+        headers, chunks = self._get_columns()
+        self._set_columns(headers, chunks)
+
+    def _get_columns(self):
+        if _is_table(self._data):
+            return _split_table(self._data, self.options.chunksize)
+        return _chain_tables(self._data, self.options.chunksize)
+
+
+@DataManagerFactory.register("parquet", "Parquet file interface")
+class ParquetTable(DataFrameTable):
+    """
+    Load data from a Parquet file.
+
+    The file is read one row group (or ``chunksize`` rows, if
+    specified) at a time, and only the columns listed in the
+    ``select`` option are read from the file.
+    """
+
+    def available(self):
+        return numpy_available and pq_available
+
+    def requirements(self):
+        return 'numpy, pyarrow'
+
+    def open(self):
+        if self.filename is None:  # pragma:nocover
+            raise IOError("No filename specified")
+        if not os.path.exists(self.filename):
+            raise IOError("Cannot find file '%s'" % self.filename)
+
+    def _get_columns(self):
+        parquet_file = pq.ParquetFile(self.filename)
+        columns = None
+        if self.options.select is not None:
+            columns = [str(col) for col in self.options.select]
+        if self.options.chunksize:
+            batches = parquet_file.iter_batches(
+                batch_size=self.options.chunksize, columns=columns
+            )
+        else:
+            batches = (
+                parquet_file.read_row_group(i, columns=columns)
+                for i in range(parquet_file.num_row_groups)
+            )
+        return _chain_tables(batches, None)
@@ -637,6 +637,12 @@ def _process_include(cmd, _model, _data, _default, options=None):
     Filename = cmd[1]
     global Lineno
     Lineno = 0
+    if options is not None and options.stream:
+        from pyomo.dataportal.stream_datacmds import stream_data_commands
+
+        return stream_data_commands(
+            cmd[1], _model, _data, _default, blocksize=options.blocksize
+        )
     try:
         scenarios = parse_data_commands(filename=cmd[1])
     except IOError:
@@ -645,6 +651,15 @@ def _process_include(cmd, _model, _data, _default, options=None):
         raise IOError("Error parsing file '%s': %s" % (Filename, str(err)))
     if scenarios is None:
         return False
+    _process_scenarios(scenarios, _model, _data, _default)
+    return True
+
+
+def _process_scenarios(scenarios, _model, _data, _default):
+    """
+    Called by _process_include() to process the parsed data commands,
+    organized by namespace (scenario).
+    """
     for scenario in scenarios:
         for cmd in scenarios[scenario]:
             if scenario not in _data:
@@ -668,7 +683,6 @@ def _process_include(cmd, _model, _data, _default, options=None):
                             )
             else:
                 _process_data(cmd, _model, _data[scenario], _default, Filename, Lineno)
-    return True
 
 
 def _process_table(cmd, _model, _data, _default, options=None):
@@ -0,0 +1,448 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright (c) 2008-2025
+#  National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+"""
+Streaming reader for Pyomo data command (``*.dat``) files.
+
+The standard reader (:func:`parse_data_commands`) tokenizes the entire
+file before any data is processed.  The reader in this module splits
+the file into statements as it is read, so only one statement needs to
+be held in memory at a time.  The bodies of ``param`` statements in
+the common "list" and "table" forms, e.g.::
+
+    param p := 1 1.5  2 2.5 ;
+    param : I : p q := 1 1.5 10  2 2.5 20 ;
+
+are processed in blocks without building the statement text or token
+list, and blocks that only contain numbers are converted without
+tokenizing each value individually.  All other statements (and
+``param`` statements that use other features of the data command
+syntax) are parsed with the standard parser.
+"""
+
+import locale
+import re
+
+from pyomo.dataportal.parse_datacmds import parse_data_commands, reserved, _re_number
+from pyomo.dataportal import process_data
+from pyomo.dataportal.process_data import (
+    _guess_set_dimen,
+    _process_scenarios,
+    _str_bool_values,
+    _str_false_values,
+)
+from pyomo.core.base.set import UnknownSetDimen
+
+DEFAULT_BLOCKSIZE = 1 << 20
+
+_number = _re_number.encode()
+_word = rb'[a-zA-Z_][a-zA-Z_0-9\.+\-]*'
+
+# Whitespace and comments between statements
+_re_skip = re.compile(rb'(?:\s+|\#[^\n]*\n|/\*.*?\*/)*', re.S)
+# Characters that need special handling when looking for the end of a
+# statement
+_re_special = re.compile(rb'[;"\'#]|/\*')
+_re_namespace = re.compile(rb'namespace\s+(' + _word + rb')\s*\{')
+_re_end_namespace = re.compile(rb'\}')
+# The header of a param statement that can be streamed (no quotes,
+# brackets, parentheses, or comments before the ':=')
+_re_param_header = re.compile(rb'param(?=[\s:])((?:[a-zA-Z0-9_.+\-\s]|:(?!=))*):=')
+# The end of a streamed param statement
+_re_body_stop = re.compile(rb'\#[^\n]*|/\*|;')
+_re_comment = re.compile(rb'\#[^\n]*')
+# Blocks that can be converted by the fast tokenizer
+_re_unsupported_chars = re.compile(rb'[^0-9a-zA-Z_.+\-\s]')
+_re_not_numeric = re.compile(rb'[^0-9eE.+\-\s]')
+# Integers that may not be represented exactly as a float
+_re_long_int = re.compile(rb'[0-9]{16}')
+_re_number_token = re.compile(_number)
+_re_word_token = re.compile(_word)
+
+# Reserved words that are not allowed within data
+_not_data = {w for w in reserved if w not in ('set', 'param', 'table')}
+
+
+class _FallBack(Exception):
+    """Raised when a param statement cannot be streamed"""
+
+
+def _number_value(tok):
+    # Mirror the conversion of NUM_VAL tokens in parse_datacmds
+    if b'.' in tok:
+        return float(tok)
+    _num = float(tok)
+    _int = int(_num)
+    return _int if _int == _num else _num
+
+
+def _token_value(tok):
+    # Mirror the conversion of tokens by the lexer and _process_token()
+    if _re_number_token.fullmatch(tok):
+        return _number_value(tok)
+    val = tok.decode('ascii')
+    if _re_word_token.fullmatch(tok):
+        if val in _not_data:
+            raise _FallBack()
+        if val in _str_bool_values:
+            return val not in _str_false_values
+    return val
+
+
+def _convert_block(text):
+    """Convert a block of a statement body to a list of values"""
+    if not _re_not_numeric.search(text):
+        # Blocks that only contain numbers are converted with the
+        # builtin conversions (which reject the same malformed numbers
+        # as the lexer).  Regular expressions are not used to check
+        # these blocks, as matching a repeated group over a whole block
+        # needs memory proportional to the size of the block.
+        tokens = text.split()
+        try:
+            if b'.' in text or b'e' in text or b'E' in text:
+                return list(map(_number_value, tokens))
+            if not _re_long_int.search(text):
+                return list(map(int, tokens))
+            return list(map(_number_value, tokens))
+        except ValueError:
+            pass
+    if _re_unsupported_chars.search(text):
+        raise _FallBack()
+    return list(map(_token_value, text.split()))
+
+
+class _DatFileReader(object):
+    """Read a binary file one statement at a time"""
+
+    def __init__(self, FILE, blocksize):
+        self.FILE = FILE
+        self.blocksize = blocksize
+        self.buf = b''
+        self.pos = 0
+        self.offset = 0
+        self.lineno = 1
+        self.eof = False
+
+    def read(self):
+        """Append the next block of the file to the buffer"""
+        data = self.FILE.read(self.blocksize)
+        if not data:
+            if not self.eof:
+                # Terminate any trailing comment
+                self.buf += b'\n'
+            self.eof = True
+            return False
+        self.buf += data
+        return True
+
+    def compact(self):
+        """Discard the part of the buffer that has been processed"""
+        if self.pos:
+            self.lineno += self.buf.count(b'\n', 0, self.pos)
+            self.offset += self.pos
+            self.buf = self.buf[self.pos :]
+            self.pos = 0
+
+    def seek(self, offset, lineno):
+        self.FILE.seek(offset)
+        self.buf = b''
+        self.pos = 0
+        self.offset = offset
+        self.lineno = lineno
+        self.eof = False
+
+    def fill(self, n):
+        """Read until at least n bytes are available after pos"""
+        while len(self.buf) - self.pos < n and self.read():
+            pass
+
+    def skip(self):
+        """Skip whitespace and comments.  Returns False at the end of
+        the file"""
+        while True:
+            self.pos = _re_skip.match(self.buf, self.pos).end()
+            if self.pos < len(self.buf):
+                c = self.buf[self.pos : self.pos + 2]
+                if not (c[:1] == b'#' or c == b'/*' or c == b'/') or self.eof:
+                    return True
+            elif self.eof:
+                return False
+            self.compact()
+            self.read()
+
+    def match(self, regex, n=4096):
+        self.fill(n)
+        m = regex.match(self.buf, self.pos)
+        if m is not None:
+            self.pos = m.end()
+        return m
+
+    def statement(self):
+        """Return the text of the next statement (up to and including
+        the terminating ';')"""
+        i = self.pos
+        while True:
+            m = _re_special.search(self.buf, i)
+            if m is None:
+                if self.eof:
+                    end = len(self.buf)
+                    break
+                i = max(self.pos, len(self.buf) - 1)
+                self.read()
+                continue
+            c = m.group()
+            if c == b';':
+                end = m.end()
+                break
+            if c == b'#':
+                j = self.buf.find(b'\n', m.end())
+            elif c == b'/*':
+                j = self.buf.find(b'*/', m.end())
+                if j >= 0:
+                    j += 1
+            else:
+                j = m.end()
+                while True:
+                    j = self.buf.find(c, j)
+                    if j < 0:
+                        break
+                    if j + 1 == len(self.buf) and not self.eof:
+                        # we cannot tell if the quote is doubled
+                        j = -1
+                        break
+                    if self.buf[j + 1 : j + 2] != c:
+                        break
+                    # doubled ("escaped") quotation character
+                    j += 2
+            if j < 0:
+                if self.eof:
+                    end = len(self.buf)
+                    break
+                i = m.start()
+                self.read()
+                continue
+            i = j + 1
+        text = self.buf[self.pos : end]
+        self.pos = end
+        return text
+
+    def body_blocks(self):
+        """Generate the blocks of a streamed statement body, up to the
+        terminating ';'"""
+        while True:
+            self.compact()
+            self.fill(self.blocksize)
+            buf = self.buf
+            if self.eof:
+                cut = len(buf)
+            else:
+                # Break the block at a newline (so that comments are
+                # not split), or at whitespace for very long lines
+                cut = buf.rfind(b'\n') + 1
+                if not cut:
+                    cut = max(buf.rfind(b' '), buf.rfind(b'\t')) + 1
+                    if not cut or b'#' in buf[:cut]:
+                        self.read()
+                        continue
+            for m in _re_body_stop.finditer(buf, 0, cut):
+                c = m.group()
+                if c == b';':
+                    self.pos = m.end()
+                    yield _re_comment.sub(b'', buf[: m.start()])
+                    return
+                if c == b'/*':
+                    raise _FallBack()
+            if self.eof:
+                # Missing ';': let the standard parser report the error
+                raise _FallBack()
+            self.pos = cut
+            yield _re_comment.sub(b'', buf[:cut])
+
+
+def _param_dimen(_model, pname):
+    if _model is None:
+        return 1
+    try:
+        _param = getattr(_model, pname)
+    except AttributeError:
+        raise _FallBack()
+    d = _param.dim()
+    if d is UnknownSetDimen:
+        d = _guess_set_dimen(_param.index_set())
+    return d
+
+
+def _parse_param_header(header, _model):
+    """Return the (index set name, dimen, parameter names, default) for
+    a param statement header, or raise _FallBack if the statement cannot
+    be streamed"""
+    tokens = header.replace(b':', b' : ').split()
+    if not tokens:
+        raise _FallBack()
+    for tok in tokens:
+        if tok != b':' and not _re_word_token.fullmatch(tok):
+            if not _re_number_token.fullmatch(tok):
+                raise _FallBack()
+    tokens = [tok.decode('ascii') for tok in tokens]
+    sname = None
+    default = None
+    if tokens[0] == ':':
+        # param : [set :] p1 p2 ... :=
+        tokens = tokens[1:]
+        if ':' in tokens:
+            i = tokens.index(':')
+            if i != 1 or ':' in tokens[i + 1 :]:
+                raise _FallBack()
+            sname = tokens[0]
+            tokens = tokens[2:]
+        params = tokens
+        if not params:
+            raise _FallBack()
+    else:
+        # param p [default value] :=
+        if len(tokens) == 3 and tokens[1] == 'default':
+            default = _token_value(tokens[2].encode('ascii'))
+        elif len(tokens) != 1:
+            raise _FallBack()
+        params = tokens[:1]
+    for name in params + ([sname] if sname else []):
+        if name in reserved or not _re_word_token.fullmatch(name.encode('ascii')):
+            raise _FallBack()
+
+    dims = {_param_dimen(_model, pname) for pname in params}
+    if sname is not None and _model is not None:
+        try:
+            dims.add(_guess_set_dimen(getattr(_model, sname)))
+        except AttributeError:
+            raise _FallBack()
+    if len(dims) != 1:
+        raise _FallBack()
+    d = dims.pop()
+    if not d:
+        raise _FallBack()
+    return sname, d, params, default
+
+
+def _stream_param(reader, header, _model, _data, _default):
+    """Process the body of a param statement in blocks"""
+    sname, d, params, default = _parse_param_header(header, _model)
+    rowlen = d + len(params)
+    keys = [] if sname is not None else None
+    values = {pname: {} for pname in params}
+    carry = []
+    nrows = 0
+    for text in reader.body_blocks():
+        tokens = _convert_block(text)
+        if carry:
+            tokens = carry + tokens
+        n = len(tokens) - len(tokens) % rowlen
+        carry = tokens[n:]
+        if not n:
+            continue
+        if n != len(tokens):
+            del tokens[n:]
+        nrows += n // rowlen
+        if d == 1:
+            ndx = tokens[0::rowlen]
+        else:
+            ndx = list(zip(*(tokens[i::rowlen] for i in range(d))))
+        if keys is not None:
+            keys.extend(ndx)
+        for i, pname in enumerate(params):
+            vals = tokens[d + i :: rowlen]
+            if '.' in vals:
+                values[pname].update((k, v) for k, v in zip(ndx, vals) if v != '.')
+            else:
+                values[pname].update(zip(ndx, vals))
+    if carry or not nrows:
+        # The data does not fill a whole number of rows (or there is no
+        # data).  The standard parser generates the appropriate error.
+        raise _FallBack()
+
+    if default is not None:
+        _default[params[0]] = default
+    if keys is not None:
+        _data[sname] = {None: keys}
+    for pname, vals in values.items():
+        if pname in _data:
+            _data[pname].update(vals)
+        else:
+            _data[pname] = vals
+
+
+def stream_data_commands(
+    filename, _model, _data, _default, blocksize=None, encoding=None
+):
+    """Read and process a data command file one statement at a time
+
+    Args:
+        filename (str): the data command file
+        _model: the model (used to determine the dimension of the
+            parameters); may be None
+        _data (dict): the data dictionary (organized by namespace) that
+            is updated with the data in the file
+        _default (dict): the dictionary of parameter default values
+        blocksize (int): the number of bytes read from the file at a
+            time (default 1 MB)
+        encoding (str): the encoding of the file (defaults to the
+            encoding used by :func:`open`)
+    """
+    if not blocksize:
+        blocksize = DEFAULT_BLOCKSIZE
+    if encoding is None:
+        encoding = locale.getpreferredencoding(False)
+    namespace = None
+    with open(filename, 'rb') as FILE:
+        reader = _DatFileReader(FILE, blocksize)
+        while reader.skip():
+            reader.compact()
+            process_data.Lineno = reader.lineno
+            m = reader.match(_re_namespace)
+            if m is not None:
+                if namespace is not None:
+                    raise IOError(
+                        "Cannot define a namespace within another namespace "
+                        "(line %s of file %s)" % (reader.lineno, filename)
+                    )
+                namespace = m.group(1).decode(encoding)
+                continue
+            if namespace is not None and reader.match(_re_end_namespace):
+                namespace = None
+                continue
+
+            if namespace not in _data:
+                _data[namespace] = {}
+            m = reader.match(_re_param_header, 65536)
+            if m is not None:
+                offset = reader.offset
+                lineno = reader.lineno
+                try:
+                    _stream_param(
+                        reader, m.group(1), _model, _data[namespace], _default
+                    )
+                    continue
+                except _FallBack:
+                    reader.seek(offset, lineno)
+
+            lineno = reader.lineno
+            text = reader.statement().decode(encoding)
+            try:
+                scenarios = parse_data_commands(data=text)
+            except IOError as e:
+                raise IOError(
+                    "Error parsing the statement starting on line %s of "
+                    "file %s: %s" % (lineno, filename, e)
+                )
+            if namespace is not None:
+                scenarios = {namespace: scenarios[None]}
+            _process_scenarios(scenarios, _model, _data, _default)
+    if namespace is not None:
+        raise IOError("Missing '}' at the end of namespace %s" % (namespace,))
+    return True
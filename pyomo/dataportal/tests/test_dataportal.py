@@ -21,7 +21,15 @@ pyomo_dir = dirname(dirname(abspath(__file__))) + os.sep + ".."
 
 import pyomo.common.unittest as unittest
 
+from pyomo.common.dependencies import (
+    attempt_import,
+    numpy as np,
+    numpy_available,
+    pandas as pd,
+    pandas_available,
+)
 from pyomo.common.errors import ApplicationError
+from pyomo.common.tempfiles import TempfileManager
 from pyomo.common.tee import capture_output
 from pyomo.dataportal.factory import DataManagerFactory
 from pyomo.environ import (
@@ -79,6 +87,7 @@ try:
     xlsm_interface = DataManagerFactory('xlsm').available()
 except:
     xlsm_interface = False
+pq, pq_available = attempt_import('pyarrow.parquet')
 try:
     yaml_interface = DataManagerFactory('yaml').available()
     import yaml
@@ -1026,6 +1035,112 @@ class TestOnlyCsvPortal(TestOnlyTextPortal):
         }
 
 
+@unittest.skipUnless(pandas_available, "pandas is not available")
+class TestOnlyDataFramePortal(TestOnlyTextPortal):
+    # tableZ is a single value without a header row
+    skiplist = ['empty', 'tableZ']
+
+    def read_csv(self, name):
+        return pd.read_csv(
+            os.path.abspath(tutorial_dir + os.sep + 'csv' + os.sep + name + '.csv'),
+            na_values=['.'],
+            keep_default_na=False,
+        )
+
+    def create_options(self, name):
+        return {'using': 'dataframe', 'frame': self.read_csv(name), 'chunksize': 2}
+
+    def test_no_frame(self):
+        dp = DataPortal()
+        with self.assertRaisesRegex(IOError, "No data frame specified"):
+            dp.load(using='dataframe', set='A')
+
+    def test_bad_chunksize(self):
+        dp = DataPortal()
+        with self.assertRaisesRegex(ValueError, "chunksize must be a positive"):
+            dp.load(set='A', using='dataframe', frame=self.read_csv('A'), chunksize=0)
+
+    def test_record_array(self):
+        dp = DataPortal()
+        frame = self.read_csv('PO').to_records(index=False)
+        dp.load(using='dataframe', frame=frame, index='J', param=('P', 'O'))
+        self.assertEqual(dp.data('J'), [('A1', 'B1'), ('A2', 'B2'), ('A3', 'B3')])
+        self.assertEqual(
+            dp.data('P'), {('A3', 'B3'): 4.5, ('A1', 'B1'): 4.3, ('A2', 'B2'): 4.4}
+        )
+        with self.assertRaisesRegex(ValueError, "must be structured"):
+            dp.load(using='dataframe', frame=np.zeros(3), param='X')
+
+    def test_dict_of_columns(self):
+        dp = DataPortal()
+        frame = {'A': ['A1', 'A2', 'A3'], 'S': np.array([3.3, np.nan, 3.5])}
+        dp.load(using='dataframe', frame=frame, param='S')
+        self.assertEqual(dp.data('S'), {'A1': 3.3, 'A3': 3.5})
+
+    def test_set_missing_values(self):
+        # Set members with missing values are skipped
+        dp = DataPortal()
+        frame = {'A': ['A1', None, 'A3']}
+        dp.load(using='dataframe', frame=frame, set='A')
+        self.assertEqual(dp.data('A'), ['A1', 'A3'])
+        frame = pd.DataFrame({'A': ['A1', 'A2', 'A3'], 'B': [1, np.nan, 3]})
+        dp.load(using='dataframe', frame=frame, set='C', chunksize=2)
+        self.assertEqual(dp.data('C'), [('A1', 1), ('A3', 3)])
+
+    def test_chunked_reader(self):
+        dp = DataPortal()
+        frame = pd.read_csv(
+            os.path.abspath(tutorial_dir + os.sep + 'csv' + os.sep + 'XW.csv'),
+            chunksize=1,
+        )
+        dp.load(using='dataframe', frame=frame, index='A', param=('X', 'W'))
+        self.assertEqual(dp.data('A'), ['A1', 'A2', 'A3'])
+        self.assertEqual(dp.data('X'), {'A1': 3.3, 'A2': 3.4, 'A3': 3.5})
+        self.assertEqual(dp.data('W'), {'A1': 4.3, 'A2': 4.4, 'A3': 4.5})
+
+        frames = [self.read_csv('XW'), self.read_csv('PO')]
+        with self.assertRaisesRegex(ValueError, "Inconsistent table columns"):
+            dp.load(using='dataframe', frame=frames, param=('X', 'W'))
+
+    def test_abstract_model(self):
+        model = AbstractModel()
+        model.J = Set(dimen=2)
+        model.P = Param(model.J)
+        model.O = Param(model.J)
+        data = DataPortal()
+        data.load(
+            using='dataframe',
+            frame=self.read_csv('PO'),
+            index=model.J,
+            param=(model.P, model.O),
+        )
+        instance = model.create_instance(data)
+        self.assertEqual(list(instance.J), [('A1', 'B1'), ('A2', 'B2'), ('A3', 'B3')])
+        self.assertEqual(instance.P['A2', 'B2'], 4.4)
+        self.assertEqual(instance.O['A3', 'B3'], 5.5)
+
+
+@unittest.skipUnless(
+    pandas_available and pq_available, "pandas or pyarrow is not available"
+)
+class TestOnlyParquetPortal(TestOnlyDataFramePortal):
+    def setUp(self):
+        TempfileManager.push()
+
+    def tearDown(self):
+        TempfileManager.pop()
+
+    def create_options(self, name):
+        fname = TempfileManager.create_tempfile(suffix='.parquet')
+        self.read_csv(name).to_parquet(fname, index=False)
+        return {'filename': fname, 'chunksize': 2}
+
+    def test_select(self):
+        dp = DataPortal()
+        dp.load(select=('A', 'X'), param='X', **self.create_options('XW'))
+        self.assertEqual(dp.data('X'), {'A1': 3.3, 'A2': 3.4, 'A3': 3.5})
+
+
 class TestOnlyXmlPortal(TestOnlyTextPortal):
     suffix = '.xml'
     skiplist = ['tableD', 'tableT', 'tableU']
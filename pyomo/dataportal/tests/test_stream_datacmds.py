@@ -0,0 +1,167 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright (c) 2008-2025
+#  National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+#
+# Unit Tests for the streaming data command reader
+#
+
+import glob
+import os
+from os.path import abspath, basename, dirname, join
+
+import pyomo.common.unittest as unittest
+
+from pyomo.common.tempfiles import TempfileManager
+from pyomo.environ import AbstractModel, DataPortal, Param, Set
+
+currdir = dirname(abspath(__file__))
+
+# The blocksizes exercise statements and table rows that are split
+# across blocks
+blocksizes = (None, 1, 3, 17)
+
+
+class TestStreamDataCommands(unittest.TestCase):
+    def setUp(self):
+        TempfileManager.push()
+
+    def tearDown(self):
+        TempfileManager.pop()
+
+    def write_dat(self, text):
+        fname = TempfileManager.create_tempfile(suffix='.dat')
+        with open(fname, 'w') as FILE:
+            FILE.write(text)
+        return fname
+
+    def load(self, fname, model=None, **kwds):
+        dp = DataPortal(model=model)
+        dp.load(filename=fname, **kwds)
+        return dp
+
+    def assertSameData(self, fname, model=None):
+        expected = self.load(fname, model)
+        for blocksize in blocksizes:
+            dp = self.load(fname, model, stream=True, blocksize=blocksize)
+            self.assertEqual(dp._data, expected._data)
+            self.assertEqual(dp._default, expected._default)
+        return expected
+
+    def test_test_files(self):
+        cwd = os.getcwd()
+        os.chdir(currdir)
+        try:
+            for fname in sorted(glob.glob(join(currdir, 'data*.dat'))):
+                fname = basename(fname)
+                try:
+                    self.load(fname)
+                except Exception as e:
+                    # Some files require a model: check that the
+                    # streaming reader reports the same error
+                    with self.assertRaises(type(e)):
+                        self.load(fname, stream=True)
+                    continue
+                self.assertSameData(fname)
+        finally:
+            os.chdir(cwd)
+
+    def test_param_list(self):
+        model = AbstractModel()
+        model.I = Set(dimen=2)
+        model.p = Param(model.I)
+        model.q = Param(model.I)
+        fname = self.write_dat(
+            """# a comment; with a semicolon
+set I := (1,1) (1,2) (2,1) ;
+/* a multi-line
+   comment */
+param p default 0 :=
+1 1 1.5   # row 1
+1 2 -2e3
+2 1 .   ;param q := 1 1 a 2 1 true
+;"""
+        )
+        dp = self.assertSameData(fname, model)
+        self.assertEqual(dp['p'], {(1, 1): 1.5, (1, 2): -2000})
+        self.assertEqual(dp['q'], {(1, 1): 'a', (2, 1): True})
+        instance = model.create_instance(self.load(fname, model, stream=True))
+        self.assertEqual(instance.p[2, 1], 0)
+        self.assertEqual(instance.q[1, 1], 'a')
+
+    def test_param_table(self):
+        fname = self.write_dat(
+            """param : A : x y :=
+1 10 100
+2 20.5 .
+3 1e2 3E-1 ;
+param : z w :=
+a1 "b c" 1
+a2 'd' 2 ;
+namespace ns {
+    param : A : x y := 4 40 400 ;
+}
+"""
+        )
+        dp = self.assertSameData(fname)
+        self.assertEqual(dp['A'], [1, 2, 3])
+        self.assertEqual(dp['x'], {1: 10, 2: 20.5, 3: 100})
+        self.assertEqual(dp['y'], {1: 100, 3: 0.3})
+        self.assertEqual(dp['z'], {'a1': 'b c', 'a2': 'd'})
+        self.assertEqual(dp['ns', 'x'], {4: 40})
+
+    def test_numeric_blocks(self):
+        # Values are converted exactly as the lexer converts them (large
+        # integers are converted through float, and tokens that only
+        # contain numeric characters need not be numbers)
+        fname = self.write_dat(
+            "param p := 1 12345678901234567891 2 1e5 3 e 4 -.5 5 1E+2 6 007 ;"
+        )
+        dp = self.assertSameData(fname)
+        self.assertEqual(
+            dp['p'], {1: 12345678901234567168, 2: 100000, 3: 'e', 4: -0.5, 5: 100, 6: 7}
+        )
+
+    def test_fallback(self):
+        # Statements that are not streamed (or that stop being streamed
+        # partway through the body) are parsed with the standard parser
+        fname = self.write_dat(
+            "param : x y := "
+            + " ".join("%s %s %s" % (i, i, i) for i in range(100))
+            + ' 100 "quoted" 1 ;'
+            + " param : A B : u := 1 2 3 ; set S := a b c ;"
+        )
+        dp = self.assertSameData(fname)
+        self.assertEqual(dp['y'][99], 99)
+        self.assertEqual(dp['x'][100], 'quoted')
+        self.assertEqual(dp['S'], ['a', 'b', 'c'])
+
+    def test_missing_semicolon(self):
+        fname = self.write_dat("param : x y := 1 2 3 4 5 6 \n")
+        with self.assertRaisesRegex(
+            IOError, "statement starting on line 1 of file .*end of file"
+        ):
+            self.load(fname, stream=True)
+
+    def test_syntax_error_line(self):
+        fname = self.write_dat("set A := 1 2 ;\n\n\nset B := 1 := 2 ;\n")
+        with self.assertRaisesRegex(IOError, "statement starting on line 4 of file"):
+            self.load(fname, stream=True)
+
+    def test_nested_namespace(self):
+        fname = self.write_dat("namespace a { namespace b { set A := 1; } }")
+        with self.assertRaisesRegex(IOError, "namespace within another namespace"):
+            self.load(fname, stream=True)
+        fname = self.write_dat("namespace a { set A := 1; ")
+        with self.assertRaisesRegex(IOError, "Missing '}'"):
+            self.load(fname, stream=True)
+
+
+if __name__ == "__main__":
+    unittest.main()
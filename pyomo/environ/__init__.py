@@ -19,7 +19,9 @@ def _do_import(pkg_name):
 
 
 #
-# These packages contain plugins that need to be loaded
+# These packages contain plugins that need to be loaded.  The plugins
+# in the packages listed in pyomo.environ.deferred_plugins are not
+# imported until they are first used.
 #
 _packages = [
     'pyomo.common',
@@ -59,10 +61,22 @@ _packages = [
 
 
 def _import_packages():
+    from pyomo.common.factory import register_entry_point
+    from pyomo.environ.deferred_plugins import deferred_plugins
+
     #
     # Import required packages
     #
     for _package in _packages:
+        if _package in deferred_plugins:
+            # Record the plugins in this package: they are imported
+            # the first time they are used
+            for entry_point, groups in deferred_plugins[_package].items():
+                for group, names in groups.items():
+                    for name in names:
+                        register_entry_point(group, name, entry_point)
+            continue
+
         pname = _package + '.plugins'
         try:
             _do_import(pname)
@@ -180,6 +194,7 @@ from pyomo.core import (
     BuildCheck,
     Set,
     SetOf,
+    ColumnarSet,
     simple_set_rule,
     RangeSet,
     Param,
@@ -0,0 +1,394 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright (c) 2008-2025
+#  National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+
+"""The plugins that :py:mod:`pyomo.environ` registers without importing
+
+Importing every plugin package (all solver interfaces, writers,
+transformations, and the contrib packages) accounts for more than half
+of the time it takes to import :py:mod:`pyomo.environ`.  Instead,
+:py:mod:`pyomo.environ` records the names of the plugins in these
+packages along with the *entry point* that registers them (see
+:py:func:`pyomo.common.factory.register_entry_point`).  The entry point
+is loaded the first time one of its plugins is looked up (e.g.,
+``SolverFactory('glpk')`` or ``TransformationFactory('gdp.bigm')``), or
+when the plugins registered with a factory are enumerated.
+
+:py:data:`deferred_plugins` maps each plugin package to its entry
+points, and each entry point to the names that it registers with each
+factory group.  An entry point is either a module (that registers its
+plugins when it is imported) or a ``"module:function"`` string (calling
+the function registers the plugins).  Packages that are not listed here
+are imported (and their plugins loaded) when :py:mod:`pyomo.environ` is
+imported.
+
+As these packages are not imported, they are not set as attributes of
+their parent packages by :py:mod:`pyomo.environ`.  The ``pyomo`` and
+``pyomo.contrib`` packages import their subpackages on first attribute
+access (e.g., ``pyomo.dae.ContinuousSet`` or
+``pyomo.contrib.gdpopt``), but modules deeper in these packages (e.g.,
+``pyomo.gdp.plugins.bigm``) must be imported explicitly before they are
+accessed as attributes.
+
+This table must be updated when plugins are added to (or removed from)
+these packages; ``pyomo/environ/tests/test_environ.py`` verifies that it
+is consistent with the plugins that the packages actually register.
+
+"""
+
+deferred_plugins = {
+    'pyomo.core': {
+        'pyomo.core.plugins.transform': {
+            'pyomo.transformations': [
+                'core.relax_integer_vars',
+                'core.relax_discrete',
+                'core.fix_integer_vars',
+                'core.fix_discrete',
+                'core.relax_integrality',
+                'core.expand_connectors',
+                'core.nonnegative_vars',
+                'core.radix_linearization',
+                'core.add_slack_variables',
+                'core.scale_model',
+                'core.logical_to_linear',
+                'core.lp_dual',
+            ]
+        }
+    },
+    'pyomo.dataportal': {
+        'pyomo.dataportal.plugins.columnar': {
+            'pyomo.data_managers': ['dataframe', 'parquet']
+        },
+        'pyomo.dataportal.plugins.csv_table': {'pyomo.data_managers': ['csv']},
+        'pyomo.dataportal.plugins.datacommands': {'pyomo.data_managers': ['dat']},
+        'pyomo.dataportal.plugins.db_table': {
+            'pyomo.data_managers': ['pyodbc', 'pypyodbc', 'sqlite3', 'pymysql']
+        },
+        'pyomo.dataportal.plugins.json_dict': {'pyomo.data_managers': ['json', 'yaml']},
+        'pyomo.dataportal.plugins.text': {'pyomo.data_managers': ['tab']},
+        'pyomo.dataportal.plugins.xml_table': {'pyomo.data_managers': ['xml']},
+        'pyomo.dataportal.plugins.sheet': {
+            'pyomo.data_managers': ['xls', 'xlsx', 'xlsm']
+        },
+    },
+    'pyomo.duality': {
+        'pyomo.duality.plugins': {'pyomo.transformations': ['duality.linear_dual']}
+    },
+    'pyomo.repn': {
+        'pyomo.repn.plugins:load': {
+            'pyomo.writers': [
+                'lp_v1',
+                'cpxlp_v1',
+                'nl_v1',
+                'bar',
+                'mps',
+                'gams',
+                'lp_v2',
+                'cpxlp_v2',
+                'nl_v2',
+                'compile_standard_form',
+                'compile_parameterized_standard_form',
+                'nl',
+                'lp',
+                'cpxlp',
+            ]
+        }
+    },
+    'pyomo.neos': {
+        'pyomo.neos.plugins.NEOS': {'pyomo.solvers': ['_neos']},
+        'pyomo.neos.plugins.kestrel_plugin': {'pyomo.solver_managers': ['neos']},
+    },
+    'pyomo.solvers': {
+        'pyomo.solvers.plugins:load': {
+            'pyomo.converters': ['ampl', 'glpsol', 'pyomo'],
+            'pyomo.solvers': [
+                'cbc',
+                '_cbc_shell',
+                '_mock_cbc',
+                'glpk',
+                '_glpk_shell',
+                '_mock_glpk',
+                'cplex',
+                '_cplex_shell',
+                '_mock_cplex',
+                'gurobi_direct',
+                'asl',
+                '_mock_asl',
+                'gurobi',
+                '_gurobi_nl',
+                '_gurobi_shell',
+                '_gurobi_file',
+                'baron',
+                'py',
+                'scip',
+                'conopt',
+                'xpress',
+                'ipopt',
+                'gurobi_persistent',
+                'cplex_direct',
+                'cplex_persistent',
+                'gams',
+                '_gams_direct',
+                '_gams_shell',
+                'mosek',
+                'mosek_direct',
+                'mosek_persistent',
+                'xpress_direct',
+                'xpress_persistent',
+                'sas',
+                '_sas94',
+                '_sascas',
+                'knitroampl',
+            ],
+        }
+    },
+    'pyomo.gdp': {
+        'pyomo.gdp.disjunct': {'pyomo.components': ['Disjunct', 'Disjunction']},
+        'pyomo.gdp.plugins.bigm': {'pyomo.transformations': ['gdp.bigm']},
+        'pyomo.gdp.plugins.hull': {'pyomo.transformations': ['gdp.hull', 'gdp.chull']},
+        'pyomo.gdp.plugins.bilinear': {'pyomo.transformations': ['gdp.bilinear']},
+        'pyomo.gdp.plugins.gdp_var_mover': {
+            'pyomo.transformations': ['gdp.reclassify']
+        },
+        'pyomo.gdp.plugins.cuttingplane': {
+            'pyomo.transformations': ['gdp.cuttingplane']
+        },
+        'pyomo.gdp.plugins.fix_disjuncts': {
+            'pyomo.transformations': ['gdp.fix_disjuncts']
+        },
+        'pyomo.gdp.plugins.partition_disjuncts': {
+            'pyomo.transformations': ['gdp.partition_disjuncts']
+        },
+        'pyomo.gdp.plugins.between_steps': {
+            'pyomo.transformations': ['gdp.between_steps']
+        },
+        'pyomo.gdp.plugins.multiple_bigm': {'pyomo.transformations': ['gdp.mbigm']},
+        'pyomo.gdp.plugins.transform_current_disjunctive_state': {
+            'pyomo.transformations': ['gdp.transform_current_disjunctive_state']
+        },
+        'pyomo.gdp.plugins.bound_pretransformation': {
+            'pyomo.transformations': ['gdp.bound_pretransformation']
+        },
+        'pyomo.gdp.plugins.binary_multiplication': {
+            'pyomo.transformations': ['gdp.binary_multiplication']
+        },
+    },
+    'pyomo.mpec': {
+        'pyomo.mpec.complementarity': {
+            'pyomo.components': ['Complementarity', 'ComplementarityList']
+        },
+        'pyomo.mpec.plugins.mpec1': {
+            'pyomo.transformations': ['mpec.simple_nonlinear']
+        },
+        'pyomo.mpec.plugins.mpec2': {
+            'pyomo.transformations': ['mpec.simple_disjunction']
+        },
+        'pyomo.mpec.plugins.mpec3': {'pyomo.transformations': ['mpec.standard_form']},
+        'pyomo.mpec.plugins.mpec4': {'pyomo.transformations': ['mpec.nl']},
+        'pyomo.mpec.plugins.solver1': {'pyomo.solvers': ['mpec_nlp']},
+        'pyomo.mpec.plugins.solver2': {'pyomo.solvers': ['mpec_minlp']},
+        'pyomo.mpec.plugins.pathampl': {'pyomo.solvers': ['path']},
+    },
+    'pyomo.dae': {
+        'pyomo.dae.contset': {'pyomo.components': ['ContinuousSet']},
+        'pyomo.dae.diffvar': {'pyomo.components': ['DerivativeVar']},
+        'pyomo.dae.integral': {'pyomo.components': ['Integral']},
+        'pyomo.dae.plugins.colloc': {'pyomo.transformations': ['dae.collocation']},
+        'pyomo.dae.plugins.finitedifference': {
+            'pyomo.transformations': ['dae.finite_difference']
+        },
+    },
+    'pyomo.network': {
+        'pyomo.network.port': {'pyomo.components': ['Port']},
+        'pyomo.network.arc': {'pyomo.components': ['Arc']},
+        'pyomo.network.plugins.expand_arcs': {
+            'pyomo.transformations': ['network.expand_arcs']
+        },
+    },
+    'pyomo.contrib.ampl_function_demo': {
+        'pyomo.contrib.ampl_function_demo.plugins:load': {
+            'pyomo.extension_builders': ['ampl_function_demo']
+        }
+    },
+    'pyomo.contrib.appsi': {
+        'pyomo.contrib.appsi.plugins:load': {
+            'pyomo.extension_builders': ['appsi'],
+            'pyomo.appsi.solvers': [
+                'gurobi',
+                'cplex',
+                'ipopt',
+                'cbc',
+                'highs',
+                'maingo',
+            ],
+            'pyomo.solvers': [
+                'appsi_gurobi',
+                'appsi_cplex',
+                'appsi_ipopt',
+                'appsi_cbc',
+                'appsi_highs',
+                'appsi_maingo',
+            ],
+        }
+    },
+    # (the community_detection plugins do not register anything)
+    'pyomo.contrib.community_detection': {},
+    'pyomo.contrib.cp': {
+        'pyomo.contrib.cp.interval_var': {'pyomo.components': ['IntervalVar']},
+        'pyomo.contrib.cp.sequence_var': {'pyomo.components': ['SequenceVar']},
+        'pyomo.contrib.cp.repn.docplex_writer': {
+            'pyomo.writers': ['docplex_model'],
+            'pyomo.solvers': ['cp_optimizer'],
+        },
+        'pyomo.contrib.cp.transform.logical_to_disjunctive_program': {
+            'pyomo.transformations': ['contrib.logical_to_disjunctive']
+        },
+    },
+    'pyomo.contrib.cspline_external': {
+        'pyomo.contrib.cspline_external.plugins:load': {
+            'pyomo.extension_builders': ['cspline_external']
+        }
+    },
+    'pyomo.contrib.example': {
+        'pyomo.contrib.example.plugins.ex_plugin': {
+            'pyomo.transformations': ['contrib.example.xfrm']
+        }
+    },
+    'pyomo.contrib.fme': {
+        'pyomo.contrib.fme.fourier_motzkin_elimination': {
+            'pyomo.transformations': ['contrib.fourier_motzkin_elimination']
+        }
+    },
+    'pyomo.contrib.gdp_bounds': {
+        'pyomo.contrib.gdp_bounds.compute_bounds': {
+            'pyomo.transformations': ['contrib.compute_disj_var_bounds']
+        }
+    },
+    'pyomo.contrib.gdpopt': {
+        'pyomo.contrib.gdpopt.GDPopt': {'pyomo.solvers': ['gdpopt']},
+        'pyomo.contrib.gdpopt.gloa': {'pyomo.solvers': ['gdpopt.gloa']},
+        'pyomo.contrib.gdpopt.branch_and_bound': {'pyomo.solvers': ['gdpopt.lbb']},
+        'pyomo.contrib.gdpopt.loa': {'pyomo.solvers': ['gdpopt.loa']},
+        'pyomo.contrib.gdpopt.ric': {'pyomo.solvers': ['gdpopt.ric']},
+        'pyomo.contrib.gdpopt.enumerate': {'pyomo.solvers': ['gdpopt.enumerate']},
+        'pyomo.contrib.gdpopt.ldsda': {'pyomo.solvers': ['gdpopt.ldsda']},
+    },
+    'pyomo.contrib.gjh': {
+        'pyomo.contrib.gjh.plugins:load': {
+            'pyomo.downloaders': ['gjh'],
+            'pyomo.solvers': ['contrib.gjh'],
+        }
+    },
+    'pyomo.contrib.aslfunctions': {
+        'pyomo.contrib.aslfunctions.plugins:load': {
+            'pyomo.extension_builders': ['aslfunctions']
+        }
+    },
+    'pyomo.contrib.mcpp': {
+        'pyomo.contrib.mcpp.plugins:load': {
+            'pyomo.downloaders': ['mcpp'],
+            'pyomo.extension_builders': ['mcpp'],
+        }
+    },
+    'pyomo.contrib.mindtpy': {
+        'pyomo.contrib.mindtpy.MindtPy': {'pyomo.solvers': ['mindtpy']},
+        'pyomo.contrib.mindtpy.outer_approximation': {'pyomo.solvers': ['mindtpy.oa']},
+        'pyomo.contrib.mindtpy.extended_cutting_plane': {
+            'pyomo.solvers': ['mindtpy.ecp']
+        },
+        'pyomo.contrib.mindtpy.global_outer_approximation': {
+            'pyomo.solvers': ['mindtpy.goa']
+        },
+        'pyomo.contrib.mindtpy.feasibility_pump': {'pyomo.solvers': ['mindtpy.fp']},
+    },
+    'pyomo.contrib.multistart': {
+        'pyomo.contrib.multistart.multi': {'pyomo.solvers': ['multistart']}
+    },
+    'pyomo.contrib.preprocessing': {
+        'pyomo.contrib.preprocessing.plugins.deactivate_trivial_constraints': {
+            'pyomo.transformations': ['contrib.deactivate_trivial_constraints']
+        },
+        'pyomo.contrib.preprocessing.plugins.detect_fixed_vars': {
+            'pyomo.transformations': ['contrib.detect_fixed_vars']
+        },
+        'pyomo.contrib.preprocessing.plugins.init_vars': {
+            'pyomo.transformations': [
+                'contrib.init_vars_midpoint',
+                'contrib.init_vars_zero',
+            ]
+        },
+        'pyomo.contrib.preprocessing.plugins.remove_zero_terms': {
+            'pyomo.transformations': ['contrib.remove_zero_terms']
+        },
+        'pyomo.contrib.preprocessing.plugins.equality_propagate': {
+            'pyomo.transformations': [
+                'contrib.propagate_fixed_vars',
+                'contrib.propagate_eq_var_bounds',
+            ]
+        },
+        'pyomo.contrib.preprocessing.plugins.strip_bounds': {
+            'pyomo.transformations': ['contrib.strip_var_bounds']
+        },
+        'pyomo.contrib.preprocessing.plugins.zero_sum_propagator': {
+            'pyomo.transformations': ['contrib.propagate_zero_sum']
+        },
+        'pyomo.contrib.preprocessing.plugins.bounds_to_vars': {
+            'pyomo.transformations': ['contrib.constraints_to_var_bounds']
+        },
+        'pyomo.contrib.preprocessing.plugins.var_aggregator': {
+            'pyomo.transformations': ['contrib.aggregate_vars']
+        },
+        'pyomo.contrib.preprocessing.plugins.induced_linearity': {
+            'pyomo.transformations': ['contrib.induced_linearity']
+        },
+        'pyomo.contrib.preprocessing.plugins.constraint_tightener': {
+            'pyomo.transformations': ['core.tighten_constraints_from_vars']
+        },
+        'pyomo.contrib.preprocessing.plugins.int_to_binary': {
+            'pyomo.transformations': ['contrib.integer_to_binary']
+        },
+    },
+    'pyomo.contrib.pynumero': {
+        'pyomo.contrib.pynumero.plugins:load': {
+            'pyomo.extension_builders': ['pynumero'],
+            'pyomo.solvers': [
+                'cyipopt',
+                'scipy.fsolve',
+                'scipy.root',
+                'scipy.newton',
+                'scipy.secant-newton',
+            ],
+        }
+    },
+    'pyomo.contrib.simplification': {
+        'pyomo.contrib.simplification.plugins:load': {
+            'pyomo.extension_builders': ['ginac']
+        }
+    },
+    'pyomo.contrib.solver': {
+        'pyomo.contrib.solver.plugins:load': {
+            'pyomo.contrib.solvers': [
+                'ipopt',
+                'gurobi_persistent',
+                'gurobi_direct',
+                'highs',
+            ],
+            'pyomo.solvers': [
+                'ipopt_v2',
+                'gurobi_persistent_v2',
+                'gurobi_direct_v2',
+                'highs',
+            ],
+        }
+    },
+    'pyomo.contrib.trustregion': {
+        'pyomo.contrib.trustregion.TRF': {'pyomo.solvers': ['trustregion']}
+    },
+}
@@ -12,6 +12,7 @@
 # Unit Tests for pyomo.base.misc
 #
 
+import os
 import re
 import sys
 import subprocess
@@ -169,6 +170,128 @@ class TestPyomoEnviron(unittest.TestCase):
             diff, set(), "Unexpected module found in 5 slowest-loading TPL modules"
         )
 
+    @unittest.skipUnless(hasattr(os, 'fork'), "test requires os.fork()")
+    def test_deferred_plugins(self):
+        # Verify that pyomo.environ.deferred_plugins is consistent with
+        # the plugins that the packages actually register: (1) loading
+        # each entry point (starting from a freshly imported
+        # pyomo.environ) registers the names recorded for it, and (2)
+        # loading the plugin packages does not register any names that
+        # were not recorded.
+        output = subprocess.run(
+            [sys.executable, '-c', _deferred_plugin_check],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+        ).stdout
+        self.assertEqual(output.strip(), "OK")
+
+    def test_deferred_plugins_not_imported(self):
+        rc = subprocess.call(
+            [
+                sys.executable,
+                '-c',
+                'import pyomo.environ, sys; '
+                'sys.exit( 1 if any(m in sys.modules for m in '
+                '("pyomo.solvers.plugins.solvers", "pyomo.gdp.plugins.bigm", '
+                '"pyomo.repn.plugins.nl_writer")) else 0 )',
+            ]
+        )
+        if rc:
+            self.fail("Importing pyomo.environ imported deferred plugins")
+
+    def test_deferred_packages_accessible(self):
+        # Plugin packages that are not imported by pyomo.environ are
+        # still available as attributes of the pyomo package
+        rc = subprocess.call(
+            [
+                sys.executable,
+                '-c',
+                'import pyomo.environ, sys; '
+                'assert "pyomo.dae" not in sys.modules; '
+                'pyomo.dae.ContinuousSet, pyomo.gdp.Disjunct, pyomo.network.Arc, '
+                'pyomo.mpec.Complementarity, pyomo.repn.generate_standard_repn, '
+                'pyomo.solvers, pyomo.contrib.gdpopt, pyomo.util',
+            ]
+        )
+        if rc:
+            self.fail(
+                "Plugin packages are not accessible after importing pyomo.environ"
+            )
+
+
+_deferred_plugin_check = """
+import os, sys
+import pyomo.environ
+from pyomo.environ import _packages
+from pyomo.environ.deferred_plugins import deferred_plugins
+from pyomo.common.download import DownloadFactory
+from pyomo.common.extensions import ExtensionBuilderFactory
+from pyomo.common.factory import load_entry_point, load_entry_points
+from pyomo.contrib.appsi.base import SolverFactory as AppsiSolverFactory
+from pyomo.contrib.solver.common.factory import SolverFactory as ContribSolverFactory
+from pyomo.core.base.component import ModelComponentFactory
+from pyomo.dataportal.factory import DataManagerFactory
+from pyomo.opt import (
+    ReaderFactory,
+    SolverFactory,
+    SolverManagerFactory,
+    WriterFactory,
+)
+from pyomo.opt.base.convert import ProblemConverterFactory
+from pyomo.core.base.transformation import TransformationFactory
+
+registries = {
+    f._cls.group: f._cls
+    for f in (
+        DownloadFactory,
+        ExtensionBuilderFactory,
+        AppsiSolverFactory,
+        ContribSolverFactory,
+        ModelComponentFactory,
+        DataManagerFactory,
+        ReaderFactory,
+        SolverFactory,
+        SolverManagerFactory,
+        WriterFactory,
+        ProblemConverterFactory,
+        TransformationFactory,
+    )
+}
+
+def registered(group):
+    return set(dict.keys(registries[group]))
+
+# The names registered by pyomo.environ (directly, or as entry points)
+expected = {group: registered(group) for group in registries}
+for package, entry_points in deferred_plugins.items():
+    for entry_point, groups in entry_points.items():
+        for group, names in groups.items():
+            expected[group].update(names)
+
+for package, entry_points in deferred_plugins.items():
+    for entry_point, groups in entry_points.items():
+        sys.stdout.flush()
+        pid = os.fork()
+        if not pid:
+            load_entry_point(entry_point)
+            for group, names in groups.items():
+                for name in set(names) - registered(group):
+                    print("%s did not register %s:%s" % (entry_point, group, name))
+            sys.stdout.flush()
+            os._exit(0)
+        os.waitpid(pid, 0)
+
+load_entry_points()
+for package in _packages:
+    module = __import__(package + '.plugins', fromlist=['load'])
+    module.load()
+for group in registries:
+    for name in registered(group) - expected[group]:
+        print("%s:%s is not in deferred_plugins" % (group, name))
+print("OK")
+"""
+
 
 if __name__ == "__main__":
     # Running this file as a script will print out the package timing
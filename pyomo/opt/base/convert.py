@@ -19,7 +19,7 @@ from pyomo.common import Factory
 
 # WEH - Should we treat these as singleton objects?  Not for now, since
 # I can't think of a case where that would impact performance
-ProblemConverterFactory = Factory('problem converter')
+ProblemConverterFactory = Factory('problem converter', 'pyomo.converters')
 
 
 def convert_problem(
@@ -12,7 +12,7 @@
 from pyomo.common import Factory
 
 
-WriterFactory = Factory('problem writer')
+WriterFactory = Factory('problem writer', 'pyomo.writers')
 
 
 class AbstractProblemWriter(object):
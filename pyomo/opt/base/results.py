@@ -12,7 +12,7 @@
 from pyomo.common import Factory
 
 
-ReaderFactory = Factory('problem reader')
+ReaderFactory = Factory('problem reader', 'pyomo.readers')
 
 
 class AbstractResultsReader(object):
@@ -192,7 +192,9 @@ class SolverFactoryClass(Factory):
 
 
 #: Global registry/factory for "v1" solver interfaces.
-LegacySolverFactory: SolverFactoryClass = SolverFactoryClass('solver type')
+LegacySolverFactory: SolverFactoryClass = SolverFactoryClass(
+    'solver type', 'pyomo.solvers'
+)
 
 SolverFactory = SolverFactoryClass('solver type')
 SolverFactory._cls = LegacySolverFactory._cls
@@ -13,7 +13,7 @@ from pyomo.common import Factory
 from pyomo.opt.parallel.manager import AsynchronousActionManager
 
 
-SolverManagerFactory = Factory('solver manager')
+SolverManagerFactory = Factory('solver manager', 'pyomo.solver_managers')
 
 
 class AsynchronousSolverManager(AsynchronousActionManager):
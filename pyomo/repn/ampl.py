@@ -1220,6 +1220,42 @@ class AMPLRepnVisitor(StreamBasedExpressionVisitor):
         #
         return _operator_handles[node.__class__](self, node, *data)
 
+    def walk_canonical_form(self, repn, scale=1):
+        """Return the AMPLRepn for a linear expression in canonical form
+
+        This is used for constraints that store their body in linear
+        canonical form (i.e., ``_linear_canonical_form`` is True, as
+        for :py:class:`MatrixConstraint` rows) so that callers do not
+        need to build and walk the body expression.
+
+        Parameters
+        ----------
+        repn: StandardRepn
+            The (linear) canonical form, e.g., as returned by
+            ``ConstraintData.canonical_form()``
+        scale: float
+            Scaling factor to apply to the expression
+
+        """
+        var_map = self.var_map
+        linear = {}
+        for var, coef in zip(repn.linear_vars, repn.linear_coefs):
+            if not coef:
+                continue
+            vid = id(var)
+            if vid not in var_map:
+                _before_child_handlers._record_var(self, var)
+            if vid in linear:
+                linear[vid] += coef
+            else:
+                linear[vid] = coef
+        const = repn.constant
+        if scale != 1:
+            const *= scale
+            for vid in linear:
+                linear[vid] *= scale
+        return self.Result(const, linear, None)
+
     def finalizeResult(self, result):
         ans = self.node_result_to_amplrepn(result)
 
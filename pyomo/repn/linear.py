@@ -891,6 +891,36 @@ class LinearRepnVisitor(StreamBasedExpressionVisitor):
             return False, self.finalizeResult(result)
         return True, expr
 
+    def walk_canonical_form(self, repn):
+        """Return the Result for a linear expression in canonical form
+
+        This is used for constraints that store their body in linear
+        canonical form (i.e., ``_linear_canonical_form`` is True, as
+        for :py:class:`MatrixConstraint` rows) so that callers do not
+        need to build and walk the body expression.
+
+        Parameters
+        ----------
+        repn: StandardRepn
+            The (linear) canonical form, e.g., as returned by
+            ``ConstraintData.canonical_form()``
+
+        """
+        ans = self.Result()
+        var_map = self.var_map
+        linear = ans.linear
+        for var, coef in zip(repn.linear_vars, repn.linear_coefs):
+            vid = id(var)
+            if vid not in var_map:
+                self.var_recorder.add(var)
+            if vid in linear:
+                linear[vid] += coef
+            else:
+                linear[vid] = coef
+        ans.constant = repn.constant
+        self._filter_zeros(ans)
+        return ans
+
     def beforeChild(self, node, child, child_idx):
         return self.before_child_dispatcher[child.__class__](self, child)
 
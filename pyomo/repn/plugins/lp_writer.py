@@ -410,10 +410,18 @@ class _LPWriter_impl(object):
             if with_debug_timing and con.parent_component() is not last_parent:
                 timer.toc('Constraint %s', last_parent, level=logging.DEBUG)
                 last_parent = con.parent_component()
-            # Note: Constraint.to_bounded_expression(evaluate_bounds=True)
-            # guarantee a return value that is either a (finite)
-            # native_numeric_type, or None
-            lb, body, ub = con.to_bounded_expression(True)
+            if con._linear_canonical_form:
+                # Constraints stored in linear canonical form (e.g.,
+                # MatrixConstraint rows) have numeric bounds, and we
+                # can skip building (and walking) the body expression
+                lb = con.lb
+                ub = con.ub
+                body = None
+            else:
+                # Note: Constraint.to_bounded_expression(evaluate_bounds=True)
+                # guarantee a return value that is either a (finite)
+                # native_numeric_type, or None
+                lb, body, ub = con.to_bounded_expression(True)
 
             if lb is None and ub is None:
                 # Note: you *cannot* output trivial (unbounded)
@@ -421,7 +429,10 @@ class _LPWriter_impl(object):
                 # slack variable if skip_trivial_constraints is False,
                 # but that seems rather silly.
                 continue
-            repn = constraint_visitor.walk_expression(body)
+            if body is None:
+                repn = constraint_visitor.walk_canonical_form(con.canonical_form())
+            else:
+                repn = constraint_visitor.walk_expression(body)
             if repn.nonlinear is not None:
                 raise ValueError(
                     f"Model constraint ({con.name}) contains nonlinear terms that "
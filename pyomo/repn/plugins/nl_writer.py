@@ -682,11 +682,19 @@ class _NLWriter_impl(object):
                     timer.toc('Constraint %s', last_parent, level=logging.DEBUG)
                 last_parent = con.parent_component()
             scale = scaling_factor(con)
-            # Note: Constraint.to_bounded_expression(evaluate_bounds=True)
-            # guarantee a return value that is either a (finite)
-            # native_numeric_type, or None
-            lb, body, ub = con.to_bounded_expression(True)
-            expr_info = visitor.walk_expression((body, con, 0, scale))
+            if con._linear_canonical_form:
+                # Constraints stored in linear canonical form (e.g.,
+                # MatrixConstraint rows) have numeric bounds, and we
+                # can skip building (and walking) the body expression
+                lb = con.lb
+                ub = con.ub
+                expr_info = visitor.walk_canonical_form(con.canonical_form(), scale)
+            else:
+                # Note: Constraint.to_bounded_expression(evaluate_bounds=True)
+                # guarantee a return value that is either a (finite)
+                # native_numeric_type, or None
+                lb, body, ub = con.to_bounded_expression(True)
+                expr_info = visitor.walk_expression((body, con, 0, scale))
             if expr_info.named_exprs:
                 self._record_named_expression_usage(expr_info.named_exprs, con, 0)
 
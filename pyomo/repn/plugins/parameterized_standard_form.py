@@ -345,6 +345,9 @@ class _CSCMatrix(_SparseMatrixBase):
 class _ParameterizedLinearStandardFormCompiler_impl(_LinearStandardFormCompiler_impl):
     _csc_matrix = _CSCMatrix
     _csr_matrix = _CSRMatrix
+    # The canonical form evaluates fixed variables, but fixed variables
+    # in wrt must be preserved as parameters
+    _use_canonical_form = False
 
     def _get_visitor(self, subexpression_cache, var_recorder):
         wrt = self.config.wrt
@@ -274,6 +274,9 @@ class _LinearStandardFormCompiler_impl(object):
     _to_vector = None
     _csc_matrix = None
     _csr_matrix = None
+    # Compile constraints stored in linear canonical form (e.g.,
+    # MatrixConstraint rows) without building their body expressions
+    _use_canonical_form = True
 
     def __init__(self, config):
         self.config = config
@@ -420,6 +423,7 @@ class _LinearStandardFormCompiler_impl(object):
         con_index = []
         con_index_ptr = [0]
         last_parent = None
+        use_canonical_form = self._use_canonical_form
         for con in ordered_active_constraints(model, self.config):
             if with_debug_timing and con._component is not last_parent:
                 if last_parent is not None:
@@ -432,13 +436,21 @@ class _LinearStandardFormCompiler_impl(object):
                 )
                 N = len(linear_data)
             else:
-                # Note: lb and ub could be a number, expression, or None
-                lb, body, ub = con.to_bounded_expression()
-                if lb.__class__ not in native_types:
-                    lb = value(lb)
-                if ub.__class__ not in native_types:
-                    ub = value(ub)
-                repn = visitor.walk_expression(body)
+                if use_canonical_form and con._linear_canonical_form:
+                    # Constraints stored in linear canonical form (e.g.,
+                    # MatrixConstraint rows) have numeric bounds, and we
+                    # can skip building (and walking) the body expression
+                    lb = con.lb
+                    ub = con.ub
+                    repn = visitor.walk_canonical_form(con.canonical_form())
+                else:
+                    # Note: lb and ub could be a number, expression, or None
+                    lb, body, ub = con.to_bounded_expression()
+                    if lb.__class__ not in native_types:
+                        lb = value(lb)
+                    if ub.__class__ not in native_types:
+                        ub = value(ub)
+                    repn = visitor.walk_expression(body)
                 if repn.nonlinear is not None:
                     raise ValueError(
                         f"Model constraint ({con.name}) contains nonlinear terms that "
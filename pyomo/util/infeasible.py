@@ -16,11 +16,19 @@ from math import fabs
 import logging
 
 from pyomo.common import deprecated
+from pyomo.common.dependencies import numpy as np, numpy_available
+from pyomo.core.base.block import _get_structure_cache
 from pyomo.core.expr.visitor import identify_variables
 from pyomo.util.blockutil import log_model_constraints
+from pyomo.util.residuals import ConstraintResidualEvaluator
 
 logger = logging.getLogger(__name__)
 
+# Relative margin used when screening constraints with the vectorized
+# evaluator: NumPy may sum terms in a different order than value(), so
+# values within this margin of the tolerance are always checked exactly
+_SCREENING_RTOL = 1e-9
+
 
 def _check_infeasible(obj, val, tol):
     if val is None:
@@ -43,7 +51,53 @@ def _check_infeasible(obj, val, tol):
     return infeasible
 
 
-def find_infeasible_constraints(m, tol=1e-6):
+def _residual_evaluator(m, constraints):
+    """Return a ConstraintResidualEvaluator for the constraints on m
+
+    The compiled evaluator is cached on the block so that repeated
+    diagnostics (e.g., after re-solving the model) do not need to
+    recompile the constraint expressions.  Compiling the evaluator costs
+    more than checking the constraints once with value(), so this is
+    only used when requested (``use_evaluator=True``).
+
+    """
+    cache = _get_structure_cache(m, '_residual_cache')
+    evaluator = cache.get('evaluator', None)
+    if evaluator is None or not evaluator.is_current(constraints):
+        evaluator = cache['evaluator'] = ConstraintResidualEvaluator(constraints)
+    return evaluator
+
+
+def _screen_infeasible_constraints(m, constraints, tol):
+    """Return the constraints that may be infeasible
+
+    The constraints are screened using the vectorized residual
+    evaluator; the caller is expected to verify the returned
+    candidates exactly using :py:func:`value()`.
+
+    """
+    evaluator = _residual_evaluator(m, constraints)
+    body, residual, violation = evaluator.evaluate()
+    margin = _SCREENING_RTOL * (1 + np.abs(body))
+    # Note: NaN (undefined) violations are always returned
+    feasible = violation <= tol - margin
+    return [constraints[i] for i in np.flatnonzero(~feasible)]
+
+
+def _screen_close_constraints(m, constraints, tol):
+    """Return the constraints that may be close to one of their bounds"""
+    evaluator = _residual_evaluator(m, constraints)
+    body = evaluator.evaluate_body()
+    lb, ub = evaluator.evaluate_bounds()
+    margin = _SCREENING_RTOL * (1 + np.abs(body))
+    with np.errstate(invalid='ignore'):
+        interior = (np.abs(lb - body) > tol + margin) & (
+            np.abs(body - ub) > tol + margin
+        )
+    return [constraints[i] for i in np.flatnonzero(~interior)]
+
+
+def find_infeasible_constraints(m, tol=1e-6, use_evaluator=False):
     """Find the infeasible constraints in the model.
 
     Uses the current model state.
@@ -56,6 +110,14 @@ def find_infeasible_constraints(m, tol=1e-6):
     tol: float
         absolute feasibility tolerance
 
+    use_evaluator: bool
+        If True (and NumPy is available), screen the constraints with a
+        compiled :py:class:`ConstraintResidualEvaluator` that is cached
+        on ``m``, and only check the candidates with :py:func:`value()`.
+        Compiling the evaluator makes the first call slower, but
+        repeated calls on the same model (e.g., after every solve) are
+        much faster.  The results are the same either way.
+
     Yields
     ------
     constr: ConstraintData
@@ -72,9 +134,12 @@ def find_infeasible_constraints(m, tol=1e-6):
 
     """
     # Iterate through all active constraints on the model
-    for constr in m.component_data_objects(
+    constraints = m.component_data_objects(
         ctype=Constraint, active=True, descend_into=True
-    ):
+    )
+    if use_evaluator and numpy_available:
+        constraints = _screen_infeasible_constraints(m, list(constraints), tol)
+    for constr in constraints:
         body_value = value(constr.body, exception=False)
         infeasible = _check_infeasible(constr, body_value, tol)
         if infeasible:
@@ -82,7 +147,12 @@ def find_infeasible_constraints(m, tol=1e-6):
 
 
 def log_infeasible_constraints(
-    m, tol=1e-6, logger=logger, log_expression=False, log_variables=False
+    m,
+    tol=1e-6,
+    logger=logger,
+    log_expression=False,
+    log_variables=False,
+    use_evaluator=False,
 ):
     """Logs the infeasible constraints in the model.
 
@@ -105,6 +175,10 @@ def log_infeasible_constraints(
     log_variables: bool
         If true, prints the constraint variable names and values
 
+    use_evaluator: bool
+        Screen the constraints with a cached, compiled evaluator (see
+        :py:func:`find_infeasible_constraints()`)
+
     """
     if logger.getEffectiveLevel() > logging.INFO:
         logger.warning(
@@ -113,7 +187,9 @@ def log_infeasible_constraints(
             'will be logged regardless of constraint feasibility'
         )
 
-    for constr, body, infeas in find_infeasible_constraints(m, tol):
+    for constr, body, infeas in find_infeasible_constraints(
+        m, tol, use_evaluator=use_evaluator
+    ):
         if constr.equality:
             lb = lb_expr = lb_op = ""
             ub_expr = constr.upper
@@ -256,7 +332,7 @@ def _check_close(obj, val, tol):
     return close
 
 
-def find_close_to_bounds(m, tol=1e-6):
+def find_close_to_bounds(m, tol=1e-6, use_evaluator=False):
     """Find variables and constraints whose values are close to their bounds.
 
     Uses the current model state. Variables with no values and
@@ -284,6 +360,10 @@ def find_close_to_bounds(m, tol=1e-6):
         absolute feasibility tolerance: values within tol of the bound
         will be returned.
 
+    use_evaluator: bool
+        Screen the constraints with a cached, compiled evaluator (see
+        :py:func:`find_infeasible_constraints()`)
+
     Yields
     ------
     var: ComponentData
@@ -313,9 +393,12 @@ def find_close_to_bounds(m, tol=1e-6):
             continue
         yield var, val, close
 
-    for con in m.component_data_objects(
+    constraints = m.component_data_objects(
         ctype=Constraint, active=True, descend_into=True
-    ):
+    )
+    if use_evaluator and numpy_available:
+        constraints = _screen_close_constraints(m, list(constraints), tol)
+    for con in constraints:
         if con.equality:
             continue
         val = value(con.body, exception=False)
@@ -330,7 +413,7 @@ def find_close_to_bounds(m, tol=1e-6):
         yield con, val, close
 
 
-def log_close_to_bounds(m, tol=1e-6, logger=logger):
+def log_close_to_bounds(m, tol=1e-6, logger=logger, use_evaluator=False):
     """Print the variables and constraints that are near their bounds.
 
     See :py:func:`find_close_to_bounds()` for a description of the
@@ -347,6 +430,10 @@ def log_close_to_bounds(m, tol=1e-6, logger=logger):
     logger: logging.Logger
         Logger to output to; defaults to `pyomo.util.infeasible`.
 
+    use_evaluator: bool
+        Screen the constraints with a cached, compiled evaluator (see
+        :py:func:`find_infeasible_constraints()`)
+
     """
     if logger.getEffectiveLevel() > logging.INFO:
         logger.warning(
@@ -355,7 +442,7 @@ def log_close_to_bounds(m, tol=1e-6, logger=logger):
             'will be logged regardless of bound status'
         )
 
-    for obj, val, close in find_close_to_bounds(m, tol):
+    for obj, val, close in find_close_to_bounds(m, tol, use_evaluator=use_evaluator):
         if not close:
             if obj.ctype is Var:
                 logger.debug(f"Skipping VAR {obj.name} with no assigned value.")
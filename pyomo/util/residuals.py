@@ -0,0 +1,227 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright (c) 2008-2025
+#  National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+
+"""Vectorized evaluation of constraint bodies, residuals and violations.
+
+The :class:`ConstraintResidualEvaluator` walks the body of each
+constraint exactly once and compiles the (deduplicated) expression DAG
+into a short sequence of NumPy operations over an array of variable
+values.  Re-evaluating the constraints at a new point only replays
+those operations and never walks the expression trees again.
+
+The constraint bodies are recorded with the same tape compiler as
+:py:class:`~pyomo.core.expr.calculus.sparse_ad.DerivativeTape` (without
+the derivative information).
+
+"""
+
+from pyomo.common.dependencies import numpy as np
+from pyomo.common.gc_manager import PauseGC
+from pyomo.common.numeric_types import native_numeric_types, value
+from pyomo.core.expr.calculus.diff_with_pyomo import DifferentiationException
+from pyomo.core.expr.calculus.sparse_ad import _Tape, _TapeBuilder, _to_float
+
+
+class ConstraintResidualEvaluator(_Tape):
+    """Evaluate the bodies, residuals and violations of many constraints.
+
+    The constraint bodies are compiled once (when the evaluator is
+    created) into a vectorized program over an array of variable
+    values.  Expressions that cannot be vectorized (e.g.,
+    ``Expr_if`` or external functions) are evaluated one constraint at
+    a time using :py:func:`value()`.
+
+    Note that the evaluator captures the *structure* of the constraint
+    expressions: if a constraint expression is changed (e.g., with
+    ``set_value()``), a new evaluator must be created (see
+    :py:meth:`is_current()`).  Changes to
+    variable values, mutable parameter values and constraint bounds
+    are picked up on each evaluation.
+
+    Parameters
+    ----------
+    constraints: iterable of ConstraintData
+        The constraints to evaluate
+
+    """
+
+    def __init__(self, constraints):
+        self._constraints = list(constraints)
+        self._exprs = [con.expr for con in self._constraints]
+        builder = _TapeBuilder(include_fixed=True, differentiate=False)
+        roots = []
+        fallback = []
+        lb = []
+        ub = []
+        dynamic_bounds = []
+        with PauseGC():
+            for i, con in enumerate(self._constraints):
+                try:
+                    roots.append(builder.record(con.body, i))
+                except DifferentiationException:
+                    roots.append(-1)
+                    fallback.append(i)
+                lower, upper = con.lower, con.upper
+                lb.append(self._bound(lower, -np.inf, i, 0, dynamic_bounds))
+                ub.append(self._bound(upper, np.inf, i, 1, dynamic_bounds))
+
+        self._load_tape(builder, roots)
+        self._named = builder.named
+        self._fallback = np.array(fallback, dtype=np.intp)
+        self._lb = np.array(lb, dtype=float)
+        self._ub = np.array(ub, dtype=float)
+        self._dynamic_bounds = dynamic_bounds
+
+    @staticmethod
+    def _bound(bound, default, i, which, dynamic_bounds):
+        if bound is None:
+            return default
+        if bound.__class__ in native_numeric_types:
+            return bound
+        if bound.is_constant():
+            return _to_float(value(bound, exception=False))
+        dynamic_bounds.append((i, which, bound))
+        return np.nan
+
+    def is_current(self, constraints):
+        """Return True if this evaluator was compiled for ``constraints``
+
+        This checks both the list of constraints and that none of the
+        constraint (or named subexpression) expressions have been
+        changed since the evaluator was created.
+
+        """
+        if len(constraints) != len(self._constraints):
+            return False
+        for con, _con, expr in zip(constraints, self._constraints, self._exprs):
+            if con is not _con or con.expr is not expr:
+                return False
+        for node, expr in self._named:
+            if node.expr is not expr:
+                return False
+        return True
+
+    @property
+    def constraints(self):
+        """The list of constraints (in the order of the result arrays)"""
+        return self._constraints
+
+    @property
+    def variables(self):
+        """The list of variables appearing in the compiled bodies
+
+        This defines the order of the ``values`` array accepted by
+        :py:meth:`evaluate_body()` and :py:meth:`evaluate()`.
+
+        """
+        return self._variables
+
+    def evaluate_body(self, values=None):
+        """Evaluate the constraint bodies
+
+        Parameters
+        ----------
+        values: numpy.ndarray
+            Values for the variables (ordered as in
+            :py:attr:`variables`).  If None, the current variable
+            values are used.
+
+        Returns
+        -------
+        numpy.ndarray
+            The body values (``nan`` where the body could not be
+            evaluated or was not finite)
+
+        """
+        load_point = values is not None
+        values = self._point(values)
+        if self._nslots:
+            with np.errstate(all='ignore'):
+                body = self._forward(values)[self._roots]
+        else:
+            body = np.zeros(len(self._roots))
+        # Domain errors (e.g., log(0)) raise exceptions in Python
+        # (making value() return None), but generate inf in NumPy
+        body[np.isinf(body)] = np.nan
+        if len(self._fallback):
+            if load_point:
+                # Fallback expressions are evaluated using the Var values
+                # stored on the model: temporarily load the point
+                saved = [v.value for v in self._variables]
+                self._load(values)
+            try:
+                body[self._fallback] = [
+                    _to_float(value(self._constraints[i].body, exception=False))
+                    for i in self._fallback
+                ]
+            finally:
+                if load_point:
+                    for v, val in zip(self._variables, saved):
+                        v.set_value(val, skip_validation=True)
+        return body
+
+    def _load(self, values):
+        for v, val in zip(self._variables, values.tolist()):
+            v.set_value(None if val != val else val, skip_validation=True)
+
+    def evaluate_bounds(self):
+        """Evaluate the constraint bounds
+
+        Returns
+        -------
+        lb: numpy.ndarray
+            The lower bounds (``-inf`` for constraints without a lower
+            bound and ``nan`` for bounds that could not be evaluated)
+
+        ub: numpy.ndarray
+            The upper bounds (``inf`` for constraints without an upper
+            bound and ``nan`` for bounds that could not be evaluated)
+
+        """
+        lb = self._lb.copy()
+        ub = self._ub.copy()
+        bounds = (lb, ub)
+        for i, which, expr in self._dynamic_bounds:
+            bounds[which][i] = _to_float(value(expr, exception=False))
+        return lb, ub
+
+    def evaluate(self, values=None):
+        """Evaluate the constraint bodies, residuals and violations
+
+        The residual is the signed distance from the body value to the
+        interval defined by the constraint bounds (negative if the body
+        is below the lower bound, positive if it is above the upper
+        bound, and 0 if the constraint is satisfied).  The violation is
+        the absolute value of the residual.
+
+        Parameters
+        ----------
+        values: numpy.ndarray
+            Values for the variables (ordered as in
+            :py:attr:`variables`).  If None, the current variable
+            values are used.
+
+        Returns
+        -------
+        body: numpy.ndarray
+        residual: numpy.ndarray
+        violation: numpy.ndarray
+            ``nan`` indicates the body or a bound could not be evaluated
+
+        """
+        body = self.evaluate_body(values)
+        lb, ub = self.evaluate_bounds()
+        with np.errstate(invalid='ignore'):
+            residual = np.where(body < lb, body - lb, 0.0)
+            residual = np.where(body > ub, body - ub, residual)
+            # Propagate evaluation errors in the body or the bounds
+            residual[np.isnan(body) | np.isnan(lb) | np.isnan(ub)] = np.nan
+        return body, residual, np.abs(residual)
@@ -18,6 +18,7 @@ import pyomo.common.unittest as unittest
 from pyomo.common.log import LoggingIntercept
 from pyomo.environ import ConcreteModel, Constraint, Var, inequality
 from pyomo.util.infeasible import (
+    find_infeasible_constraints,
     log_active_constraints,
     log_close_to_bounds,
     log_infeasible_bounds,
@@ -154,6 +155,23 @@ class TestInfeasible(unittest.TestCase):
         ]
         self.assertEqual(expected_output, output.getvalue().splitlines())
 
+    def test_use_evaluator(self):
+        """Test that the vectorized screening is only used on request."""
+        m = self.build_model()
+        logs = []
+        for use_evaluator in (False, True):
+            output = StringIO()
+            with LoggingIntercept(output, 'pyomo.util.infeasible', logging.INFO):
+                log_infeasible_constraints(
+                    m, log_variables=True, use_evaluator=use_evaluator
+                )
+                log_close_to_bounds(m, use_evaluator=use_evaluator)
+            logs.append(output.getvalue())
+            # The compiled evaluator is only cached on the model when
+            # it was requested
+            self.assertEqual('_residual_cache' in m.__dict__, use_evaluator)
+        self.assertEqual(logs[0], logs[1])
+
     def test_log_infeasible_constraints_verbose_expressions(self):
         """Test for logging of infeasible constraints."""
         m = self.build_model()
@@ -202,6 +220,50 @@ class TestInfeasible(unittest.TestCase):
         ]
         self.assertEqual(expected_output, output.getvalue().splitlines())
 
+    def test_find_infeasible_constraints_repeated(self):
+        """Test repeated diagnostics after changing the model."""
+        m = self.build_model()
+
+        def infeasible():
+            ans = [
+                (c.name, val, infeas)
+                for c, val, infeas in find_infeasible_constraints(m)
+            ]
+            # The (cached) vectorized screening gives the same results
+            self.assertEqual(
+                ans,
+                [
+                    (c.name, val, infeas)
+                    for c, val, infeas in find_infeasible_constraints(
+                        m, use_evaluator=True
+                    )
+                ],
+            )
+            return ans
+
+        ref = [
+            ('c1', 1, 1),
+            ('c2', 1, 1),
+            ('c3', 1, 2),
+            ('c5', None, 4),
+            ('c7', None, 4),
+            ('c8', 1, 1),
+            ('c9', 1, 2),
+        ]
+        self.assertEqual(infeasible(), ref)
+        self.assertIn('_residual_cache', m.__dict__)
+        self.assertEqual(infeasible(), ref)
+
+        m.x = 0.25
+        m.z = 6
+        m.c2.deactivate()
+        m.c10.activate()
+        m.c3.set_value(m.x <= -1)
+        self.assertEqual(
+            infeasible(),
+            [('c1', 0.25, 1), ('c3', 0.25, 2), ('c8', 0.25, 1), ('c10', 1.9999999, 1)],
+        )
+
 
 if __name__ == '__main__':
     unittest.main()
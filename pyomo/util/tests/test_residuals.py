@@ -0,0 +1,193 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright (c) 2008-2025
+#  National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+
+import math
+
+import pyomo.common.unittest as unittest
+from pyomo.common.dependencies import numpy as np, numpy_available
+from pyomo.environ import (
+    ConcreteModel,
+    Constraint,
+    ConstraintList,
+    Expression,
+    Expr_if,
+    Param,
+    Var,
+    cos,
+    exp,
+    floor,
+    inequality,
+    log,
+    sqrt,
+    value,
+)
+from pyomo.util.residuals import ConstraintResidualEvaluator
+
+
+def _value(expr):
+    val = value(expr, exception=False)
+    return math.nan if val is None else val
+
+
+@unittest.skipUnless(numpy_available, "residual evaluation requires numpy")
+class TestConstraintResidualEvaluator(unittest.TestCase):
+    def build_model(self):
+        m = ConcreteModel()
+        m.x = Var([1, 2, 3], initialize={1: 1, 2: 2, 3: 3})
+        m.p = Param(mutable=True, initialize=2)
+        m.e = Expression(expr=m.x[1] * m.x[2] - m.p)
+        m.c = ConstraintList()
+        m.c.add(m.x[1] + 2 * m.x[2] - m.x[3] <= 4)
+        m.c.add(m.e + exp(m.x[3]) / m.x[1] == 1)
+        m.c.add(inequality(-1, -(m.x[2] ** m.p) + abs(m.x[1] - 5), m.p))
+        m.c.add(sqrt(m.x[1]) + cos(m.e) * floor(m.x[3] / 2) >= 0)
+        m.c.add(log(m.x[3] - 3) <= 10)
+        m.c.add(m.x[1] >= m.x[2])
+        m.c.add(m.e**2 <= m.p)
+        return m
+
+    def test_body(self):
+        m = self.build_model()
+        ev = ConstraintResidualEvaluator(m.c.values())
+        self.assertEqual(ev.constraints, list(m.c.values()))
+        self.assertEqual(len(ev.variables), 3)
+        self.assertEqual(list(ev.get_variable_values()), [1, 2, 3])
+
+        for point in ([1, 2, 3], [4, -1, 3.5], [0.5, 1.5, 10]):
+            for v, val in zip(m.x.values(), point):
+                v.set_value(val)
+            ref = [_value(c.body) for c in m.c.values()]
+            self.assertStructuredAlmostEqual(
+                list(ev.evaluate_body()), ref, reltol=1e-12, abstol=0
+            )
+        # The domain error in log() is reported as NaN
+        m.x[3] = 3
+        self.assertTrue(math.isnan(ev.evaluate_body()[4]))
+
+    def test_values(self):
+        m = self.build_model()
+        ev = ConstraintResidualEvaluator(m.c.values())
+        order = [v.index() for v in ev.variables]
+        body = ev.evaluate_body(np.array([[4, -1, 3.5][i - 1] for i in order]))
+        # The model was not changed
+        self.assertEqual([m.x[i].value for i in (1, 2, 3)], [1, 2, 3])
+        m.x[1] = 4
+        m.x[2] = -1
+        m.x[3] = 3.5
+        self.assertStructuredAlmostEqual(
+            list(body), [_value(c.body) for c in m.c.values()], reltol=1e-12
+        )
+
+        with self.assertRaisesRegex(
+            ValueError, r"Expected an array of 3 variable values \(found shape"
+        ):
+            ev.evaluate_body([1, 2])
+
+    def test_uninitialized(self):
+        m = self.build_model()
+        m.x[2] = None
+        ev = ConstraintResidualEvaluator(m.c.values())
+        body = ev.evaluate_body()
+        self.assertEqual(
+            [math.isnan(b) for b in body], [True, True, True, True, True, True, True]
+        )
+        # Evaluating at an explicit point fills in the missing value
+        body = ev.evaluate_body(
+            np.array([1, 2, 3])[[v.index() - 1 for v in ev.variables]]
+        )
+        self.assertFalse(math.isnan(body[0]))
+
+    def test_residuals(self):
+        m = ConcreteModel()
+        m.x = Var(initialize=3)
+        m.lb = Param(mutable=True, initialize=5)
+        m.c = ConstraintList()
+        m.c.add(m.x <= 1)
+        m.c.add(m.x >= 4)
+        m.c.add(inequality(0, m.x, 10))
+        m.c.add(m.x == 3)
+        m.c.add(m.x >= m.lb)
+        ev = ConstraintResidualEvaluator(m.c.values())
+        body, residual, violation = ev.evaluate()
+        self.assertEqual(list(body), [3, 3, 3, 3, 3])
+        self.assertEqual(list(residual), [2, -1, 0, 0, -2])
+        self.assertEqual(list(violation), [2, 1, 0, 0, 2])
+
+        # Mutable bounds are re-evaluated
+        m.lb = 1
+        lb, ub = ev.evaluate_bounds()
+        self.assertEqual(list(lb), [-np.inf, 4, 0, 3, 1])
+        self.assertEqual(list(ub), [1, np.inf, 10, 3, np.inf])
+        body, residual, violation = ev.evaluate([5])
+        self.assertEqual(list(residual), [4, 0, 0, 2, 0])
+        self.assertEqual(m.x.value, 3)
+
+        # Undefined values propagate as NaN
+        m.x = None
+        body, residual, violation = ev.evaluate()
+        self.assertTrue(all(math.isnan(v) for v in violation))
+
+    def test_fallback(self):
+        m = ConcreteModel()
+        m.x = Var(initialize=2)
+        m.y = Var(initialize=-1)
+        m.c1 = Constraint(expr=Expr_if(m.x >= 0, m.x, -m.x) + m.y <= 0)
+        m.c2 = Constraint(expr=m.x * m.y <= 0)
+        ev = ConstraintResidualEvaluator([m.c1, m.c2])
+        self.assertEqual(list(ev.evaluate_body()), [1, -2])
+        self.assertEqual(list(ev.evaluate_body([-3, 1])), [4, -3])
+        # The variable values were restored
+        self.assertEqual((m.x.value, m.y.value), (2, -1))
+
+    def test_deep_expression(self):
+        m = ConcreteModel()
+        m.x = Var(initialize=1)
+        e = m.x
+        for i in range(5000):
+            e = 2 * e - m.x
+        m.c = Constraint(expr=e <= 0)
+        # Deep expressions are recorded without recursion (and are not
+        # evaluated with the fallback)
+        ev = ConstraintResidualEvaluator([m.c])
+        self.assertEqual(len(ev._fallback), 0)
+        self.assertEqual(list(ev.evaluate_body()), [1])
+
+    def test_shared_subexpressions(self):
+        m = ConcreteModel()
+        m.x = Var(initialize=2)
+        m.e = Expression(expr=m.x**2)
+        m.c = Constraint([1, 2, 3], rule=lambda m, i: m.e + i <= 10)
+        ev = ConstraintResidualEvaluator(m.c.values())
+        self.assertEqual(list(ev.evaluate_body()), [5, 6, 7])
+        # The named expression is only compiled (and evaluated) once
+        self.assertEqual(
+            sum(len(targets) for kind, targets, a, b, e0 in ev._steps if kind == 'pow'),
+            1,
+        )
+        # Changing the named expression invalidates the evaluator
+        self.assertTrue(ev.is_current(list(m.c.values())))
+        m.e.expr = 3 * m.x
+        self.assertFalse(ev.is_current(list(m.c.values())))
+
+    def test_is_current(self):
+        m = ConcreteModel()
+        m.x = Var(initialize=2)
+        m.c = Constraint([1, 2], rule=lambda m, i: m.x <= i)
+        ev = ConstraintResidualEvaluator(m.c.values())
+        self.assertTrue(ev.is_current(list(m.c.values())))
+        self.assertFalse(ev.is_current([m.c[1]]))
+        self.assertFalse(ev.is_current([m.c[2], m.c[1]]))
+        m.c[2].set_value(m.x >= 2)
+        self.assertFalse(ev.is_current(list(m.c.values())))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,95 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright (c) 2008-2025
+#  National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+
+#
+# This script compares the standard and streaming readers for data
+# command (*.dat) files.  A synthetic file with one large indexed
+# parameter table is written to a temporary directory and loaded with
+# both readers.  The output is organized into three columns: a
+# description of the reader, the time to load the file, and the peak
+# memory allocated (as reported by tracemalloc) while loading it.
+#
+
+# number of rows in the parameter table
+N = 200000
+# number of repetitions for each timing
+R = 3
+
+import gc
+import os
+import tempfile
+import time
+import tracemalloc
+
+import pyomo.environ
+from pyomo.dataportal import DataPortal
+
+
+def measure(f, n=R):
+    """measure the best time and the peak memory over n trials"""
+    best = None
+    for i in range(n):
+        gc.collect()
+        start = time.perf_counter()
+        f()
+        stop = time.perf_counter()
+        if best is None or stop - start < best:
+            best = stop - start
+    gc.collect()
+    tracemalloc.start()
+    f()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best, peak
+
+
+def summarize(results):
+    """neatly summarize output for comparison of several tests"""
+    line = "%40s %9s %9s %12s %9s"
+    print(line % ("Label", "Time (s)", "", "Peak (MB)", ""))
+    _, (base_time, base_peak) = results[0]
+    line = "%40s %9.2f %9s %12.1f %9s"
+    for i, (label, (time_s, peak)) in enumerate(results):
+        time_factor = "(%4.2fx)" % (time_s / base_time) if i else ""
+        peak_factor = "(%4.2fx)" % (peak / base_peak) if i else ""
+        print(line % (label, time_s, time_factor, peak / 2**20, peak_factor))
+
+
+def write_dat(fname):
+    with open(fname, 'w') as FILE:
+        FILE.write("set T := node edge ;\n")
+        FILE.write("param : I : cost cap :=\n")
+        for i in range(N):
+            FILE.write("%d %.3f %d\n" % (i, i * 0.125, i % 97))
+        FILE.write(";\n")
+        FILE.write("param scale := 2.5 ;\n")
+
+
+def run():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        fname = os.path.join(tmpdir, 'data.dat')
+        write_dat(fname)
+
+        def standard():
+            DataPortal().load(filename=fname)
+
+        def stream():
+            DataPortal().load(filename=fname, stream=True)
+
+        results = [
+            ("standard reader", measure(standard)),
+            ("streaming reader", measure(stream)),
+        ]
+    summarize(results)
+
+
+if __name__ == "__main__":
+    run()
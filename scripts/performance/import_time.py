@@ -0,0 +1,98 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright (c) 2008-2025
+#  National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+
+#
+# This script measures the cost of starting Pyomo: the time to import
+# pyomo.environ (and to use the first plugins, which pyomo.environ
+# registers but does not import), and the memory used by the process
+# afterwards.  Every case is run in a fresh Python interpreter.  The
+# output is organized into four columns: a description of the case,
+# the time to run it, the peak memory allocated by Python (as reported
+# by tracemalloc, in a separate run), and the number of modules that
+# were imported.
+#
+
+# number of repetitions for each timing
+R = 5
+
+import json
+import subprocess
+import sys
+
+cases = [
+    ("import pyomo.core", "import pyomo.core"),
+    ("import pyomo.environ", "import pyomo.environ"),
+    (
+        "  + SolverFactory('glpk')",
+        "import pyomo.environ as pyo; pyo.SolverFactory('glpk')",
+    ),
+    (
+        "  + TransformationFactory('gdp.bigm')",
+        "import pyomo.environ as pyo; pyo.TransformationFactory('gdp.bigm')",
+    ),
+    (
+        "  + WriterFactory('nl')",
+        "import pyomo.environ; from pyomo.opt import WriterFactory; "
+        "WriterFactory('nl')",
+    ),
+    (
+        "  + all plugins",
+        "import pyomo.environ; from pyomo.common.factory import "
+        "load_entry_points; load_entry_points()",
+    ),
+]
+
+_driver = """
+import sys, time, tracemalloc
+if %(trace)s:
+    tracemalloc.start()
+start = time.perf_counter()
+exec(%(code)r)
+stop = time.perf_counter()
+peak = tracemalloc.get_traced_memory()[1] if %(trace)s else 0
+print(repr((stop - start, peak, len(sys.modules))))
+"""
+
+
+def run_case(code, trace):
+    output = subprocess.check_output(
+        [sys.executable, '-c', _driver % {'code': code, 'trace': trace}], text=True
+    )
+    return eval(output.strip().splitlines()[-1])
+
+
+def measure(code, n=R):
+    """measure the best time over n trials and the peak memory"""
+    best = min(run_case(code, False)[0] for i in range(n))
+    _, peak, modules = run_case(code, True)
+    return best, peak, modules
+
+
+def summarize(results):
+    """neatly summarize output for comparison of several tests"""
+    line = "%40s %9s %12s %9s"
+    print(line % ("Label", "Time (s)", "Peak (MB)", "Modules"))
+    line = "%40s %9.3f %12.1f %9d"
+    for label, (time_s, peak, modules) in results:
+        print(line % (label, time_s, peak / 2**20, modules))
+
+
+def run():
+    results = [(label, measure(code)) for label, code in cases]
+    summarize(results)
+    if len(sys.argv) > 1:
+        # Save the results (e.g., to track them over time)
+        with open(sys.argv[1], 'w') as FILE:
+            json.dump({label: result for label, result in results}, FILE, indent=2)
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,133 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright (c) 2008-2025
+#  National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+
+#
+# This script measures the cost of looking up component data objects
+# on indexed components.  The output is organized into three columns:
+# a description of the access pattern, the average time per lookup,
+# and the time relative to a lookup in a plain Python dict with the
+# same keys.
+#
+
+# set the size of each indexing set (components are indexed by I x J)
+N = 100
+# number of repetitions for each timing
+R = 5
+
+import gc
+import time
+
+import numpy
+
+from pyomo.environ import ColumnarSet, ConcreteModel, Param, Set, Var
+
+
+def measure(f, n_lookups, n=R):
+    """measure the best time per lookup over n trials"""
+    best = None
+    for i in range(n):
+        gc.collect()
+        start = time.perf_counter()
+        f()
+        stop = time.perf_counter()
+        if best is None or stop - start < best:
+            best = stop - start
+    return best / n_lookups
+
+
+def summarize(results):
+    """neatly summarize output for comparison of several tests"""
+    line = "%50s %12s %9s"
+    print(line % ("Label", "Time (ns)", ""))
+    _, baseline = results[0]
+    line = "%50s %12.1f %9s"
+    for i, (label, time_s) in enumerate(results):
+        factor = "(%4.2fx)" % (time_s / baseline) if i else ""
+        print(line % (label, time_s * 1e9, factor))
+
+
+def build_model():
+    m = ConcreteModel()
+    m.I = Set(initialize=range(N))
+    m.J = Set(initialize=range(N))
+    m.x = Var(m.I, m.J)
+    m.p = Param(m.I, m.J, initialize={(0, 0): 1}, default=0)
+    m.q = Param(m.I, m.J, initialize={(0, 0): 1}, default=0, mutable=True)
+    m.K = ColumnarSet(
+        [numpy.arange(N * N) // N, numpy.arange(N * N) % N], within=m.I * m.J
+    )
+    m.y = Var(m.K)
+    return m
+
+
+def run():
+    m = build_model()
+    keys = [(i, j) for i in range(N) for j in range(N)]
+    nested = [((i,), j) for i, j in keys]
+    ref = dict(m.x.items())
+    n = len(keys)
+
+    def dict_lookup():
+        for k in keys:
+            ref[k]
+
+    def var_lookup():
+        x = m.x
+        for k in keys:
+            x[k]
+
+    def var_nested_lookup():
+        x = m.x
+        for k in nested:
+            x[k]
+
+    def param_default_lookup():
+        p = m.p
+        for k in keys:
+            p[k]
+
+    def mutable_param_lookup():
+        q = m.q
+        for k in keys:
+            q[k]
+
+    def columnar_lookup():
+        y = m.y
+        for k in keys:
+            y[k]
+
+    def getitems():
+        m.x.getitems(keys)
+
+    def getitems_param():
+        m.p.getitems(keys)
+
+    def getitems_array():
+        m.x.getitems(array_keys)
+
+    array_keys = numpy.array(keys)
+
+    results = [
+        ("dict lookup", measure(dict_lookup, n)),
+        ("Var lookup", measure(var_lookup, n)),
+        ("Var lookup (nested index)", measure(var_nested_lookup, n)),
+        ("Param lookup (default value)", measure(param_default_lookup, n)),
+        ("Param lookup (mutable)", measure(mutable_param_lookup, n)),
+        ("Var lookup (indexed by ColumnarSet)", measure(columnar_lookup, n)),
+        ("Var.getitems(list)", measure(getitems, n)),
+        ("Var.getitems(ndarray)", measure(getitems_array, n)),
+        ("Param.getitems(list) (default value)", measure(getitems_param, n)),
+    ]
+    summarize(results)
+
+
+if __name__ == "__main__":
+    run()
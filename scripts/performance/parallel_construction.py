@@ -0,0 +1,128 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright (c) 2008-2025
+#  National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+
+#
+# This script compares serial and parallel construction
+# (create_instance(parallel=N)) of abstract models.
+#
+# Parallel construction evaluates the rules in worker processes, but
+# the main process still has to unpickle every expression the workers
+# generate.  The time spent doing that ("main process" below) is a
+# lower bound on the parallel construction time, no matter how many
+# workers are used.  Parallel construction therefore only pays off for
+# rules that do much more work than building the expression they
+# return:
+#
+#   - "cheap rules": every rule builds a 5-term linear constraint from
+#     data that is directly indexed.  Unpickling the expression costs
+#     about as much as calling the rule, so parallel construction is
+#     never faster.
+#
+#   - "expensive rules": every rule scans all arcs of a network to
+#     build a (short) flow balance constraint.  The rule is O(arcs),
+#     but the expression is O(degree), so the main process does a small
+#     fraction of the serial work.
+#
+# Usage: parallel_construction.py [workers]
+#
+
+import sys
+import time
+
+from pyomo.core.base.parallel_construction import ParallelConstruction
+from pyomo.environ import AbstractModel, Constraint, Param, RangeSet, Set, Var
+
+# number of repetitions for each timing
+R = 3
+
+N = 100000
+NODES = 2000
+DEGREE = 4
+
+
+def cheap_rule(m, i):
+    return sum(m.a[j] * m.x[(i + j) % N] for j in range(5)) <= m.p[i]
+
+
+def cheap_model():
+    m = AbstractModel()
+    m.I = RangeSet(0, N - 1)
+    m.a = Param(range(5), initialize=lambda m, j: j + 1)
+    m.p = Param(m.I, initialize=1)
+    m.x = Var(m.I)
+    m.c = Constraint(m.I, rule=cheap_rule)
+    return m
+
+
+def balance_rule(m, n):
+    inflow = [m.flow[i, j] for (i, j) in m.ARCS if j == n]
+    outflow = [m.flow[i, j] for (i, j) in m.ARCS if i == n]
+    return sum(inflow) - sum(outflow) == m.demand[n]
+
+
+def expensive_model():
+    m = AbstractModel()
+    m.NODES = RangeSet(0, NODES - 1)
+    m.ARCS = Set(
+        dimen=2,
+        initialize=[
+            (i, (i * 7919 + k * 104729) % NODES)
+            for i in range(NODES)
+            for k in range(1, DEGREE + 1)
+        ],
+    )
+    m.demand = Param(m.NODES, initialize=0)
+    m.flow = Var(m.ARCS)
+    m.balance = Constraint(m.NODES, rule=balance_rule)
+    return m
+
+
+_attach = ParallelConstruction._attach
+_main_time = [0]
+
+
+def _timed_attach(*args):
+    start = time.perf_counter()
+    try:
+        return _attach(*args)
+    finally:
+        _main_time[0] += time.perf_counter() - start
+
+
+def measure(model, parallel):
+    best = None
+    for i in range(R):
+        _main_time[0] = 0
+        start = time.perf_counter()
+        model.create_instance(parallel=parallel)
+        result = (time.perf_counter() - start, _main_time[0])
+        if best is None or result < best:
+            best = result
+    return best
+
+
+def run(workers):
+    ParallelConstruction._attach = _timed_attach
+    line = "%20s %12s %14s %16s"
+    print(line % ("Label", "Serial (s)", "Parallel (s)", "Main process (s)"))
+    line = "%20s %12.3f %14.3f %16.3f"
+    for label, builder in (
+        ("cheap rules", cheap_model),
+        ("expensive rules", expensive_model),
+    ):
+        model = builder()
+        serial, _ = measure(model, False)
+        parallel, main = measure(model, workers)
+        print(line % (label, serial, parallel, main))
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else True)